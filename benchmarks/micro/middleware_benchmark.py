@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""
+API Middleware Micro-Benchmark
+
+Compares per-request latency of a trivial endpoint behind:
+1. legacy: the previous BaseHTTPMiddleware security headers and in-process
+   rate limiting layers plus the "http" CSRF middleware
+2. asgi: the pure ASGI SecurityHeaders, RateLimit and CSRF middleware
+
+Requests are driven straight through the ASGI interface, so the numbers
+measure middleware overhead only. By default the new rate limiter uses an
+in-memory limiter; pass --redis-url to include the Redis GCRA round trip.
+
+Usage:
+    python benchmarks/micro/middleware_benchmark.py --requests 20000
+"""
+
+import os
+import sys
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class AllowAllLimiter:
+    """In-memory stand-in for GCRARateLimiter that allows every request."""
+
+    async def allow_request(self, key, category, endpoint=None, ip_address=None):
+        return True, {"limit": 100, "remaining": 99, "reset": 1}
+
+
+def build_legacy_app(csrf_protection):
+    """Build the previous middleware stack around a trivial endpoint."""
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.responses import PlainTextResponse, Response
+    from starlette.routing import Route
+
+    from src.api.middleware import SECURITY_HEADERS
+
+    class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            response = await call_next(request)
+            for name, value in SECURITY_HEADERS:
+                response.headers[name.decode()] = value.decode()
+            return response
+
+    class LegacyRateLimitingMiddleware(BaseHTTPMiddleware):
+        def __init__(self, app, max_requests: int = 10 ** 9, window: int = 60):
+            super().__init__(app)
+            self.rate_limit_store: Dict[str, List[int]] = {}
+            self.max_requests = max_requests
+            self.window = window
+
+        async def dispatch(self, request, call_next):
+            client_ip = request.client.host if request.client else "unknown"
+            trusted_ips = os.getenv("TRUSTED_IPS", "127.0.0.1,::1").split(",")
+            if client_ip in trusted_ips:
+                return await call_next(request)
+            current_time = int(time.time())
+            window_start = current_time - self.window
+            self.rate_limit_store[client_ip] = [
+                timestamp for timestamp in self.rate_limit_store.get(client_ip, [])
+                if timestamp > window_start
+            ]
+            if len(self.rate_limit_store[client_ip]) >= self.max_requests:
+                return Response(content="Too many requests. Please try again later.", status_code=429)
+            self.rate_limit_store[client_ip].append(current_time)
+            return await call_next(request)
+
+    async def ping(request):
+        return PlainTextResponse("ok")
+
+    return Starlette(
+        routes=[Route("/api/v1/ping", ping, methods=["GET", "POST"])],
+        middleware=[
+            Middleware(BaseHTTPMiddleware, dispatch=csrf_protection.csrf_protect_middleware),
+            Middleware(LegacyRateLimitingMiddleware),
+            Middleware(LegacySecurityHeadersMiddleware),
+        ]
+    )
+
+
+def build_asgi_app(csrf_protection, limiter):
+    """Build the pure ASGI middleware stack around the same endpoint."""
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from src.api.middleware import CSRFMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
+
+    async def ping(request):
+        return PlainTextResponse("ok")
+
+    return Starlette(
+        routes=[Route("/api/v1/ping", ping, methods=["GET", "POST"])],
+        middleware=[
+            Middleware(CSRFMiddleware, protection=csrf_protection),
+            Middleware(RateLimitMiddleware, limiter=limiter, trusted_ips=[]),
+            Middleware(SecurityHeadersMiddleware),
+        ]
+    )
+
+
+async def measure(app, method: str, headers: list, requests: int, warmup: int) -> List[float]:
+    """Send requests through the ASGI app and return per-request latencies in microseconds."""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"Unexpected status {message['status']}")
+
+    latencies = []
+    for i in range(warmup + requests):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": "/api/v1/ping",
+            "raw_path": b"/api/v1/ping",
+            "query_string": b"",
+            "root_path": "",
+            "headers": headers,
+            "client": (f"10.0.{i % 250}.{i % 200}", 50000),
+            "server": ("testserver", 80),
+        }
+        start = time.perf_counter()
+        await app(scope, receive, send)
+        if i >= warmup:
+            latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def report(name: str, latencies: List[float]) -> None:
+    """Print p50/p99 latency for one scenario."""
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<12} p50 {percentiles[49]:8.1f}us  p99 {percentiles[98]:8.1f}us  "
+          f"mean {statistics.fmean(latencies):8.1f}us")
+
+
+async def run(args) -> None:
+    """Run every scenario against both stacks."""
+    from src.core.security import csrf_protection
+    from src.core.rate_limiting import GCRARateLimiter
+
+    limiter = GCRARateLimiter() if args.redis_url else AllowAllLimiter()
+    if args.redis_url:
+        limiter.limits = {
+            name: dict(limits, tokens_per_interval=10 ** 9, burst_limit=10 ** 9)
+            for name, limits in limiter.limits.items()
+        }
+
+    token = csrf_protection.generate_token()
+    post_headers = [(b"x-csrf-token", token.encode()), (b"cookie", f"csrf_token={token}".encode())]
+    stacks = {
+        "legacy": build_legacy_app(csrf_protection),
+        "asgi": build_asgi_app(csrf_protection, limiter),
+    }
+
+    for method, headers in (("GET", []), ("POST", post_headers)):
+        for name, app in stacks.items():
+            latencies = await measure(app, method, headers, args.requests, args.warmup)
+            report(f"{name} {method}", latencies)
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the API middleware stacks")
+    parser.add_argument("--requests", type=int, default=20000,
+                        help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=1000,
+                        help="Unmeasured warm-up requests per scenario")
+    parser.add_argument("--redis-url", default=None,
+                        help="Use the Redis GCRA limiter against this Redis URL")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        os.environ["REDIS_URL"] = args.redis_url
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
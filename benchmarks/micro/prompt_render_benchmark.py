@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Prompt Template Rendering Micro-Benchmark
+
+Compares rendering a campaign prompt template for many recipients with:
+1. legacy: the previous per-render re.sub with a callback that walks dotted
+   paths on every match
+2. render: PromptTemplate.render, one call per recipient, using the
+   compiled segment list
+3. render_many: PromptTemplate.render_many over the whole batch
+
+Usage:
+    python benchmarks/micro/prompt_render_benchmark.py --recipients 10000
+"""
+
+import re
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+TEMPLATE = {
+    "system_prompt": (
+        "You are the copywriter for {{brand.name}}. Write in a {{brand.voice.tone}} tone, "
+        "{{brand.voice.style}} style, and never mention {{brand.avoid}}."
+    ),
+    "template": (
+        "Write a {{channel}} message for {{recipient.first_name}} {{recipient.last_name}} "
+        "in {{recipient.city}}, who last bought {{recipient.last_purchase}} on "
+        "{{recipient.last_purchase_date}}. Promote {{campaign.product}} with the offer "
+        "\"{{campaign.offer}}\" valid until {{campaign.expires}}. Mention our store in "
+        "{{recipient.city}} and end with {{campaign.cta}}. Keep it under {{max_words}} words."
+    ),
+    "response_format": "Return JSON with keys subject and body for {{channel}}."
+}
+
+
+def legacy_substitute(text: str, variables: Dict[str, Any]) -> str:
+    """The previous PromptTemplate._substitute_variables implementation."""
+    if not text:
+        return ""
+
+    pattern = r'{{([^{}]+)}}'
+
+    def replace(match):
+        variable_name = match.group(1).strip()
+        if '.' in variable_name:
+            parts = variable_name.split('.')
+            value = variables
+            for part in parts:
+                if isinstance(value, dict) and part in value:
+                    value = value[part]
+                else:
+                    return match.group(0)
+            return str(value)
+        if variable_name in variables:
+            return str(variables[variable_name])
+        return match.group(0)
+
+    return re.sub(pattern, replace, text)
+
+
+def legacy_render(template, variable_sets: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Render every variable set with the previous implementation."""
+    return [
+        {
+            "system_prompt": legacy_substitute(template.system_prompt, variables),
+            "user_prompt": legacy_substitute(template.template, variables),
+            "response_format": legacy_substitute(template.response_format, variables)
+        }
+        for variables in variable_sets
+    ]
+
+
+def make_variable_sets(count: int) -> List[Dict[str, Any]]:
+    """Build one variable set per campaign recipient."""
+    brand = {"name": "Acme", "voice": {"tone": "warm", "style": "concise"}, "avoid": "competitors"}
+    campaign = {"product": "trail shoes", "offer": "20% off", "expires": "Friday", "cta": "a link"}
+    return [
+        {
+            "brand": brand,
+            "campaign": campaign,
+            "channel": "email",
+            "max_words": 120,
+            "recipient": {
+                "first_name": f"First{i}",
+                "last_name": f"Last{i}",
+                "city": f"City{i % 50}",
+                "last_purchase": "running socks",
+                "last_purchase_date": "2024-05-01"
+            }
+        }
+        for i in range(count)
+    ]
+
+
+def measure(name: str, render: Callable[[], List[Dict[str, str]]], rounds: int, count: int) -> List[Dict[str, str]]:
+    """Run a render strategy several times and print its best time."""
+    best = float("inf")
+    result = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = render()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<12} {best * 1000:9.2f}ms total  {best / count * 1e6:7.2f}us per prompt")
+    return result
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark prompt template rendering")
+    parser.add_argument("--recipients", type=int, default=10000,
+                        help="Variable sets rendered per round")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Rounds per strategy; the best round is reported")
+    args = parser.parse_args()
+
+    from src.agents.integrations.prompt_manager import PromptTemplate
+
+    with tempfile.TemporaryDirectory() as templates_dir:
+        template_path = Path(templates_dir) / "campaign_email.yaml"
+        template_path.write_text(yaml.dump(TEMPLATE))
+        template = PromptTemplate(str(template_path))
+        variable_sets = make_variable_sets(args.recipients)
+
+        expected = measure("legacy", lambda: legacy_render(template, variable_sets), args.rounds, args.recipients)
+        rendered = measure("render", lambda: [template.render(v) for v in variable_sets], args.rounds, args.recipients)
+        batched = measure("render_many", lambda: template.render_many(variable_sets), args.rounds, args.recipients)
+
+        if rendered != expected or batched != expected:
+            raise SystemExit("Rendered prompts differ from the legacy implementation")
+
+
+if __name__ == "__main__":
+    main()
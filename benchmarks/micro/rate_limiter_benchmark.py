@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Rate Limiter Micro-Benchmark
+
+Measures TokenBucketRateLimiter throughput against a live Redis:
+1. legacy: the previous allow_request hot path (block list, circuit state,
+   bucket read and bucket write as separate round trips)
+2. script: the single Lua script call used by allow_request
+3. async: allow_request_async with concurrent callers on one event loop
+
+Usage:
+    python benchmarks/micro/rate_limiter_benchmark.py --redis-url redis://localhost:6379/0
+"""
+
+import os
+import sys
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def legacy_allow_request(limiter, key: str, ip_address: str) -> bool:
+    """Previous allow_request implementation, kept here as the baseline."""
+    blocked_ips = limiter.cache.get(limiter.block_list_key) or []
+    if ip_address in blocked_ips:
+        return False
+    circuit_data = limiter.cache.get(f"{limiter.prefix}circuit") or {}
+    if circuit_data.get("state") == "open":
+        return False
+
+    limits = limiter.default_limits["default"]
+    cache_key = f"{limiter.prefix}default:{key}"
+    now = time.time()
+    bucket = limiter.cache.get(cache_key)
+    if not bucket:
+        bucket = {"tokens": limits["burst_limit"], "last_update": now, "request_count": 0, "blocked_until": 0}
+    elif isinstance(bucket, str):
+        bucket = json.loads(bucket)
+
+    refill = (now - bucket["last_update"]) * (limits["tokens_per_interval"] / limits["interval_seconds"])
+    tokens = min(bucket["tokens"] + refill, limits["burst_limit"])
+    allowed = tokens >= 1
+    bucket.update(
+        tokens=tokens - 1 if allowed else tokens,
+        last_update=now,
+        request_count=bucket.get("request_count", 0) + 1
+    )
+    limiter.cache.set(cache_key, bucket, expire=limits["interval_seconds"] * 2)
+    return allowed
+
+
+def report(name: str, requests: int, elapsed: float, baseline: float = None) -> float:
+    """Print throughput for one scenario and return it."""
+    throughput = requests / elapsed
+    line = f"{name:<8} {requests:>7} requests  {elapsed:8.3f}s  {throughput:10.0f} req/s"
+    if baseline:
+        line += f"  ({throughput / baseline:.1f}x legacy)"
+    print(line)
+    return throughput
+
+
+async def run_async(limiter, requests: int, concurrency: int) -> float:
+    """Run allow_request_async from concurrent callers and return elapsed seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            await limiter.allow_request_async(f"bench-{i % 100}", ip_address="203.0.113.1")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return time.perf_counter() - start
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TokenBucketRateLimiter")
+    parser.add_argument("--redis-url", default=None,
+                        help="Redis URL (defaults to the REDIS_URL setting)")
+    parser.add_argument("--requests", type=int, default=5000,
+                        help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=50,
+                        help="Concurrent callers for the async scenario")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        os.environ["REDIS_URL"] = args.redis_url
+
+    from src.core.rate_limiting import TokenBucketRateLimiter
+
+    limiter = TokenBucketRateLimiter(prefix="ratelimit:bench:")
+    # Keep every request under the limit so all scenarios do the same work
+    limiter.default_limits["default"].update(tokens_per_interval=10 ** 9, burst_limit=10 ** 9)
+
+    start = time.perf_counter()
+    for i in range(args.requests):
+        legacy_allow_request(limiter, f"bench-{i % 100}", "203.0.113.1")
+    legacy = report("legacy", args.requests, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(args.requests):
+        limiter.allow_request(f"bench-{i % 100}", ip_address="203.0.113.1")
+    report("script", args.requests, time.perf_counter() - start, legacy)
+
+    elapsed = asyncio.run(run_async(limiter, args.requests, args.concurrency))
+    report("async", args.requests, elapsed, legacy)
+
+
+if __name__ == "__main__":
+    main()
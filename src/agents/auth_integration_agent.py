@@ -1,6 +1,5 @@
 from typing import Dict, Any, List, Optional, Tuple, Union
 from loguru import logger
-import requests
 import json
 import time
 import os
@@ -14,6 +13,7 @@ from threading import Thread, Event
 
 from src.agents.base_agent import BaseAgent
 from src.core.database import get_db
+from src.core.http_client import http_client
 from src.core.security import encrypt_sensitive_data, decrypt_sensitive_data
 # Import all models through the package to ensure all models are loaded
 import src.models
@@ -394,7 +394,7 @@ class AuthIntegrationAgent(BaseAgent):
         
         try:
             # Make the token request
-            response = requests.post(
+            response = http_client.post(
                 config["token_uri"],
                 headers=headers,
                 data=token_request_params
@@ -439,7 +439,7 @@ class AuthIntegrationAgent(BaseAgent):
         
         try:
             # Make request to user info endpoint
-            response = requests.get(
+            response = http_client.get(
                 config["user_info_endpoint"],
                 headers=headers
             )
@@ -643,7 +643,7 @@ class AuthIntegrationAgent(BaseAgent):
                 return {"valid": False, "message": "Missing access token"}
             
             try:
-                response = requests.get(
+                response = http_client.get(
                     f"https://graph.facebook.com/v18.0/me",
                     params={"access_token": credentials["access_token"]}
                 )
@@ -680,7 +680,7 @@ class AuthIntegrationAgent(BaseAgent):
                     "Authorization": f"Bearer {credentials['access_token']}"
                 }
                 
-                response = requests.get(
+                response = http_client.get(
                     "https://api.twitter.com/2/users/me",
                     headers=headers
                 )
@@ -716,7 +716,7 @@ class AuthIntegrationAgent(BaseAgent):
                     "X-Restli-Protocol-Version": "2.0.0"
                 }
                 
-                response = requests.get(
+                response = http_client.get(
                     "https://api.linkedin.com/v2/me",
                     headers=headers
                 )
@@ -770,7 +770,7 @@ class AuthIntegrationAgent(BaseAgent):
                 if not api_url.endswith("wp-json/"):
                     api_url += "wp-json/"
                 
-                response = requests.get(
+                response = http_client.get(
                     f"{api_url}wp/v2/users/me",
                     headers=headers
                 )
@@ -814,7 +814,7 @@ class AuthIntegrationAgent(BaseAgent):
                 if shop_url.endswith("/"):
                     shop_url = shop_url[:-1]
                 
-                response = requests.get(
+                response = http_client.get(
                     f"{shop_url}/admin/api/2023-10/shop.json",
                     headers=headers
                 )
@@ -860,7 +860,7 @@ class AuthIntegrationAgent(BaseAgent):
                     "grant_type": "refresh_token"
                 }
                 
-                token_response = requests.post(
+                token_response = http_client.post(
                     "https://oauth2.googleapis.com/token",
                     data=refresh_params
                 )
@@ -882,7 +882,7 @@ class AuthIntegrationAgent(BaseAgent):
                 # This is a simplified version - real implementation would use Google Ads API client
                 customer_id = credentials.get("customer_id", "")
                 if customer_id:
-                    response = requests.get(
+                    response = http_client.get(
                         f"https://googleads.googleapis.com/v14/customers/{customer_id}/googleAds:search",
                         headers=headers,
                         params={"query": "SELECT customer.id FROM customer LIMIT 1"}
@@ -934,7 +934,7 @@ class AuthIntegrationAgent(BaseAgent):
                     if not ad_account_id.startswith("act_"):
                         ad_account_id = f"act_{ad_account_id}"
                     
-                    response = requests.get(
+                    response = http_client.get(
                         f"https://graph.facebook.com/v18.0/{ad_account_id}",
                         params=params
                     )
@@ -957,7 +957,7 @@ class AuthIntegrationAgent(BaseAgent):
                         }
                 else:
                     # If no specific ad account ID, check for ad accounts the user has access to
-                    response = requests.get(
+                    response = http_client.get(
                         "https://graph.facebook.com/v18.0/me/adaccounts",
                         params=params
                     )
@@ -1326,7 +1326,7 @@ class AuthIntegrationAgent(BaseAgent):
             
             try:
                 # Check rate limits and account status with Graph API
-                response = requests.get(
+                response = http_client.get(
                     "https://graph.facebook.com/v18.0/me/insights",
                     params={"access_token": credentials["access_token"]}
                 )
@@ -1370,7 +1370,7 @@ class AuthIntegrationAgent(BaseAgent):
                     "Authorization": f"Bearer {credentials['access_token']}"
                 }
                 
-                response = requests.get(
+                response = http_client.get(
                     "https://api.twitter.com/2/users/me",
                     headers=headers
                 )
@@ -1414,7 +1414,7 @@ class AuthIntegrationAgent(BaseAgent):
                     "X-Restli-Protocol-Version": "2.0.0"
                 }
                 
-                response = requests.get(
+                response = http_client.get(
                     "https://api.linkedin.com/v2/me",
                     headers=headers
                 )
@@ -1471,7 +1471,7 @@ class AuthIntegrationAgent(BaseAgent):
                     auth_header = b64encode(auth_str.encode()).decode()
                     headers["Authorization"] = f"Basic {auth_header}"
                 
-                response = requests.get(
+                response = http_client.get(
                     f"{api_url}",  # Root WP REST API endpoint
                     headers=headers
                 )
@@ -1516,7 +1516,7 @@ class AuthIntegrationAgent(BaseAgent):
                 if shop_url.endswith("/"):
                     shop_url = shop_url[:-1]
                 
-                response = requests.get(
+                response = http_client.get(
                     f"{shop_url}/admin/api/2023-10/shop.json",
                     headers=headers
                 )
@@ -1568,7 +1568,7 @@ class AuthIntegrationAgent(BaseAgent):
                     "grant_type": "refresh_token"
                 }
                 
-                token_response = requests.post(
+                token_response = http_client.post(
                     "https://oauth2.googleapis.com/token",
                     data=refresh_params
                 )
@@ -1590,7 +1590,7 @@ class AuthIntegrationAgent(BaseAgent):
                         "developer-token": credentials["developer_token"]
                     }
                     
-                    response = requests.get(
+                    response = http_client.get(
                         f"https://googleads.googleapis.com/v14/customers/{credentials['customer_id']}/googleAds:search",
                         headers=headers,
                         params={"query": "SELECT customer.id FROM customer LIMIT 1"}
@@ -1641,7 +1641,7 @@ class AuthIntegrationAgent(BaseAgent):
                     if not ad_account_id.startswith("act_"):
                         ad_account_id = f"act_{ad_account_id}"
                     
-                    response = requests.get(
+                    response = http_client.get(
                         f"https://graph.facebook.com/v18.0/{ad_account_id}",
                         params=params
                     )
@@ -1687,7 +1687,7 @@ class AuthIntegrationAgent(BaseAgent):
                         }
                 else:
                     # Check the user's permissions if no specific ad account
-                    response = requests.get(
+                    response = http_client.get(
                         "https://graph.facebook.com/v18.0/me/permissions",
                         params={"access_token": credentials["access_token"]}
                     )
@@ -2164,7 +2164,7 @@ class AuthIntegrationAgent(BaseAgent):
         
         try:
             # Make the token refresh request
-            response = requests.post(
+            response = http_client.post(
                 config["token_uri"],
                 headers=headers,
                 data=refresh_request_params
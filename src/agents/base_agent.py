@@ -1,6 +1,4 @@
 # Standard library imports
-import queue
-import threading
 import uuid
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Callable, Union
@@ -9,7 +7,7 @@ from typing import Dict, Any, List, Optional, Callable, Union
 from loguru import logger
 
 # Local imports
-from src.core.messaging import RabbitMQClient
+from src.core.messaging import RabbitMQClient, RabbitMQRpcClient
 from src.core.cache import RedisCache
 
 class BaseAgent(ABC):
@@ -25,9 +23,13 @@ class BaseAgent(ABC):
         self.mq_client = RabbitMQClient()
         self.cache = RedisCache()
         self.task_handlers = {}
+        # Per task type limits on concurrently running handlers
+        self.task_concurrency_limits: Dict[str, int] = {}
         self.is_running = False
         self.input_queue = f"{self.agent_id}_queue"
         self.event_handlers = {}
+        # Shared reply queue for send_task, started on the first request that waits
+        self.rpc_client = RabbitMQRpcClient(self.agent_id)
         self._initialize()
     
     def _initialize(self):
@@ -40,9 +42,23 @@ class BaseAgent(ABC):
         self.register_event_handler("heartbeat", self._handle_heartbeat)
         self.register_event_handler("shutdown", self._handle_shutdown)
     
-    def register_task_handler(self, task_type: str, handler: Callable[[Dict[str, Any]], Any]):
-        """Register a handler for a specific task type."""
+    def register_task_handler(
+        self,
+        task_type: str,
+        handler: Callable[[Dict[str, Any]], Any],
+        max_concurrency: Optional[int] = None
+    ):
+        """Register a handler for a specific task type.
+        
+        Args:
+            task_type: Task type the handler processes
+            handler: Callable receiving the task message
+            max_concurrency: Optional limit on concurrently running tasks of this
+                type when the agent is started with max_concurrency above 1
+        """
         self.task_handlers[task_type] = handler
+        if max_concurrency is not None:
+            self.task_concurrency_limits[task_type] = max_concurrency
         logger.debug(f"Registered handler for task type: {task_type}")
     
     def register_event_handler(self, event_type: str, handler: Callable[[Dict[str, Any]], Any]):
@@ -66,7 +82,13 @@ class BaseAgent(ABC):
         pass
     
     def handle_task(self, message: Dict[str, Any]):
-        """Handle an incoming task message."""
+        """Handle an incoming task message.
+        
+        Raises:
+            Exception: Whatever the handler raised, after the error reply has been
+                sent, so the consumer retries or dead-letters the message. Handlers
+                raise PoisonMessageError for input that can never succeed.
+        """
         try:
             task_type = message.get("task_type")
             task_id = message.get("task_id")
@@ -84,6 +106,7 @@ class BaseAgent(ABC):
             if response_queue and result is not None:
                 result["task_id"] = task_id
                 result["agent_id"] = self.agent_id
+                result["correlation_id"] = message.get("correlation_id")
                 self.mq_client.publish_direct(response_queue, result)
                 logger.debug(f"Sent result for task {task_id} to {response_queue}")
                 
@@ -96,11 +119,12 @@ class BaseAgent(ABC):
                 error_result = {
                     "task_id": message.get("task_id"),
                     "agent_id": self.agent_id,
+                    "correlation_id": message.get("correlation_id"),
                     "status": "error",
                     "error": str(e)
                 }
                 self.mq_client.publish_direct(response_queue, error_result)
-            return {"status": "error", "error": str(e)}
+            raise
     
     def handle_event(self, message: Dict[str, Any]):
         """Handle an incoming event message."""
@@ -135,15 +159,23 @@ class BaseAgent(ABC):
         self.stop()
         return {"status": "shutdown", "agent_id": self.agent_id}
     
-    def start(self):
-        """Start the agent and begin processing tasks."""
+    def start(self, prefetch_count: int = 1, max_concurrency: int = 1):
+        """Start the agent and begin processing tasks.
+        
+        Args:
+            prefetch_count: Number of messages the broker may deliver ahead
+            max_concurrency: Number of messages handled concurrently on a worker
+                pool; 1 processes them one at a time on the consuming thread
+        """
         if self.is_running:
             logger.warning(f"Agent {self.agent_id} is already running")
             return
         
         try:
-            # Declare input queue
+            # Declare the input queue, and the events exchange before handlers run on
+            # worker threads, where channel calls must be marshalled to the consume loop
             self.mq_client.declare_queue(self.input_queue)
+            self.mq_client.declare_exchange("events")
             logger.info(f"Agent {self.agent_id} ({self.name}) started")
             
             # Define message callback
@@ -157,7 +189,13 @@ class BaseAgent(ABC):
             
             # Start consuming
             self.is_running = True
-            self.mq_client.consume(self.input_queue, message_callback)
+            self.mq_client.consume(
+                self.input_queue,
+                message_callback,
+                prefetch_count=prefetch_count,
+                max_workers=max_concurrency,
+                concurrency_limits=self.task_concurrency_limits
+            )
         except Exception as e:
             logger.error(f"Error starting agent {self.agent_id}: {e}")
             self.is_running = False
@@ -169,70 +207,83 @@ class BaseAgent(ABC):
             return
         
         try:
-            # Close messaging connection
+            # Close messaging connections
+            self.rpc_client.close()
             self.mq_client.close()
             logger.info(f"Agent {self.agent_id} ({self.name}) stopped")
             self.is_running = False
         except Exception as e:
             logger.error(f"Error stopping agent {self.agent_id}: {e}")
     
-    def send_task(self, target_agent_id: str, task: Dict[str, Any], wait_for_response: bool = False) -> Optional[Dict[str, Any]]:
+    def send_task(
+        self,
+        target_agent_id: str,
+        task: Dict[str, Any],
+        wait_for_response: bool = False,
+        timeout: float = 30.0
+    ) -> Optional[Dict[str, Any]]:
         """Send a task to another agent.
         
         Args:
             target_agent_id: ID of the target agent
             task: Task details
             wait_for_response: Whether to wait for a response
+            timeout: Seconds to wait for the response
             
         Returns:
             Task result if wait_for_response is True, None otherwise
         """
         try:
-            # Generate task ID if not provided
-            if "task_id" not in task:
-                task["task_id"] = str(uuid.uuid4())
-            
-            # Set sender information
-            task["sender_agent_id"] = self.agent_id
+            self._prepare_task(task)
+            target_queue = f"{target_agent_id}_queue"
             
-            # Create response queue if waiting for response
             if wait_for_response:
-                response_queue = f"response_{self.agent_id}_{uuid.uuid4()}"
-                self.mq_client.declare_queue(response_queue)
-                task["response_queue"] = response_queue
-                
-                # Send task
-                target_queue = f"{target_agent_id}_queue"
-                self.mq_client.publish_direct(target_queue, task)
-                
-                result_queue = queue.Queue()
-                
-                def response_callback(message):
-                    result_queue.put(message)
-                
-                # Start consuming from response queue
-                threading.Thread(
-                    target=self.mq_client.consume,
-                    args=(response_queue, response_callback),
-                    daemon=True
-                ).start()
-                
-                # Wait for response with timeout (30 seconds)
+                # Replies arrive on this agent's shared reply queue, matched by correlation ID
                 try:
-                    result = result_queue.get(timeout=30)
-                    return result
-                except queue.Empty:
+                    return self.rpc_client.call(target_queue, task, timeout=timeout)
+                except TimeoutError:
                     logger.warning(f"Timeout waiting for response from {target_agent_id}")
                     return {"status": "timeout", "error": "No response received"}
             else:
                 # Send task without waiting for response
-                target_queue = f"{target_agent_id}_queue"
                 self.mq_client.publish_direct(target_queue, task)
                 return None
         except Exception as e:
             logger.error(f"Error sending task to {target_agent_id}: {e}")
             return {"status": "error", "error": str(e)}
     
+    async def send_task_async(
+        self,
+        target_agent_id: str,
+        task: Dict[str, Any],
+        timeout: float = 30.0
+    ) -> Dict[str, Any]:
+        """Send a task to another agent and await its response.
+        
+        Args:
+            target_agent_id: ID of the target agent
+            task: Task details
+            timeout: Seconds to wait for the response
+            
+        Returns:
+            Task result, or a status dict on timeout or error
+        """
+        try:
+            self._prepare_task(task)
+            return await self.rpc_client.call_async(f"{target_agent_id}_queue", task, timeout=timeout)
+        except TimeoutError:
+            logger.warning(f"Timeout waiting for response from {target_agent_id}")
+            return {"status": "timeout", "error": "No response received"}
+        except Exception as e:
+            logger.error(f"Error sending task to {target_agent_id}: {e}")
+            return {"status": "error", "error": str(e)}
+    
+    def _prepare_task(self, task: Dict[str, Any]) -> None:
+        """Set the task ID if not provided and the sender information."""
+        if "task_id" not in task:
+            task["task_id"] = str(uuid.uuid4())
+        task["sender_agent_id"] = self.agent_id
+    
     def broadcast_event(self, event: Dict[str, Any]):
         """Broadcast an event to all agents.
         
@@ -247,7 +298,8 @@ class BaseAgent(ABC):
             # Set sender information
             event["sender_agent_id"] = self.agent_id
             
-            # Broadcast to events exchange
+            # Broadcast to events exchange; declared in start(), so from a running agent
+            # this reaches the broker only through the thread-safe publish path
             self.mq_client.declare_exchange("events")
             self.mq_client.publish("events", "broadcast", event)
             logger.debug(f"Broadcasted event: {event['event_id']} of type: {event.get('event_type')}")
@@ -14,6 +14,7 @@ from io import BytesIO
 
 from src.agents.base_agent import BaseAgent
 from src.core.database import get_db
+from src.core.http_client import http_client
 from src.core.security import create_audit_log
 from src.models.project import Brand, Project, ProjectType
 from src.models.system import AuditLog, User
@@ -212,7 +213,7 @@ class BrandProjectManagementAgent(BaseAgent):
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, "html.parser")
@@ -1303,7 +1304,7 @@ class BrandProjectManagementAgent(BaseAgent):
                 # Send alerts if configured
                 if hasattr(self, "webhook_urls") and "alerts" in self.webhook_urls:
                     try:
-                        requests.post(
+                        http_client.post(
                             self.webhook_urls["alerts"],
                             json={
                                 "event": "health_check_failed",
@@ -1332,7 +1333,7 @@ class BrandProjectManagementAgent(BaseAgent):
         
         try:
             # Validate URL
-            response = requests.head(url, timeout=5)
+            response = http_client.head(url, timeout=5)
             response.raise_for_status()
             
             # Store webhook
@@ -1408,7 +1409,7 @@ class BrandProjectManagementAgent(BaseAgent):
             # Send notification using webhooks if configured
             if hasattr(self, "webhook_urls") and "user_notifications" in self.webhook_urls:
                 try:
-                    requests.post(
+                    http_client.post(
                         self.webhook_urls["user_notifications"],
                         json={
                             "event": "user_created",
@@ -1454,7 +1455,7 @@ class BrandProjectManagementAgent(BaseAgent):
                         project_name = project.name if project else "Unknown"
                         brand_name = brand.name if brand else "Unknown"
                     
-                    requests.post(
+                    http_client.post(
                         self.webhook_urls["content_notifications"],
                         json={
                             "event": "content_published",
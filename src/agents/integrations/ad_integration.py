@@ -8,7 +8,6 @@ performance tracking.
 import os
 import json
 import logging
-import requests
 import random
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -42,6 +41,17 @@ class AdPlatformIntegration(Integration):
         """
         raise NotImplementedError("Subclasses must implement create_campaign")
     
+    async def create_campaign_async(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a campaign without blocking the event loop.
+        
+        Args:
+            campaign_data: Campaign configuration data
+            
+        Returns:
+            Dict containing the campaign creation result
+        """
+        return await self.run_blocking(self.create_campaign, campaign_data)
+    
     def update_campaign(self, campaign_id: str, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing advertising campaign.
         
@@ -169,7 +179,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
             if "end_time" in campaign_data:
                 data["end_time"] = campaign_data["end_time"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{self.account_id}/campaigns",
                 params=params,
                 json=data
@@ -223,7 +233,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
                 if field in campaign_data:
                     data[field] = campaign_data[field]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{campaign_id}",
                 params=params,
                 json=data
@@ -264,7 +274,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
                 "fields": "id,name,objective,status,daily_budget,lifetime_budget,start_time,end_time,created_time,updated_time"
             }
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/{campaign_id}",
                 params=params
             )
@@ -316,7 +326,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
                 "time_range": json.dumps({"since": since, "until": until})
             }
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/{campaign_id}/insights",
                 params=params
             )
@@ -385,7 +395,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
                 "status": "PAUSED"
             }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{campaign_id}",
                 params=params,
                 json=data
@@ -429,7 +439,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
                 "status": "ACTIVE"
             }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{campaign_id}",
                 params=params,
                 json=data
@@ -474,7 +484,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
                 "status": "ARCHIVED"
             }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{campaign_id}",
                 params=params,
                 json=data
@@ -518,7 +528,7 @@ class FacebookAdsIntegration(AdPlatformIntegration):
             }
             
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/{self.account_id}",
                 params=params
             )
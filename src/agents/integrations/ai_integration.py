@@ -11,7 +11,7 @@ import json
 import hashlib
 import yaml
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable, Awaitable
+from typing import Dict, Any, List, Optional, Union, Callable, Awaitable, AsyncIterator
 from functools import wraps
 import tiktoken
 import anthropic
@@ -20,7 +20,9 @@ from openai import AsyncOpenAI
 from anthropic import AsyncAnthropic
 from loguru import logger
 
-from src.core.cache import cache
+from src.agents.integrations.ai_scheduler import AIRequestScheduler, RequestPriority
+from src.core.cache import async_cache
+from src.core.http_client import async_http_client
 from src.core.logging import log_api_usage
 from src.core.settings import settings
 
@@ -152,42 +154,6 @@ async def update_token_counters(provider: str, tokens: int) -> None:
             counter['tokens'] += tokens
 
 
-async def check_rate_limits(provider: str, tokens: int) -> bool:
-    """Check if a request would exceed rate limits.
-    
-    Args:
-        provider: AI provider (openai, anthropic)
-        tokens: Number of tokens for this request
-        
-    Returns:
-        True if request is allowed, False if it would exceed rate limits
-    """
-    async with TOKEN_COUNTER_LOCK:
-        current_time = time.time()
-        
-        # Get provider config
-        provider_config = ai_config.get(provider, {})
-        rate_limits = provider_config.get('rate_limits', {})
-        
-        # Check tokens per minute
-        tokens_per_minute = rate_limits.get('tokens_per_minute', float('inf'))
-        minute_counter = TOKEN_COUNTERS[provider]['minute']
-        
-        # Reset counter if period has elapsed
-        if current_time > minute_counter['reset_time']:
-            minute_counter['tokens'] = 0
-            minute_counter['reset_time'] = current_time + 60
-        
-        # Check if this request would exceed the limit
-        if minute_counter['tokens'] + tokens > tokens_per_minute:
-            return False
-        
-        # For now, we only check the minute rate limit
-        # Additional period checks could be added here
-        
-        return True
-
-
 class AIClient:
     """Unified client for AI services with caching, rate limiting and cost tracking."""
     
@@ -196,7 +162,11 @@ class AIClient:
         # OpenAI client
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         if self.openai_api_key:
-            self.openai_async_client = AsyncOpenAI(api_key=self.openai_api_key)
+            self.openai_async_client = AsyncOpenAI(
+                api_key=self.openai_api_key,
+                http_client=async_http_client.httpx_client(),
+                timeout=async_http_client.httpx_timeout_for("https://api.openai.com", settings.AI_REQUEST_TIMEOUT)
+            )
             logger.info("OpenAI client initialized")
         else:
             self.openai_async_client = None
@@ -205,7 +175,11 @@ class AIClient:
         # Anthropic client
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         if self.anthropic_api_key:
-            self.anthropic_async_client = AsyncAnthropic(api_key=self.anthropic_api_key)
+            self.anthropic_async_client = AsyncAnthropic(
+                api_key=self.anthropic_api_key,
+                http_client=async_http_client.httpx_client(),
+                timeout=async_http_client.httpx_timeout_for("https://api.anthropic.com", settings.AI_REQUEST_TIMEOUT)
+            )
             logger.info("Anthropic client initialized")
         else:
             self.anthropic_async_client = None
@@ -222,6 +196,9 @@ class AIClient:
         # Initialize cache TTL from environment or settings
         self.cache_ttl = int(os.getenv("MODEL_CACHE_TTL", 3600))
         
+        # Per-provider and per-model request and token buckets with queued admission
+        self.scheduler = AIRequestScheduler(ai_config)
+        
         # Initialize adaptive rate limiting
         self.adaptive_rate_limiting_enabled = True
         self.adaptive_rate_limiting_window = 300  # 5 minutes
@@ -243,6 +220,10 @@ class AIClient:
         retry_delay: float = 1.0,
         agent_type: Optional[str] = None,
         task_id: Optional[str] = None,
+        priority: Union[RequestPriority, str] = RequestPriority.INTERACTIVE,
+        brand_id: Optional[str] = None,
+        bypass_queue: bool = False,
+        max_queue_wait: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get a text completion from an AI provider.
         
@@ -259,9 +240,19 @@ class AIClient:
             cache_ttl: Cache TTL in seconds (if None, uses default)
             retry_count: Number of retries on failure
             retry_delay: Delay between retries in seconds
+            agent_type: Calling agent type, for usage logging
+            task_id: Task ID, for usage logging
+            priority: Scheduling lane; interactive requests are admitted ahead of batch work
+            brand_id: Brand the request is made for, so brands share capacity fairly
+            bypass_queue: Admit immediately, borrowing from future capacity (urgent requests)
+            max_queue_wait: Longest wait for rate limit capacity in seconds
             
         Returns:
             Response containing the generated text and usage statistics
+            
+        Raises:
+            AIRateLimitExceeded: If no capacity became available within max_queue_wait
+            AIRequestError: If the request fails
         """
         # Check if model/provider is available
         if provider.lower() == 'openai' and self.openai_async_client is None:
@@ -308,8 +299,8 @@ class AIClient:
                     cost=cost,
                     endpoint="completion",
                     cached=True,
-                    agent_type=kwargs.get('agent_type'),
-                    task_id=kwargs.get('task_id')
+                    agent_type=agent_type,
+                    task_id=task_id
                 )
                 
                 return cached_response
@@ -317,108 +308,293 @@ class AIClient:
         # Count input tokens
         input_tokens = count_tokens(prompt, model)
         
-        # Check rate limits
-        rate_limit_allowed = await check_rate_limits(provider, input_tokens + max_tokens)
-        if not rate_limit_allowed:
-            raise AIRateLimitExceeded(f"Rate limit exceeded for {provider}")
+        # Wait for room in the provider and model buckets; bursts queue instead of failing
+        try:
+            admission = await self.scheduler.acquire(
+                provider.lower(),
+                model,
+                input_tokens + max_tokens,
+                priority=RequestPriority(priority),
+                brand_id=brand_id,
+                bypass_queue=bypass_queue,
+                timeout=max_queue_wait
+            )
+        except asyncio.TimeoutError:
+            raise AIRateLimitExceeded(f"Rate limit exceeded for {provider}: no capacity within the queue timeout")
         
         # Make the API request with retries
         start_time = time.time()
-        for attempt in range(retry_count):
-            try:
-                if provider.lower() == 'openai':
-                    response = await self._get_openai_completion(
-                        model=model,
-                        prompt=prompt,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        top_p=top_p,
-                        frequency_penalty=frequency_penalty,
-                        presence_penalty=presence_penalty
+        settled = False
+        try:
+            for attempt in range(retry_count):
+                try:
+                    if provider.lower() == 'openai':
+                        response = await self._get_openai_completion(
+                            model=model,
+                            prompt=prompt,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            top_p=top_p,
+                            frequency_penalty=frequency_penalty,
+                            presence_penalty=presence_penalty
+                        )
+                    elif provider.lower() == 'anthropic':
+                        response = await self._get_anthropic_completion(
+                            model=model,
+                            prompt=prompt,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            top_p=top_p
+                        )
+                    else:
+                        raise AIRequestError(f"Unsupported provider: {provider}")
+                    
+                    # Calculate request duration
+                    duration_ms = round((time.time() - start_time) * 1000, 2)
+                    
+                    # Update token usage for rate limiting
+                    output_tokens = response.get('usage', {}).get('completion_tokens',
+                        count_tokens(response.get('text', ''), model))
+                    total_tokens = input_tokens + output_tokens
+                    await update_token_counters(provider, total_tokens)
+                    self.scheduler.settle(admission, total_tokens)
+                    settled = True
+                    
+                    # Update request history for adaptive rate limiting
+                    REQUEST_HISTORY[provider].append({
+                        'timestamp': time.time(),
+                        'success': True,
+                        'tokens': total_tokens
+                    })
+                    
+                    # Trim history to keep only records from the adaptive window
+                    self._trim_request_history(provider)
+                    
+                    # Cache the response
+                    if cache and settings.ENABLE_MODEL_CACHING:
+                        ttl = cache_ttl or self.cache_ttl
+                        await self._save_to_cache(cache_key, response, ttl)
+                    
+                    # Log API usage
+                    model_config = self.model_configs.get(model, {})
+                    cost = self._calculate_cost(
+                        model_config, 
+                        input_tokens, 
+                        output_tokens
                     )
-                elif provider.lower() == 'anthropic':
-                    response = await self._get_anthropic_completion(
+                    
+                    from src.core.logging import log_api_usage_sync
+                    
+                    log_api_usage_sync(
+                        provider=provider,
                         model=model,
-                        prompt=prompt,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        top_p=top_p
+                        tokens_in=input_tokens,
+                        tokens_out=output_tokens,
+                        duration_ms=duration_ms,
+                        cost=cost,
+                        endpoint="completion",
+                        cached=False,
+                        success=True,
+                        agent_type=agent_type,
+                        task_id=task_id
                     )
-                else:
-                    raise AIRequestError(f"Unsupported provider: {provider}")
-                
-                # Calculate request duration
-                duration_ms = round((time.time() - start_time) * 1000, 2)
-                
-                # Update token usage for rate limiting
-                output_tokens = response.get('usage', {}).get('completion_tokens',
-                    count_tokens(response.get('text', ''), model))
-                total_tokens = input_tokens + output_tokens
-                await update_token_counters(provider, total_tokens)
-                
-                # Update request history for adaptive rate limiting
-                REQUEST_HISTORY[provider].append({
-                    'timestamp': time.time(),
-                    'success': True,
-                    'tokens': total_tokens
-                })
-                
-                # Trim history to keep only records from the adaptive window
-                self._trim_request_history(provider)
-                
-                # Cache the response
-                if cache and settings.ENABLE_MODEL_CACHING:
-                    ttl = cache_ttl or self.cache_ttl
-                    await self._save_to_cache(cache_key, response, ttl)
-                
-                # Log API usage
-                model_config = self.model_configs.get(model, {})
-                cost = self._calculate_cost(
-                    model_config, 
-                    input_tokens, 
-                    output_tokens
-                )
-                
-                from src.core.logging import log_api_usage_sync
-                
-                log_api_usage_sync(
-                    provider=provider,
-                    model=model,
-                    tokens_in=input_tokens,
-                    tokens_out=output_tokens,
-                    duration_ms=duration_ms,
-                    cost=cost,
-                    endpoint="completion",
-                    cached=False,
-                    success=True,
-                    agent_type=kwargs.get('agent_type'),
-                    task_id=kwargs.get('task_id')
-                )
-                
-                return response
-                
-            except Exception as e:
-                # Update request history with failure
-                REQUEST_HISTORY[provider].append({
-                    'timestamp': time.time(),
-                    'success': False,
-                    'error': str(e)
-                })
-                
-                # Trim history to keep only records from the adaptive window
-                self._trim_request_history(provider)
-                
-                # Adjust rate limits based on error rate if adaptive rate limiting is enabled
-                if self.adaptive_rate_limiting_enabled:
-                    await self._adjust_rate_limits(provider)
-                
-                # Last attempt, re-raise the exception
-                if attempt == retry_count - 1:
-                    logger.error(f"AI request failed after {retry_count} attempts: {str(e)}")
-                    raise AIRequestError(f"Failed to get completion from {provider}: {str(e)}")
-                
-                # Wait before retrying
-                await asyncio.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+                    
+                    return response
+                    
+                except Exception as e:
+                    # Update request history with failure
+                    REQUEST_HISTORY[provider].append({
+                        'timestamp': time.time(),
+                        'success': False,
+                        'error': str(e)
+                    })
+                    
+                    # Trim history to keep only records from the adaptive window
+                    self._trim_request_history(provider)
+                    
+                    # Adjust rate limits based on error rate if adaptive rate limiting is enabled
+                    if self.adaptive_rate_limiting_enabled:
+                        await self._adjust_rate_limits(provider)
+                    
+                    # Last attempt, re-raise the exception
+                    if attempt == retry_count - 1:
+                        logger.error(f"AI request failed after {retry_count} attempts: {str(e)}")
+                        raise AIRequestError(f"Failed to get completion from {provider}: {str(e)}")
+                    
+                    # Wait before retrying
+                    await asyncio.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+        finally:
+            # Failed, or abandoned by the caller at any await (e.g. a losing hedged request
+            # or during the backoff); return the unused reservation
+            if not settled:
+                self.scheduler.settle(admission, input_tokens)
+    
+    async def stream_text_completion(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        cache: bool = True,
+        cache_ttl: Optional[int] = None,
+        retry_count: int = 3,
+        retry_delay: float = 1.0,
+        agent_type: Optional[str] = None,
+        task_id: Optional[str] = None,
+        priority: Union[RequestPriority, str] = RequestPriority.INTERACTIVE,
+        brand_id: Optional[str] = None,
+        bypass_queue: bool = False,
+        max_queue_wait: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a text completion from an AI provider as it is generated.
+        
+        Takes the same arguments as get_text_completion. Yields
+        ``{"type": "token", "text": ...}`` events as chunks arrive, then one
+        ``{"type": "done", "response": ...}`` event whose response has the same
+        shape as a get_text_completion result. A cached response is yielded as a
+        single token event. Failures are retried only until the first chunk has
+        been yielded.
+        
+        Raises:
+            AIRateLimitExceeded: If no capacity became available within max_queue_wait
+            AIRequestError: If the request fails
+        """
+        if provider.lower() == 'openai' and self.openai_async_client is None:
+            raise AIRequestError("OpenAI client not initialized. Check API key.")
+        if provider.lower() == 'anthropic' and self.anthropic_async_client is None:
+            raise AIRequestError("Anthropic client not initialized. Check API key.")
+        
+        cache_key = generate_cache_key(
+            provider=provider,
+            model=model,
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty
+        )
+        
+        if cache and settings.ENABLE_MODEL_CACHING:
+            cached_response = await self._get_from_cache(cache_key)
+            if cached_response:
+                yield {"type": "token", "text": cached_response['text']}
+                yield {"type": "done", "response": cached_response}
+                return
+        
+        input_tokens = count_tokens(prompt, model)
+        
+        try:
+            admission = await self.scheduler.acquire(
+                provider.lower(),
+                model,
+                input_tokens + max_tokens,
+                priority=RequestPriority(priority),
+                brand_id=brand_id,
+                bypass_queue=bypass_queue,
+                timeout=max_queue_wait
+            )
+        except asyncio.TimeoutError:
+            raise AIRateLimitExceeded(f"Rate limit exceeded for {provider}: no capacity within the queue timeout")
+        
+        start_time = time.time()
+        response = None
+        chunks: List[str] = []
+        settled = False
+        try:
+            for attempt in range(retry_count):
+                chunks = []
+                try:
+                    if provider.lower() == 'openai':
+                        stream = self._stream_openai_completion(
+                            model=model,
+                            prompt=prompt,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            top_p=top_p,
+                            frequency_penalty=frequency_penalty,
+                            presence_penalty=presence_penalty
+                        )
+                    elif provider.lower() == 'anthropic':
+                        stream = self._stream_anthropic_completion(
+                            model=model,
+                            prompt=prompt,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            top_p=top_p
+                        )
+                    else:
+                        raise AIRequestError(f"Unsupported provider: {provider}")
+                    
+                    async for event in stream:
+                        if event["type"] == "token":
+                            chunks.append(event["text"])
+                            yield event
+                        else:
+                            response = event["response"]
+                    break
+                    
+                except Exception as e:
+                    REQUEST_HISTORY[provider].append({
+                        'timestamp': time.time(),
+                        'success': False,
+                        'error': str(e)
+                    })
+                    self._trim_request_history(provider)
+                    if self.adaptive_rate_limiting_enabled:
+                        await self._adjust_rate_limits(provider)
+                    
+                    # Text already sent to the caller cannot be taken back, so only retry before it
+                    if chunks or attempt == retry_count - 1:
+                        logger.error(f"AI streaming request failed after {attempt + 1} attempts: {str(e)}")
+                        raise AIRequestError(f"Failed to stream completion from {provider}: {str(e)}")
+                    
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+            
+            duration_ms = round((time.time() - start_time) * 1000, 2)
+            
+            output_tokens = response.get('usage', {}).get('completion_tokens') or count_tokens(response['text'], model)
+            total_tokens = input_tokens + output_tokens
+            await update_token_counters(provider, total_tokens)
+            self.scheduler.settle(admission, total_tokens)
+            settled = True
+        finally:
+            # Failed, or cancelled or closed by the consumer at any await (including the
+            # backoff); settle for the prompt and whatever text was already sent
+            if not settled:
+                self.scheduler.settle(admission, input_tokens + count_tokens(''.join(chunks), model))
+        
+        REQUEST_HISTORY[provider].append({
+            'timestamp': time.time(),
+            'success': True,
+            'tokens': total_tokens
+        })
+        self._trim_request_history(provider)
+        
+        if cache and settings.ENABLE_MODEL_CACHING:
+            await self._save_to_cache(cache_key, response, cache_ttl or self.cache_ttl)
+        
+        from src.core.logging import log_api_usage_sync
+        
+        log_api_usage_sync(
+            provider=provider,
+            model=model,
+            tokens_in=input_tokens,
+            tokens_out=output_tokens,
+            duration_ms=duration_ms,
+            cost=self._calculate_cost(self.model_configs.get(model, {}), input_tokens, output_tokens),
+            endpoint="completion_stream",
+            cached=False,
+            success=True,
+            agent_type=agent_type,
+            task_id=task_id
+        )
+        
+        yield {"type": "done", "response": response}
     
     async def _get_openai_completion(
         self,
@@ -554,6 +730,129 @@ class AIClient:
             logger.error(f"Anthropic API error: {str(e)}")
             raise AIRequestError(f"Anthropic API error: {str(e)}")
     
+    async def _stream_openai_completion(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a completion from OpenAI as token events followed by a done event.
+        
+        Args:
+            model: OpenAI model name
+            prompt: The prompt text
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+            frequency_penalty: Frequency penalty
+            presence_penalty: Presence penalty
+        """
+        chat = 'gpt' in model.lower()
+        params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "frequency_penalty": frequency_penalty,
+            "presence_penalty": presence_penalty,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+        try:
+            if chat:
+                stream = await self.openai_async_client.chat.completions.create(
+                    messages=[{"role": "user", "content": prompt}], **params
+                )
+            else:
+                # Legacy completions API
+                stream = await self.openai_async_client.completions.create(prompt=prompt, **params)
+            
+            chunks: List[str] = []
+            usage = None
+            async for chunk in stream:
+                # The final chunk carries usage and no choices
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content if chat else chunk.choices[0].text
+                if text:
+                    chunks.append(text)
+                    yield {"type": "token", "text": text}
+        except Exception as e:
+            logger.error(f"OpenAI API error: {str(e)}")
+            raise AIRequestError(f"OpenAI API error: {str(e)}")
+        
+        text = ''.join(chunks)
+        prompt_tokens = usage.prompt_tokens if usage else count_tokens(prompt, model)
+        completion_tokens = usage.completion_tokens if usage else count_tokens(text, model)
+        yield {
+            "type": "done",
+            "response": {
+                'text': text,
+                'provider': 'openai',
+                'model': model,
+                'usage': {
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': completion_tokens,
+                    'total_tokens': prompt_tokens + completion_tokens
+                }
+            }
+        }
+    
+    async def _stream_anthropic_completion(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        top_p: float = 1.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a completion from Anthropic as token events followed by a done event.
+        
+        Args:
+            model: Anthropic model name
+            prompt: The prompt text
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Nucleus sampling parameter
+        """
+        try:
+            async with self.anthropic_async_client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield {"type": "token", "text": text}
+                message = await stream.get_final_message()
+        except Exception as e:
+            logger.error(f"Anthropic API error: {str(e)}")
+            raise AIRequestError(f"Anthropic API error: {str(e)}")
+        
+        text = ''.join(block.text for block in message.content if getattr(block, 'type', 'text') == 'text')
+        input_tokens = message.usage.input_tokens
+        output_tokens = message.usage.output_tokens
+        yield {
+            "type": "done",
+            "response": {
+                'text': text,
+                'provider': 'anthropic',
+                'model': model,
+                'usage': {
+                    'prompt_tokens': input_tokens,
+                    'completion_tokens': output_tokens,
+                    'total_tokens': input_tokens + output_tokens
+                }
+            }
+        }
+    
     async def _get_from_cache(self, key: str) -> Optional[Dict[str, Any]]:
         """Get a response from cache.
         
@@ -564,7 +863,7 @@ class AIClient:
             Cached response or None if not found
         """
         try:
-            value = cache.get(key)
+            value = await async_cache.get(key)
             return value
         except Exception as e:
             logger.warning(f"Error getting from cache: {str(e)}")
@@ -579,7 +878,7 @@ class AIClient:
             ttl: Time to live in seconds
         """
         try:
-            cache.set(key, value, expire=ttl)
+            await async_cache.set(key, value, expire=ttl)
         except Exception as e:
             logger.warning(f"Error saving to cache: {str(e)}")
     
@@ -642,27 +941,25 @@ class AIClient:
         
         error_rate = failed_requests / total_requests
         
-        # Get current rate limits
-        async with TOKEN_COUNTER_LOCK:
-            provider_config = ai_config.get(provider, {})
-            rate_limits = provider_config.get('rate_limits', {})
-            current_limit = rate_limits.get('tokens_per_minute', float('inf'))
+        current_limit = self.scheduler.token_rate(provider)
+        if current_limit == float('inf'):
+            return
+        
+        # Adjust limits based on error rate
+        if error_rate > self.max_error_rate:
+            # Too many errors, reduce rate limit by 20%
+            new_limit = int(current_limit * 0.8)
+            logger.warning(f"Reducing {provider} rate limit to {new_limit} tokens/minute due to high error rate ({error_rate:.2%})")
+            self.scheduler.set_token_rate(provider, new_limit)
+        elif error_rate < self.max_error_rate / 2 and failed_requests == 0:
+            # Very few errors, can increase rate limit by 10% up to original
+            original_limit = self.scheduler.configured_token_rates.get(provider, float('inf'))
+            new_limit = min(int(current_limit * 1.1), original_limit)
             
-            # Adjust limits based on error rate
-            if error_rate > self.max_error_rate:
-                # Too many errors, reduce rate limit by 20%
-                new_limit = int(current_limit * 0.8)
-                logger.warning(f"Reducing {provider} rate limit to {new_limit} tokens/minute due to high error rate ({error_rate:.2%})")
-                rate_limits['tokens_per_minute'] = new_limit
-            elif error_rate < self.max_error_rate / 2 and failed_requests == 0:
-                # Very few errors, can increase rate limit by 10% up to original
-                original_limit = ai_config.get(provider, {}).get('rate_limits', {}).get('tokens_per_minute', float('inf'))
-                new_limit = min(int(current_limit * 1.1), original_limit)
-                
-                if new_limit > current_limit:
-                    logger.info(f"Increasing {provider} rate limit to {new_limit} tokens/minute due to low error rate ({error_rate:.2%})")
-                    rate_limits['tokens_per_minute'] = new_limit
+            if new_limit > current_limit:
+                logger.info(f"Increasing {provider} rate limit to {new_limit} tokens/minute due to low error rate ({error_rate:.2%})")
+                self.scheduler.set_token_rate(provider, new_limit)
 
 
 # Create a singleton instance
-ai_client = AIClient()
\ No newline at end of file
+ai_client = AIClient()
@@ -0,0 +1,155 @@
+"""
+AI Latency Tracking
+
+This module keeps a rolling window of recent call latencies and outcomes for
+every provider/model pair. The provider manager uses the percentiles and
+error rates to prefer models that are currently fast and healthy, and to
+decide how long to wait before hedging a slow request with a second provider.
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.core.settings import settings
+
+
+@dataclass
+class LatencyStats:
+    """Latency percentiles (seconds) and error rate over a model's recent calls."""
+    samples: int
+    p50: float
+    p95: float
+    p99: float
+    error_rate: float
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LatencyTracker:
+    """Rolling per-provider/model latency and error tracker.
+
+    Each model keeps at most ``window_size`` calls from the last
+    ``window_seconds``. Latencies of failed calls are not counted in the
+    percentiles, since a fast failure says nothing about how long a
+    successful call takes. Calls abandoned while slow count as lower bounds
+    on latency but are left out of the error rate, since they never
+    finished. Statistics are only reported once a model has ``min_samples``
+    calls in its window, so routing ignores cold models.
+    """
+
+    def __init__(self,
+                 window_seconds: Optional[float] = None,
+                 window_size: Optional[int] = None,
+                 min_samples: Optional[int] = None):
+        self.window_seconds = window_seconds if window_seconds is not None else settings.AI_LATENCY_WINDOW_SECONDS
+        self.window_size = window_size if window_size is not None else settings.AI_LATENCY_WINDOW_SIZE
+        self.min_samples = min_samples if min_samples is not None else settings.AI_LATENCY_MIN_SAMPLES
+        # (provider, model) -> deque of (timestamp, latency seconds, success); success is
+        # None for a lower bound
+        self._calls: Dict[Tuple[str, str], Deque[Tuple[float, float, Optional[bool]]]] = {}
+
+    def record(self, provider: str, model: str, latency: float, success: bool) -> None:
+        """Record one completed call.
+
+        Args:
+            provider: AI provider
+            model: Model name
+            latency: Wall-clock duration of the call in seconds
+            success: Whether the call returned a response
+        """
+        self._append(provider, model, latency, success)
+
+    def record_lower_bound(self, provider: str, model: str, latency: float) -> None:
+        """Record a call that was abandoned after running at least latency seconds.
+
+        Args:
+            provider: AI provider
+            model: Model name
+            latency: Seconds the call had run when it was cancelled
+        """
+        self._append(provider, model, latency, None)
+
+    def _append(self, provider: str, model: str, latency: float, success: Optional[bool]) -> None:
+        calls = self._calls.get((provider, model))
+        if calls is None:
+            calls = self._calls[(provider, model)] = deque(maxlen=self.window_size)
+        calls.append((time.monotonic(), latency, success))
+
+    def _window(self, provider: str, model: str) -> Deque[Tuple[float, float, Optional[bool]]]:
+        """Get a model's calls with those older than the window dropped."""
+        calls = self._calls.get((provider, model))
+        if not calls:
+            return deque()
+        cutoff = time.monotonic() - self.window_seconds
+        while calls and calls[0][0] < cutoff:
+            calls.popleft()
+        return calls
+
+    def stats(self, provider: str, model: str) -> Optional[LatencyStats]:
+        """Get a model's recent latency percentiles and error rate.
+
+        Returns:
+            The statistics, or None if the model has fewer than min_samples recent calls
+        """
+        calls = self._window(provider, model)
+        if len(calls) < self.min_samples:
+            return None
+
+        latencies = sorted(latency for _, latency, success in calls if success is not False)
+        finished = sum(1 for _, _, success in calls if success is not None)
+        errors = sum(1 for _, _, success in calls if success is False)
+        error_rate = errors / finished if finished else 0.0
+        if not latencies:
+            # Every recent call failed; latency is unknown but the error rate says enough
+            return LatencyStats(samples=len(calls), p50=math.inf, p95=math.inf, p99=math.inf, error_rate=1.0)
+
+        return LatencyStats(
+            samples=len(calls),
+            p50=_percentile(latencies, 50),
+            p95=_percentile(latencies, 95),
+            p99=_percentile(latencies, 99),
+            error_rate=error_rate
+        )
+
+    def hedge_delay(self, provider: str, model: str) -> Optional[float]:
+        """Get how long to wait on a call before hedging it with another provider.
+
+        The delay is the model's recent p95 latency, so only about one call in
+        twenty is hedged, bounded below by AI_HEDGE_MIN_DELAY_SECONDS.
+
+        Returns:
+            Delay in seconds, or None if there is not enough data to hedge
+        """
+        stats = self.stats(provider, model)
+        if stats is None or math.isinf(stats.p95):
+            return None
+        return max(stats.p95, settings.AI_HEDGE_MIN_DELAY_SECONDS)
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get recent statistics for every tracked model, for monitoring.
+
+        Percentiles are None for a model whose recent calls all failed, as the
+        result is served as JSON.
+        """
+        def to_ms(seconds: float) -> Optional[float]:
+            return None if math.isinf(seconds) else round(seconds * 1000, 2)
+
+        status = {}
+        for provider, model in list(self._calls):
+            stats = self.stats(provider, model)
+            if stats is not None:
+                status[f"{provider}/{model}"] = {
+                    "samples": stats.samples,
+                    "p50_ms": to_ms(stats.p50),
+                    "p95_ms": to_ms(stats.p95),
+                    "p99_ms": to_ms(stats.p99),
+                    "error_rate": round(stats.error_rate, 4)
+                }
+        return status
@@ -6,23 +6,60 @@ with automatic fallback mechanisms, model routing, and content optimization.
 """
 
 import os
+import re
 import time
 import yaml
 import json
 import asyncio
 import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, Awaitable, AsyncIterator
 from enum import Enum
 from functools import lru_cache
 
 from src.agents.integrations.ai_integration import ai_client, AIRequestError, AIRateLimitExceeded
+from src.agents.integrations.ai_latency import LatencyTracker
+from src.agents.integrations.ai_scheduler import RequestPriority
 from src.core.logging import log_api_usage
-from src.core.cache import cache
+from src.core.cache import async_cache
+from src.core.api_metrics import metrics_service
+from src.core.settings import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_WHITESPACE = re.compile(r"\s+")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def normalize_prompt_text(text: Optional[str]) -> Optional[str]:
+    """
+    Canonical form of a prompt for request deduplication.
+    
+    Embedded JSON objects are rewritten with sorted keys and runs of whitespace
+    are collapsed, so template renders that differ only in spacing or in the
+    order of their variables map to the same text.
+    """
+    if not text:
+        return text
+    
+    parts = []
+    position = 0
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, end = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            start = text.find("{", start + 1)
+            continue
+        parts.append(text[position:start])
+        parts.append(json.dumps(value, sort_keys=True))
+        position = end
+        start = text.find("{", end)
+    parts.append(text[position:])
+    
+    return _WHITESPACE.sub(" ", "".join(parts)).strip()
+
 
 class ContentType(Enum):
     """Types of content for AI generation."""
@@ -95,6 +132,13 @@ class AIProviderManager:
         self.fallback_counter = 0
         self.fallback_history = []
         
+        # Rolling latency and error statistics per provider/model, for routing and hedging
+        self.latency_tracker = LatencyTracker()
+        self.hedge_stats = {"fired": 0, "won": 0}
+        
+        # Generations in flight by cache key, shared by identical concurrent requests
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        
         # Create service routing map
         self.service_routing = self._create_service_routing()
     
@@ -236,7 +280,11 @@ class AIProviderManager:
                              temperature: float = 0.7,
                              use_cache: bool = True,
                              bypass_queue: bool = False,
-                             task_id: Optional[str] = None) -> Dict[str, Any]:
+                             task_id: Optional[str] = None,
+                             brand_id: Optional[str] = None,
+                             priority: Union[RequestPriority, str] = RequestPriority.INTERACTIVE,
+                             normalize_prompt: bool = False,
+                             hedge: Optional[bool] = None) -> Dict[str, Any]:
         """
         Generate content using the most appropriate AI provider and model.
         
@@ -254,6 +302,12 @@ class AIProviderManager:
             use_cache: Whether to use cache for identical requests
             bypass_queue: Whether to bypass queuing (for urgent requests)
             task_id: Optional task ID for tracking
+            brand_id: Optional brand the content is for, used to share provider capacity fairly
+            priority: Scheduling lane for provider rate limits (interactive or batch)
+            normalize_prompt: Treat prompts that differ only in whitespace or in the key order
+                of embedded JSON as identical for caching and coalescing
+            hedge: Race a fallback provider once the call outlasts the model's p95 latency;
+                defaults to AI_HEDGE_ENABLED for interactive requests
             
         Returns:
             Dictionary containing generated content and metadata
@@ -271,27 +325,279 @@ class AIProviderManager:
         if isinstance(industry, IndustryType):
             industry = industry.value
         
-        # Create cache key if caching is enabled
+        if hedge is None:
+            hedge = settings.AI_HEDGE_ENABLED and RequestPriority(priority) == RequestPriority.INTERACTIVE
+        scheduling = {"priority": priority, "brand_id": brand_id, "bypass_queue": bypass_queue, "hedge": hedge}
+        
+        if not use_cache:
+            return await self._generate_uncached(
+                prompt, system_prompt, content_type, language, industry, cost_tier,
+                preferred_provider, preferred_model, max_tokens, temperature, task_id, start_time,
+                scheduling
+            )
+        
+        cache_key = self._content_cache_key(
+            prompt, system_prompt, content_type, language, industry, max_tokens, temperature,
+            normalize=normalize_prompt
+        )
+        
+        generated = False
+        
+        async def generate() -> Dict[str, Any]:
+            nonlocal generated
+            generated = True
+            metrics_service.record_generation_dedup("generated")
+            return await self._generate_uncached(
+                prompt, system_prompt, content_type, language, industry, cost_tier,
+                preferred_provider, preferred_model, max_tokens, temperature, task_id, start_time,
+                scheduling
+            )
+        
+        async def lookup() -> Dict[str, Any]:
+            # Other workers computing the same key are waited for via the cache lock, and
+            # popular entries are refreshed shortly before they expire instead of all at once
+            result = await async_cache.get_or_compute(
+                cache_key,
+                generate,
+                expire=3600,  # 1 hour default
+                lock_timeout=120,
+                should_cache=bool
+            )
+            if not generated:
+                metrics_service.record_generation_dedup("cache_hit")
+            return result
+        
+        return await self._coalesced(cache_key, lookup)
+    
+    async def generate_content_stream(self,
+                                      prompt: str,
+                                      system_prompt: Optional[str] = None,
+                                      content_type: Union[ContentType, str] = ContentType.GENERAL,
+                                      language: Union[LanguageType, str] = LanguageType.ENGLISH,
+                                      industry: Union[IndustryType, str] = IndustryType.GENERAL,
+                                      cost_tier: str = "standard",
+                                      preferred_provider: Optional[str] = None,
+                                      preferred_model: Optional[str] = None,
+                                      max_tokens: int = 1000,
+                                      temperature: float = 0.7,
+                                      use_cache: bool = True,
+                                      bypass_queue: bool = False,
+                                      task_id: Optional[str] = None,
+                                      brand_id: Optional[str] = None,
+                                      priority: Union[RequestPriority, str] = RequestPriority.INTERACTIVE,
+                                      normalize_prompt: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate content like generate_content, yielding text as the provider produces it.
+        
+        Yields ``{"type": "token", "text": ...}`` events, then one
+        ``{"type": "done", "response": ...}`` event carrying the same result
+        generate_content would return. Cached results, and results of an
+        identical request already in flight, arrive as a single token event.
+        Fallback providers are tried only while no text has been yielded.
+        
+        Raises:
+            AIRequestError: If content generation fails
+        """
+        start_time = time.time()
+        
+        if isinstance(content_type, ContentType):
+            content_type = content_type.value
+        if isinstance(language, LanguageType):
+            language = language.value
+        if isinstance(industry, IndustryType):
+            industry = industry.value
+        
         cache_key = None
         if use_cache:
-            cache_context = {
-                "prompt": prompt,
-                "system_prompt": system_prompt,
-                "content_type": content_type,
-                "language": language,
-                "industry": industry,
-                "max_tokens": max_tokens,
-                "temperature": temperature
-            }
-            cache_key = f"content_gen:{hashlib.md5(json.dumps(cache_context).encode()).hexdigest()}"
-            
-            # Try to get from cache
-            cached_result = cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for content generation request")
-                # Record cache hit in metrics
-                return cached_result
+            cache_key = self._content_cache_key(
+                prompt, system_prompt, content_type, language, industry, max_tokens, temperature,
+                normalize=normalize_prompt
+            )
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                metrics_service.record_generation_dedup("coalesced")
+                result = dict(await asyncio.shield(inflight))
+            else:
+                result = await async_cache.get_computed(cache_key)
+                if result is not None:
+                    metrics_service.record_generation_dedup("cache_hit")
+            if result is not None:
+                yield {"type": "token", "text": result.get("text", "")}
+                yield {"type": "done", "response": result}
+                return
+        
+        provider, model = await self._select_provider_and_model(
+            content_type=content_type,
+            language=language,
+            industry=industry,
+            cost_tier=cost_tier,
+            preferred_provider=preferred_provider,
+            preferred_model=preferred_model
+        )
+        
+        final_prompt = prompt
+        if system_prompt and provider not in ("openai", "anthropic"):
+            final_prompt = f"{system_prompt}\n\n{prompt}"
+        
+        # The primary model first, then the configured fallbacks
+        candidates = [(provider, model)]
+        if self.service_routing.get("_global", {}).get("enabled", True):
+            max_retries = self.service_routing.get("_global", {}).get("max_retries", 3)
+            for fallback_provider in self.service_routing.get(provider, {}).get("fallback_providers", [])[:max_retries]:
+                fallback_model = self._get_best_model_for_provider(fallback_provider)
+                if fallback_model:
+                    candidates.append((fallback_provider, fallback_model))
+        
+        if use_cache:
+            metrics_service.record_generation_dedup("generated")
+        
+        errors = []
+        for used_provider, used_model in candidates:
+            streamed = False
+            call_started = time.monotonic()
+            try:
+                async for event in ai_client.stream_text_completion(
+                    provider=used_provider,
+                    model=used_model,
+                    prompt=final_prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    cache=False,  # We manage caching at this level
+                    task_id=task_id,
+                    priority=priority,
+                    brand_id=brand_id,
+                    bypass_queue=bypass_queue
+                ):
+                    if event["type"] == "token":
+                        streamed = True
+                        yield event
+                        continue
+                    
+                    self.latency_tracker.record(used_provider, used_model, time.monotonic() - call_started, True)
+                    self.provider_health_cache[used_provider] = {
+                        "status": "healthy",
+                        "last_success": time.time()
+                    }
+                    if used_provider != provider:
+                        self.fallback_counter += 1
+                        self.fallback_history.append({
+                            "timestamp": time.time(),
+                            "original_provider": provider,
+                            "original_model": model,
+                            "fallback_provider": used_provider,
+                            "fallback_model": used_model,
+                            "success": True
+                        })
+                    
+                    response = self._post_process_response(event["response"], used_provider, used_model)
+                    response["provider"] = used_provider
+                    response["model"] = used_model
+                    response["content_type"] = content_type
+                    response["language"] = language
+                    response["industry"] = industry
+                    response["generation_time"] = round((time.time() - start_time) * 1000, 2)
+                    
+                    if cache_key is not None and response.get("text"):
+                        # Share the result with later generate_content calls
+                        async def stored() -> Dict[str, Any]:
+                            return response
+                        await async_cache.get_or_compute(cache_key, stored, expire=3600, should_cache=bool)
+                    
+                    yield {"type": "done", "response": response}
+                    return
+            except Exception as e:
+                self.latency_tracker.record(used_provider, used_model, time.monotonic() - call_started, False)
+                errors.append({"provider": used_provider, "model": used_model, "error": str(e)})
+                self.provider_health_cache[used_provider] = {
+                    "status": "error",
+                    "last_error": time.time(),
+                    "error_message": str(e)
+                }
+                if streamed or not self._is_retryable_error(e):
+                    logger.error(f"Content stream from {used_provider}/{used_model} failed: {str(e)}")
+                    raise AIRequestError(f"Content generation failed: {str(e)}")
+                logger.warning(f"Content stream from {used_provider}/{used_model} failed before any output: {str(e)}")
+        
+        error_message = "All content generation attempts failed:"
+        for error in errors:
+            error_message += f"\n- {error['provider']}/{error['model']}: {error['error']}"
+        logger.error(error_message)
+        raise AIRequestError(error_message)
+    
+    async def _coalesced(self,
+                         cache_key: str,
+                         compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Run compute for a cache key, sharing it with identical requests already in flight.
+        
+        The computation runs as its own task, so a caller that is cancelled (for
+        example a disconnected client) does not fail the others waiting on it.
+        Callers that joined an existing computation get a copy of the result.
+        """
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            metrics_service.record_generation_dedup("coalesced")
+            return dict(await asyncio.shield(task))
+        
+        task = asyncio.ensure_future(compute())
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        return await asyncio.shield(task)
+    
+    def _forget_inflight(self, cache_key: str, task: "asyncio.Future[Dict[str, Any]]") -> None:
+        """Drop a finished computation from the in-flight map."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every waiter has gone away
+            task.exception()
+    
+    @staticmethod
+    def _content_cache_key(prompt: str,
+                           system_prompt: Optional[str],
+                           content_type: Union[ContentType, str],
+                           language: Union[LanguageType, str],
+                           industry: Union[IndustryType, str],
+                           max_tokens: int,
+                           temperature: float,
+                           normalize: bool = False) -> str:
+        """Build the cache key for a generation request from its output-affecting parameters."""
+        if normalize:
+            prompt = normalize_prompt_text(prompt)
+            system_prompt = normalize_prompt_text(system_prompt)
+        cache_context = {
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "content_type": content_type.value if isinstance(content_type, ContentType) else content_type,
+            "language": language.value if isinstance(language, LanguageType) else language,
+            "industry": industry.value if isinstance(industry, IndustryType) else industry,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        digest = hashlib.md5(json.dumps(cache_context).encode()).hexdigest()
+        # Normalized keys live in their own namespace so they never collide with exact ones
+        return f"content_gen:n:{digest}" if normalize else f"content_gen:{digest}"
+    
+    async def _generate_uncached(self,
+                                 prompt: str,
+                                 system_prompt: Optional[str],
+                                 content_type: str,
+                                 language: str,
+                                 industry: str,
+                                 cost_tier: str,
+                                 preferred_provider: Optional[str],
+                                 preferred_model: Optional[str],
+                                 max_tokens: int,
+                                 temperature: float,
+                                 task_id: Optional[str],
+                                 start_time: float,
+                                 scheduling: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Select a provider and generate content without consulting the cache.
         
+        Raises:
+            AIRequestError: If content generation fails
+        """
         # Select appropriate provider and model
         provider, model = await self._select_provider_and_model(
             content_type=content_type,
@@ -307,7 +613,8 @@ class AIProviderManager:
             "max_tokens": max_tokens,
             "temperature": temperature,
             "cache": False,  # We manage caching at this level
-            "task_id": task_id
+            "task_id": task_id,
+            **(scheduling or {})
         }
         
         # Prepare prompt based on provider
@@ -337,19 +644,14 @@ class AIProviderManager:
             # Post-process response if needed
             processed_response = self._post_process_response(response, provider, model)
             
-            # Add metadata to response
-            processed_response["provider"] = provider
-            processed_response["model"] = model
+            # Add metadata to response; a fallback or hedge may have answered instead
+            processed_response["provider"] = response.get("provider", provider)
+            processed_response["model"] = response.get("model", model)
             processed_response["content_type"] = content_type
             processed_response["language"] = language
             processed_response["industry"] = industry
             processed_response["generation_time"] = round((time.time() - start_time) * 1000, 2)
             
-            # Cache the result if caching is enabled
-            if use_cache and cache_key:
-                cache_ttl = 3600  # 1 hour default
-                cache.set(cache_key, processed_response, cache_ttl)
-            
             return processed_response
             
         except Exception as e:
@@ -385,24 +687,16 @@ class AIProviderManager:
         # List of errors encountered
         errors = []
         
-        # Try the primary provider/model
+        # Try the primary provider/model, hedged with a fallback if it runs unusually long
         try:
-            # Call the AI client
-            response = await ai_client.get_text_completion(
-                provider=provider,
-                model=model,
-                prompt=prompt,
-                max_tokens=generation_params.get("max_tokens", 1000),
-                temperature=generation_params.get("temperature", 0.7),
-                top_p=generation_params.get("top_p", 1.0),
-                frequency_penalty=generation_params.get("frequency_penalty", 0.0),
-                presence_penalty=generation_params.get("presence_penalty", 0.0),
-                cache=generation_params.get("cache", False),
-                task_id=generation_params.get("task_id")
-            )
+            if fallbacks_enabled and generation_params.get("hedge"):
+                response, answered_by = await self._call_hedged(provider, model, prompt, generation_params)
+            else:
+                response = await self._call_model(provider, model, prompt, generation_params)
+                answered_by = provider
             
             # Update provider health cache
-            self.provider_health_cache[provider] = {
+            self.provider_health_cache[answered_by] = {
                 "status": "healthy",
                 "last_success": time.time()
             }
@@ -425,15 +719,7 @@ class AIProviderManager:
                 logger.warning(f"Fallbacks disabled, not attempting alternative providers")
                 raise
             
-            # Check if it's a retryable error
-            if isinstance(e, AIRateLimitExceeded) or "rate limit" in str(e).lower():
-                retryable = True
-            elif "timeout" in str(e).lower() or "connection" in str(e).lower():
-                retryable = True
-            else:
-                retryable = False
-                
-            if not retryable:
+            if not self._is_retryable_error(e):
                 logger.warning(f"Non-retryable error, not attempting fallbacks: {str(e)}")
                 raise
         
@@ -460,18 +746,7 @@ class AIProviderManager:
             
             try:
                 # Call the AI client with fallback provider/model
-                response = await ai_client.get_text_completion(
-                    provider=fallback_provider,
-                    model=fallback_model,
-                    prompt=prompt,
-                    max_tokens=generation_params.get("max_tokens", 1000),
-                    temperature=generation_params.get("temperature", 0.7),
-                    top_p=generation_params.get("top_p", 1.0),
-                    frequency_penalty=generation_params.get("frequency_penalty", 0.0),
-                    presence_penalty=generation_params.get("presence_penalty", 0.0),
-                    cache=generation_params.get("cache", False),
-                    task_id=generation_params.get("task_id")
-                )
+                response = await self._call_model(fallback_provider, fallback_model, prompt, generation_params)
                 
                 # Update fallback tracking
                 self.fallback_counter += 1
@@ -530,6 +805,120 @@ class AIProviderManager:
         logger.error(error_message)
         raise AIRequestError(error_message)
     
+    async def _call_model(self,
+                          provider: str,
+                          model: str,
+                          prompt: str,
+                          generation_params: Dict[str, Any],
+                          slow_after: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Call one provider/model through the AI client, recording its latency and outcome.
+        
+        A cancelled call is only recorded if it had already run past slow_after
+        (the hedge delay of a hedged primary), as a lower bound on its latency.
+        """
+        started = time.monotonic()
+        try:
+            response = await ai_client.get_text_completion(
+                provider=provider,
+                model=model,
+                prompt=prompt,
+                max_tokens=generation_params.get("max_tokens", 1000),
+                temperature=generation_params.get("temperature", 0.7),
+                top_p=generation_params.get("top_p", 1.0),
+                frequency_penalty=generation_params.get("frequency_penalty", 0.0),
+                presence_penalty=generation_params.get("presence_penalty", 0.0),
+                cache=generation_params.get("cache", False),
+                task_id=generation_params.get("task_id"),
+                priority=generation_params.get("priority", RequestPriority.INTERACTIVE),
+                brand_id=generation_params.get("brand_id"),
+                bypass_queue=generation_params.get("bypass_queue", False)
+            )
+        except asyncio.CancelledError:
+            # A primary that lost its hedge was at least this slow; dropping it would hide
+            # exactly the slow calls from the percentiles
+            elapsed = time.monotonic() - started
+            if slow_after is not None and elapsed >= slow_after:
+                self.latency_tracker.record_lower_bound(provider, model, elapsed)
+            raise
+        except Exception:
+            self.latency_tracker.record(provider, model, time.monotonic() - started, False)
+            raise
+        
+        self.latency_tracker.record(provider, model, time.monotonic() - started, True)
+        return response
+    
+    def _hedge_target(self, provider: str, model: str) -> Optional[Tuple[str, str]]:
+        """Pick the fallback provider/model to race a slow call against, if any is healthy enough."""
+        for fallback_provider in self.service_routing.get(provider, {}).get("fallback_providers", []):
+            fallback_model = self._get_best_model_for_provider(fallback_provider)
+            if not fallback_model or (fallback_provider, fallback_model) == (provider, model):
+                continue
+            stats = self.latency_tracker.stats(fallback_provider, fallback_model)
+            if stats is not None and stats.error_rate >= 0.5:
+                continue
+            return fallback_provider, fallback_model
+        return None
+    
+    async def _call_hedged(self,
+                           provider: str,
+                           model: str,
+                           prompt: str,
+                           generation_params: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """
+        Call a provider/model, racing a second provider if it outlasts its usual latency.
+        
+        Once the primary call has run longer than its recent p95, the same prompt is
+        sent to a fallback provider; the first successful response wins and the other
+        call is cancelled. Without enough latency history, no hedge is sent.
+        
+        Returns:
+            Tuple of (response, provider that answered)
+            
+        Raises:
+            Exception: The primary call's error if no call succeeded
+        """
+        delay = self.latency_tracker.hedge_delay(provider, model)
+        hedge = self._hedge_target(provider, model) if delay is not None else None
+        if hedge is None:
+            return await self._call_model(provider, model, prompt, generation_params), provider
+        
+        primary = asyncio.ensure_future(
+            self._call_model(provider, model, prompt, generation_params, slow_after=delay)
+        )
+        calls = {primary: provider}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done:
+                hedge_provider, hedge_model = hedge
+                logger.info(f"{provider}/{model} exceeded {delay:.2f}s, hedging with {hedge_provider}/{hedge_model}")
+                self.hedge_stats["fired"] += 1
+                hedged = asyncio.ensure_future(
+                    self._call_model(hedge_provider, hedge_model, prompt, generation_params)
+                )
+                calls[hedged] = hedge_provider
+            
+            pending = set(calls)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_stats["won"] += 1
+                        return task.result(), calls[task]
+            raise primary.exception()
+        finally:
+            for task in calls:
+                if not task.done():
+                    task.cancel()
+    
+    @staticmethod
+    def _is_retryable_error(error: Exception) -> bool:
+        """Check whether a failed generation is worth retrying on a fallback provider."""
+        message = str(error).lower()
+        return (isinstance(error, AIRateLimitExceeded) or "rate limit" in message
+                or "timeout" in message or "connection" in message)
+    
     async def _select_provider_and_model(self,
                                       content_type: str,
                                       language: str,
@@ -670,6 +1059,9 @@ class AIProviderManager:
                     elif time_since_error < 3600:  # 1 hour
                         candidate["score"] -= 2  # Moderate penalty for errors in the last hour
         
+        # 6. Consider recent latency and error rates of each model
+        self._apply_latency_scores(candidates)
+        
         # If no candidates found, add default models
         if not candidates:
             # Add OpenAI default
@@ -702,6 +1094,29 @@ class AIProviderManager:
         # If no candidates at all, raise an error
         raise ValueError("No suitable AI provider or model found for the given requirements")
     
+    def _apply_latency_scores(self, candidates: List[Dict[str, Any]]) -> None:
+        """
+        Adjust candidate scores by their models' recent error rates and tail latency.
+        
+        A model loses up to 5 points for its error rate (as much as a fresh error) and up
+        to 2 points for its p95 latency relative to the fastest measured candidate, so
+        specialisation still outweighs speed. Models without enough recent calls are
+        left unchanged.
+        """
+        measured = []
+        for candidate in candidates:
+            stats = self.latency_tracker.stats(candidate["provider"], candidate["model"])
+            if stats is not None:
+                candidate["score"] -= 5 * stats.error_rate
+                measured.append((candidate, stats))
+        
+        finite = [stats.p95 for _, stats in measured if stats.p95 != float("inf")]
+        if not finite:
+            return
+        fastest = min(finite)
+        for candidate, stats in measured:
+            candidate["score"] -= min(2.0, stats.p95 / fastest - 1) if fastest > 0 else 0
+    
     async def _get_best_model_for_params(self,
                                       provider: str,
                                       content_type: str,
@@ -882,6 +1297,11 @@ class AIProviderManager:
             else:
                 status[provider]["fallback_success_rate"] = 0
         
+        # Recent latency percentiles and error rates per model
+        for model_id, model_stats in self.latency_tracker.get_status().items():
+            provider = model_id.split("/", 1)[0]
+            status.setdefault(provider, {"status": "unknown"}).setdefault("models", {})[model_id] = model_stats
+        
         return status
     
     async def batch_generate_content(self, 
@@ -900,62 +1320,112 @@ class AIProviderManager:
         # Set up semaphore to limit concurrency
         semaphore = asyncio.Semaphore(concurrency_limit)
         
-        async def _process_request(request: Dict[str, Any]) -> Dict[str, Any]:
+        async def _generate(request: Dict[str, Any]) -> Dict[str, Any]:
             async with semaphore:
-                try:
-                    # Extract parameters from request
-                    prompt = request.get("prompt", "")
-                    system_prompt = request.get("system_prompt")
-                    content_type = request.get("content_type", ContentType.GENERAL)
-                    language = request.get("language", LanguageType.ENGLISH)
-                    industry = request.get("industry", IndustryType.GENERAL)
-                    cost_tier = request.get("cost_tier", "standard")
-                    preferred_provider = request.get("preferred_provider")
-                    preferred_model = request.get("preferred_model")
-                    max_tokens = request.get("max_tokens", 1000)
-                    temperature = request.get("temperature", 0.7)
-                    use_cache = request.get("use_cache", True)
-                    bypass_queue = request.get("bypass_queue", False)
-                    task_id = request.get("task_id")
-                    
-                    # Generate content
-                    result = await self.generate_content(
-                        prompt=prompt,
-                        system_prompt=system_prompt,
-                        content_type=content_type,
-                        language=language,
-                        industry=industry,
-                        cost_tier=cost_tier,
-                        preferred_provider=preferred_provider,
-                        preferred_model=preferred_model,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        use_cache=use_cache,
-                        bypass_queue=bypass_queue,
-                        task_id=task_id
-                    )
-                    
-                    # Add request ID if provided
-                    if "request_id" in request:
-                        result["request_id"] = request["request_id"]
-                        
-                    return result
+                return await self.generate_content(
+                    prompt=request.get("prompt", ""),
+                    system_prompt=request.get("system_prompt"),
+                    content_type=request.get("content_type", ContentType.GENERAL),
+                    language=request.get("language", LanguageType.ENGLISH),
+                    industry=request.get("industry", IndustryType.GENERAL),
+                    cost_tier=request.get("cost_tier", "standard"),
+                    preferred_provider=request.get("preferred_provider"),
+                    preferred_model=request.get("preferred_model"),
+                    max_tokens=request.get("max_tokens", 1000),
+                    temperature=request.get("temperature", 0.7),
+                    use_cache=False,  # Cacheable requests are resolved as one batch below
+                    bypass_queue=request.get("bypass_queue", False),
+                    task_id=request.get("task_id"),
+                    brand_id=request.get("brand_id"),
+                    priority=request.get("priority", RequestPriority.BATCH)
+                )
+        
+        computed_keys = set()
+        
+        async def _generate_missing(cache_key: str, request: Dict[str, Any]) -> Dict[str, Any]:
+            computed_keys.add(cache_key)
+            
+            async def generate() -> Dict[str, Any]:
+                metrics_service.record_generation_dedup("generated")
+                return await _generate(request)
+            
+            # Join an identical generate_content call that is already running
+            return await self._coalesced(cache_key, generate)
+        
+        def _record_cache_hits() -> None:
+            # Keys whose computation never ran were served from the cache
+            for cache_key in computations:
+                if cache_key not in computed_keys:
+                    metrics_service.record_generation_dedup("cache_hit")
+        
+        # Look up all cacheable requests with one MGET and write the misses back in one
+        # pipeline; identical requests in the batch are generated only once
+        cache_keys: Dict[int, str] = {}
+        computations: Dict[str, Callable[[], Any]] = {}
+        for index, request in enumerate(requests):
+            if not request.get("use_cache", True):
+                continue
+            cache_key = self._content_cache_key(
+                request.get("prompt", ""),
+                request.get("system_prompt"),
+                request.get("content_type", ContentType.GENERAL),
+                request.get("language", LanguageType.ENGLISH),
+                request.get("industry", IndustryType.GENERAL),
+                request.get("max_tokens", 1000),
+                request.get("temperature", 0.7),
+                normalize=request.get("normalize_prompt", False)
+            )
+            cache_keys[index] = cache_key
+            if cache_key in computations:
+                metrics_service.record_generation_dedup("coalesced")
+                continue
+            computations[cache_key] = lambda cache_key=cache_key, request=request: _generate_missing(
+                cache_key, request
+            )
+        
+        cached_batch = None
+        if computations:
+            cached_batch = asyncio.ensure_future(async_cache.get_or_compute_many(
+                computations,
+                expire=3600,  # 1 hour default, as for single requests
+                should_cache=bool,
+                envelope=True,  # Share entries with generate_content
+                return_exceptions=True
+            ))
+            cached_batch.add_done_callback(lambda _: _record_cache_hits())
+        
+        async def _process_request(index: int, request: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                if index in cache_keys:
+                    result = (await cached_batch)[cache_keys[index]]
+                    if isinstance(result, Exception):
+                        raise result
+                    # Duplicate requests share one result; copy before adding request IDs
+                    result = dict(result)
+                else:
+                    result = await _generate(request)
+                
+                # Add request ID if provided
+                if "request_id" in request:
+                    result["request_id"] = request["request_id"]
                     
-                except Exception as e:
-                    # Create error response
-                    error_response = {
-                        "error": str(e),
-                        "success": False
-                    }
+                return result
+                
+            except Exception as e:
+                # Create error response
+                error_response = {
+                    "error": str(e),
+                    "success": False
+                }
+                
+                # Add request ID if provided
+                if "request_id" in request:
+                    error_response["request_id"] = request["request_id"]
                     
-                    # Add request ID if provided
-                    if "request_id" in request:
-                        error_response["request_id"] = request["request_id"]
-                        
-                    return error_response
+                return error_response
         
         # Create tasks for all requests
-        tasks = [_process_request(request) for request in requests]
+        tasks = [_process_request(index, request) for index, request in enumerate(requests)]
         
         # Wait for all tasks to complete
         results = await asyncio.gather(*tasks)
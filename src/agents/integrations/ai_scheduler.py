@@ -0,0 +1,372 @@
+"""
+AI Request Scheduler
+
+This module admits LLM calls against per-provider and per-model request and
+token buckets. Callers over the limit wait in a queue instead of failing:
+interactive requests are served ahead of batch work (with a guaranteed share
+for batch so it never starves), and brands within a lane take turns so one
+brand's bulk job cannot crowd out everyone else.
+"""
+
+import time
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.core.settings import settings
+
+
+class RequestPriority(Enum):
+    """Scheduling lanes for AI requests."""
+    INTERACTIVE = "interactive"  # A user is waiting on the result
+    BATCH = "batch"              # Background or bulk generation
+
+
+class TokenBucket:
+    """Continuously refilling bucket measured in units per minute.
+
+    Consumption may drive the level below zero (for requests larger than the
+    bucket or urgent requests that skip the queue); later callers then wait
+    until the debt has been refilled, which smooths the burst out.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float):
+        self.per_minute = per_minute
+        self.burst_seconds = burst_seconds
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        """Maximum level, enough for burst_seconds of traffic (at least one unit)."""
+        return max(self.per_minute * self.burst_seconds / 60, 1.0)
+
+    def set_rate(self, per_minute: float) -> None:
+        """Change the refill rate, keeping the current level within the new capacity."""
+        self._refill()
+        self.per_minute = per_minute
+        self.level = min(self.level, self.capacity)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.per_minute / 60)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be consumed, 0 if it can be consumed now."""
+        self._refill()
+        needed = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) * 60 / self.per_minute
+
+    def consume(self, amount: float) -> None:
+        """Take amount from the bucket; negative amounts return unused units."""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+@dataclass
+class Admission:
+    """A granted slot; settle it with the real token usage once the call finishes."""
+    provider: str
+    model: str
+    tokens: int
+    waited: float = 0.0
+
+
+@dataclass
+class _Waiter:
+    model: str
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class _ModelQueue:
+    """Priority lanes of per-brand FIFO queues for the models sharing one provider's buckets.
+
+    Its waiters' futures, pump task and wakeup event all belong to one event loop.
+    """
+
+    def __init__(self):
+        self.lanes: Dict[RequestPriority, "OrderedDict[str, Deque[_Waiter]]"] = {
+            priority: OrderedDict() for priority in RequestPriority
+        }
+        self.interactive_streak = 0
+        self.wakeup = asyncio.Event()
+        self.pump: Optional[asyncio.Task] = None
+
+    def __bool__(self) -> bool:
+        return any(self.lanes.values())
+
+    def push(self, priority: RequestPriority, brand: str, waiter: _Waiter) -> None:
+        self.lanes[priority].setdefault(brand, deque()).append(waiter)
+        self.wakeup.set()
+
+    def _drop_cancelled(self) -> None:
+        for lane in self.lanes.values():
+            for brand in list(lane):
+                waiters = lane[brand]
+                while waiters and waiters[0].future.done():
+                    waiters.popleft()
+                if not waiters:
+                    del lane[brand]
+
+    def _lane(self, interactive_weight: int) -> Optional[RequestPriority]:
+        interactive = self.lanes[RequestPriority.INTERACTIVE]
+        batch = self.lanes[RequestPriority.BATCH]
+        if interactive and (not batch or self.interactive_streak < interactive_weight):
+            return RequestPriority.INTERACTIVE
+        if batch:
+            return RequestPriority.BATCH
+        return None
+
+    def peek(self, interactive_weight: int) -> Optional[Tuple[RequestPriority, str, _Waiter]]:
+        """Get the next waiter to admit without removing it."""
+        self._drop_cancelled()
+        priority = self._lane(interactive_weight)
+        if priority is None:
+            return None
+        brand, waiters = next(iter(self.lanes[priority].items()))
+        return priority, brand, waiters[0]
+
+    def pop(self, priority: RequestPriority, brand: str) -> _Waiter:
+        """Remove the head waiter and send its brand to the back of the lane."""
+        lane = self.lanes[priority]
+        waiter = lane[brand].popleft()
+        if lane[brand]:
+            lane.move_to_end(brand)
+        else:
+            del lane[brand]
+        if priority is RequestPriority.INTERACTIVE:
+            self.interactive_streak += 1
+        else:
+            self.interactive_streak = 0
+        return waiter
+
+
+class AIRequestScheduler:
+    """Admission control for AI provider calls.
+
+    Each provider has a requests-per-minute and a tokens-per-minute bucket
+    from the ``rate_limits`` section of its configuration; models may add
+    their own ``rate_limits`` on top. A request is admitted once every
+    applicable bucket has room for one request and its estimated tokens.
+    """
+
+    def __init__(
+        self,
+        ai_config: Dict[str, Any],
+        burst_seconds: Optional[float] = None,
+        interactive_weight: Optional[int] = None
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            ai_config: The ``ai_services`` configuration section
+            burst_seconds: Seconds of traffic a bucket may absorb at once
+            interactive_weight: Interactive admissions per batch admission when both wait
+        """
+        self.burst_seconds = burst_seconds or settings.AI_SCHEDULER_BURST_SECONDS
+        self.interactive_weight = interactive_weight or settings.AI_SCHEDULER_INTERACTIVE_WEIGHT
+        self.buckets: Dict[Tuple[str, Optional[str]], Dict[str, TokenBucket]] = {}
+        self.configured_token_rates: Dict[str, float] = {}
+        # Queues per event loop, as a scheduler may outlive loops (e.g. one asyncio.run per task)
+        self._queues: Dict[asyncio.AbstractEventLoop, Dict[Tuple[str, Optional[str]], _ModelQueue]] = {}
+
+        for provider, provider_config in ai_config.items():
+            self._add_buckets((provider, None), provider_config.get('rate_limits', {}))
+            self.configured_token_rates[provider] = provider_config.get('rate_limits', {}).get(
+                'tokens_per_minute', float('inf')
+            )
+            for model_config in provider_config.get('models', []):
+                if model_config.get('name'):
+                    self._add_buckets(
+                        (provider, model_config['name']), model_config.get('rate_limits', {})
+                    )
+
+    def _add_buckets(self, scope: Tuple[str, Optional[str]], rate_limits: Dict[str, Any]) -> None:
+        buckets = {}
+        for kind, limit_name in (('requests', 'requests_per_minute'), ('tokens', 'tokens_per_minute')):
+            if rate_limits.get(limit_name):
+                buckets[kind] = TokenBucket(rate_limits[limit_name], self.burst_seconds)
+        if buckets:
+            self.buckets[scope] = buckets
+
+    def _buckets_for(self, provider: str, model: str) -> List[Tuple[str, TokenBucket]]:
+        found = []
+        for scope in ((provider, None), (provider, model)):
+            found.extend(self.buckets.get(scope, {}).items())
+        return found
+
+    def _queue_key(self, provider: str, model: str) -> Tuple[str, Optional[str]]:
+        """Get the queue for a model: one per provider when its models share provider buckets."""
+        return (provider, None) if (provider, None) in self.buckets else (provider, model)
+
+    def _queue_for(self, provider: str, model: str) -> _ModelQueue:
+        """Get the running loop's queue for a model, dropping the queues of closed loops."""
+        loop = asyncio.get_running_loop()
+        for closed in [other for other in self._queues if other.is_closed()]:
+            del self._queues[closed]
+        return self._queues.setdefault(loop, {}).setdefault(self._queue_key(provider, model), _ModelQueue())
+
+    def _wake(self, queue_key: Tuple[str, Optional[str]]) -> None:
+        """Have every loop's pump for a queue re-check its buckets."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, queues in list(self._queues.items()):
+            queue = queues.get(queue_key)
+            if queue is None or loop.is_closed():
+                continue
+            if loop is running:
+                queue.wakeup.set()
+            else:
+                loop.call_soon_threadsafe(queue.wakeup.set)
+
+    def _wait_time(self, provider: str, model: str, tokens: int) -> float:
+        return max(
+            (bucket.wait_time(1 if kind == 'requests' else tokens)
+             for kind, bucket in self._buckets_for(provider, model)),
+            default=0.0
+        )
+
+    def _consume(self, provider: str, model: str, tokens: int) -> None:
+        for kind, bucket in self._buckets_for(provider, model):
+            bucket.consume(1 if kind == 'requests' else tokens)
+
+    def _release(self, provider: str, model: str, tokens: int) -> None:
+        for kind, bucket in self._buckets_for(provider, model):
+            bucket.consume(-1 if kind == 'requests' else -tokens)
+
+    def token_rate(self, provider: str) -> float:
+        """Get the current tokens-per-minute limit for a provider."""
+        bucket = self.buckets.get((provider, None), {}).get('tokens')
+        return bucket.per_minute if bucket else float('inf')
+
+    def set_token_rate(self, provider: str, tokens_per_minute: float) -> None:
+        """Change a provider's tokens-per-minute limit, e.g. for adaptive rate limiting."""
+        bucket = self.buckets.get((provider, None), {}).get('tokens')
+        if bucket:
+            bucket.set_rate(tokens_per_minute)
+            queue_keys = {key for queues in self._queues.values() for key in queues if key[0] == provider}
+            for queue_key in queue_keys:
+                self._wake(queue_key)
+
+    async def acquire(
+        self,
+        provider: str,
+        model: str,
+        tokens: int,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        brand_id: Optional[str] = None,
+        bypass_queue: bool = False,
+        timeout: Optional[float] = None
+    ) -> Admission:
+        """Wait until a request may be sent.
+
+        Args:
+            provider: AI provider name
+            model: Model name
+            tokens: Estimated tokens (prompt plus max completion)
+            priority: Scheduling lane (a RequestPriority or its value)
+            brand_id: Brand the request is made for, used for fair sharing
+            bypass_queue: Admit immediately, borrowing from future capacity
+            timeout: Maximum seconds to wait (defaults to AI_SCHEDULER_MAX_WAIT_SECONDS)
+
+        Returns:
+            The admission to settle once actual usage is known
+
+        Raises:
+            asyncio.TimeoutError: If the request could not be admitted in time
+        """
+        priority = RequestPriority(priority)
+        queue = self._queue_for(provider, model)
+
+        # Fast path: nobody sharing these buckets is waiting and they have room
+        if bypass_queue or (not queue and self._wait_time(provider, model, tokens) == 0):
+            self._consume(provider, model, tokens)
+            return Admission(provider, model, tokens)
+
+        waiter = _Waiter(model, tokens, asyncio.get_running_loop().create_future())
+        queue.push(priority, str(brand_id or ""), waiter)
+        logger.debug(f"Queued {priority.value} request for {provider}/{model} ({tokens} tokens)")
+        if queue.pump is None or queue.pump.done():
+            queue.pump = asyncio.ensure_future(self._pump(provider, queue))
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter.future),
+                timeout if timeout is not None else settings.AI_SCHEDULER_MAX_WAIT_SECONDS
+            )
+        except BaseException:
+            # Timed out or cancelled: leave the queue, returning the slot if it was just granted
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(provider, model, tokens)
+            waiter.future.cancel()
+            queue.wakeup.set()
+            raise
+
+        return Admission(provider, model, tokens, waited=time.monotonic() - waiter.enqueued_at)
+
+    async def _pump(self, provider: str, queue: _ModelQueue) -> None:
+        """Admit queued waiters in order as bucket capacity becomes available.
+
+        The head waiter holds the queue until its model's buckets have room, so
+        later or smaller requests on other models cannot starve it.
+        """
+        while True:
+            queue.wakeup.clear()
+            head = queue.peek(self.interactive_weight)
+            if head is None:
+                return
+
+            priority, brand, waiter = head
+            wait = self._wait_time(provider, waiter.model, waiter.tokens)
+            if wait == 0:
+                queue.pop(priority, brand)
+                self._consume(provider, waiter.model, waiter.tokens)
+                waiter.future.set_result(None)
+                continue
+
+            # Sleep until capacity returns, or re-check early if a new waiter or rate change arrives
+            try:
+                await asyncio.wait_for(queue.wakeup.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def settle(self, admission: Admission, actual_tokens: int) -> None:
+        """Correct the token buckets once a request's real usage is known.
+
+        Args:
+            admission: The admission returned by acquire
+            actual_tokens: Tokens the provider actually processed
+        """
+        for kind, bucket in self._buckets_for(admission.provider, admission.model):
+            if kind == 'tokens':
+                bucket.consume(actual_tokens - admission.tokens)
+
+        self._wake(self._queue_key(admission.provider, admission.model))
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get bucket levels and queue depths for monitoring."""
+        status = {}
+        for (provider, model), buckets in self.buckets.items():
+            name = f"{provider}/{model}" if model else provider
+            status[name] = {kind: round(bucket.level, 2) for kind, bucket in buckets.items()}
+        for queues in self._queues.values():
+            for (provider, model), queue in queues.items():
+                depth = sum(
+                    not waiter.future.done()
+                    for lane in queue.lanes.values() for waiters in lane.values() for waiter in waiters
+                )
+                if depth:
+                    entry = status.setdefault(f"{provider}/{model}" if model else provider, {})
+                    entry["queued"] = entry.get("queued", 0) + depth
+        return status
@@ -15,9 +15,8 @@ import jwt
 import http.client
 import urllib.parse
 
-import requests
-
 from src.agents.integrations.analytics.base import AnalyticsIntegration, IntegrationError
+from src.core.http_client import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +98,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
                     "jwt_token": jwt_token
                 }
                 
-                token_response = requests.post(
+                token_response = http_client.post(
                     "https://ims-na1.adobelogin.com/ims/exchange/jwt",
                     data=token_data
                 )
@@ -203,7 +202,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
                     request_data["globalFilters"]["segmentId"] = filters["segmentId"]
             
             # Execute the report request
-            response = requests.post(
+            response = http_client.post(
                 f"https://analytics.adobe.io/api/{self.company_id}/reports",
                 headers=self._get_headers(),
                 json=request_data
@@ -292,7 +291,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
             }
             
             # Execute the report request
-            response = requests.post(
+            response = http_client.post(
                 f"https://analytics.adobe.io/api/{self.company_id}/reports/realtime",
                 headers=self._get_headers(),
                 json=request_data
@@ -376,7 +375,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
             }
             
             # Execute the report request
-            response = requests.post(
+            response = http_client.post(
                 f"https://analytics.adobe.io/api/{self.company_id}/reports",
                 headers=self._get_headers(),
                 json=request_data
@@ -457,7 +456,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
                 }
                 
                 # Execute the report request
-                response = requests.post(
+                response = http_client.post(
                     f"https://analytics.adobe.io/api/{self.company_id}/reports",
                     headers=self._get_headers(),
                     json=request_data
@@ -532,7 +531,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
             }
             
             # Execute the report request
-            response = requests.post(
+            response = http_client.post(
                 f"https://analytics.adobe.io/api/{self.company_id}/reports",
                 headers=self._get_headers(),
                 json=request_data
@@ -633,7 +632,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
                 request_data["globalFilters"]["segmentId"] = filters["segmentId"]
             
             # Execute the report request
-            response = requests.post(
+            response = http_client.post(
                 f"https://analytics.adobe.io/api/{self.company_id}/reports",
                 headers=self._get_headers(),
                 json=request_data
@@ -704,7 +703,7 @@ class AdobeAnalyticsIntegration(AnalyticsIntegration):
             
             # Get company info to verify API access
             start_time = time.time()
-            response = requests.get(
+            response = http_client.get(
                 f"https://analytics.adobe.io/api/{self.company_id}/reportSuites",
                 headers=self._get_headers(),
                 params={"limit": 1}
@@ -8,7 +8,6 @@ and other search-related metrics.
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import aiohttp
 import json
 import os
 from urllib.parse import urlparse, urljoin
@@ -22,6 +21,7 @@ from google.auth.exceptions import RefreshError
 
 from src.agents.integrations.analytics.base import BaseAnalyticsIntegration
 from src.core import seo_settings
+from src.core.http_client import async_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -283,21 +283,21 @@ class GoogleSearchConsoleIntegration(BaseAnalyticsIntegration):
                     }]
                 
                 # Make the API request
-                async with aiohttp.ClientSession() as session:
-                    full_url = urljoin(self.api_base_url, endpoint)
-                    async with session.post(full_url, headers=headers, json=payload) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # Cache the successful response
-                            self.cache[cache_key] = data
-                            return data
-                        else:
-                            error_text = await response.text()
-                            logger.error(f"Error fetching search performance: {error_text}")
-                            # Fall back to mock data
-                            logger.info("Falling back to mock data due to API error")
-                            mock_data = self._get_mock_search_data(dimensions, url_filter)
-                            return mock_data
+                session = await async_http_client.session()
+                full_url = urljoin(self.api_base_url, endpoint)
+                async with session.post(full_url, headers=headers, json=payload) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        # Cache the successful response
+                        self.cache[cache_key] = data
+                        return data
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Error fetching search performance: {error_text}")
+                        # Fall back to mock data
+                        logger.info("Falling back to mock data due to API error")
+                        mock_data = self._get_mock_search_data(dimensions, url_filter)
+                        return mock_data
             else:
                 # Use mock data for development or if no credentials
                 logger.info("Using mock data for search performance")
@@ -333,20 +333,20 @@ class GoogleSearchConsoleIntegration(BaseAnalyticsIntegration):
                 headers = await self._get_headers()
                 
                 # Make the API request
-                async with aiohttp.ClientSession() as session:
-                    full_url = urljoin(self.api_base_url, endpoint)
-                    async with session.get(full_url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # Cache the successful response
-                            self.cache[cache_key] = data
-                            return data
-                        else:
-                            error_text = await response.text()
-                            logger.error(f"Error fetching sitemaps: {error_text}")
-                            # Fall back to mock data
-                            logger.info("Falling back to mock data due to API error")
-                            return self._get_mock_sitemaps()
+                session = await async_http_client.session()
+                full_url = urljoin(self.api_base_url, endpoint)
+                async with session.get(full_url, headers=headers) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        # Cache the successful response
+                        self.cache[cache_key] = data
+                        return data
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Error fetching sitemaps: {error_text}")
+                        # Fall back to mock data
+                        logger.info("Falling back to mock data due to API error")
+                        return self._get_mock_sitemaps()
             else:
                 # Use mock data for development or if no credentials
                 logger.info("Using mock data for sitemaps")
@@ -391,20 +391,20 @@ class GoogleSearchConsoleIntegration(BaseAnalyticsIntegration):
                 }
                 
                 # Make the API request
-                async with aiohttp.ClientSession() as session:
-                    full_url = urljoin(self.api_base_url, endpoint)
-                    async with session.post(full_url, headers=headers, json=payload) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # Cache the successful response
-                            self.cache[cache_key] = data
-                            return data
-                        else:
-                            error_text = await response.text()
-                            logger.error(f"Error inspecting URL: {error_text}")
-                            # Fall back to mock data
-                            logger.info("Falling back to mock data due to API error")
-                            return self._get_mock_url_inspection(url)
+                session = await async_http_client.session()
+                full_url = urljoin(self.api_base_url, endpoint)
+                async with session.post(full_url, headers=headers, json=payload) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        # Cache the successful response
+                        self.cache[cache_key] = data
+                        return data
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Error inspecting URL: {error_text}")
+                        # Fall back to mock data
+                        logger.info("Falling back to mock data due to API error")
+                        return self._get_mock_url_inspection(url)
             else:
                 # Use mock data for development or if no credentials
                 logger.info("Using mock data for URL inspection")
@@ -6,13 +6,58 @@ ensuring consistent error handling, response formatting, and health checking.
 
 import os
 import json
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional, List
+import functools
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 
+import requests
+
+from src.core.http_client import http_client
+from src.core.settings import settings
+
 logger = logging.getLogger(__name__)
 
+# Dedicated pool for blocking platform calls made from async code, so a burst of slow
+# integrations neither stalls the event loop nor exhausts the loop's default executor
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get the integration I/O thread pool, creating it on first use."""
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=settings.INTEGRATION_IO_WORKERS, thread_name_prefix="integration-io"
+                )
+    return _io_executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call in the integration I/O thread pool, keeping the caller's context.
+    
+    Args:
+        func: Blocking function to run
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+        
+    Returns:
+        The function's return value
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        get_io_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
 class IntegrationError(Exception):
     """Base exception for all integration errors."""
     pass
@@ -30,6 +75,8 @@ class Integration:
         self.platform = platform.lower()
         self.credentials = credentials
         self.initialized_at = datetime.now().isoformat()
+        # Shared keep-alive connection pool; use it instead of module-level requests calls
+        self.http = http_client
     
     def format_success_response(self, **kwargs) -> Dict[str, Any]:
         """Format a successful response.
@@ -69,6 +116,9 @@ class Integration:
     def safe_request(self, func, error_message: str, **kwargs) -> Dict[str, Any]:
         """Safely execute a request function with error handling.
         
+        HTTP calls made by func should go through ``self.http`` so they reuse
+        pooled connections and get the configured per-host timeouts.
+        
         Args:
             func: Function to execute
             error_message: Error message prefix to use on failure
@@ -79,6 +129,12 @@ class Integration:
         """
         try:
             return func(**kwargs)
+        except requests.Timeout as e:
+            logger.error(f"{error_message}: request timed out: {e}")
+            return self.format_error_response(
+                error_message=f"{error_message}: request timed out",
+                details=str(e)
+            )
         except Exception as e:
             logger.error(f"{error_message}: {e}")
             return self.format_error_response(
@@ -111,6 +167,29 @@ class Integration:
         """
         raise NotImplementedError("Subclasses must implement check_health")
     
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking integration call in the integration I/O thread pool.
+        
+        Args:
+            func: Blocking function to run
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            The function's return value
+        """
+        return await run_blocking(func, *args, **kwargs)
+    
+    async def check_health_async(self) -> Dict[str, Any]:
+        """Check the health of the integration without blocking the event loop.
+        
+        Subclasses with a native async client can override this.
+        
+        Returns:
+            Dict containing health status information
+        """
+        return await self.run_blocking(self.check_health)
+    
     def measure_response_time(self, func, *args, **kwargs) -> tuple:
         """Measure the response time of a function.
         
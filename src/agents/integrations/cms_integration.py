@@ -8,7 +8,6 @@ and management of content on these platforms.
 import os
 import json
 import logging
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
@@ -60,6 +59,29 @@ class CMSIntegration(Integration):
         """
         raise NotImplementedError("Subclasses must implement schedule_content")
     
+    async def publish_content_async(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Publish content without blocking the event loop.
+        
+        Args:
+            content_data: Formatted content data to be published
+            
+        Returns:
+            Dict containing the publishing result with status and platform-specific details
+        """
+        return await self.run_blocking(self.publish_content, content_data)
+    
+    async def schedule_content_async(self, content_data: Dict[str, Any], publish_time: str) -> Dict[str, Any]:
+        """Schedule content without blocking the event loop.
+        
+        Args:
+            content_data: Formatted content data to be published
+            publish_time: ISO format datetime for scheduled publishing
+            
+        Returns:
+            Dict containing the scheduling result with status and platform-specific details
+        """
+        return await self.run_blocking(self.schedule_content, content_data, publish_time)
+    
     def update_content(self, content_id: str, content_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update existing content on the CMS platform.
         
@@ -167,7 +189,7 @@ class WordPressIntegration(CMSIntegration):
                     "yoast_wpseo_focuskw": content_data.get("focus_keyword", "")
                 }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/posts",
                 json=wp_post,
                 headers=self._get_headers(),
@@ -222,7 +244,7 @@ class WordPressIntegration(CMSIntegration):
                 "featured_media": content_data.get("featured_image_id")
             }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/posts",
                 json=wp_post,
                 headers=self._get_headers(),
@@ -278,7 +300,7 @@ class WordPressIntegration(CMSIntegration):
             # Remove None values
             wp_post = {k: v for k, v in wp_post.items() if v is not None}
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/posts/{content_id}",
                 json=wp_post,
                 headers=self._get_headers(),
@@ -321,7 +343,7 @@ class WordPressIntegration(CMSIntegration):
             )
         
         def execute_request():
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/posts/{content_id}",
                 headers=self._get_headers(),
                 auth=self.auth
@@ -365,7 +387,7 @@ class WordPressIntegration(CMSIntegration):
             )
         
         def execute_request():
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/posts/{content_id}",
                 headers=self._get_headers(),
                 auth=self.auth,
@@ -403,7 +425,7 @@ class WordPressIntegration(CMSIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}",
                 headers=self._get_headers(),
                 auth=self.auth
@@ -496,7 +518,7 @@ class ShopifyIntegration(CMSIntegration):
             if not blog_id:
                 return self.format_error_response("Missing blog_id parameter")
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/blogs/{blog_id}/articles.json",
                 json=shopify_article,
                 headers={"Content-Type": "application/json"}
@@ -573,7 +595,7 @@ class WebflowIntegration(CMSIntegration):
             }
             
             # Create the collection item
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/collections/{collection_id}/items",
                 headers=self._get_headers(),
                 json=webflow_item
@@ -583,7 +605,7 @@ class WebflowIntegration(CMSIntegration):
                 item_data = response.json()
                 
                 # Now publish the collection with the new item
-                publish_response = requests.post(
+                publish_response = self.http.post(
                     f"{self.api_url}/sites/{content_data.get('site_id')}/publish",
                     headers=self._get_headers(),
                     json={
@@ -637,7 +659,7 @@ class WebflowIntegration(CMSIntegration):
                 }
             }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/collections/{collection_id}/items",
                 headers=self._get_headers(),
                 json=webflow_item
@@ -687,7 +709,7 @@ class WebflowIntegration(CMSIntegration):
                 }
             }
             
-            response = requests.put(
+            response = self.http.put(
                 f"{self.api_url}/collections/{collection_id}/items/{content_id}",
                 headers=self._get_headers(),
                 json=webflow_item
@@ -698,7 +720,7 @@ class WebflowIntegration(CMSIntegration):
                 
                 # Publish the updated item if requested
                 if content_data.get("publish", False):
-                    publish_response = requests.post(
+                    publish_response = self.http.post(
                         f"{self.api_url}/sites/{content_data.get('site_id')}/publish",
                         headers=self._get_headers(),
                         json={
@@ -745,7 +767,7 @@ class WebflowIntegration(CMSIntegration):
             if not collection_id:
                 return self.format_error_response("Missing collection_id parameter")
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/collections/{collection_id}/items/{content_id}",
                 headers=self._get_headers()
             )
@@ -789,7 +811,7 @@ class WebflowIntegration(CMSIntegration):
             if not collection_id:
                 return self.format_error_response("Missing collection_id parameter")
             
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/collections/{collection_id}/items/{content_id}",
                 headers=self._get_headers()
             )
@@ -825,7 +847,7 @@ class WebflowIntegration(CMSIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/sites",
                 headers=self._get_headers()
             )
@@ -915,7 +937,7 @@ class DrupalIntegration(CMSIntegration):
             
             # First need to get CSRF token for POST requests
             if not self.api_key:
-                csrf_response = requests.get(
+                csrf_response = self.http.get(
                     f"{self.base_url}/session/token",
                     auth=self._get_auth()
                 )
@@ -948,7 +970,7 @@ class DrupalIntegration(CMSIntegration):
                 if field not in ["title", "content"]:
                     drupal_data["data"]["attributes"][field] = value
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{content_type}",
                 json=drupal_data,
                 headers=headers,
@@ -1014,7 +1036,7 @@ class DrupalIntegration(CMSIntegration):
             
             # Get CSRF token for PATCH requests
             if not self.api_key:
-                csrf_response = requests.get(
+                csrf_response = self.http.get(
                     f"{self.base_url}/session/token",
                     auth=self._get_auth()
                 )
@@ -1052,7 +1074,7 @@ class DrupalIntegration(CMSIntegration):
                 if field not in ["title", "content"]:
                     drupal_data["data"]["attributes"][field] = value
             
-            response = requests.patch(
+            response = self.http.patch(
                 f"{self.api_url}/{content_type}/{content_id}",
                 json=drupal_data,
                 headers=headers,
@@ -1091,7 +1113,7 @@ class DrupalIntegration(CMSIntegration):
         def execute_request():
             content_type = content_data.get("content_type", "node--article")
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/{content_type}/{content_id}",
                 headers=self._get_headers(),
                 auth=self._get_auth()
@@ -1141,7 +1163,7 @@ class DrupalIntegration(CMSIntegration):
             
             # Get CSRF token for DELETE requests
             if not self.api_key:
-                csrf_response = requests.get(
+                csrf_response = self.http.get(
                     f"{self.base_url}/session/token",
                     auth=self._get_auth()
                 )
@@ -1155,7 +1177,7 @@ class DrupalIntegration(CMSIntegration):
             else:
                 headers = self._get_headers()
             
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/{content_type}/{content_id}",
                 headers=headers,
                 auth=self._get_auth()
@@ -1192,7 +1214,7 @@ class DrupalIntegration(CMSIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}",
                 headers=self._get_headers(),
                 auth=self._get_auth()
@@ -1285,7 +1307,7 @@ class JoomlaIntegration(CMSIntegration):
             if "tags" in content_data:
                 joomla_article["tags"] = content_data["tags"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/content/articles",
                 json=joomla_article,
                 headers=self._get_headers()
@@ -1341,7 +1363,7 @@ class JoomlaIntegration(CMSIntegration):
             if "tags" in content_data:
                 joomla_article["tags"] = content_data["tags"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/content/articles",
                 json=joomla_article,
                 headers=self._get_headers()
@@ -1412,7 +1434,7 @@ class JoomlaIntegration(CMSIntegration):
             if "tags" in content_data:
                 joomla_article["tags"] = content_data["tags"]
             
-            response = requests.patch(
+            response = self.http.patch(
                 f"{self.api_url}/content/articles/{content_id}",
                 json=joomla_article,
                 headers=self._get_headers()
@@ -1448,7 +1470,7 @@ class JoomlaIntegration(CMSIntegration):
             return credentials_check
         
         def execute_request():
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/content/articles/{content_id}",
                 headers=self._get_headers()
             )
@@ -1497,7 +1519,7 @@ class JoomlaIntegration(CMSIntegration):
             return credentials_check
         
         def execute_request():
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/content/articles/{content_id}",
                 headers=self._get_headers()
             )
@@ -1533,7 +1555,7 @@ class JoomlaIntegration(CMSIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/content/articles",
                 headers=self._get_headers()
             )
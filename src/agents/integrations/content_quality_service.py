@@ -14,7 +14,7 @@ from dataclasses import dataclass
 import asyncio
 
 from src.agents.integrations.ai_provider_manager import ai_provider_manager
-from src.core.cache import cache
+from src.core.cache import async_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -136,7 +136,7 @@ class ContentQualityService:
         cache_key = f"content_quality:{hashlib.md5(json.dumps(cache_params).encode()).hexdigest()}"
         
         # Check cache for previous evaluation
-        cached_result = cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             logger.info(f"Cache hit for content quality evaluation")
             return cached_result
@@ -195,7 +195,7 @@ class ContentQualityService:
         )
         
         # Cache the result
-        cache.set(cache_key, quality_score, expire=3600)  # Cache for 1 hour
+        await async_cache.set(cache_key, quality_score, expire=3600)  # Cache for 1 hour
         
         return quality_score
     
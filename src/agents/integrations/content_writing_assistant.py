@@ -16,7 +16,7 @@ import logging
 from uuid import uuid4
 
 from src.agents.integrations.ai_provider_manager import ai_provider_manager
-from src.core.cache import cache
+from src.core.cache import async_cache
 from src.core.websocket_bridge import notify_ai_suggestion, notify_seo_tip
 from src.core.api_metrics import ux_analytics_service
 
@@ -60,7 +60,7 @@ class ContentWritingAssistant:
         cache_key = f"completion:{hash(prefix_text)}:{hash(json.dumps(context or {}))}"
         
         # Check cache
-        cached_result = await cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             return cached_result
         
@@ -108,7 +108,7 @@ class ContentWritingAssistant:
                 })
             
             # Cache results
-            await cache.set(cache_key, suggestions, ttl=self.cache_ttl)
+            await async_cache.set(cache_key, suggestions, expire=self.cache_ttl)
             
             return suggestions
         
@@ -169,7 +169,7 @@ class ContentWritingAssistant:
         cache_key = f"rephrase:{hash(selected_text)}:{hash(json.dumps(context or {}))}"
         
         # Check cache
-        cached_result = await cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             return cached_result
         
@@ -219,7 +219,7 @@ class ContentWritingAssistant:
                 })
             
             # Cache results
-            await cache.set(cache_key, suggestions, ttl=self.cache_ttl)
+            await async_cache.set(cache_key, suggestions, expire=self.cache_ttl)
             
             return suggestions
         
@@ -283,7 +283,7 @@ class ContentWritingAssistant:
         cache_key = f"seo_tips:{hash(content_text)}:{hash(json.dumps(keywords or []))}:{hash(json.dumps(context or {}))}"
         
         # Check cache
-        cached_result = await cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             return cached_result
         
@@ -330,7 +330,7 @@ class ContentWritingAssistant:
                 })
             
             # Cache results
-            await cache.set(cache_key, suggestions, ttl=self.cache_ttl)
+            await async_cache.set(cache_key, suggestions, expire=self.cache_ttl)
             
             return suggestions
         
@@ -357,7 +357,7 @@ class ContentWritingAssistant:
         cache_key = f"quality_improvements:{hash(content_text)}:{hash(json.dumps(context or {}))}"
         
         # Check cache
-        cached_result = await cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             return cached_result
         
@@ -400,7 +400,7 @@ class ContentWritingAssistant:
                 })
             
             # Cache results
-            await cache.set(cache_key, suggestions, ttl=self.cache_ttl)
+            await async_cache.set(cache_key, suggestions, expire=self.cache_ttl)
             
             return suggestions
         
@@ -425,7 +425,7 @@ class ContentWritingAssistant:
         cache_key = f"grammar_corrections:{hash(content_text)}"
         
         # Check cache
-        cached_result = await cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             return cached_result
         
@@ -457,7 +457,7 @@ class ContentWritingAssistant:
                 suggestion["metadata"]["model"] = result.get("model", "unknown")
             
             # Cache results
-            await cache.set(cache_key, suggestions, ttl=self.cache_ttl)
+            await async_cache.set(cache_key, suggestions, expire=self.cache_ttl)
             
             return suggestions
         
@@ -537,7 +537,7 @@ class ContentWritingAssistant:
         cache_key = f"style_recommendations:{hash(content_text)}:{target_style}:{target_tone}:{hash(json.dumps(context or {}))}"
         
         # Check cache
-        cached_result = await cache.get(cache_key)
+        cached_result = await async_cache.get(cache_key)
         if cached_result:
             return cached_result
         
@@ -580,7 +580,7 @@ class ContentWritingAssistant:
                 suggestion["metadata"]["target_tone"] = target_tone
             
             # Cache results
-            await cache.set(cache_key, suggestions, ttl=self.cache_ttl)
+            await async_cache.set(cache_key, suggestions, expire=self.cache_ttl)
             
             return suggestions
         
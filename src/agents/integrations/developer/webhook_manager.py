@@ -18,6 +18,7 @@ import requests
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.database import get_db
+from src.core.http_client import http_client
 from src.models.integration import Webhook
 
 logger = logging.getLogger(__name__)
@@ -401,7 +402,7 @@ class WebhookManager:
             
             # Send webhook request
             start_time = time.time()
-            response = requests.post(
+            response = http_client.post(
                 webhook_url,
                 data=formatted_payload,
                 headers=headers,
@@ -8,7 +8,6 @@ import json
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import requests
 
 from src.agents.integrations.email_marketing.base import EmailMarketingIntegration, IntegrationError
 
@@ -76,7 +75,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
         self._refresh_token_if_needed()
         
         def execute_request():
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/contacts/v1/lists",
                 headers=self._get_headers(),
                 params=self._get_api_key_param()
@@ -139,7 +138,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             # Add API key if needed
             query_params.update(self._get_api_key_param())
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/contacts/v1/lists/{list_id}/contacts/all",
                 headers=self._get_headers(),
                 params=query_params
@@ -220,7 +219,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             }
             
             # Create or update the contact
-            contact_response = requests.post(
+            contact_response = self.http.post(
                 f"{self.api_url}/contacts/v1/contact/createOrUpdate/email/{email}",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -234,7 +233,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             vid = contact_response.json().get("vid")
             
             # Now add the contact to the list
-            add_response = requests.post(
+            add_response = self.http.post(
                 f"{self.api_url}/contacts/v1/lists/{list_id}/add",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -305,7 +304,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             }
             
             # Update the contact
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/contacts/v1/contact/email/{email}/profile",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -377,7 +376,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
                 email_data["templateId"] = campaign_data["template_id"]
             
             # Create the email
-            email_response = requests.post(
+            email_response = self.http.post(
                 f"{self.api_url}/marketing-emails/v1/emails",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -429,7 +428,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             # 2. Schedule or send the campaign
             
             # First, ensure the campaign is ready to send
-            ready_response = requests.post(
+            ready_response = self.http.post(
                 f"{self.api_url}/marketing-emails/v1/emails/{campaign_id}/send-test",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -442,7 +441,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             # Now send the campaign
             # This is typically done through the Calendar API in HubSpot
             # For simplicity, we're using a direct send method here
-            send_response = requests.post(
+            send_response = self.http.post(
                 f"{self.api_url}/marketing-emails/v1/emails/{campaign_id}/send",
                 headers=self._get_headers(),
                 params=self._get_api_key_param()
@@ -479,7 +478,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
         
         def execute_request():
             # Get email stats
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/marketing-emails/v1/emails/{campaign_id}/statistics",
                 headers=self._get_headers(),
                 params=self._get_api_key_param()
@@ -554,7 +553,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
             }
             
             # Create the template
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/design-manager/v1/templates",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -645,7 +644,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
                 single_email["emailId"] = template_response.get("template_id")
             
             # Send the transactional email
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/email/public/v1/singleEmail/send",
                 headers=self._get_headers(),
                 params=self._get_api_key_param(),
@@ -686,7 +685,7 @@ class HubSpotIntegration(EmailMarketingIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/contacts/v1/lists",
                 headers=self._get_headers(),
                 params=self._get_api_key_param()
@@ -9,7 +9,6 @@ import json
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import requests
 
 from src.agents.integrations.email_marketing.base import EmailMarketingIntegration, IntegrationError
 
@@ -64,7 +63,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
             return credentials_check
         
         def execute_request():
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/lists",
                 headers=self._get_headers()
             )
@@ -114,7 +113,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
             # Build query parameters for filtering
             query_params = params or {}
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/lists/{list_id}/members",
                 headers=self._get_headers(),
                 params=query_params
@@ -191,7 +190,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
             if "tags" in member_data:
                 mailchimp_data["tags"] = member_data["tags"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/lists/{list_id}/members",
                 headers=self._get_headers(),
                 json=mailchimp_data
@@ -257,7 +256,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
             # Add tags if provided
             if "tags" in member_data:
                 # Tags require a separate API call in Mailchimp
-                tags_response = requests.post(
+                tags_response = self.http.post(
                     f"{self.api_url}/lists/{list_id}/members/{subscriber_hash}/tags",
                     headers=self._get_headers(),
                     json={
@@ -268,7 +267,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
                 if tags_response.status_code != 204:
                     logger.warning(f"Failed to update tags: {tags_response.status_code} - {tags_response.text}")
             
-            response = requests.patch(
+            response = self.http.patch(
                 f"{self.api_url}/lists/{list_id}/members/{subscriber_hash}",
                 headers=self._get_headers(),
                 json=mailchimp_data
@@ -333,7 +332,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
                 }
             
             # Create the campaign
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/campaigns",
                 headers=self._get_headers(),
                 json=mailchimp_campaign
@@ -347,7 +346,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
             
             # If content is provided, set the campaign content
             if "content" in campaign_data:
-                content_response = requests.put(
+                content_response = self.http.put(
                     f"{self.api_url}/campaigns/{campaign_id}/content",
                     headers=self._get_headers(),
                     json={"html": campaign_data["content"]}
@@ -387,7 +386,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
         
         def execute_request():
             # Check campaign before sending
-            check_response = requests.get(
+            check_response = self.http.get(
                 f"{self.api_url}/campaigns/{campaign_id}",
                 headers=self._get_headers()
             )
@@ -402,7 +401,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
                 )
             
             # Send the campaign
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/campaigns/{campaign_id}/actions/send",
                 headers=self._get_headers()
             )
@@ -437,7 +436,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
         
         def execute_request():
             # Get campaign report
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/reports/{campaign_id}",
                 headers=self._get_headers()
             )
@@ -503,7 +502,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
             }
             
             # Create the template
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/templates",
                 headers=self._get_headers(),
                 json=mailchimp_template
@@ -595,7 +594,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
                 if "merge_vars" in email_data:
                     mandrill_data["message"]["merge_vars"] = email_data["merge_vars"]
                 
-                response = requests.post(
+                response = self.http.post(
                     "https://mandrillapp.com/api/1.0/messages/send-template",
                     json=mandrill_data
                 )
@@ -611,7 +610,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
                     "async": email_data.get("async", False)
                 }
                 
-                response = requests.post(
+                response = self.http.post(
                     "https://mandrillapp.com/api/1.0/messages/send",
                     json=mandrill_data
                 )
@@ -655,7 +654,7 @@ class MailchimpIntegration(EmailMarketingIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/ping",
                 headers=self._get_headers()
             )
@@ -7,31 +7,40 @@ various platforms, including CMS, social media, and advertising platforms.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Hashable, Callable, Awaitable, AsyncIterator
 from datetime import datetime
 import asyncio
 
 from src.core.database import get_db
+from src.core.settings import settings
 from src.models.integration import SocialAccount, CMSAccount, AdAccount, IntegrationHealth
 from src.agents.integrations.cms_integration import CMSIntegrationFactory
 from src.agents.integrations.social_integration import SocialMediaIntegrationFactory
 from src.agents.integrations.ad_integration import AdPlatformIntegrationFactory
 from src.agents.integrations.integration_utils import sanitize_credentials
+from src.agents.integrations.base_integration import run_blocking
 
 logger = logging.getLogger(__name__)
 
 class IntegrationManager:
     """Manages integrations with external platforms."""
     
-    def __init__(self, cache=None):
+    def __init__(self, cache=None, max_concurrency: Optional[int] = None,
+                 platform_timeout: Optional[float] = None, health_check_timeout: Optional[float] = None):
         """Initialize the integration manager.
         
         Args:
             cache: Optional cache instance for storing integration data
+            max_concurrency: Maximum platform calls in flight for one fan-out
+            platform_timeout: Seconds to wait for one platform to publish
+            health_check_timeout: Seconds to wait for one integration health check
         """
         self.cache = cache
         self.cache_ttl = 3600  # 1 hour
         self.cache_prefix = "integration_credentials"
+        self.max_concurrency = max_concurrency or settings.INTEGRATION_FANOUT_CONCURRENCY
+        self.platform_timeout = platform_timeout or settings.INTEGRATION_PLATFORM_TIMEOUT
+        self.health_check_timeout = health_check_timeout or settings.INTEGRATION_HEALTH_CHECK_TIMEOUT
     
     async def _get_social_account_credentials(self, brand_id: Any, platform: str) -> Optional[Dict[str, Any]]:
         """Get social media account credentials for a brand.
@@ -53,8 +62,8 @@ class IntegrationManager:
                 except Exception:
                     pass
         
-        # If not in cache or cache failed, get from database
-        try:
+        # If not in cache or cache failed, get from database in a worker thread
+        def load_credentials() -> Optional[Dict[str, Any]]:
             with get_db() as db:
                 account = db.query(SocialAccount).filter(
                     SocialAccount.brand_id == brand_id,
@@ -77,6 +86,9 @@ class IntegrationManager:
                     return credentials
                 
                 return None
+
+        try:
+            return await run_blocking(load_credentials)
         except Exception as e:
             logger.error(f"Error getting social account credentials: {e}")
             return None
@@ -101,8 +113,8 @@ class IntegrationManager:
                 except Exception:
                     pass
         
-        # If not in cache or cache failed, get from database
-        try:
+        # If not in cache or cache failed, get from database in a worker thread
+        def load_credentials() -> Optional[Dict[str, Any]]:
             with get_db() as db:
                 account = db.query(CMSAccount).filter(
                     CMSAccount.brand_id == brand_id,
@@ -127,6 +139,9 @@ class IntegrationManager:
                     return credentials
                 
                 return None
+
+        try:
+            return await run_blocking(load_credentials)
         except Exception as e:
             logger.error(f"Error getting CMS account credentials: {e}")
             return None
@@ -151,8 +166,8 @@ class IntegrationManager:
                 except Exception:
                     pass
         
-        # If not in cache or cache failed, get from database
-        try:
+        # If not in cache or cache failed, get from database in a worker thread
+        def load_credentials() -> Optional[Dict[str, Any]]:
             with get_db() as db:
                 account = db.query(AdAccount).filter(
                     AdAccount.brand_id == brand_id,
@@ -178,6 +193,9 @@ class IntegrationManager:
                     return credentials
                 
                 return None
+
+        try:
+            return await run_blocking(load_credentials)
         except Exception as e:
             logger.error(f"Error getting ad account credentials: {e}")
             return None
@@ -195,7 +213,7 @@ class IntegrationManager:
             error_message: Error message if status is unhealthy
             details: Additional details about the health check
         """
-        try:
+        def write_record():
             with get_db() as db:
                 health_record = IntegrationHealth(
                     integration_type=integration_type,
@@ -207,6 +225,9 @@ class IntegrationManager:
                 )
                 db.add(health_record)
                 db.commit()
+
+        try:
+            await run_blocking(write_record)
         except Exception as e:
             logger.error(f"Error recording integration health: {e}")
     
@@ -273,9 +294,113 @@ class IntegrationManager:
             logger.error(f"Error creating ad platform integration: {e}")
             return None
     
+    @staticmethod
+    def _error_result(platform: str, error: str, details: Optional[str] = None) -> Dict[str, Any]:
+        """Build the error result reported for a platform."""
+        result = {
+            "status": "error",
+            "platform": platform,
+            "error": error,
+            "timestamp": datetime.now().isoformat()
+        }
+        if details:
+            result["details"] = details
+        return result
+    
+    async def _fan_out(self, jobs: Dict[Hashable, str],
+                       call: Callable[[Hashable], Awaitable[Dict[str, Any]]],
+                       timeout: float, action: str) -> AsyncIterator[Tuple[Hashable, Dict[str, Any]]]:
+        """Run one call per job concurrently and yield results as they finish.
+        
+        At most max_concurrency calls are in flight. A call that fails or takes
+        longer than timeout yields an error result instead of failing the others.
+        A timed-out call that was offloaded to a thread keeps running there, but
+        its result is discarded.
+        
+        Args:
+            jobs: Job keys mapped to the platform name used in error results
+            call: Coroutine function called with each job key
+            timeout: Seconds to wait for each call, excluding time queued for a slot
+            action: Description of the operation for error messages
+            
+        Yields:
+            Tuples of (job key, result) in completion order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(key: Hashable) -> Tuple[Hashable, Dict[str, Any]]:
+            platform = jobs[key]
+            async with semaphore:
+                try:
+                    return key, await asyncio.wait_for(call(key), timeout)
+                except asyncio.TimeoutError:
+                    logger.error(f"Timed out {action} {platform} after {timeout}s")
+                    return key, self._error_result(
+                        platform, f"Timed out after {timeout} seconds", f"Timeout during {action}"
+                    )
+                except Exception as e:
+                    logger.error(f"Error {action} {platform}: {e}")
+                    return key, self._error_result(platform, str(e), f"Exception during {action}")
+        
+        tasks = [asyncio.ensure_future(run(key)) for key in jobs]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # The consumer stopped early or was cancelled
+            for task in tasks:
+                task.cancel()
+    
+    def _load_brand_accounts(self, brand_id: Any) -> List[Tuple[str, int, str]]:
+        """Load (integration type, account ID, platform) for every account of a brand."""
+        accounts = []
+        with get_db() as db:
+            for integration_type, model in (("social", SocialAccount), ("cms", CMSAccount), ("ad", AdAccount)):
+                rows = db.query(model.id, model.platform).filter(model.brand_id == brand_id).all()
+                accounts.extend((integration_type, account_id, platform) for account_id, platform in rows)
+        return accounts
+    
+    def _write_health_results(self, checked: List[Tuple[str, int, Dict[str, Any]]]) -> None:
+        """Record health checks and update account health status in one transaction.
+        
+        Args:
+            checked: Tuples of (integration type, account ID, health result)
+        """
+        now = datetime.now()
+        with get_db() as db:
+            db.add_all([
+                IntegrationHealth(
+                    integration_type=integration_type,
+                    integration_id=account_id,
+                    status=health_result.get("status"),
+                    response_time_ms=health_result.get("response_time_ms"),
+                    error_message=health_result.get("error"),
+                    details=health_result
+                )
+                for integration_type, account_id, health_result in checked
+            ])
+            
+            for integration_type, model in (("social", SocialAccount), ("cms", CMSAccount), ("ad", AdAccount)):
+                statuses = {
+                    account_id: health_result.get("status")
+                    for checked_type, account_id, health_result in checked
+                    if checked_type == integration_type
+                }
+                if not statuses:
+                    continue
+                for account in db.query(model).filter(model.id.in_(list(statuses))).all():
+                    account.health_status = statuses[account.id]
+                    account.last_health_check = now
+            
+            db.commit()
+    
     async def check_all_integrations_health(self, brand_id: Any) -> Dict[str, Any]:
         """Check the health of all integrations for a brand.
         
+        Every account is checked concurrently (bounded by max_concurrency, each
+        limited to health_check_timeout), and the results are written to the
+        database in a single batch afterwards.
+        
         Args:
             brand_id: The brand ID
             
@@ -287,96 +412,80 @@ class IntegrationManager:
             "cms": {},
             "ad": {}
         }
+        getters = {
+            "social": self.get_social_integration,
+            "cms": self.get_cms_integration,
+            "ad": self.get_ad_integration
+        }
         
         try:
-            # Check social integrations
-            with get_db() as db:
-                social_accounts = db.query(SocialAccount).filter(
-                    SocialAccount.brand_id == brand_id
-                ).all()
-                
-                for account in social_accounts:
-                    integration = await self.get_social_integration(brand_id, account.platform)
-                    if integration:
-                        health_result = integration.check_health()
-                        results["social"][account.platform] = health_result
-                        
-                        # Record health status
-                        await self._record_integration_health(
-                            integration_type="social",
-                            integration_id=account.id,
-                            status=health_result.get("status"),
-                            response_time_ms=health_result.get("response_time_ms"),
-                            error_message=health_result.get("error"),
-                            details=health_result
-                        )
-                        
-                        # Update account health status
-                        account.health_status = health_result.get("status")
-                        account.last_health_check = datetime.now()
-                
-                # Check CMS integrations
-                cms_accounts = db.query(CMSAccount).filter(
-                    CMSAccount.brand_id == brand_id
-                ).all()
-                
-                for account in cms_accounts:
-                    integration = await self.get_cms_integration(brand_id, account.platform)
-                    if integration:
-                        health_result = integration.check_health()
-                        results["cms"][account.platform] = health_result
-                        
-                        # Record health status
-                        await self._record_integration_health(
-                            integration_type="cms",
-                            integration_id=account.id,
-                            status=health_result.get("status"),
-                            response_time_ms=health_result.get("response_time_ms"),
-                            error_message=health_result.get("error"),
-                            details=health_result
-                        )
-                        
-                        # Update account health status
-                        account.health_status = health_result.get("status")
-                        account.last_health_check = datetime.now()
-                
-                # Check ad integrations
-                ad_accounts = db.query(AdAccount).filter(
-                    AdAccount.brand_id == brand_id
-                ).all()
-                
-                for account in ad_accounts:
-                    integration = await self.get_ad_integration(brand_id, account.platform)
-                    if integration:
-                        health_result = integration.check_health()
-                        results["ad"][account.platform] = health_result
-                        
-                        # Record health status
-                        await self._record_integration_health(
-                            integration_type="ad",
-                            integration_id=account.id,
-                            status=health_result.get("status"),
-                            response_time_ms=health_result.get("response_time_ms"),
-                            error_message=health_result.get("error"),
-                            details=health_result
-                        )
-                        
-                        # Update account health status
-                        account.health_status = health_result.get("status")
-                        account.last_health_check = datetime.now()
-                
-                # Commit all health status updates
-                db.commit()
-        
+            accounts = await run_blocking(self._load_brand_accounts, brand_id)
         except Exception as e:
             logger.error(f"Error checking integrations health: {e}")
+            return results
+        
+        jobs = {(integration_type, account_id): platform for integration_type, account_id, platform in accounts}
+        
+        async def check(key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+            integration = await getters[key[0]](brand_id, jobs[key])
+            if not integration:
+                return None
+            return await integration.check_health_async()
+        
+        checked = []
+        async for (integration_type, account_id), health_result in self._fan_out(
+            jobs, check, self.health_check_timeout, "checking health of"
+        ):
+            if health_result is None:
+                continue  # No usable credentials for this account
+            if health_result.get("status") == "error":
+                health_result["status"] = "unhealthy"
+            results[integration_type][jobs[(integration_type, account_id)]] = health_result
+            checked.append((integration_type, account_id, health_result))
+        
+        if checked:
+            try:
+                await run_blocking(self._write_health_results, checked)
+            except Exception as e:
+                logger.error(f"Error recording integration health: {e}")
         
         return results
     
+    async def iter_publish_to_social(self, brand_id: Any, platforms: List[str], content_data: Dict[str, Any],
+                                     publish_time: Optional[str] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Publish content to social media platforms concurrently, yielding each result as it arrives.
+        
+        Args:
+            brand_id: The brand ID
+            platforms: List of social media platforms to publish to
+            content_data: Content data to publish
+            publish_time: Optional ISO format datetime for scheduled publishing
+            
+        Yields:
+            Tuples of (platform, publishing result) in completion order
+        """
+        async def publish(platform: str) -> Dict[str, Any]:
+            integration = await self.get_social_integration(brand_id, platform)
+            if not integration:
+                return self._error_result(platform, f"No integration available for {platform}")
+            
+            # If publish time is provided, schedule the post
+            if publish_time:
+                return await integration.schedule_content_async(content_data, publish_time)
+            return await integration.post_content_async(content_data)
+        
+        async for platform, result in self._fan_out(
+            {platform: platform for platform in platforms}, publish, self.platform_timeout, "publishing to"
+        ):
+            yield platform, result
+    
     async def publish_to_social(self, brand_id: Any, platforms: List[str], content_data: Dict[str, Any], 
                      publish_time: Optional[str] = None) -> Dict[str, Any]:
         """Publish content to social media platforms.
         
+        Platforms are published to concurrently; use iter_publish_to_social to
+        receive each result as soon as it is available.
+        
         Args:
             brand_id: The brand ID
             platforms: List of social media platforms to publish to
@@ -387,42 +496,45 @@ class IntegrationManager:
             Dict containing publishing results for each platform
         """
         results = {}
+        async for platform, result in self.iter_publish_to_social(brand_id, platforms, content_data, publish_time):
+            results[platform] = result
+        return {platform: results[platform] for platform in platforms}
+    
+    async def iter_publish_to_cms(self, brand_id: Any, platforms: List[str], content_data: Dict[str, Any],
+                                  publish_time: Optional[str] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Publish content to CMS platforms concurrently, yielding each result as it arrives.
         
-        for platform in platforms:
-            integration = await self.get_social_integration(brand_id, platform)
+        Args:
+            brand_id: The brand ID
+            platforms: List of CMS platforms to publish to
+            content_data: Content data to publish
+            publish_time: Optional ISO format datetime for scheduled publishing
+            
+        Yields:
+            Tuples of (platform, publishing result) in completion order
+        """
+        async def publish(platform: str) -> Dict[str, Any]:
+            integration = await self.get_cms_integration(brand_id, platform)
             if not integration:
-                results[platform] = {
-                    "status": "error",
-                    "platform": platform,
-                    "error": f"No integration available for {platform}",
-                    "timestamp": datetime.now().isoformat()
-                }
-                continue
+                return self._error_result(platform, f"No integration available for {platform}")
             
-            try:
-                # If publish time is provided, schedule the post
-                if publish_time:
-                    result = integration.schedule_content(content_data, publish_time)
-                else:
-                    result = integration.post_content(content_data)
-                
-                results[platform] = result
-            except Exception as e:
-                logger.error(f"Error publishing to {platform}: {e}")
-                results[platform] = {
-                    "status": "error",
-                    "platform": platform,
-                    "error": str(e),
-                    "details": "Exception during publication",
-                    "timestamp": datetime.now().isoformat()
-                }
+            # If publish time is provided, schedule the post
+            if publish_time:
+                return await integration.schedule_content_async(content_data, publish_time)
+            return await integration.publish_content_async(content_data)
         
-        return results
+        async for platform, result in self._fan_out(
+            {platform: platform for platform in platforms}, publish, self.platform_timeout, "publishing to"
+        ):
+            yield platform, result
     
     async def publish_to_cms(self, brand_id: Any, platforms: List[str], content_data: Dict[str, Any], 
                   publish_time: Optional[str] = None) -> Dict[str, Any]:
         """Publish content to CMS platforms.
         
+        Platforms are published to concurrently; use iter_publish_to_cms to
+        receive each result as soon as it is available.
+        
         Args:
             brand_id: The brand ID
             platforms: List of CMS platforms to publish to
@@ -433,41 +545,39 @@ class IntegrationManager:
             Dict containing publishing results for each platform
         """
         results = {}
+        async for platform, result in self.iter_publish_to_cms(brand_id, platforms, content_data, publish_time):
+            results[platform] = result
+        return {platform: results[platform] for platform in platforms}
+    
+    async def iter_create_ad_campaign(self, brand_id: Any, platforms: List[str],
+                                      campaign_data: Dict[str, Any]) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Create ad campaigns on multiple platforms concurrently, yielding each result as it arrives.
         
-        for platform in platforms:
-            integration = await self.get_cms_integration(brand_id, platform)
-            if not integration:
-                results[platform] = {
-                    "status": "error",
-                    "platform": platform,
-                    "error": f"No integration available for {platform}",
-                    "timestamp": datetime.now().isoformat()
-                }
-                continue
+        Args:
+            brand_id: The brand ID
+            platforms: List of ad platforms to create campaigns on
+            campaign_data: Campaign configuration data
             
-            try:
-                # If publish time is provided, schedule the post
-                if publish_time:
-                    result = integration.schedule_content(content_data, publish_time)
-                else:
-                    result = integration.publish_content(content_data)
-                
-                results[platform] = result
-            except Exception as e:
-                logger.error(f"Error publishing to {platform}: {e}")
-                results[platform] = {
-                    "status": "error",
-                    "platform": platform,
-                    "error": str(e),
-                    "details": "Exception during publication",
-                    "timestamp": datetime.now().isoformat()
-                }
+        Yields:
+            Tuples of (platform, creation result) in completion order
+        """
+        async def create(platform: str) -> Dict[str, Any]:
+            integration = await self.get_ad_integration(brand_id, platform)
+            if not integration:
+                return self._error_result(platform, f"No integration available for {platform}")
+            return await integration.create_campaign_async(campaign_data)
         
-        return results
+        async for platform, result in self._fan_out(
+            {platform: platform for platform in platforms}, create, self.platform_timeout, "creating campaign on"
+        ):
+            yield platform, result
     
     async def create_ad_campaign(self, brand_id: Any, platforms: List[str], campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create ad campaigns on multiple platforms.
         
+        Platforms are called concurrently; use iter_create_ad_campaign to
+        receive each result as soon as it is available.
+        
         Args:
             brand_id: The brand ID
             platforms: List of ad platforms to create campaigns on
@@ -477,29 +587,6 @@ class IntegrationManager:
             Dict containing creation results for each platform
         """
         results = {}
-        
-        for platform in platforms:
-            integration = await self.get_ad_integration(brand_id, platform)
-            if not integration:
-                results[platform] = {
-                    "status": "error",
-                    "platform": platform,
-                    "error": f"No integration available for {platform}",
-                    "timestamp": datetime.now().isoformat()
-                }
-                continue
-            
-            try:
-                result = integration.create_campaign(campaign_data)
-                results[platform] = result
-            except Exception as e:
-                logger.error(f"Error creating campaign on {platform}: {e}")
-                results[platform] = {
-                    "status": "error",
-                    "platform": platform,
-                    "error": str(e),
-                    "details": "Exception during campaign creation",
-                    "timestamp": datetime.now().isoformat()
-                }
-        
-        return results
\ No newline at end of file
+        async for platform, result in self.iter_create_ad_campaign(brand_id, platforms, campaign_data):
+            results[platform] = result
+        return {platform: results[platform] for platform in platforms}
@@ -9,15 +9,89 @@ import os
 import yaml
 import json
 import re
+import time
+import uuid
+import atexit
 import hashlib
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable
 import logging
 from pathlib import Path
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Not available on Windows; aggregate updates are then only safe within one process
+    FCNTL_AVAILABLE = False
+
+from src.core.settings import settings
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# {{variable}} or {{nested.variable}} placeholders in template text
+PLACEHOLDER_PATTERN = re.compile(r'{{([^{}]+)}}')
+
+
+class _Placeholder:
+    """A compiled {{variable}} reference that resolves itself against a variables dict."""
+    
+    __slots__ = ("source", "name", "path")
+    
+    def __init__(self, source: str, name: str):
+        self.source = source  # The placeholder as written, kept when the variable is missing
+        self.name = name
+        self.path = tuple(name.split('.')) if '.' in name else None
+    
+    def resolve(self, variables: Dict[str, Any]) -> str:
+        """Get the substituted text for this placeholder."""
+        if self.path is None:
+            if self.name in variables:
+                return str(variables[self.name])
+            return self.source
+        
+        # Handle nested dictionary access with dot notation
+        value = variables
+        for part in self.path:
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return self.source
+        return str(value)
+
+
+class CompiledText:
+    """
+    Template text split once into literal text and placeholders.
+    
+    Rendering joins the literals with each placeholder's value, so the text is
+    scanned for placeholders only when it is compiled rather than on every render.
+    """
+    
+    __slots__ = ("segments",)
+    
+    def __init__(self, text: str):
+        segments: List[Union[str, _Placeholder]] = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(text):
+            if match.start() > position:
+                segments.append(text[position:match.start()])
+            segments.append(_Placeholder(match.group(0), match.group(1).strip()))
+            position = match.end()
+        if position < len(text):
+            segments.append(text[position:])
+        self.segments = tuple(segments)
+    
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Substitute variables into the compiled text."""
+        return "".join([
+            segment if segment.__class__ is str else segment.resolve(variables)
+            for segment in self.segments
+        ])
+
 
 class PromptVersion:
     """Manages versioning for prompt templates."""
@@ -171,17 +245,63 @@ class PromptVersion:
 
 
 class PromptAnalytics:
-    """Analytics for prompt performance and optimization."""
+    """
+    Analytics for prompt performance and optimization.
     
-    def __init__(self, analytics_dir: str):
+    Usage records are buffered in memory and appended in batches to a
+    per-process JSONL segment under ``usage/segments``, so concurrent workers
+    never write the same file. A buffer is flushed once it holds flush_records
+    records or its oldest record is flush_seconds old, by a timer if no further
+    record arrives. Segments are sealed once they reach the size limit. Sealed
+    segments are compacted into one ``usage/YYYY-MM.jsonl`` log per month.
+    
+    Each flush also merges the batch into ``aggregates/<template_id>.json``.
+    Counts and metric sums are updated under an exclusive file lock, so
+    updates from different processes are never lost. Performance queries and
+    suggestions are answered from that aggregate plus this process's unflushed
+    records, so their cost does not grow with the number of recorded usages.
+    """
+    
+    def __init__(self, analytics_dir: str,
+                 flush_records: Optional[int] = None,
+                 flush_seconds: Optional[float] = None,
+                 segment_bytes: Optional[int] = None,
+                 compact_segments: Optional[int] = None):
         """
         Initialize the prompt analytics system.
         
         Args:
             analytics_dir: Directory to store analytics data
+            flush_records: Buffered records that trigger a flush
+            flush_seconds: Age of the oldest buffered record that triggers a flush
+            segment_bytes: Size at which a segment is sealed
+            compact_segments: Sealed segments that trigger a compaction
         """
         self.analytics_dir = analytics_dir
-        os.makedirs(analytics_dir, exist_ok=True)
+        self.flush_records = flush_records if flush_records is not None else settings.PROMPT_ANALYTICS_FLUSH_RECORDS
+        self.flush_seconds = flush_seconds if flush_seconds is not None else settings.PROMPT_ANALYTICS_FLUSH_SECONDS
+        self.segment_bytes = segment_bytes if segment_bytes is not None else settings.PROMPT_ANALYTICS_SEGMENT_BYTES
+        self.compact_segments = (compact_segments if compact_segments is not None
+                                 else settings.PROMPT_ANALYTICS_COMPACT_SEGMENTS)
+        
+        self.usage_dir = os.path.join(analytics_dir, "usage")
+        self.segments_dir = os.path.join(self.usage_dir, "segments")
+        self.aggregates_dir = os.path.join(analytics_dir, "aggregates")
+        os.makedirs(self.segments_dir, exist_ok=True)
+        os.makedirs(self.aggregates_dir, exist_ok=True)
+        
+        self._lock = threading.RLock()
+        self._buffer: List[str] = []
+        self._pending: Dict[str, Dict[str, Any]] = {}  # template_id -> aggregate of unflushed records
+        self._buffer_started: Optional[float] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._segment_path: Optional[str] = None
+        self._segment_file = None  # Open and locked while the segment is active
+        # template_id -> (aggregate file state, performance view, suggestions or None)
+        self._views: Dict[str, Tuple[Tuple[Any, Any], Dict[str, Any], Optional[List[Dict[str, Any]]]]] = {}
+        
+        # Write out buffered records when the process exits normally
+        atexit.register(self.flush)
     
     def record_usage(self, 
                    template_id: str,
@@ -214,22 +334,113 @@ class PromptAnalytics:
             "context_variables": context_vars,
             "performance_metrics": performance_metrics
         }
+        line = json.dumps(record, default=str) + "\n"
+        
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.append(line)
+            _fold_usage(self._pending.setdefault(template_id, _empty_aggregate()), version_id, performance_metrics)
+            
+            if (len(self._buffer) >= self.flush_records
+                    or time.monotonic() - self._buffer_started >= self.flush_seconds):
+                self.flush()
+            elif self._flush_timer is None:
+                # Flush on time even if no further record arrives
+                self._start_flush_timer()
+    
+    def _start_flush_timer(self) -> None:
+        timer = threading.Timer(self.flush_seconds, self._flush_on_timer)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+    
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
+            if self._buffer or self._pending:
+                # The flush failed; try again later
+                self._start_flush_timer()
+    
+    def flush(self) -> None:
+        """
+        Append buffered records to the usage log and merge them into the stored aggregates.
         
-        # Save record to analytics storage
-        month_dir = os.path.join(self.analytics_dir, datetime.now().strftime("%Y-%m"))
-        os.makedirs(month_dir, exist_ok=True)
+        Each step is dropped from the buffers as soon as it succeeds, so a flush that
+        fails part way retries only what was not yet written and never counts twice.
+        """
+        with self._lock:
+            if not self._buffer and not self._pending:
+                return
+            
+            try:
+                if self._buffer:
+                    self._append_to_segment(self._buffer)
+                    self._buffer = []
+                    self._buffer_started = None
+                for template_id in list(self._pending):
+                    self._merge_into_aggregate(template_id, self._pending[template_id])
+                    del self._pending[template_id]
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            except Exception as e:
+                # Keep the unwritten records and deltas so the next flush retries them
+                logger.error(f"Error flushing prompt analytics: {str(e)}")
+    
+    def compact(self) -> int:
+        """
+        Merge sealed usage segments into monthly logs and delete them.
         
-        record_path = os.path.join(month_dir, f"{usage_id}.json")
-        with open(record_path, 'w') as f:
-            json.dump(record, f, indent=2)
+        Writers hold a lock on their active segment until they seal it, so an active
+        segment whose lock can be taken was left behind by a process that stopped
+        without sealing it, and is compacted too. Without fcntl, active segments are
+        never compacted.
         
-        # Update aggregated metrics
-        self._update_template_metrics(template_id, version_id, performance_metrics)
+        Returns:
+            Number of segments compacted
+        """
+        with _exclusive_lock(os.path.join(self.usage_dir, ".compact.lock")):
+            compacted = 0
+            for name in sorted(os.listdir(self.segments_dir)):
+                segment_path = os.path.join(self.segments_dir, name)
+                if not name.endswith(".jsonl") or segment_path == self._segment_path:
+                    continue
+                if not name.endswith(".active.jsonl"):
+                    self._compact_segment(segment_path)
+                    compacted += 1
+                    continue
+                with _abandoned_segment(segment_path) as abandoned:
+                    if abandoned:
+                        self._compact_segment(segment_path)
+                        compacted += 1
+            
+            return compacted
+    
+    def _compact_segment(self, segment_path: str) -> None:
+        """Append a segment's records to the monthly logs and delete it."""
+        by_month: Dict[str, List[str]] = {}
+        with open(segment_path, 'r') as f:
+            for line in f:
+                try:
+                    month = json.loads(line)["timestamp"][:7]
+                except (ValueError, KeyError, TypeError):
+                    # A partial line from a crashed writer
+                    continue
+                by_month.setdefault(month, []).append(line)
+        
+        for month, lines in by_month.items():
+            with open(os.path.join(self.usage_dir, f"{month}.jsonl"), 'a') as f:
+                f.writelines(lines)
+        os.remove(segment_path)
     
     def get_template_performance(self, template_id: str, days: int = 30) -> Dict[str, Any]:
         """
         Get performance data for a specific template.
         
+        The returned dictionary may be shared with later calls and must not be modified.
+        
         Args:
             template_id: The template identifier
             days: Number of days to include in the report
@@ -237,16 +448,7 @@ class PromptAnalytics:
         Returns:
             Performance statistics dictionary
         """
-        metrics_path = os.path.join(self.analytics_dir, f"{template_id}_metrics.json")
-        if not os.path.exists(metrics_path):
-            return {"usage_count": 0, "versions": {}, "performance": {}}
-            
-        with open(metrics_path, 'r') as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                logger.error(f"Error decoding metrics file: {metrics_path}")
-                return {"usage_count": 0, "versions": {}, "performance": {}}
+        return self._current_view(template_id)[0]
     
     def get_version_performance(self, template_id: str, version_id: str) -> Dict[str, Any]:
         """
@@ -273,7 +475,19 @@ class PromptAnalytics:
         Returns:
             List of improvement suggestions
         """
-        metrics = self.get_template_performance(template_id)
+        view, cached = self._current_view(template_id)
+        if not cached:
+            return self._build_suggestions(view)
+        
+        state, view, suggestions = self._views[template_id]
+        if suggestions is None:
+            suggestions = self._build_suggestions(view)
+            self._views[template_id] = (state, view, suggestions)
+        return list(suggestions)
+    
+    @staticmethod
+    def _build_suggestions(metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Derive improvement suggestions from a template's performance statistics."""
         suggestions = []
         
         # Analyze version performance
@@ -335,62 +549,218 @@ class PromptAnalytics:
         
         return suggestions
     
-    def _update_template_metrics(self, template_id: str, version_id: str, 
-                               performance_metrics: Dict[str, Any]) -> None:
+    def _current_view(self, template_id: str) -> Tuple[Dict[str, Any], bool]:
         """
-        Update aggregated metrics for a template.
-        
-        Args:
-            template_id: The template identifier
-            version_id: The template version ID
-            performance_metrics: New performance data
-        """
-        metrics_path = os.path.join(self.analytics_dir, f"{template_id}_metrics.json")
-        
-        if os.path.exists(metrics_path):
-            with open(metrics_path, 'r') as f:
-                try:
-                    metrics = json.load(f)
-                except json.JSONDecodeError:
-                    metrics = {"usage_count": 0, "versions": {}, "performance": {}}
-        else:
-            metrics = {"usage_count": 0, "versions": {}, "performance": {}}
+        Get a template's performance view, including this process's unflushed records.
         
-        # Update overall usage count
-        metrics["usage_count"] = metrics.get("usage_count", 0) + 1
-        
-        # Ensure version exists in metrics
-        if version_id not in metrics.get("versions", {}):
-            if "versions" not in metrics:
-                metrics["versions"] = {}
-            metrics["versions"][version_id] = {"usage_count": 0, "performance": {}}
-        
-        # Update version usage count
-        metrics["versions"][version_id]["usage_count"] = metrics["versions"][version_id].get("usage_count", 0) + 1
-        
-        # Update performance metrics (running averages)
-        for metric, value in performance_metrics.items():
-            # Update global metrics
-            if metric not in metrics["performance"]:
-                metrics["performance"][metric] = value
-            else:
-                # Calculate running average
-                current = metrics["performance"][metric]
-                count = metrics["usage_count"]
-                metrics["performance"][metric] = ((current * (count - 1)) + value) / count
-                
-            # Update version-specific metrics
-            if metric not in metrics["versions"][version_id]["performance"]:
-                metrics["versions"][version_id]["performance"][metric] = value
-            else:
-                # Calculate running average
-                current = metrics["versions"][version_id]["performance"][metric]
-                count = metrics["versions"][version_id]["usage_count"]
-                metrics["versions"][version_id]["performance"][metric] = ((current * (count - 1)) + value) / count
+        Returns:
+            Tuple of (view, whether the view is the cached one); unflushed records
+            make the view one-off
+        """
+        aggregate_path = self._aggregate_path(template_id)
+        legacy_path = os.path.join(self.analytics_dir, f"{template_id}_metrics.json")
+        state = (_file_state(aggregate_path), _file_state(legacy_path))
+        
+        cache_entry = self._views.get(template_id)
+        if cache_entry is None or cache_entry[0] != state:
+            view = _aggregate_view(self._load_aggregate(template_id))
+            cache_entry = (state, view, None)
+            self._views[template_id] = cache_entry
+        
+        with self._lock:
+            delta = self._pending.get(template_id)
+            if delta is None:
+                return cache_entry[1], True
+            aggregate = self._load_aggregate(template_id)
+            _merge_aggregates(aggregate, delta)
+        return _aggregate_view(aggregate), False
+    
+    def _aggregate_path(self, template_id: str) -> str:
+        return os.path.join(self.aggregates_dir, f"{template_id}.json")
+    
+    def _load_aggregate(self, template_id: str) -> Dict[str, Any]:
+        """Read a template's stored aggregate, seeding it from a legacy metrics file if needed."""
+        aggregate_path = self._aggregate_path(template_id)
+        if os.path.exists(aggregate_path):
+            try:
+                with open(aggregate_path, 'r') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                logger.error(f"Error decoding aggregate file: {aggregate_path}")
+                return _empty_aggregate()
         
-        # Save updated metrics
-        with open(metrics_path, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        legacy_path = os.path.join(self.analytics_dir, f"{template_id}_metrics.json")
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, 'r') as f:
+                    return _aggregate_from_legacy(json.load(f))
+            except json.JSONDecodeError:
+                logger.error(f"Error decoding metrics file: {legacy_path}")
+        return _empty_aggregate()
+    
+    def _merge_into_aggregate(self, template_id: str, delta: Dict[str, Any]) -> None:
+        """Add a batch of usage to a template's stored aggregate under the cross-process lock."""
+        aggregate_path = self._aggregate_path(template_id)
+        with _exclusive_lock(f"{aggregate_path}.lock"):
+            aggregate = self._load_aggregate(template_id)
+            _merge_aggregates(aggregate, delta)
+            
+            # Write a new file and swap it in, so readers never see a partial aggregate
+            temp_path = f"{aggregate_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(aggregate, f)
+            os.replace(temp_path, aggregate_path)
+    
+    def _open_segment(self) -> None:
+        """Create this process's active segment, locked until it is sealed."""
+        name = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        segment_path = os.path.join(self.segments_dir, f"{name}.active.jsonl")
+        
+        # Lock under a temporary name, so compaction never finds the segment unlocked
+        temp_path = os.path.join(self.segments_dir, f"{name}.new")
+        segment_file = open(temp_path, 'a')
+        if FCNTL_AVAILABLE:
+            fcntl.flock(segment_file.fileno(), fcntl.LOCK_EX)
+        os.replace(temp_path, segment_path)
+        self._segment_path, self._segment_file = segment_path, segment_file
+    
+    def _append_to_segment(self, lines: List[str]) -> None:
+        """Append lines to this process's active segment, sealing it once it is full."""
+        if self._segment_file is None:
+            self._open_segment()
+        
+        self._segment_file.write("".join(lines))
+        self._segment_file.flush()
+        size = self._segment_file.tell()
+        
+        if size >= self.segment_bytes:
+            os.replace(self._segment_path, self._segment_path.replace(".active.jsonl", ".jsonl"))
+            # Closing releases the lock, now that the segment is sealed
+            self._segment_file.close()
+            self._segment_path, self._segment_file = None, None
+            
+            sealed = sum(1 for name in os.listdir(self.segments_dir)
+                         if name.endswith(".jsonl") and not name.endswith(".active.jsonl"))
+            if sealed >= self.compact_segments:
+                self.compact()
+
+
+def _file_state(path: str) -> Optional[Tuple[int, int, int]]:
+    """Get a file's inode, modification time and size, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def _exclusive_lock(lock_path: str):
+    """Hold an exclusive lock on a lock file, shared across processes on this host."""
+    with open(lock_path, 'a') as lock_file:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def _abandoned_segment(segment_path: str):
+    """
+    Yield whether an active segment's writer has gone, holding its lock if so.
+    
+    Without fcntl there is no way to tell, so segments are never reported abandoned.
+    """
+    if not FCNTL_AVAILABLE:
+        yield False
+        return
+    try:
+        segment_file = open(segment_path, 'a')
+    except FileNotFoundError:
+        # Sealed since it was listed
+        yield False
+        return
+    with segment_file:
+        try:
+            fcntl.flock(segment_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        # Its writer may have sealed it between the open and the lock
+        yield os.path.exists(segment_path)
+
+
+def _empty_aggregate() -> Dict[str, Any]:
+    """Create an empty usage aggregate; metrics map to [sum, count] pairs."""
+    return {"usage_count": 0, "metrics": {}, "versions": {}}
+
+
+def _fold_usage(aggregate: Dict[str, Any], version_id: str, performance_metrics: Dict[str, Any]) -> None:
+    """Add one usage to an aggregate."""
+    version = aggregate["versions"].setdefault(version_id, {"usage_count": 0, "metrics": {}})
+    aggregate["usage_count"] += 1
+    version["usage_count"] += 1
+    for metric, value in performance_metrics.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        for totals in (aggregate["metrics"], version["metrics"]):
+            total = totals.setdefault(metric, [0, 0])
+            total[0] += value
+            total[1] += 1
+
+
+def _merge_aggregates(target: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Add the counts and sums of one aggregate into another."""
+    target["usage_count"] += delta["usage_count"]
+    for metric, (value_sum, count) in delta["metrics"].items():
+        total = target["metrics"].setdefault(metric, [0, 0])
+        total[0] += value_sum
+        total[1] += count
+    for version_id, version_delta in delta["versions"].items():
+        version = target["versions"].setdefault(version_id, {"usage_count": 0, "metrics": {}})
+        version["usage_count"] += version_delta["usage_count"]
+        for metric, (value_sum, count) in version_delta["metrics"].items():
+            total = version["metrics"].setdefault(metric, [0, 0])
+            total[0] += value_sum
+            total[1] += count
+
+
+def _aggregate_view(aggregate: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an aggregate to the usage counts and metric averages reported by PromptAnalytics."""
+    def averages(metrics: Dict[str, List[float]]) -> Dict[str, float]:
+        return {metric: value_sum / count for metric, (value_sum, count) in metrics.items() if count}
+    
+    return {
+        "usage_count": aggregate["usage_count"],
+        "versions": {
+            version_id: {"usage_count": version["usage_count"], "performance": averages(version["metrics"])}
+            for version_id, version in aggregate["versions"].items()
+        },
+        "performance": averages(aggregate["metrics"])
+    }
+
+
+def _aggregate_from_legacy(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild an aggregate from a metrics file written by the previous running-average format."""
+    def totals(performance: Dict[str, Any], count: int) -> Dict[str, List[float]]:
+        return {metric: [value * count, count] for metric, value in performance.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)}
+    
+    usage_count = metrics.get("usage_count", 0)
+    return {
+        "usage_count": usage_count,
+        "metrics": totals(metrics.get("performance", {}), usage_count),
+        "versions": {
+            version_id: {
+                "usage_count": version.get("usage_count", 0),
+                "metrics": totals(version.get("performance", {}), version.get("usage_count", 0))
+            }
+            for version_id, version in metrics.get("versions", {}).items()
+        }
+    }
 
 
 class PromptTemplate:
@@ -409,6 +779,9 @@ class PromptTemplate:
         self.analytics = analytics
         self.versioning = PromptVersion(template_path)
         
+        # Compiled form of each template text, built on first render
+        self._compiled: Dict[str, CompiledText] = {}
+        
         # Load the template
         self.reload()
     
@@ -426,6 +799,8 @@ class PromptTemplate:
             self.metadata = template_data.get('metadata', {})
             self.examples = template_data.get('examples', [])
             
+            self._compiled.clear()
+            
         except Exception as e:
             logger.error(f"Error loading template {self.template_path}: {str(e)}")
             raise
@@ -463,6 +838,37 @@ class PromptTemplate:
             "response_format": rendered_response_format
         }
     
+    def render_many(self, variable_sets: Iterable[Dict[str, Any]],
+                    system_prompt_vars: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """
+        Render the template for many variable sets, e.g. one per campaign recipient.
+        
+        The template texts are compiled once for the whole batch.
+        
+        Args:
+            variable_sets: Variables to substitute, one dictionary per rendered prompt
+            system_prompt_vars: Optional variables shared by every system prompt; by
+                default each system prompt uses its own variable set
+            
+        Returns:
+            Rendered prompts in the same order as variable_sets, as returned by render
+        """
+        system = self._compile(self.system_prompt)
+        template = self._compile(self.template)
+        response_format = self._compile(self.response_format)
+        
+        # A system prompt rendered from shared variables is the same for every set
+        shared_system = system.render(system_prompt_vars) if system_prompt_vars is not None else None
+        
+        return [
+            {
+                "system_prompt": shared_system if shared_system is not None else system.render(variables),
+                "user_prompt": template.render(variables),
+                "response_format": response_format.render(variables)
+            }
+            for variables in variable_sets
+        ]
+    
     def save_version(self, version_note: str) -> str:
         """
         Save the current template as a new version.
@@ -482,6 +888,9 @@ class PromptTemplate:
             'examples': self.examples
         }, default_flow_style=False)
         
+        # Start the new version with only its own texts compiled
+        self._compiled.clear()
+        
         return self.versioning.save_version(template_content, version_note)
     
     def load_version(self, version_id: str) -> bool:
@@ -507,6 +916,8 @@ class PromptTemplate:
             self.metadata = template_data.get('metadata', {})
             self.examples = template_data.get('examples', [])
             
+            self._compiled.clear()
+            
             return True
         except Exception as e:
             logger.error(f"Error loading template version {version_id}: {str(e)}")
@@ -555,6 +966,19 @@ class PromptTemplate:
             return self.analytics.get_improvement_suggestions(self.template_id)
         return []
     
+    def _compile(self, text: Optional[str]) -> CompiledText:
+        """
+        Get the compiled form of a template text, compiling it on first use.
+        
+        Entries are keyed by the text itself, so texts edited in place (for example
+        by PromptManager.update_template) are compiled afresh rather than served stale.
+        """
+        text = text or ""
+        compiled = self._compiled.get(text)
+        if compiled is None:
+            compiled = self._compiled[text] = CompiledText(text)
+        return compiled
+    
     def _substitute_variables(self, text: str, variables: Dict[str, Any]) -> str:
         """
         Substitute variables in template text.
@@ -568,33 +992,9 @@ class PromptTemplate:
         """
         if not text:
             return ""
-            
-        # Use regex to find all {{variable}} patterns
-        pattern = r'{{([^{}]+)}}'
-        
-        def replace(match):
-            variable_name = match.group(1).strip()
-            
-            # Handle nested dictionary access with dot notation
-            if '.' in variable_name:
-                parts = variable_name.split('.')
-                value = variables
-                for part in parts:
-                    if isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        # If any part doesn't exist, return the original placeholder
-                        return match.group(0)
-                return str(value)
-                
-            # Simple variable replacement
-            if variable_name in variables:
-                return str(variables[variable_name])
-                
-            # If variable not found, return the original placeholder
-            return match.group(0)
-            
-        return re.sub(pattern, replace, text)
+        
+        # Placeholders that are not found in variables are left as written
+        return self._compile(text).render(variables)
 
 
 class PromptManager:
@@ -670,6 +1070,28 @@ class PromptManager:
             
         return template.render(variables, system_prompt_vars)
     
+    def render_many(self, template_id: str, variable_sets: Iterable[Dict[str, Any]],
+                    system_prompt_vars: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """
+        Render a template for many variable sets in one pass, for bulk generation.
+        
+        Args:
+            template_id: The template identifier
+            variable_sets: Variables to substitute, one dictionary per rendered prompt
+            system_prompt_vars: Optional variables shared by every system prompt
+            
+        Returns:
+            Rendered prompts in the same order as variable_sets
+            
+        Raises:
+            ValueError: If template not found
+        """
+        template = self.get_template(template_id)
+        if not template:
+            raise ValueError(f"Template not found: {template_id}")
+            
+        return template.render_many(variable_sets, system_prompt_vars)
+    
     def create_template(self, template_id: str, system_prompt: str, 
                       template_content: str, response_format: str = "",
                       metadata: Dict[str, Any] = None) -> str:
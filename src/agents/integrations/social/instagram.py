@@ -5,7 +5,6 @@ with specific optimizations for image posting and performance tracking.
 """
 
 import logging
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
@@ -47,7 +46,7 @@ class InstagramIntegration(SocialMediaIntegration):
         
         # Try to get the Instagram business account ID
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/{self.account_id}",
                 params={
                     "access_token": self.access_token,
@@ -76,7 +75,7 @@ class InstagramIntegration(SocialMediaIntegration):
         """
         try:
             # Download the image
-            response = requests.get(image_url, stream=True)
+            response = self.http.get(image_url, stream=True)
             if response.status_code != 200:
                 return {"status": "error", "message": f"Failed to download image: {response.status_code}"}
             
@@ -193,7 +192,7 @@ class InstagramIntegration(SocialMediaIntegration):
                     # For simplicity, we'll still use the URL in this implementation
                 
                 # Create container for Instagram media
-                container_response = requests.post(
+                container_response = self.http.post(
                     f"{self.api_url}/{business_account_id}/media",
                     params={
                         "access_token": self.access_token,
@@ -208,7 +207,7 @@ class InstagramIntegration(SocialMediaIntegration):
                 container_id = container_response.json().get("id")
                 
                 # Publish the container as an Instagram post
-                publish_response = requests.post(
+                publish_response = self.http.post(
                     f"{self.api_url}/{business_account_id}/media_publish",
                     params={
                         "access_token": self.access_token,
@@ -222,7 +221,7 @@ class InstagramIntegration(SocialMediaIntegration):
                 post_id = publish_response.json().get("id")
                 
                 # Get the permalink URL for the post
-                media_response = requests.get(
+                media_response = self.http.get(
                     f"{self.api_url}/{post_id}",
                     params={
                         "access_token": self.access_token,
@@ -246,7 +245,7 @@ class InstagramIntegration(SocialMediaIntegration):
                 video_url = content_data["video_url"]
                 
                 # Create container for Instagram media
-                container_response = requests.post(
+                container_response = self.http.post(
                     f"{self.api_url}/{business_account_id}/media",
                     params={
                         "access_token": self.access_token,
@@ -270,7 +269,7 @@ class InstagramIntegration(SocialMediaIntegration):
                     attempts += 1
                     time.sleep(5)  # Wait 5 seconds between status checks
                     
-                    status_response = requests.get(
+                    status_response = self.http.get(
                         f"{self.api_url}/{container_id}",
                         params={
                             "access_token": self.access_token,
@@ -297,7 +296,7 @@ class InstagramIntegration(SocialMediaIntegration):
                     )
                 
                 # Publish the container as an Instagram post
-                publish_response = requests.post(
+                publish_response = self.http.post(
                     f"{self.api_url}/{business_account_id}/media_publish",
                     params={
                         "access_token": self.access_token,
@@ -311,7 +310,7 @@ class InstagramIntegration(SocialMediaIntegration):
                 post_id = publish_response.json().get("id")
                 
                 # Get the permalink URL for the post
-                media_response = requests.get(
+                media_response = self.http.get(
                     f"{self.api_url}/{post_id}",
                     params={
                         "access_token": self.access_token,
@@ -389,7 +388,7 @@ class InstagramIntegration(SocialMediaIntegration):
                 container_params["media_type"] = "VIDEO"
                 container_params["video_url"] = content_data["video_url"]
             
-            container_response = requests.post(
+            container_response = self.http.post(
                 f"{self.api_url}/{business_account_id}/media",
                 params=container_params
             )
@@ -409,7 +408,7 @@ class InstagramIntegration(SocialMediaIntegration):
                     attempts += 1
                     time.sleep(5)  # Wait 5 seconds between status checks
                     
-                    status_response = requests.get(
+                    status_response = self.http.get(
                         f"{self.api_url}/{container_id}",
                         params={
                             "access_token": self.access_token,
@@ -465,7 +464,7 @@ class InstagramIntegration(SocialMediaIntegration):
         
         def execute_request():
             # Get media insights
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/{content_id}",
                 params={
                     "access_token": self.access_token,
@@ -521,7 +520,7 @@ class InstagramIntegration(SocialMediaIntegration):
             return credentials_check
         
         def execute_request():
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/{content_id}",
                 params={
                     "access_token": self.access_token
@@ -569,7 +568,7 @@ class InstagramIntegration(SocialMediaIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/{business_account_id}",
                 params={
                     "access_token": self.access_token,
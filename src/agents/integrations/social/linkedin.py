@@ -5,7 +5,6 @@ supporting content publishing, scheduling, and performance tracking.
 """
 
 import logging
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
@@ -60,7 +59,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
         """
         try:
             # Download the image
-            response = requests.get(image_url, stream=True)
+            response = self.http.get(image_url, stream=True)
             if response.status_code != 200:
                 logger.error(f"Failed to download image: {response.status_code}")
                 return None
@@ -88,7 +87,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
                 }
             }
             
-            register_response = requests.post(
+            register_response = self.http.post(
                 f"{self.api_url}/assets?action=registerUpload",
                 headers=register_headers,
                 json=register_data
@@ -113,7 +112,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
                 "Authorization": f"Bearer {self.access_token}"
             }
             
-            upload_response = requests.put(
+            upload_response = self.http.put(
                 upload_url,
                 headers=upload_headers,
                 data=image_data
@@ -275,7 +274,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             }
             
             # Send the request
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/ugcPosts",
                 headers=headers,
                 json=post_data
@@ -351,7 +350,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             }
             
             # Get post details
-            post_response = requests.get(
+            post_response = self.http.get(
                 f"{self.api_url}/ugcPosts/{content_id}",
                 headers=headers
             )
@@ -364,7 +363,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             # Try to get social metrics
             metrics = {}
             try:
-                metrics_response = requests.get(
+                metrics_response = self.http.get(
                     f"{self.api_url}/socialActions/{content_id}",
                     headers=headers
                 )
@@ -432,7 +431,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
                 "X-Restli-Protocol-Version": "2.0.0"
             }
             
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/ugcPosts/{content_id}",
                 headers=headers
             )
@@ -475,7 +474,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             
             organization_id = self._get_organization_urn().split(':')[-1]
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/organizations/{organization_id}",
                 headers=headers
             )
@@ -488,7 +487,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             # Try to get follower statistics
             follower_count = None
             try:
-                follower_response = requests.get(
+                follower_response = self.http.get(
                     f"{self.api_url}/organizationalEntityFollowerStatistics?q=organizationalEntity&organizationalEntity={self._get_organization_urn()}",
                     headers=headers
                 )
@@ -549,7 +548,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             }
             
             # Get page statistics
-            stats_response = requests.get(
+            stats_response = self.http.get(
                 f"{self.api_url}/organizationPageStatistics?q=organization&organization={self._get_organization_urn()}&timeIntervals.timeGranularityType={time_range}&timeIntervals.timeRange.start=0",
                 headers=headers
             )
@@ -593,7 +592,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             
             # Get follower statistics
             try:
-                follower_response = requests.get(
+                follower_response = self.http.get(
                     f"{self.api_url}/organizationalEntityFollowerStatistics?q=organizationalEntity&organizationalEntity={self._get_organization_urn()}",
                     headers=headers
                 )
@@ -660,7 +659,7 @@ class LinkedInCompanyIntegration(SocialMediaIntegration):
             }
             
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/me",
                 headers=headers
             )
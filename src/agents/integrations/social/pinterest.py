@@ -5,7 +5,6 @@ and performance tracking with specific optimization for Pinterest's Pin format.
 """
 
 import logging
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
@@ -62,7 +61,7 @@ class PinterestIntegration(SocialMediaIntegration):
         # This is a simplified implementation
         try:
             # Test current token
-            test_response = requests.get(
+            test_response = self.http.get(
                 f"{self.api_url}/user_account",
                 headers=self._get_headers()
             )
@@ -85,7 +84,7 @@ class PinterestIntegration(SocialMediaIntegration):
                 "client_secret": client_secret
             }
             
-            refresh_response = requests.post(
+            refresh_response = self.http.post(
                 "https://api.pinterest.com/v5/oauth/token",
                 data=refresh_data
             )
@@ -107,7 +106,7 @@ class PinterestIntegration(SocialMediaIntegration):
             List of Pinterest boards
         """
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/boards",
                 headers=self._get_headers(),
                 params={"page_size": 100}
@@ -145,7 +144,7 @@ class PinterestIntegration(SocialMediaIntegration):
                 "description": f"Board for {board_name} content"
             }
             
-            create_response = requests.post(
+            create_response = self.http.post(
                 f"{self.api_url}/boards",
                 headers=self._get_headers(),
                 json=create_data
@@ -220,7 +219,7 @@ class PinterestIntegration(SocialMediaIntegration):
                 }
             
             # Create the pin
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/pins",
                 headers=self._get_headers(),
                 json=pin_data
@@ -332,7 +331,7 @@ class PinterestIntegration(SocialMediaIntegration):
                 }
             
             # Create the scheduled pin
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/ad_accounts/{self.ad_account_id}/scheduled_pins",
                 headers=self._get_headers(),
                 json=pin_data
@@ -383,7 +382,7 @@ class PinterestIntegration(SocialMediaIntegration):
         
         def execute_request():
             # Get pin details
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/pins/{content_id}",
                 headers=self._get_headers()
             )
@@ -398,7 +397,7 @@ class PinterestIntegration(SocialMediaIntegration):
             if self.business_account_id:
                 try:
                     # Last 7 days analytics
-                    analytics_response = requests.get(
+                    analytics_response = self.http.get(
                         f"{self.api_url}/pins/{content_id}/analytics",
                         headers=self._get_headers(),
                         params={
@@ -458,7 +457,7 @@ class PinterestIntegration(SocialMediaIntegration):
         self._refresh_token_if_needed()
         
         def execute_request():
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/pins/{content_id}",
                 headers=self._get_headers()
             )
@@ -507,7 +506,7 @@ class PinterestIntegration(SocialMediaIntegration):
             if "privacy" in board_data:
                 create_data["privacy"] = board_data["privacy"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/boards",
                 headers=self._get_headers(),
                 json=create_data
@@ -568,7 +567,7 @@ class PinterestIntegration(SocialMediaIntegration):
                 end_date = datetime.now().strftime("%Y-%m-%d")
             
             # Get pin analytics
-            analytics_response = requests.get(
+            analytics_response = self.http.get(
                 f"{self.api_url}/pins/{content_id}/analytics",
                 headers=self._get_headers(),
                 params={
@@ -652,7 +651,7 @@ class PinterestIntegration(SocialMediaIntegration):
         
         try:
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/user_account",
                 headers=self._get_headers()
             )
@@ -5,7 +5,6 @@ and performance tracking.
 """
 
 import logging
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
@@ -100,7 +99,7 @@ class TikTokIntegration(SocialMediaIntegration):
         # Check if we need to refresh (ideally would check expiry, but simplified implementation)
         try:
             # Verify current token
-            test_response = requests.get(
+            test_response = self.http.get(
                 f"{self.api_url}/business/info/",
                 headers=self._get_headers("/business/info/")
             )
@@ -117,7 +116,7 @@ class TikTokIntegration(SocialMediaIntegration):
                 "refresh_token": self.refresh_token
             }
             
-            refresh_response = requests.post(
+            refresh_response = self.http.post(
                 "https://open-api.tiktok.com/oauth/refresh_token/",
                 json=refresh_params
             )
@@ -167,7 +166,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             upload_headers = self._get_headers("/video/upload/", upload_params)
             
-            upload_info_response = requests.get(
+            upload_info_response = self.http.get(
                 f"{self.api_url}/video/upload/",
                 headers=upload_headers,
                 params=upload_params
@@ -188,14 +187,14 @@ class TikTokIntegration(SocialMediaIntegration):
                 raise IntegrationError("Failed to get TikTok upload URL and token")
             
             # Download the video
-            video_response = requests.get(content_data["video_url"], stream=True)
+            video_response = self.http.get(content_data["video_url"], stream=True)
             if video_response.status_code != 200:
                 raise IntegrationError(f"Failed to download video: {video_response.status_code}")
             
             video_data = video_response.content
             
             # Upload the video
-            upload_response = requests.post(
+            upload_response = self.http.post(
                 upload_url,
                 files={"video": video_data},
                 data={"upload_token": upload_token}
@@ -234,7 +233,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             post_headers = self._get_headers("/post/publish/video/", post_params)
             
-            post_response = requests.post(
+            post_response = self.http.post(
                 f"{self.api_url}/post/publish/video/",
                 headers=post_headers,
                 params=post_params,
@@ -296,7 +295,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             upload_headers = self._get_headers("/video/upload/", upload_params)
             
-            upload_info_response = requests.get(
+            upload_info_response = self.http.get(
                 f"{self.api_url}/video/upload/",
                 headers=upload_headers,
                 params=upload_params
@@ -317,14 +316,14 @@ class TikTokIntegration(SocialMediaIntegration):
                 raise IntegrationError("Failed to get TikTok upload URL and token")
             
             # Download the video
-            video_response = requests.get(content_data["video_url"], stream=True)
+            video_response = self.http.get(content_data["video_url"], stream=True)
             if video_response.status_code != 200:
                 raise IntegrationError(f"Failed to download video: {video_response.status_code}")
             
             video_data = video_response.content
             
             # Upload the video
-            upload_response = requests.post(
+            upload_response = self.http.post(
                 upload_url,
                 files={"video": video_data},
                 data={"upload_token": upload_token}
@@ -368,7 +367,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             post_headers = self._get_headers("/post/publish/video/schedule/", post_params)
             
-            post_response = requests.post(
+            post_response = self.http.post(
                 f"{self.api_url}/post/publish/video/schedule/",
                 headers=post_headers,
                 params=post_params,
@@ -424,7 +423,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             headers = self._get_headers("/post/info/query/", params)
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/post/info/query/",
                 headers=headers,
                 params=params
@@ -452,7 +451,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             metrics_headers = self._get_headers("/post/metrics/", metrics_params)
             
-            metrics_response = requests.get(
+            metrics_response = self.http.get(
                 f"{self.api_url}/post/metrics/",
                 headers=metrics_headers,
                 params=metrics_params
@@ -506,7 +505,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             headers = self._get_headers("/post/delete/", params)
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/post/delete/",
                 headers=headers,
                 params=params
@@ -552,7 +551,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             info_headers = self._get_headers("/business/info/", info_params)
             
-            info_response = requests.get(
+            info_response = self.http.get(
                 f"{self.api_url}/business/info/",
                 headers=info_headers,
                 params=info_params
@@ -576,7 +575,7 @@ class TikTokIntegration(SocialMediaIntegration):
             
             metrics_headers = self._get_headers("/business/metrics/", metrics_params)
             
-            metrics_response = requests.get(
+            metrics_response = self.http.get(
                 f"{self.api_url}/business/metrics/",
                 headers=metrics_headers,
                 params=metrics_params
@@ -638,7 +637,7 @@ class TikTokIntegration(SocialMediaIntegration):
             info_headers = self._get_headers("/business/info/", info_params)
             
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/business/info/",
                 headers=info_headers,
                 params=info_params
@@ -8,7 +8,6 @@ and monitoring of content on these platforms.
 import os
 import json
 import logging
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import time
@@ -57,6 +56,29 @@ class SocialMediaIntegration(Integration):
         """
         raise NotImplementedError("Subclasses must implement schedule_content")
     
+    async def post_content_async(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Post content without blocking the event loop.
+        
+        Args:
+            content_data: Formatted content data to be posted
+            
+        Returns:
+            Dict containing the posting result with status and platform-specific details
+        """
+        return await self.run_blocking(self.post_content, content_data)
+    
+    async def schedule_content_async(self, content_data: Dict[str, Any], publish_time: str) -> Dict[str, Any]:
+        """Schedule content without blocking the event loop.
+        
+        Args:
+            content_data: Formatted content data to be posted
+            publish_time: ISO format datetime for scheduled posting
+            
+        Returns:
+            Dict containing the scheduling result with status and platform-specific details
+        """
+        return await self.run_blocking(self.schedule_content, content_data, publish_time)
+    
     def get_content_status(self, content_id: str) -> Dict[str, Any]:
         """Get the status of posted content.
         
@@ -122,7 +144,7 @@ class FacebookIntegration(SocialMediaIntegration):
             if content_data.get("link_url"):
                 params["link"] = content_data["link_url"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{self.account_id}/feed",
                 params=params
             )
@@ -176,7 +198,7 @@ class FacebookIntegration(SocialMediaIntegration):
             if content_data.get("link_url"):
                 params["link"] = content_data["link_url"]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/{self.account_id}/feed",
                 params=params
             )
@@ -215,7 +237,7 @@ class FacebookIntegration(SocialMediaIntegration):
                 "fields": "id,message,created_time,permalink_url,is_published,insights.metric(post_impressions,post_engagements,post_reactions_by_type_total)"
             }
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/{content_id}",
                 params=params
             )
@@ -264,7 +286,7 @@ class FacebookIntegration(SocialMediaIntegration):
                 "access_token": self.access_token
             }
             
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/{content_id}",
                 params=params
             )
@@ -300,7 +322,7 @@ class FacebookIntegration(SocialMediaIntegration):
         
         def execute_request():
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/me",
                 params={"access_token": self.access_token, "fields": "id,name"}
             )
@@ -374,7 +396,7 @@ class TwitterIntegration(SocialMediaIntegration):
                 "text": tweet_text
             }
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/tweets",
                 headers=headers,
                 json=data
@@ -436,7 +458,7 @@ class TwitterIntegration(SocialMediaIntegration):
                 "Authorization": f"Bearer {self.bearer_token}"
             }
             
-            response = requests.get(
+            response = self.http.get(
                 f"{self.api_url}/tweets/{content_id}?expansions=author_id&tweet.fields=created_at,public_metrics",
                 headers=headers
             )
@@ -483,7 +505,7 @@ class TwitterIntegration(SocialMediaIntegration):
                 "Authorization": f"Bearer {self.bearer_token}"
             }
             
-            response = requests.delete(
+            response = self.http.delete(
                 f"{self.api_url}/tweets/{content_id}",
                 headers=headers
             )
@@ -523,7 +545,7 @@ class TwitterIntegration(SocialMediaIntegration):
             }
             
             response, response_time = self.measure_response_time(
-                requests.get,
+                self.http.get,
                 f"{self.api_url}/users/me",
                 headers=headers
             )
@@ -622,7 +644,7 @@ class LinkedInIntegration(SocialMediaIntegration):
                     }
                 }]
             
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/ugcPosts",
                 headers=headers,
                 json=post_data
@@ -11,17 +11,16 @@ from typing import Callable, List
 import contextlib
 import asyncio
 
-from fastapi import FastAPI, Request, WebSocket, Response
+from fastapi import FastAPI, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
 
 from src.core.settings import settings
 from src.core.logging import setup_logging, get_logger
 from src.core.security import csrf_protection, jwt_manager
 from src.core.migration_utils import run_migrations, ensure_schema_exists
+from src.api.middleware import CSRFMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
 
 # Add current directory to path to help with imports
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -40,101 +39,6 @@ app = FastAPI(
     openapi_url="/api/openapi.json"
 )
 
-# Custom security headers middleware
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
-    
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Content Security Policy
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://fonts.googleapis.com; "
-            "font-src 'self' https://fonts.gstatic.com; "
-            "img-src 'self' data: https://*; "
-            "connect-src 'self' https://api.openai.com https://api.anthropic.com; "
-            "frame-src 'self'; "
-            "object-src 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'; "
-            "frame-ancestors 'self'; "
-            "block-all-mixed-content; "
-            "upgrade-insecure-requests;"
-        )
-        
-        # Other security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # Feature Policy / Permissions Policy
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=(), interest-cohort=()"
-        )
-        
-        return response
-
-# Rate limiting middleware
-class RateLimitingMiddleware(BaseHTTPMiddleware):
-    """Middleware to implement rate limiting."""
-    
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        # Use Redis or in-memory store for rate limiting counters
-        self.rate_limit_store = {}  # Replace with Redis in production
-    
-    async def dispatch(self, request: Request, call_next):
-        # Extract client IP
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Skip rate limiting for trusted IPs
-        trusted_ips = os.getenv("TRUSTED_IPS", "127.0.0.1,::1").split(",")
-        if client_ip in trusted_ips:
-            return await call_next(request)
-        
-        # Check if IP is already blocked
-        if self._is_ip_blocked(client_ip):
-            return Response(
-                content="Too many requests. Please try again later.",
-                status_code=429
-            )
-        
-        # Get current count for this IP
-        current_time = int(time.time())
-        window_start = current_time - (settings.RATE_LIMIT_WINDOW_MS // 1000)
-        
-        # Clean up old entries
-        if client_ip in self.rate_limit_store:
-            self.rate_limit_store[client_ip] = [
-                timestamp for timestamp in self.rate_limit_store[client_ip]
-                if timestamp > window_start
-            ]
-        else:
-            self.rate_limit_store[client_ip] = []
-        
-        # Check if rate limit exceeded
-        if len(self.rate_limit_store[client_ip]) >= settings.RATE_LIMIT_MAX_REQUESTS:
-            return Response(
-                content="Too many requests. Please try again later.",
-                status_code=429,
-                headers={"Retry-After": str(settings.RATE_LIMIT_WINDOW_MS // 1000)}
-            )
-        
-        # Add current timestamp to the store
-        self.rate_limit_store[client_ip].append(current_time)
-        
-        # Process the request
-        return await call_next(request)
-    
-    def _is_ip_blocked(self, ip: str) -> bool:
-        """Check if an IP is blocked."""
-        # In a real implementation, this would check a database or cache
-        return False
-
 # Import database module
 from src.core.database import get_db, SessionLocal
 
@@ -221,7 +125,15 @@ async def shutdown_event():
         await general_ws_manager.shutdown()
     except Exception as e:
         logger.error(f"Error during WebSocket shutdown: {str(e)}")
-    
+
+    # Close pooled outbound HTTP connections
+    try:
+        from src.core.http_client import http_client, async_http_client
+        await async_http_client.close()
+        http_client.close()
+    except Exception as e:
+        logger.error(f"Error closing HTTP client pools: {str(e)}")
+
     logger.info("Application shutdown complete")
 
 # Configure CORS with more restrictive settings
@@ -236,7 +148,7 @@ app.add_middleware(
 
 # Add security middleware
 app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RateLimitingMiddleware)
+app.add_middleware(RateLimitMiddleware)
 
 # Add trusted host middleware
 app.add_middleware(
@@ -245,9 +157,7 @@ app.add_middleware(
 )
 
 # Add CSRF protection middleware
-@app.middleware("http")
-async def csrf_middleware(request: Request, call_next):
-    return await csrf_protection.csrf_protect_middleware(request, call_next)
+app.add_middleware(CSRFMiddleware)
 
 # Import routers
 from src.api.routers import health
@@ -0,0 +1,272 @@
+"""
+Pure ASGI middleware for the API gateway.
+
+These classes wrap the ASGI callable directly instead of subclassing
+BaseHTTPMiddleware, so they add no extra task or body stream per request
+and leave streaming responses untouched.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers
+from starlette.requests import Request, cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.rate_limiting import GCRARateLimiter, RateLimitCategory
+from src.core.security import CSRFProtection, csrf_protection
+from src.core.settings import settings
+
+# Static security headers, encoded once and appended to every HTTP response
+SECURITY_HEADERS: Tuple[Tuple[bytes, bytes], ...] = tuple(
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in (
+        ("Content-Security-Policy", (
+            "default-src 'self'; "
+            "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://fonts.googleapis.com; "
+            "font-src 'self' https://fonts.gstatic.com; "
+            "img-src 'self' data: https://*; "
+            "connect-src 'self' https://api.openai.com https://api.anthropic.com; "
+            "frame-src 'self'; "
+            "object-src 'none'; "
+            "base-uri 'self'; "
+            "form-action 'self'; "
+            "frame-ancestors 'self'; "
+            "block-all-mixed-content; "
+            "upgrade-insecure-requests;"
+        )),
+        ("X-Content-Type-Options", "nosniff"),
+        ("X-Frame-Options", "DENY"),
+        ("X-XSS-Protection", "1; mode=block"),
+        ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+        ("Permissions-Policy", "camera=(), microphone=(), geolocation=(), interest-cohort=()"),
+    )
+)
+
+# Path prefixes mapped to rate limit categories, checked in order; anything else is DEFAULT
+DEFAULT_PATH_CATEGORIES: Tuple[Tuple[str, RateLimitCategory], ...] = (
+    (f"{settings.API_PREFIX}/auth", RateLimitCategory.SECURITY),
+    (f"{settings.API_PREFIX}/csrf-token", RateLimitCategory.SECURITY),
+    (f"{settings.API_PREFIX}/compliance", RateLimitCategory.SENSITIVE),
+    (f"{settings.API_PREFIX}/developer", RateLimitCategory.SENSITIVE),
+    (f"{settings.API_PREFIX}/health", RateLimitCategory.PUBLIC),
+    ("/health", RateLimitCategory.PUBLIC),
+    ("/api/docs", RateLimitCategory.PUBLIC),
+    ("/api/redoc", RateLimitCategory.PUBLIC),
+    ("/api/openapi.json", RateLimitCategory.PUBLIC),
+)
+
+RATE_LIMITED_BODY = b"Too many requests. Please try again later."
+CSRF_REJECTED_BODY = b'{"detail":"CSRF token missing or invalid"}'
+
+# Content types whose body may carry the CSRF token as a form field
+_FORM_CONTENT_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+
+
+def _rate_limit_headers(context: Dict[str, Any]) -> List[Tuple[bytes, bytes]]:
+    """Build X-RateLimit-* response headers from a limiter decision."""
+    headers = []
+    for name, field in (
+        (b"x-ratelimit-limit", "limit"),
+        (b"x-ratelimit-remaining", "remaining"),
+        (b"x-ratelimit-reset", "reset"),
+    ):
+        if field in context:
+            headers.append((name, str(context[field]).encode("latin-1")))
+    return headers
+
+
+async def _send_plain_response(
+    send: Send,
+    status: int,
+    body: bytes,
+    content_type: bytes,
+    headers: Sequence[Tuple[bytes, bytes]] = ()
+) -> None:
+    """Send a complete response without going through a Response object."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Build a receive callable that yields an already read body, then defers to receive."""
+    pending = True
+
+    async def replay() -> Message:
+        nonlocal pending
+        if pending:
+            pending = False
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+class SecurityHeadersMiddleware:
+    """
+    Add the static security header block to every HTTP response.
+
+    Headers an endpoint already set under the same names are replaced, so
+    the gateway policy always wins.
+    """
+
+    def __init__(self, app: ASGIApp, headers: Sequence[Tuple[bytes, bytes]] = SECURITY_HEADERS):
+        self.app = app
+        self.headers = list(headers)
+        self.names = frozenset(name for name, _ in self.headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() not in self.names
+                ] + self.headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class CSRFMiddleware:
+    """
+    Double-submit CSRF check for state-changing requests.
+
+    Safe methods and exempt paths pass straight through. Other requests need
+    the CSRF cookie and a valid signed token in the X-CSRF-Token header or,
+    for form posts, a csrf_token form field; the body is only read in that
+    last case and is replayed to the application.
+    """
+
+    def __init__(self, app: ASGIApp, protection: Optional[CSRFProtection] = None):
+        self.app = app
+        self.protection = protection or csrf_protection
+        self.safe_methods = frozenset(self.protection._safe_methods)
+        self.exempt_paths = tuple(self.protection._exempt_paths)
+        self.header_name = self.protection._header_name.lower().encode("latin-1")
+        self.cookie_name = self.protection._cookie_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in self.safe_methods
+            or scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        token = cookie = None
+        for name, value in scope["headers"]:
+            if name == self.header_name:
+                token = value.decode("latin-1")
+            elif name == b"cookie" and cookie is None:
+                cookie = cookie_parser(value.decode("latin-1")).get(self.cookie_name)
+
+        if cookie and not token:
+            receive, token = await self._form_token(scope, receive)
+
+        if not token or not cookie or not self.protection.validate_token(token):
+            await _send_plain_response(send, 403, CSRF_REJECTED_BODY, b"application/json")
+            return
+
+        await self.app(scope, receive, send)
+
+    async def _form_token(self, scope: Scope, receive: Receive) -> Tuple[Receive, Optional[str]]:
+        """Read the csrf_token form field, returning a receive that replays the body."""
+        if not Headers(scope=scope).get("content-type", "").startswith(_FORM_CONTENT_TYPES):
+            return receive, None
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        try:
+            form = await Request(scope, _replay_body(body, receive)).form()
+            token = form.get("csrf_token")
+        except Exception:
+            token = None
+        return _replay_body(body, receive), token if isinstance(token, str) else None
+
+
+class RateLimitMiddleware:
+    """
+    Distributed per-client rate limiting shared by every worker.
+
+    Each HTTP request is classified into a RateLimitCategory by path prefix
+    and checked against Redis with a single GCRA script call. Rejected
+    requests get a 429 with Retry-After; allowed responses carry the
+    X-RateLimit-* headers. WebSocket and lifespan traffic passes through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[GCRARateLimiter] = None,
+        trusted_ips: Optional[Iterable[str]] = None,
+        path_categories: Optional[Sequence[Tuple[str, RateLimitCategory]]] = None
+    ):
+        self.app = app
+        self.limiter = limiter or GCRARateLimiter()
+        # Parsed once here rather than on every request
+        self.trusted_ips = frozenset(settings.TRUSTED_IPS if trusted_ips is None else trusted_ips)
+        self.path_categories = tuple(
+            DEFAULT_PATH_CATEGORIES if path_categories is None else path_categories
+        )
+
+    def category_for(self, path: str) -> RateLimitCategory:
+        """Get the rate limit category for a request path."""
+        for prefix, category in self.path_categories:
+            if path.startswith(prefix):
+                return category
+        return RateLimitCategory.DEFAULT
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        if client_ip in self.trusted_ips:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        allowed, context = await self.limiter.allow_request(
+            client_ip, self.category_for(path), endpoint=path, ip_address=client_ip
+        )
+        headers = _rate_limit_headers(context)
+
+        if not allowed:
+            await _send_plain_response(
+                send, 429, RATE_LIMITED_BODY, b"text/plain; charset=utf-8",
+                [(b"retry-after", str(context.get("retry_after", 1)).encode("latin-1")), *headers]
+            )
+            return
+
+        if not headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
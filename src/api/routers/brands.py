@@ -12,12 +12,14 @@ import asyncio
 import logging
 
 from src.api.routers.auth import oauth2_scheme, get_current_user
-from src.core.messaging import RabbitMQClient
+from src.core.messaging import RabbitMQClient, RabbitMQRpcClient
 from src.core.database import get_db
 from src.models.project import Brand, Project, ProjectType
 
 router = APIRouter()
 mq_client = RabbitMQClient()
+# Shared reply queue for request/response calls to agents
+rpc_client = RabbitMQRpcClient("api")
 
 # Pydantic Models
 class BrandBase(BaseModel):
@@ -154,61 +156,19 @@ async def send_agent_task(task_type: str, task_data: Dict[str, Any], wait_for_re
         }
         
         if wait_for_response:
-            # Generate unique response queue
-            import uuid
-            response_queue = f"response_api_{uuid.uuid4()}"
-            mq_client.declare_queue(response_queue)
-            task["response_queue"] = response_queue
-            
-            # Send task
-            mq_client.publish_direct("brand_project_agent_queue", task)
-            
-            # Wait for response
-            import asyncio
-            from concurrent.futures import ThreadPoolExecutor
-            
-            # Create a future to store the result
-            loop = asyncio.get_event_loop()
-            result_future = loop.create_future()
-            
-            def consume_response():
-                # This function runs in a separate thread
-                result = None
-                try:
-                    # Consume one message from the response queue
-                    def callback(message):
-                        nonlocal result
-                        result = message
-                        return False  # Stop consuming after first message
-                    
-                    mq_client.consume_one(response_queue, callback, timeout=30)
-                except Exception as e:
-                    result = {"status": "error", "error": f"Error receiving response: {str(e)}"}
-                
-                # Set the result in the future
-                loop.call_soon_threadsafe(result_future.set_result, result)
-            
-            # Run the consumption in a thread pool
-            with ThreadPoolExecutor() as executor:
-                executor.submit(consume_response)
-            
-            # Wait for the result
-            result = await result_future
-            
-            # Delete the response queue
-            mq_client.delete_queue(response_queue)
-            
-            if not result:
+            try:
+                return await rpc_client.call_async("brand_project_agent_queue", task, timeout=30)
+            except TimeoutError:
                 raise HTTPException(
                     status_code=status.HTTP_504_GATEWAY_TIMEOUT,
                     detail="Timeout waiting for agent response"
                 )
-            
-            return result
         else:
             # Send task without waiting for response
             mq_client.publish_direct("brand_project_agent_queue", task)
             return {"status": "sent"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -6,9 +6,9 @@ and templates, with quality assessment and optimization capabilities.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator, Awaitable, Callable
 import uuid
 import json
 import asyncio
@@ -52,6 +52,12 @@ class MockAIProviderManager:
         """Mock content generation."""
         return {"text": "Mock generated content", "success": True}
         
+    async def generate_content_stream(self, **kwargs):
+        """Mock streamed content generation."""
+        for word in ("Mock ", "generated ", "content"):
+            yield {"type": "token", "text": word}
+        yield {"type": "done", "response": {"text": "Mock generated content", "success": True}}
+        
     async def batch_generate_content(self, requests, **kwargs):
         """Mock batch content generation."""
         return [{"text": "Mock generated content", "success": True} for _ in requests]
@@ -94,6 +100,7 @@ content_quality_service = MockContentQualityService()
 from src.core.rate_limiting import rate_limiter
 from src.core.cache import cache
 from src.core.logging import log_api_usage_sync
+from src.core.websocket_bridge import notify_generation_chunk, notify_generation_progress
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -256,6 +263,51 @@ async def generate_content(
         logger.error(f"Content generation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Content generation failed: {str(e)}")
 
+@router.post("/generate/stream")
+async def generate_content_stream(
+    request: GenerationRequest,
+    user=Depends(get_current_user)
+):
+    """
+    Generate content, streaming the text as Server-Sent Events while it is produced.
+    
+    Emits ``token`` events with ``{"text": ...}`` as the model writes, then a
+    single ``done`` event with the full generation response (including quality
+    assessment), or an ``error`` event if generation fails.
+    
+    Args:
+        request: Content generation request
+        user: The authenticated user
+        
+    Returns:
+        A text/event-stream response
+    """
+    # Charged at the content generation endpoint cost on the user's own bucket
+    allowed, _ = await rate_limiter.allow_request_async(
+        f"content_gen:{user.id}", endpoint="/api/v1/content/generate"
+    )
+    if not allowed:
+        raise HTTPException(status_code=429, detail="Rate limit exceeded for content generation")
+    
+    log_api_usage_sync(
+        endpoint="content_generation_stream",
+        user_id=user.id,
+        request_data={
+            "content_type": request.content_type,
+            "template_id": request.template_id,
+            "language": request.language,
+            "industry": request.industry,
+            "has_brand_id": request.brand_id is not None,
+            "has_seo": request.seo_keywords is not None
+        }
+    )
+    
+    return StreamingResponse(
+        _stream_generation_events(request, user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/batch", response_model=Dict[str, Any])
 async def batch_generate_content(
     request: BatchGenerationRequest,
@@ -558,13 +610,51 @@ async def get_content_quality(
         logger.error(f"Quality assessment error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Quality assessment failed: {str(e)}")
 
-async def _generate_content(request: GenerationRequest, user_id: int) -> GenerationResponse:
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+async def _stream_generation_events(request: GenerationRequest, user_id: int) -> AsyncIterator[str]:
+    """
+    Run a generation and yield its text and final response as Server-Sent Events.
+    
+    Generation runs as a separate task feeding a queue, so a client that
+    disconnects cancels it instead of leaving it running.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def on_token(text: str) -> None:
+        await queue.put(text)
+    
+    generation = asyncio.ensure_future(_generate_content(request, user_id, on_token=on_token))
+    generation.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while True:
+            text = await queue.get()
+            if text is None:
+                break
+            yield _sse_event("token", {"text": text})
+        
+        try:
+            result = generation.result()
+        except Exception as e:
+            logger.error(f"Streamed content generation error: {str(e)}")
+            yield _sse_event("error", {"detail": f"Content generation failed: {str(e)}"})
+            return
+        yield _sse_event("done", result.dict())
+    finally:
+        generation.cancel()
+
+async def _generate_content(request: GenerationRequest, user_id: int,
+                            on_token: Optional[Callable[[str], Awaitable[None]]] = None) -> GenerationResponse:
     """
     Generate content based on request.
     
     Args:
         request: Content generation request
         user_id: User identifier
+        on_token: Optional callback awaited with each piece of text as the model
+            produces it; the content is streamed from the provider when given
         
     Returns:
         Generation response
@@ -632,20 +722,29 @@ async def _generate_content(request: GenerationRequest, user_id: int) -> Generat
     rendered = template.render(request.variables)
     
     # Generate content
+    generation_args = dict(
+        prompt=rendered["user_prompt"],
+        system_prompt=rendered["system_prompt"],
+        content_type=mapped_content_type,
+        language=mapped_language,
+        industry=mapped_industry,
+        cost_tier=cost_tier,
+        preferred_provider=preferred_provider,
+        preferred_model=preferred_model,
+        max_tokens=model_prefs.get("max_tokens", 2000),
+        temperature=model_prefs.get("temperature", 0.7),
+        use_cache=True,
+        normalize_prompt=True  # Renders differing only in spacing or variable order share a result
+    )
     try:
-        generation_result = await ai_provider_manager.generate_content(
-            prompt=rendered["user_prompt"],
-            system_prompt=rendered["system_prompt"],
-            content_type=mapped_content_type,
-            language=mapped_language,
-            industry=mapped_industry,
-            cost_tier=cost_tier,
-            preferred_provider=preferred_provider,
-            preferred_model=preferred_model,
-            max_tokens=model_prefs.get("max_tokens", 2000),
-            temperature=model_prefs.get("temperature", 0.7),
-            use_cache=True
-        )
+        if on_token is None:
+            generation_result = await ai_provider_manager.generate_content(**generation_args)
+        else:
+            async for event in ai_provider_manager.generate_content_stream(**generation_args):
+                if event["type"] == "token":
+                    await on_token(event["text"])
+                else:
+                    generation_result = event["response"]
     except Exception as e:
         logger.error(f"Content generation error: {str(e)}")
         raise ValueError(f"Content generation failed: {str(e)}")
@@ -771,16 +870,27 @@ async def _generate_content_async(task_id: str, request: GenerationRequest, user
     # Update task status
     TASK_STORE[task_id]["status"] = "processing"
     TASK_STORE[task_id]["progress"] = 10
+    await notify_generation_progress(str(user_id), task_id, 10, "processing")
+    
+    # Push the text to the user's WebSocket connections as it is generated
+    sequence = 0
+    
+    async def on_token(text: str) -> None:
+        nonlocal sequence
+        await notify_generation_chunk(str(user_id), task_id, text, sequence)
+        sequence += 1
     
     try:
         # Generate content
-        result = await _generate_content(request, user_id)
+        result = await _generate_content(request, user_id, on_token=on_token)
+        await notify_generation_chunk(str(user_id), task_id, "", sequence, done=True)
         
         # Update task with result
         TASK_STORE[task_id]["status"] = "completed"
         TASK_STORE[task_id]["progress"] = 100
         TASK_STORE[task_id]["result"] = result.dict()
         TASK_STORE[task_id]["completion_time"] = datetime.now().isoformat()
+        await notify_generation_progress(str(user_id), task_id, 100, "completed", result.dict())
         
     except Exception as e:
         # Update task with error
@@ -788,6 +898,7 @@ async def _generate_content_async(task_id: str, request: GenerationRequest, user
         TASK_STORE[task_id]["error"] = str(e)
         TASK_STORE[task_id]["completion_time"] = datetime.now().isoformat()
         logger.error(f"Async content generation failed: {str(e)}")
+        await notify_generation_progress(str(user_id), task_id, TASK_STORE[task_id]["progress"], "failed", {"error": str(e)})
 
 async def _process_batch(task_id: str, batch_id: str, requests: List[GenerationRequest], 
                        concurrency_limit: int, user_id: int):
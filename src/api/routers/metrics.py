@@ -185,6 +185,11 @@ async def get_cache_metrics(
         end_date=end_date
     )
 
+@router.get("/api-usage/generation-dedup")
+async def get_generation_dedup_metrics():
+    """Get cache hit and request coalescing counts for content generation."""
+    return await metrics_service.get_generation_dedup_metrics()
+
 @router.get("/api-usage/errors")
 async def get_error_rates(
     start_date: Optional[date] = None,
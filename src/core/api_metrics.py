@@ -11,6 +11,7 @@ This module provides functionality for:
 import asyncio
 import json
 import time
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta, date
 from sqlalchemy import func, select, and_, desc, extract, cast
@@ -35,6 +36,10 @@ from src.models.system import (
 # Lock for synchronizing daily summary updates
 SUMMARY_UPDATE_LOCK = asyncio.Lock()
 
+# Process-local outcomes of cacheable content generation requests
+GENERATION_DEDUP_OUTCOMES = ("cache_hit", "coalesced", "generated")
+GENERATION_DEDUP_COUNTERS: Counter = Counter()
+
 class MetricsService:
     """Service for tracking and analyzing API usage metrics."""
     
@@ -482,6 +487,40 @@ class MetricsService:
                 "cached_requests": 0
             }
     
+    @staticmethod
+    def record_generation_dedup(outcome: str) -> None:
+        """Count how a cacheable content generation request was served.
+        
+        Args:
+            outcome: "cache_hit" (served from the cache), "coalesced" (joined an
+                identical request already in flight) or "generated" (called a provider)
+        """
+        if outcome not in GENERATION_DEDUP_OUTCOMES:
+            raise ValueError(f"Unknown generation dedup outcome: {outcome}")
+        GENERATION_DEDUP_COUNTERS[outcome] += 1
+    
+    @staticmethod
+    async def get_generation_dedup_metrics() -> Dict[str, float]:
+        """Get cache hit and request coalescing counts for content generation.
+        
+        Counts cover this process since it started.
+        
+        Returns:
+            Dictionary with per-outcome counts and the share of requests that
+            did not need a provider call
+        """
+        counts = {outcome: GENERATION_DEDUP_COUNTERS[outcome] for outcome in GENERATION_DEDUP_OUTCOMES}
+        total_requests = sum(counts.values())
+        deduplicated = counts["cache_hit"] + counts["coalesced"]
+        
+        return {
+            "total_requests": total_requests,
+            "cache_hits": counts["cache_hit"],
+            "coalesced": counts["coalesced"],
+            "generated": counts["generated"],
+            "dedup_ratio": deduplicated / total_requests if total_requests else 0
+        }
+    
     @staticmethod
     async def get_error_rates(
         start_date: Optional[date] = None,
@@ -1,13 +1,24 @@
 import json
+import math
 import time
+import uuid
+import random
+import asyncio
+import fnmatch
 import hashlib
 import inspect
 import functools
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from enum import Enum
-from typing import Any, Optional, Dict, Union, List, Callable, TypeVar, cast, Set
+from typing import Any, Awaitable, Optional, Dict, Union, List, Callable, TypeVar, cast, Sequence, Set, Tuple
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import ResponseError
 from src.core.settings import settings
+from src.core.cache_codecs import CodecError, create_codec, is_encoded
 
 # Type definitions for function decorators
 F = TypeVar('F', bound=Callable[..., Any])
@@ -31,29 +42,433 @@ class CacheCategory(str, Enum):
         """Generate a prefixed cache key within a category."""
         return f"{category}:{key}"
 
+
+KEY_PREFIX = "umt:"  # Prefix for all keys in this application
+
+# Identifies this process in cache invalidation broadcasts
+_PROCESS_ID = uuid.uuid4().hex
+
+
+# Codec for structured values; the header byte it writes lets entries produced with
+# other codec settings, and legacy plain JSON entries, be read side by side
+codec = create_codec(
+    settings.CACHE_SERIALIZER,
+    settings.CACHE_COMPRESSION_ALGORITHM if settings.CACHE_ENABLE_COMPRESSION else None,
+    settings.CACHE_COMPRESSION_THRESHOLD
+)
+
+
+def _serialize(value: Any) -> Union[str, bytes]:
+    """Serialize a value for storage unless it is already a string or bytes."""
+    if isinstance(value, (str, bytes)):
+        return value
+    return codec.encode(value)
+
+
+def _deserialize(value: bytes) -> Any:
+    """Deserialize a stored value, falling back to the raw decoded string."""
+    if is_encoded(value):
+        try:
+            return codec.decode(value)
+        except CodecError as e:
+            logging.warning(f"Cache codec error: {e}")
+            return None
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value.decode()
+
+
+def _client_options() -> Dict[str, Any]:
+    """Connection options shared by the sync and async Redis clients."""
+    return {
+        "decode_responses": False,  # We'll handle decoding manually
+        "socket_timeout": 5.0,      # Socket timeout in seconds
+        "socket_connect_timeout": 3.0,  # Connection timeout
+        "health_check_interval": 30,  # Health check every 30 seconds
+        "retry_on_timeout": True,     # Retry on timeout
+        "max_connections": 20         # Max connections in pool
+    }
+
+
+TAG_PREFIX = f"{KEY_PREFIX}tags:"  # Sorted sets indexing the keys written under each tag, scored by expiry
+_SCAN_COUNT = 1000  # Keys examined per SCAN/SSCAN step
+_UNLINK_BATCH_SIZE = 500  # Keys freed per UNLINK call
+
+
+def _category_name(category: Union[CacheCategory, str]) -> str:
+    """Plain category name regardless of how the enum formats on this Python version."""
+    return category.value if isinstance(category, CacheCategory) else str(category)
+
+
+def _category_patterns(category: Union[CacheCategory, str]) -> Set[str]:
+    """Key patterns covering a category, both plain and formatted enum spellings."""
+    name = _category_name(category)
+    patterns = {f"{KEY_PREFIX}{name}:*"}
+    if name in CacheCategory._value2member_map_:
+        patterns.add(f"{KEY_PREFIX}{CacheCategory(name)}:*")
+    return patterns
+
+
+def _tag_key(tag: str) -> str:
+    """Redis key of the sorted set indexing a tag's members."""
+    return f"{TAG_PREFIX}{tag}"
+
+
+def _key_category(prefixed_key: str) -> Optional[str]:
+    """Category a prefixed key was written under, if any."""
+    segment = prefixed_key[len(KEY_PREFIX):].split(":", 1)[0]
+    if segment in CacheCategory._value2member_map_:
+        return segment
+    if segment.startswith("CacheCategory."):
+        member = CacheCategory.__members__.get(segment.split(".", 1)[1])
+        return member.value if member else None
+    return None
+
+
+def _key_tags(prefixed_key: str, tags: Optional[List[str]] = None) -> List[str]:
+    """Tags a key is indexed under: its category plus any explicit tags."""
+    key_tags = list(tags or [])
+    category = _key_category(prefixed_key)
+    if category and category not in key_tags:
+        key_tags.append(category)
+    return key_tags
+
+
+LOCK_PREFIX = "lock:"  # Prefix for single-flight recomputation locks
+_LOCK_POLL_INTERVAL = 0.05  # Seconds between checks while another worker recomputes
+
+# Compare-and-delete so a worker only releases a lock it still owns
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Value a lock holder leaves behind when it stored no result, so waiting workers
+# compute for themselves at once instead of polling until lock_timeout
+_UNSTORED_MARKER = "unstored"
+_UNSTORED_MARKER_TTL_MS = 2000
+
+# Compare-and-swap a lock we still own for the unstored marker
+_MARK_UNSTORED_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('set', KEYS[1], ARGV[2], 'PX', ARGV[3])
+end
+return 0
+"""
+
+class _LeaderCancelled(Exception):
+    """Handed to in-process followers when the coroutine computing their value is cancelled."""
+
+
+# Background refreshes for stale-while-revalidate entries of sync callers
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+def _decode_lock_value(value: Union[str, bytes]) -> str:
+    """Lock values as text; clients are created without decode_responses."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _envelope(value: Any, ttl: int, delta: float) -> Dict[str, Any]:
+    """Wrap a value with the metadata needed for early expiration and stale serving."""
+    return {
+        "_cache_envelope": True,
+        "value": value,
+        "expires_at": time.time() + ttl,
+        "delta": delta  # Seconds the value took to compute
+    }
+
+
+def _is_envelope(entry: Any) -> bool:
+    """Check whether a cached entry was written by get_or_compute."""
+    return isinstance(entry, dict) and entry.get("_cache_envelope") is True
+
+
+def _needs_refresh(entry: Dict[str, Any], beta: float) -> bool:
+    """
+    Decide whether an enveloped value should be recomputed now.
+    
+    Past its logical expiry it always needs a refresh. Before that, probabilistic
+    early expiration (XFetch) lets a random caller refresh ahead of time, with the
+    probability rising as expiry nears and the value gets more expensive to compute.
+    """
+    now = time.time()
+    if now >= entry["expires_at"]:
+        return True
+    if beta <= 0 or entry.get("delta", 0) <= 0:
+        return False
+    return now - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires_at"]
+
+
+def _index_tags(pipeline: Any, prefixed_key: str, tags: List[str], ttl: Optional[int]) -> None:
+    """
+    Queue tag index updates on a sync or async pipeline.
+    
+    Members are scored by the time their key expires (never, when ttl is None) and members
+    past that time are pruned on every write, so an index only holds keys that may still
+    exist. The index itself expires once its tag has been idle for the longer of the key
+    TTL and CACHE_LONG_TTL.
+    """
+    now = time.time()
+    expires_at = now + ttl if ttl else math.inf
+    tag_ttl = max(ttl or 0, settings.CACHE_LONG_TTL)
+    for tag in tags:
+        tag_key = _tag_key(tag)
+        pipeline.zremrangebyscore(tag_key, "-inf", now)
+        pipeline.zadd(tag_key, {prefixed_key: expires_at})
+        pipeline.expire(tag_key, tag_ttl)
+
+
+def _batch_hit(entry: Any, is_usable: Optional[Callable[[Any], bool]]) -> Tuple[bool, Any]:
+    """Return whether an entry read by get_or_compute_many is a hit, and its value."""
+    if _is_envelope(entry):
+        if time.time() >= entry["expires_at"]:
+            return False, None
+        return True, entry["value"]
+    if entry is not None and (is_usable is None or is_usable(entry)):
+        return True, entry
+    return False, None
+
+
+def _batch_writes(
+    misses: List[str],
+    outcomes: List[Tuple[Optional[Exception], Any, float]],
+    expire: Union[int, Callable[[Any], int], None],
+    default_ttl: int,
+    should_cache: Optional[Callable[[Any], bool]],
+    envelope: bool
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Collect the computed values to write back and their per-key TTLs."""
+    mapping: Dict[str, Any] = {}
+    ttls: Dict[str, int] = {}
+    for key, (error, value, delta) in zip(misses, outcomes):
+        if error is not None or (should_cache is not None and not should_cache(value)):
+            continue
+        if callable(expire):
+            ttl = expire(value)
+        else:
+            ttl = expire if expire is not None else default_ttl
+        mapping[key] = _envelope(value, ttl, delta) if envelope else value
+        ttls[key] = ttl
+    return mapping, ttls
+
+
+def _batch_results(
+    keys: List[str],
+    hits: Dict[str, Any],
+    misses: List[str],
+    outcomes: List[Tuple[Optional[Exception], Any, float]],
+    return_exceptions: bool
+) -> Dict[str, Any]:
+    """Merge hits and computed values in request order, raising the first error unless returned."""
+    for key, (error, value, _) in zip(misses, outcomes):
+        if error is not None and not return_exceptions:
+            raise error
+        hits[key] = error if error is not None else value
+    return {key: hits[key] for key in keys}
+
+
+class LocalCache:
+    """
+    In-process LRU cache with TTL and memory bounds, used as the L1 tier in front of Redis.
+    
+    Values are kept in their serialized form so memory accounting is exact and callers
+    never share mutable objects. Coherence across workers is maintained by listening for
+    invalidations broadcast over Redis pub/sub by any RedisCache or AsyncRedisCache.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: int = 60,
+        categories: Optional[List[str]] = None,
+        channel: str = "umt:cache:invalidation"
+    ):
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._bytes = 0
+        self._channel = channel
+        self._listener = None
+        self._listener_lock = threading.Lock()
+        # Only keys in these categories are held locally. Match both the plain name and
+        # the formatted enum, which differ on newer Python versions
+        names = [name.strip() for name in (categories or []) if name.strip()]
+        self._key_prefixes = tuple(
+            {f"{KEY_PREFIX}{name}:" for name in names}
+            | {
+                f"{KEY_PREFIX}{CacheCategory(name)}:"
+                for name in names if name in CacheCategory._value2member_map_
+            }
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    @property
+    def channel(self) -> str:
+        """Pub/sub channel used to broadcast invalidations."""
+        return self._channel
+    
+    def accepts(self, key: str) -> bool:
+        """Check whether a prefixed key belongs to a category held in L1."""
+        return key.startswith(self._key_prefixes)
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a serialized value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store a serialized value, evicting least recently used entries as needed."""
+        size = len(value)
+        if size > self._max_bytes:
+            return
+        local_ttl = min(ttl, self._ttl) if ttl else self._ttl
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, time.monotonic() + local_ttl)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+    
+    def delete(self, key: str) -> bool:
+        """Remove a single key."""
+        with self._lock:
+            return self._remove(key)
+    
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove all keys matching a Redis glob-style pattern."""
+        with self._lock:
+            matches = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in matches:
+                self._remove(key)
+            return len(matches)
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def _remove(self, key: str) -> bool:
+        """Remove a key; the caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= len(entry[0])
+        return True
+    
+    def apply_invalidation(self, op: str, target: Optional[str] = None) -> None:
+        """Apply an invalidation locally."""
+        self.invalidations += 1
+        if op == "key" and target:
+            self.delete(target)
+        elif op == "pattern" and target:
+            self.delete_pattern(target)
+        else:
+            self.clear()
+    
+    def invalidation_message(self, op: str, target: Optional[str] = None) -> str:
+        """Build the pub/sub payload for an invalidation originating in this process."""
+        return json.dumps({"origin": _PROCESS_ID, "op": op, "target": target})
+    
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation received from another worker."""
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError, KeyError) as e:
+            logging.warning(f"Ignoring malformed cache invalidation message: {e}")
+            return
+        if payload.get("origin") == _PROCESS_ID:
+            return  # Already applied locally before publishing
+        self.apply_invalidation(payload.get("op", "clear"), payload.get("target"))
+    
+    def is_listening(self) -> bool:
+        """Check, without blocking, whether the pub/sub listener is running."""
+        return self._listener is not None and self._listener.is_alive()
+    
+    def ensure_listening(self) -> bool:
+        """
+        Start the background pub/sub listener if it is not running.
+        
+        Returns:
+            bool: True if invalidations from other workers will be received. L1 is
+            only populated while this holds, so a lost subscription can never leave
+            stale entries beyond what was cached before it dropped.
+        """
+        if self.is_listening():
+            return True
+        with self._listener_lock:
+            if self.is_listening():
+                return True
+            try:
+                client = Redis.from_url(str(settings.REDIS_URL), **_client_options())
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{self._channel: self._handle_message})
+                self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+                # Anything cached before the subscription existed may have been missed
+                self.clear()
+                return True
+            except Exception as e:
+                logging.warning(f"Cache invalidation listener failed to start: {e}")
+                self._listener = None
+                return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """L1 hit/miss counters and memory usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "l1_hits": self.hits,
+                "l1_misses": self.misses,
+                "l1_hit_ratio": self.hits / lookups if lookups > 0 else 0,
+                "l1_entries": len(self._entries),
+                "l1_bytes": self._bytes,
+                "l1_evictions": self.evictions,
+                "l1_invalidations": self.invalidations
+            }
+
+
 class RedisCache:
     """Redis cache client for storing and retrieving data with enhanced functionality."""
     
-    def __init__(self):
+    def __init__(self, local: Optional[LocalCache] = None):
         self._client = None
         self._default_ttl = 3600  # Default TTL: 1 hour
-        self._key_prefix = "umt:"  # Prefix for all keys in this application
+        self._key_prefix = KEY_PREFIX
         self._monitor_keys = set()  # Set to track keys for monitoring
+        self._local = local  # Optional in-process L1 tier
+        self._scanned_categories: Set[str] = set()  # Categories swept for unindexed keys
+        self._inflight: Dict[str, Future] = {}  # Single-flight computations by key
+        self._inflight_lock = threading.Lock()
     
     @property
     def client(self) -> Redis:
         """Get or create Redis client with connection pooling."""
         if self._client is None:
             # Parse connection pool settings from URL or use defaults
-            self._client = Redis.from_url(
-                str(settings.REDIS_URL),
-                decode_responses=False,  # We'll handle decoding manually
-                socket_timeout=5.0,      # Socket timeout in seconds
-                socket_connect_timeout=3.0, # Connection timeout
-                health_check_interval=30,  # Health check every 30 seconds
-                retry_on_timeout=True,     # Retry on timeout
-                max_connections=20         # Max connections in pool
-            )
+            self._client = Redis.from_url(str(settings.REDIS_URL), **_client_options())
         return self._client
     
     def _prefix_key(self, key: str) -> str:
@@ -62,24 +477,42 @@ class RedisCache:
             return key
         return f"{self._key_prefix}{key}"
     
+    def _local_for(self, prefixed_key: str) -> Optional[LocalCache]:
+        """Return the L1 tier if it holds this key's category."""
+        if self._local is not None and self._local.accepts(prefixed_key):
+            return self._local
+        return None
+    
+    def _publish_invalidation(self, op: str, target: Optional[str] = None) -> None:
+        """Broadcast an L1 invalidation to other workers."""
+        try:
+            self.client.publish(self._local.channel, self._local.invalidation_message(op, target))
+        except Exception as e:
+            logging.warning(f"Redis publish error for cache invalidation {op} {target}: {e}")
+    
     def get(self, key: str, default: Any = None) -> Optional[Any]:
         """Get a value from the cache with default fallback."""
         prefixed_key = self._prefix_key(key)
+        local = self._local_for(prefixed_key)
+        if local is not None:
+            local_value = local.get(prefixed_key)
+            if local_value is not None:
+                return _deserialize(local_value)
         try:
             value = self.client.get(prefixed_key)
             if value is None:
                 return default
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value.decode()
+            if local is not None and local.ensure_listening():
+                local.set(prefixed_key, value)
+            return _deserialize(value)
         except Exception as e:
             logging.warning(f"Redis get error for key {key}: {e}")
             return default
     
     def set(
         self, key: str, value: Any, expire: Optional[int] = None, 
-        nx: bool = False, xx: bool = False, keep_ttl: bool = False
+        nx: bool = False, xx: bool = False, keep_ttl: bool = False,
+        tags: Optional[List[str]] = None
     ) -> bool:
         """
         Set a value in the cache with enhanced options.
@@ -91,6 +524,7 @@ class RedisCache:
             nx: Only set if key doesn't exist
             xx: Only set if key already exists
             keep_ttl: Keep the existing TTL when updating value
+            tags: Extra tags to index the key under, in addition to its category
             
         Returns:
             bool: Success status
@@ -104,21 +538,56 @@ class RedisCache:
                 self._monitor_keys.add(prefixed_key)
             
             # Serialize the value if it's not already a string or bytes
-            serialized = (
-                json.dumps(value) 
-                if not isinstance(value, (str, bytes)) 
-                else value
-            )
+            serialized = _serialize(value)
             
-            # Set with options
-            result = self.client.set(
-                prefixed_key, 
-                serialized,
-                ex=ttl if not keep_ttl else None,
-                nx=nx,
-                xx=xx,
-                keepttl=keep_ttl
-            )
+            local = self._local_for(prefixed_key)
+            key_tags = _key_tags(prefixed_key, tags)
+            if local is None and not key_tags:
+                # Set with options
+                result = self.client.set(
+                    prefixed_key, 
+                    serialized,
+                    ex=ttl if not keep_ttl else None,
+                    nx=nx,
+                    xx=xx,
+                    keepttl=keep_ttl
+                )
+                return bool(result)
+            
+            # Index tags and notify other workers in the same round trip as the write
+            pipeline = self.client.pipeline(transaction=False)
+            if nx or xx:
+                # A conditional write may not happen, so only index and notify once it has
+                written = self.client.set(
+                    prefixed_key,
+                    serialized,
+                    ex=ttl if not keep_ttl else None,
+                    nx=nx,
+                    xx=xx,
+                    keepttl=keep_ttl
+                )
+                if not written:
+                    return False
+            else:
+                pipeline.set(
+                    prefixed_key,
+                    serialized,
+                    ex=ttl if not keep_ttl else None,
+                    keepttl=keep_ttl
+                )
+            _index_tags(pipeline, prefixed_key, key_tags, None if keep_ttl else ttl)
+            if local is not None:
+                # Drop the old value locally and tell other workers
+                local.delete(prefixed_key)
+                pipeline.publish(local.channel, local.invalidation_message("key", prefixed_key))
+            results = pipeline.execute()
+            result = True if nx or xx else results[0]
+            if result and local is not None and local.ensure_listening():
+                local.set(
+                    prefixed_key,
+                    serialized.encode() if isinstance(serialized, str) else serialized,
+                    None if keep_ttl else ttl
+                )
             return bool(result)
         except Exception as e:
             logging.warning(f"Redis set error for key {key}: {e}")
@@ -127,21 +596,34 @@ class RedisCache:
     def mget(self, keys: List[str]) -> List[Optional[Any]]:
         """Get multiple keys at once."""
         prefixed_keys = [self._prefix_key(key) for key in keys]
-        try:
-            values = self.client.mget(prefixed_keys)
-            result = []
-            for value in values:
-                if value is None:
-                    result.append(None)
-                else:
-                    try:
-                        result.append(json.loads(value))
-                    except json.JSONDecodeError:
-                        result.append(value.decode())
-            return result
-        except Exception as e:
-            logging.warning(f"Redis mget error: {e}")
-            return [None] * len(keys)
+        if self._local is None:
+            try:
+                values = self.client.mget(prefixed_keys)
+                return [None if value is None else _deserialize(value) for value in values]
+            except Exception as e:
+                logging.warning(f"Redis mget error: {e}")
+                return [None] * len(keys)
+        
+        # Serve what we can from L1 and fetch only the remaining keys
+        raw: List[Optional[bytes]] = [
+            self._local.get(key) if self._local.accepts(key) else None for key in prefixed_keys
+        ]
+        missing = [i for i, value in enumerate(raw) if value is None]
+        if missing:
+            try:
+                fetched = self.client.mget([prefixed_keys[i] for i in missing])
+            except Exception as e:
+                logging.warning(f"Redis mget error: {e}")
+                fetched = [None] * len(missing)
+            listening = None
+            for i, value in zip(missing, fetched):
+                raw[i] = value
+                if value is not None and self._local.accepts(prefixed_keys[i]):
+                    if listening is None:
+                        listening = self._local.ensure_listening()
+                    if listening:
+                        self._local.set(prefixed_keys[i], value)
+        return [None if value is None else _deserialize(value) for value in raw]
     
     def mset(self, mapping: Dict[str, Any], expire: Optional[int] = None) -> bool:
         """Set multiple keys at once with optional expiry."""
@@ -149,37 +631,102 @@ class RedisCache:
             return True
             
         # Prefix all keys and serialize values
-        serialized_mapping = {}
-        for key, value in mapping.items():
-            prefixed_key = self._prefix_key(key)
-            serialized_value = (
-                json.dumps(value) 
-                if not isinstance(value, (str, bytes)) 
-                else value
-            )
-            serialized_mapping[prefixed_key] = serialized_value
+        serialized_mapping = {
+            self._prefix_key(key): _serialize(value) for key, value in mapping.items()
+        }
         
         try:
+            # Drop stale L1 copies here and in other workers
+            if self._local is not None:
+                local_keys = [key for key in serialized_mapping if self._local.accepts(key)]
+                if local_keys:
+                    pipeline = self.client.pipeline(transaction=False)
+                    for key in local_keys:
+                        self._local.delete(key)
+                        pipeline.publish(
+                            self._local.channel, self._local.invalidation_message("key", key)
+                        )
+                    pipeline.execute()
+            
             # Set all keys
             result = self.client.mset(serialized_mapping)
             
-            # Set expiry for each key if specified
-            if expire is not None and result:
+            # Set expiry for each key if specified and index their tags
+            if result:
                 pipeline = self.client.pipeline()
                 for key in serialized_mapping.keys():
-                    pipeline.expire(key, expire)
-                pipeline.execute()
+                    if expire is not None:
+                        pipeline.expire(key, expire)
+                    _index_tags(pipeline, key, _key_tags(key), expire)
+                if len(pipeline):
+                    pipeline.execute()
                 
             return result
         except Exception as e:
             logging.warning(f"Redis mset error: {e}")
             return False
     
+    def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None
+    ) -> bool:
+        """
+        Set multiple keys with per-key TTLs in a single pipeline round trip.
+        
+        Args:
+            mapping: Keys and values to store
+            expire: TTL in seconds for keys without an entry in ttls
+            ttls: Optional TTL in seconds per key
+            
+        Returns:
+            bool: Success status
+        """
+        if not mapping:
+            return True
+        
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                prefixed_key = self._prefix_key(key)
+                ttl = ttls.get(key, expire) if ttls else expire
+                if ttl is None:
+                    ttl = self._default_ttl
+                pipeline.set(prefixed_key, _serialize(value), ex=ttl)
+                _index_tags(pipeline, prefixed_key, _key_tags(prefixed_key), ttl)
+                if self._local_for(prefixed_key) is not None:
+                    # Drop stale L1 copies here and in other workers
+                    self._local.delete(prefixed_key)
+                    pipeline.publish(
+                        self._local.channel, self._local.invalidation_message("key", prefixed_key)
+                    )
+            pipeline.execute()
+            return True
+        except Exception as e:
+            logging.warning(f"Redis set_many error: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
-        """Delete a key from the cache."""
+        """
+        Delete a key from the cache.
+        
+        The key is also removed from its category index; indexes of explicit tags drop
+        it once its expiry time passes.
+        """
         prefixed_key = self._prefix_key(key)
+        if self._local_for(prefixed_key) is not None:
+            self._local.delete(prefixed_key)
+            self._publish_invalidation("key", prefixed_key)
         try:
-            result = self.client.delete(prefixed_key)
+            category = _key_category(prefixed_key)
+            if category is None:
+                result = self.client.delete(prefixed_key)
+            else:
+                pipeline = self.client.pipeline(transaction=False)
+                pipeline.delete(prefixed_key)
+                pipeline.zrem(_tag_key(category), prefixed_key)
+                result = pipeline.execute()[0]
             return result > 0
         except Exception as e:
             logging.warning(f"Redis delete error for key {key}: {e}")
@@ -188,19 +735,334 @@ class RedisCache:
     def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern."""
         prefixed_pattern = self._prefix_key(pattern)
+        if self._local is not None:
+            self._local.delete_pattern(prefixed_pattern)
+            self._publish_invalidation("pattern", prefixed_pattern)
         try:
-            keys = self.client.keys(prefixed_pattern)
-            if not keys:
-                return 0
-            return self.client.delete(*keys)
+            return self._scan_unlink(prefixed_pattern)
         except Exception as e:
             logging.warning(f"Redis delete_pattern error for pattern {pattern}: {e}")
             return 0
     
+    def _scan_unlink(self, prefixed_pattern: str) -> int:
+        """Incrementally SCAN for a pattern and UNLINK matches in batches."""
+        deleted = 0
+        batch = []
+        for key in self.client.scan_iter(match=prefixed_pattern, count=_SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= _UNLINK_BATCH_SIZE:
+                deleted += self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += self.client.unlink(*batch)
+        return deleted
+    
+    def _unlink_tag_members(self, tag: str) -> Optional[int]:
+        """
+        UNLINK every key indexed under a tag.
+        
+        The tag index is first renamed so keys written concurrently land in a fresh index
+        instead of being dropped from it. Returns None if the tag index does not exist.
+        """
+        purge_key = f"{_tag_key(tag)}:purge:{uuid.uuid4().hex}"
+        try:
+            self.client.rename(_tag_key(tag), purge_key)
+        except ResponseError:
+            return None  # No such key
+        deleted = 0
+        batch = []
+        for member, _ in self.client.zscan_iter(purge_key, count=_SCAN_COUNT):
+            batch.append(member)
+            if len(batch) >= _UNLINK_BATCH_SIZE:
+                deleted += self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += self.client.unlink(*batch)
+        self.client.unlink(purge_key)
+        return deleted
+    
+    def delete_tag(self, tag: str) -> int:
+        """Delete all keys indexed under a tag."""
+        try:
+            return self._unlink_tag_members(tag) or 0
+        except Exception as e:
+            logging.warning(f"Redis delete_tag error for tag {tag}: {e}")
+            return 0
+    
     def delete_category(self, category: CacheCategory) -> int:
-        """Delete all keys in a specific category."""
-        pattern = f"{self._prefix_key(category)}:*"
-        return self.delete_pattern(pattern)
+        """Delete all keys in a specific category using its tag index."""
+        name = _category_name(category)
+        patterns = _category_patterns(category)
+        if self._local is not None:
+            for pattern in patterns:
+                self._local.delete_pattern(pattern)
+                self._publish_invalidation("pattern", pattern)
+        try:
+            deleted = self._unlink_tag_members(name) or 0
+            # Keys written before the index existed are swept once per process
+            if name not in self._scanned_categories:
+                for pattern in patterns:
+                    deleted += self._scan_unlink(pattern)
+                self._scanned_categories.add(name)
+            return deleted
+        except Exception as e:
+            logging.warning(f"Redis delete_category error for category {name}: {e}")
+            return 0
+    
+    def acquire_lock(self, name: str, timeout: float) -> Optional[str]:
+        """
+        Try to take a short-lived distributed lock.
+        
+        Returns:
+            A token to pass to release_lock, or None if another worker holds the lock
+        """
+        token = uuid.uuid4().hex
+        try:
+            if self.client.set(self._prefix_key(f"{LOCK_PREFIX}{name}"), token, nx=True, px=int(timeout * 1000)):
+                return token
+            return None
+        except Exception as e:
+            logging.warning(f"Redis lock error for {name}: {e}")
+            return token  # Degrade to local single-flight only
+    
+    def release_lock(self, name: str, token: str, stored: bool = True) -> None:
+        """
+        Release a lock taken with acquire_lock if it is still ours.
+        
+        Args:
+            name: Lock name
+            token: Token returned by acquire_lock
+            stored: Whether the holder stored a result; if not, workers waiting on
+                the lock are told to stop waiting (see result_not_stored)
+        """
+        lock_key = self._prefix_key(f"{LOCK_PREFIX}{name}")
+        try:
+            if stored:
+                self.client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            else:
+                self.client.eval(
+                    _MARK_UNSTORED_SCRIPT, 1, lock_key, token, _UNSTORED_MARKER, _UNSTORED_MARKER_TTL_MS
+                )
+        except Exception as e:
+            logging.warning(f"Redis unlock error for {name}: {e}")
+    
+    def result_not_stored(self, name: str) -> bool:
+        """Check whether the last holder of a lock released it without storing a result."""
+        try:
+            value = self.client.get(self._prefix_key(f"{LOCK_PREFIX}{name}"))
+        except Exception as e:
+            logging.warning(f"Redis lock check error for {name}: {e}")
+            return False
+        return value is not None and _decode_lock_value(value) == _UNSTORED_MARKER
+    
+    def get_computed(self, key: str) -> Optional[Any]:
+        """Get a cached value without computing it, unwrapping get_or_compute entries; None on a miss or once expired."""
+        hit, value = _batch_hit(self.get(key), None)
+        return value if hit else None
+    
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        expire: Optional[int] = None,
+        stale_ttl: int = 0,
+        early_expiration_beta: float = 1.0,
+        lock_timeout: float = 30.0,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+        is_usable: Optional[Callable[[Any], bool]] = None,
+        force_refresh: bool = False
+    ) -> Any:
+        """
+        Get a value, computing it at most once across concurrent callers on a miss.
+        
+        Concurrent misses in this process wait on one local future, and other
+        processes wait on a Redis lock, so only a single caller recomputes. Values
+        are refreshed early with probability rising towards expiry, and with
+        stale_ttl an expired value keeps being served for that long while one
+        worker refreshes it in the background.
+        
+        Args:
+            key: The cache key
+            compute: Zero-argument callable producing the value
+            expire: TTL in seconds before the value is considered stale
+            stale_ttl: Seconds an expired value may still be served while refreshing
+            early_expiration_beta: XFetch aggressiveness; 0 disables early refresh
+            lock_timeout: Seconds to wait for another worker before computing anyway
+            should_cache: Predicate deciding whether a computed value is stored
+            is_usable: Predicate for plain (non-enveloped) entries already in the cache
+            force_refresh: Recompute even if a fresh value is cached
+            
+        Returns:
+            The cached or freshly computed value
+        """
+        ttl = expire if expire is not None else self._default_ttl
+        
+        if not force_refresh:
+            entry = self.get(key)
+            if _is_envelope(entry):
+                if _needs_refresh(entry, early_expiration_beta):
+                    self._refresh_in_background(
+                        key, compute, ttl, stale_ttl, lock_timeout, should_cache
+                    )
+                return entry["value"]
+            if entry is not None and (is_usable is None or is_usable(entry)):
+                return entry
+        
+        # Single-flight within this process
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            try:
+                return future.result(timeout=lock_timeout)
+            except FutureTimeoutError:
+                return compute()
+        
+        try:
+            result = self._compute_once(key, compute, ttl, stale_ttl, lock_timeout, should_cache)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _compute_once(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        lock_timeout: float,
+        should_cache: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """Compute and store a value while holding the cross-process lock."""
+        token = self.acquire_lock(key, lock_timeout)
+        if token is None:
+            # Another worker is computing; wait for its result, or until it gives up
+            # the lock without storing one
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(_LOCK_POLL_INTERVAL)
+                entry = self.get(key)
+                if _is_envelope(entry):
+                    return entry["value"]
+                if self.result_not_stored(key):
+                    break
+            else:
+                token = self.acquire_lock(key, lock_timeout)
+        stored = False
+        try:
+            started = time.monotonic()
+            result = compute()
+            if should_cache is None or should_cache(result):
+                stored = self.set(
+                    key,
+                    _envelope(result, ttl, time.monotonic() - started),
+                    expire=ttl + stale_ttl
+                )
+            return result
+        finally:
+            if token is not None:
+                self.release_lock(key, token, stored=stored)
+    
+    def _refresh_in_background(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        lock_timeout: float,
+        should_cache: Optional[Callable[[Any], bool]]
+    ) -> None:
+        """Refresh a value on the refresh pool unless another worker already is."""
+        token = self.acquire_lock(key, lock_timeout)
+        if token is None:
+            return
+        
+        def refresh() -> None:
+            try:
+                started = time.monotonic()
+                result = compute()
+                if should_cache is None or should_cache(result):
+                    self.set(
+                        key,
+                        _envelope(result, ttl, time.monotonic() - started),
+                        expire=ttl + stale_ttl
+                    )
+            except Exception as e:
+                logging.warning(f"Background cache refresh failed for key {key}: {e}")
+            finally:
+                self.release_lock(key, token)
+        
+        _refresh_executor.submit(refresh)
+    
+    def get_or_compute_many(
+        self,
+        computations: Dict[str, Callable[[], Any]],
+        expire: Union[int, Callable[[Any], int], None] = None,
+        concurrency: Optional[int] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+        is_usable: Optional[Callable[[Any], bool]] = None,
+        envelope: bool = False,
+        return_exceptions: bool = False,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Resolve many keys with one MGET, computing only the misses.
+        
+        Computed values are written back in a single pipeline, so a batch costs two
+        round trips however many keys it holds. Enveloped entries written by
+        get_or_compute are read too, and are treated as misses once expired.
+        
+        Args:
+            computations: Zero-argument callables producing each key's value
+            expire: TTL in seconds, or a callable deriving the TTL from a computed value
+            concurrency: Number of threads computing misses; computed in order if unset
+            should_cache: Predicate deciding whether a computed value is stored
+            is_usable: Predicate for plain (non-enveloped) entries already in the cache
+            envelope: Store values in the get_or_compute format to share keys with it
+            return_exceptions: Return compute errors in place of values instead of raising
+            force_refresh: Recompute every key even if a fresh value is cached
+            
+        Returns:
+            Values by key, in the order of computations
+        """
+        keys = list(computations)
+        if not keys:
+            return {}
+        
+        hits: Dict[str, Any] = {}
+        misses: List[str] = []
+        entries = [None] * len(keys) if force_refresh else self.mget(keys)
+        for key, entry in zip(keys, entries):
+            hit, value = _batch_hit(entry, is_usable)
+            if hit:
+                hits[key] = value
+            else:
+                misses.append(key)
+        
+        def run(key: str) -> Tuple[Optional[Exception], Any, float]:
+            started = time.monotonic()
+            try:
+                return None, computations[key](), time.monotonic() - started
+            except Exception as e:
+                return e, None, 0.0
+        
+        if concurrency and concurrency > 1 and len(misses) > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(misses))) as executor:
+                outcomes = list(executor.map(run, misses))
+        else:
+            outcomes = [run(key) for key in misses]
+        
+        mapping, ttls = _batch_writes(misses, outcomes, expire, self._default_ttl, should_cache, envelope)
+        self.set_many(mapping, ttls=ttls)
+        return _batch_results(keys, hits, misses, outcomes, return_exceptions)
     
     def exists(self, key: str) -> bool:
         """Check if a key exists in the cache."""
@@ -249,10 +1111,11 @@ class RedisCache:
     
     def clear(self) -> bool:
         """Clear all keys in this application's namespace."""
+        if self._local is not None:
+            self._local.clear()
+            self._publish_invalidation("clear")
         try:
-            keys = self.client.keys(f"{self._key_prefix}*")
-            if keys:
-                self.client.delete(*keys)
+            self._scan_unlink(f"{self._key_prefix}*")
             return True
         except Exception as e:
             logging.warning(f"Redis clear error: {e}")
@@ -260,6 +1123,9 @@ class RedisCache:
             
     def clear_all(self) -> bool:
         """Clear all keys in the database (use with caution)."""
+        if self._local is not None:
+            self._local.clear()
+            self._publish_invalidation("clear")
         try:
             self.client.flushdb()
             return True
@@ -272,7 +1138,9 @@ class RedisCache:
         try:
             info = self.client.info()
             keys_total = self.client.dbsize()
-            keys_app = len(self.client.keys(f"{self._key_prefix}*"))
+            keys_app = sum(
+                1 for _ in self.client.scan_iter(match=f"{self._key_prefix}*", count=_SCAN_COUNT)
+            )
             
             # Get hit/miss stats if monitoring is enabled
             hits = 0
@@ -281,7 +1149,7 @@ class RedisCache:
                 hits = info.get('keyspace_hits', 0)
                 misses = info.get('keyspace_misses', 0)
             
-            return {
+            stats = {
                 "total_keys": keys_total,
                 "app_keys": keys_app,
                 "hits": hits,
@@ -291,8 +1159,625 @@ class RedisCache:
                 "connected_clients": info.get('connected_clients', 0)
             }
         except Exception as e:
-            logging.warning(f"Redis stats error: {e}")
-            return {}
+            logging.warning(f"Redis stats error: {e}")
+            stats = {}
+        
+        if self._local is not None:
+            stats.update(self._local.get_stats())
+        return stats
+
+
+class AsyncRedisCache:
+    """
+    Asyncio Redis cache client for coroutine callers.
+    
+    Shares the key prefix and serialization of RedisCache, so entries written by
+    either client can be read by the other, but never blocks the event loop.
+    """
+    
+    def __init__(self, local: Optional[LocalCache] = None):
+        self._client = None
+        self._default_ttl = 3600  # Default TTL: 1 hour
+        self._key_prefix = KEY_PREFIX
+        self._local = local  # Optional in-process L1 tier, shared with RedisCache
+        self._scanned_categories: Set[str] = set()  # Categories swept for unindexed keys
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}  # Single-flight computations by key
+        self._refresh_tasks: Set["asyncio.Task[None]"] = set()
+    
+    @property
+    def client(self) -> AsyncRedis:
+        """Get or create the asyncio Redis client with connection pooling."""
+        if self._client is None:
+            self._client = AsyncRedis.from_url(str(settings.REDIS_URL), **_client_options())
+        return self._client
+    
+    def _prefix_key(self, key: str) -> str:
+        """Add application prefix to all keys for namespace isolation."""
+        if key.startswith(self._key_prefix):
+            return key
+        return f"{self._key_prefix}{key}"
+    
+    def _local_for(self, prefixed_key: str) -> Optional[LocalCache]:
+        """Return the L1 tier if it holds this key's category."""
+        if self._local is not None and self._local.accepts(prefixed_key):
+            return self._local
+        return None
+    
+    async def _local_listening(self) -> bool:
+        """Async counterpart of LocalCache.ensure_listening.
+        
+        Starting the listener opens a blocking pub/sub connection, so it runs in the
+        default executor rather than on the event loop.
+        """
+        if self._local.is_listening():
+            return True
+        return await asyncio.get_running_loop().run_in_executor(None, self._local.ensure_listening)
+    
+    async def _publish_invalidation(self, op: str, target: Optional[str] = None) -> None:
+        """Broadcast an L1 invalidation to other workers."""
+        try:
+            await self.client.publish(self._local.channel, self._local.invalidation_message(op, target))
+        except Exception as e:
+            logging.warning(f"Redis async publish error for cache invalidation {op} {target}: {e}")
+    
+    async def get(self, key: str, default: Any = None) -> Optional[Any]:
+        """Get a value from the cache with default fallback."""
+        prefixed_key = self._prefix_key(key)
+        local = self._local_for(prefixed_key)
+        if local is not None:
+            local_value = local.get(prefixed_key)
+            if local_value is not None:
+                return _deserialize(local_value)
+        try:
+            value = await self.client.get(prefixed_key)
+            if value is None:
+                return default
+            if local is not None and await self._local_listening():
+                local.set(prefixed_key, value)
+            return _deserialize(value)
+        except Exception as e:
+            logging.warning(f"Redis async get error for key {key}: {e}")
+            return default
+    
+    async def set(
+        self, key: str, value: Any, expire: Optional[int] = None,
+        nx: bool = False, xx: bool = False, keep_ttl: bool = False,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Set a value in the cache.
+        
+        Args:
+            key: The cache key
+            value: The value to store
+            expire: TTL in seconds
+            nx: Only set if key doesn't exist
+            xx: Only set if key already exists
+            keep_ttl: Keep the existing TTL when updating value
+            tags: Extra tags to index the key under, in addition to its category
+            
+        Returns:
+            bool: Success status
+        """
+        prefixed_key = self._prefix_key(key)
+        ttl = expire if expire is not None else self._default_ttl
+        
+        try:
+            serialized = _serialize(value)
+            local = self._local_for(prefixed_key)
+            key_tags = _key_tags(prefixed_key, tags)
+            if local is None and not key_tags:
+                result = await self.client.set(
+                    prefixed_key,
+                    serialized,
+                    ex=ttl if not keep_ttl else None,
+                    nx=nx,
+                    xx=xx,
+                    keepttl=keep_ttl
+                )
+                return bool(result)
+            
+            if nx or xx:
+                # A conditional write may not happen, so only index and notify once it has
+                written = await self.client.set(
+                    prefixed_key,
+                    serialized,
+                    ex=ttl if not keep_ttl else None,
+                    nx=nx,
+                    xx=xx,
+                    keepttl=keep_ttl
+                )
+                if not written:
+                    return False
+            
+            # Index tags and notify other workers in the same round trip as the write
+            async with self.client.pipeline(transaction=False) as pipeline:
+                if not (nx or xx):
+                    pipeline.set(
+                        prefixed_key,
+                        serialized,
+                        ex=ttl if not keep_ttl else None,
+                        keepttl=keep_ttl
+                    )
+                _index_tags(pipeline, prefixed_key, key_tags, None if keep_ttl else ttl)
+                if local is not None:
+                    # Drop the old value locally and tell other workers
+                    local.delete(prefixed_key)
+                    pipeline.publish(local.channel, local.invalidation_message("key", prefixed_key))
+                results = await pipeline.execute()
+            result = True if nx or xx else results[0]
+            if result and local is not None and await self._local_listening():
+                local.set(
+                    prefixed_key,
+                    serialized.encode() if isinstance(serialized, str) else serialized,
+                    None if keep_ttl else ttl
+                )
+            return bool(result)
+        except Exception as e:
+            logging.warning(f"Redis async set error for key {key}: {e}")
+            return False
+    
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple keys at once."""
+        prefixed_keys = [self._prefix_key(key) for key in keys]
+        if self._local is None:
+            try:
+                values = await self.client.mget(prefixed_keys)
+                return [None if value is None else _deserialize(value) for value in values]
+            except Exception as e:
+                logging.warning(f"Redis async mget error: {e}")
+                return [None] * len(keys)
+        
+        # Serve what we can from L1 and fetch only the remaining keys
+        raw: List[Optional[bytes]] = [
+            self._local.get(key) if self._local.accepts(key) else None for key in prefixed_keys
+        ]
+        missing = [i for i, value in enumerate(raw) if value is None]
+        if missing:
+            try:
+                fetched = await self.client.mget([prefixed_keys[i] for i in missing])
+            except Exception as e:
+                logging.warning(f"Redis async mget error: {e}")
+                fetched = [None] * len(missing)
+            listening = None
+            for i, value in zip(missing, fetched):
+                raw[i] = value
+                if value is not None and self._local.accepts(prefixed_keys[i]):
+                    if listening is None:
+                        listening = await self._local_listening()
+                    if listening:
+                        self._local.set(prefixed_keys[i], value)
+        return [None if value is None else _deserialize(value) for value in raw]
+    
+    async def mset(self, mapping: Dict[str, Any], expire: Optional[int] = None) -> bool:
+        """Set multiple keys at once with optional expiry."""
+        if not mapping:
+            return True
+        
+        serialized_mapping = {
+            self._prefix_key(key): _serialize(value) for key, value in mapping.items()
+        }
+        
+        try:
+            async with self.client.pipeline(transaction=False) as pipeline:
+                # Drop stale L1 copies here and in other workers
+                published = 0
+                if self._local is not None:
+                    for key in serialized_mapping.keys():
+                        if self._local.accepts(key):
+                            self._local.delete(key)
+                            pipeline.publish(
+                                self._local.channel, self._local.invalidation_message("key", key)
+                            )
+                            published += 1
+                pipeline.mset(serialized_mapping)
+                for key in serialized_mapping.keys():
+                    if expire is not None:
+                        pipeline.expire(key, expire)
+                    _index_tags(pipeline, key, _key_tags(key), expire)
+                results = await pipeline.execute()
+            return bool(results[published])
+        except Exception as e:
+            logging.warning(f"Redis async mset error: {e}")
+            return False
+    
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None
+    ) -> bool:
+        """
+        Set multiple keys with per-key TTLs in a single pipeline round trip.
+        
+        Args:
+            mapping: Keys and values to store
+            expire: TTL in seconds for keys without an entry in ttls
+            ttls: Optional TTL in seconds per key
+            
+        Returns:
+            bool: Success status
+        """
+        if not mapping:
+            return True
+        
+        try:
+            async with self.client.pipeline(transaction=False) as pipeline:
+                for key, value in mapping.items():
+                    prefixed_key = self._prefix_key(key)
+                    ttl = ttls.get(key, expire) if ttls else expire
+                    if ttl is None:
+                        ttl = self._default_ttl
+                    pipeline.set(prefixed_key, _serialize(value), ex=ttl)
+                    _index_tags(pipeline, prefixed_key, _key_tags(prefixed_key), ttl)
+                    if self._local_for(prefixed_key) is not None:
+                        # Drop stale L1 copies here and in other workers
+                        self._local.delete(prefixed_key)
+                        pipeline.publish(
+                            self._local.channel, self._local.invalidation_message("key", prefixed_key)
+                        )
+                await pipeline.execute()
+            return True
+        except Exception as e:
+            logging.warning(f"Redis async set_many error: {e}")
+            return False
+    
+    async def delete(self, key: str) -> bool:
+        """Delete a key from the cache and its category index; see RedisCache.delete."""
+        prefixed_key = self._prefix_key(key)
+        if self._local_for(prefixed_key) is not None:
+            self._local.delete(prefixed_key)
+            await self._publish_invalidation("key", prefixed_key)
+        try:
+            category = _key_category(prefixed_key)
+            if category is None:
+                result = await self.client.delete(prefixed_key)
+            else:
+                async with self.client.pipeline(transaction=False) as pipeline:
+                    pipeline.delete(prefixed_key)
+                    pipeline.zrem(_tag_key(category), prefixed_key)
+                    result = (await pipeline.execute())[0]
+            return result > 0
+        except Exception as e:
+            logging.warning(f"Redis async delete error for key {key}: {e}")
+            return False
+    
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a pattern."""
+        prefixed_pattern = self._prefix_key(pattern)
+        if self._local is not None:
+            self._local.delete_pattern(prefixed_pattern)
+            await self._publish_invalidation("pattern", prefixed_pattern)
+        try:
+            return await self._scan_unlink(prefixed_pattern)
+        except Exception as e:
+            logging.warning(f"Redis async delete_pattern error for pattern {pattern}: {e}")
+            return 0
+    
+    async def _scan_unlink(self, prefixed_pattern: str) -> int:
+        """Incrementally SCAN for a pattern and UNLINK matches in batches."""
+        deleted = 0
+        batch = []
+        async for key in self.client.scan_iter(match=prefixed_pattern, count=_SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= _UNLINK_BATCH_SIZE:
+                deleted += await self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.client.unlink(*batch)
+        return deleted
+    
+    async def _unlink_tag_members(self, tag: str) -> Optional[int]:
+        """UNLINK every key indexed under a tag; see RedisCache._unlink_tag_members."""
+        purge_key = f"{_tag_key(tag)}:purge:{uuid.uuid4().hex}"
+        try:
+            await self.client.rename(_tag_key(tag), purge_key)
+        except ResponseError:
+            return None  # No such key
+        deleted = 0
+        batch = []
+        async for member, _ in self.client.zscan_iter(purge_key, count=_SCAN_COUNT):
+            batch.append(member)
+            if len(batch) >= _UNLINK_BATCH_SIZE:
+                deleted += await self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.client.unlink(*batch)
+        await self.client.unlink(purge_key)
+        return deleted
+    
+    async def delete_tag(self, tag: str) -> int:
+        """Delete all keys indexed under a tag."""
+        try:
+            return await self._unlink_tag_members(tag) or 0
+        except Exception as e:
+            logging.warning(f"Redis async delete_tag error for tag {tag}: {e}")
+            return 0
+    
+    async def delete_category(self, category: CacheCategory) -> int:
+        """Delete all keys in a specific category using its tag index."""
+        name = _category_name(category)
+        patterns = _category_patterns(category)
+        if self._local is not None:
+            for pattern in patterns:
+                self._local.delete_pattern(pattern)
+                await self._publish_invalidation("pattern", pattern)
+        try:
+            deleted = await self._unlink_tag_members(name) or 0
+            # Keys written before the index existed are swept once per process
+            if name not in self._scanned_categories:
+                for pattern in patterns:
+                    deleted += await self._scan_unlink(pattern)
+                self._scanned_categories.add(name)
+            return deleted
+        except Exception as e:
+            logging.warning(f"Redis async delete_category error for category {name}: {e}")
+            return 0
+    
+    async def acquire_lock(self, name: str, timeout: float) -> Optional[str]:
+        """Try to take a short-lived distributed lock; see RedisCache.acquire_lock."""
+        token = uuid.uuid4().hex
+        try:
+            if await self.client.set(
+                self._prefix_key(f"{LOCK_PREFIX}{name}"), token, nx=True, px=int(timeout * 1000)
+            ):
+                return token
+            return None
+        except Exception as e:
+            logging.warning(f"Redis async lock error for {name}: {e}")
+            return token  # Degrade to local single-flight only
+    
+    async def release_lock(self, name: str, token: str, stored: bool = True) -> None:
+        """Release a lock taken with acquire_lock if it is still ours; see RedisCache.release_lock."""
+        lock_key = self._prefix_key(f"{LOCK_PREFIX}{name}")
+        try:
+            if stored:
+                await self.client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            else:
+                await self.client.eval(
+                    _MARK_UNSTORED_SCRIPT, 1, lock_key, token, _UNSTORED_MARKER, _UNSTORED_MARKER_TTL_MS
+                )
+        except Exception as e:
+            logging.warning(f"Redis async unlock error for {name}: {e}")
+    
+    async def result_not_stored(self, name: str) -> bool:
+        """Check whether the last holder of a lock released it without storing a result."""
+        try:
+            value = await self.client.get(self._prefix_key(f"{LOCK_PREFIX}{name}"))
+        except Exception as e:
+            logging.warning(f"Redis async lock check error for {name}: {e}")
+            return False
+        return value is not None and _decode_lock_value(value) == _UNSTORED_MARKER
+    
+    async def get_computed(self, key: str) -> Optional[Any]:
+        """Get a cached value without computing it, unwrapping get_or_compute entries; None on a miss or once expired."""
+        hit, value = _batch_hit(await self.get(key), None)
+        return value if hit else None
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        expire: Optional[int] = None,
+        stale_ttl: int = 0,
+        early_expiration_beta: float = 1.0,
+        lock_timeout: float = 30.0,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+        is_usable: Optional[Callable[[Any], bool]] = None,
+        force_refresh: bool = False
+    ) -> Any:
+        """
+        Get a value, computing it at most once across concurrent callers on a miss.
+        
+        Coroutine counterpart of RedisCache.get_or_compute; compute is a zero-argument
+        callable returning an awaitable, and background refreshes run as tasks.
+        """
+        ttl = expire if expire is not None else self._default_ttl
+        
+        if not force_refresh:
+            entry = await self.get(key)
+            if _is_envelope(entry):
+                if _needs_refresh(entry, early_expiration_beta):
+                    await self._refresh_in_background(
+                        key, compute, ttl, stale_ttl, lock_timeout, should_cache
+                    )
+                return entry["value"]
+            if entry is not None and (is_usable is None or is_usable(entry)):
+                return entry
+        
+        # Single-flight within this process
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout=lock_timeout)
+            except (asyncio.TimeoutError, _LeaderCancelled):
+                return await compute()
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._compute_once(key, compute, ttl, stale_ttl, lock_timeout, should_cache)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; its followers compute for themselves
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception so an unobserved future does not log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+    
+    async def _compute_once(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        lock_timeout: float,
+        should_cache: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """Compute and store a value while holding the cross-process lock."""
+        token = await self.acquire_lock(key, lock_timeout)
+        if token is None:
+            # Another worker is computing; wait for its result, or until it gives up
+            # the lock without storing one
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_LOCK_POLL_INTERVAL)
+                entry = await self.get(key)
+                if _is_envelope(entry):
+                    return entry["value"]
+                if await self.result_not_stored(key):
+                    break
+            else:
+                token = await self.acquire_lock(key, lock_timeout)
+        stored = False
+        try:
+            started = time.monotonic()
+            result = await compute()
+            if should_cache is None or should_cache(result):
+                stored = await self.set(
+                    key,
+                    _envelope(result, ttl, time.monotonic() - started),
+                    expire=ttl + stale_ttl
+                )
+            return result
+        finally:
+            if token is not None:
+                await self.release_lock(key, token, stored=stored)
+    
+    async def _refresh_in_background(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        lock_timeout: float,
+        should_cache: Optional[Callable[[Any], bool]]
+    ) -> None:
+        """Refresh a value in a background task unless another worker already is."""
+        token = await self.acquire_lock(key, lock_timeout)
+        if token is None:
+            return
+        
+        async def refresh() -> None:
+            try:
+                started = time.monotonic()
+                result = await compute()
+                if should_cache is None or should_cache(result):
+                    await self.set(
+                        key,
+                        _envelope(result, ttl, time.monotonic() - started),
+                        expire=ttl + stale_ttl
+                    )
+            except Exception as e:
+                logging.warning(f"Background cache refresh failed for key {key}: {e}")
+            finally:
+                await self.release_lock(key, token)
+        
+        task = asyncio.create_task(refresh())
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def get_or_compute_many(
+        self,
+        computations: Dict[str, Callable[[], Awaitable[Any]]],
+        expire: Union[int, Callable[[Any], int], None] = None,
+        concurrency: Optional[int] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+        is_usable: Optional[Callable[[Any], bool]] = None,
+        envelope: bool = False,
+        return_exceptions: bool = False,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Resolve many keys with one MGET, computing only the misses.
+        
+        Coroutine counterpart of RedisCache.get_or_compute_many; misses are computed
+        concurrently, at most concurrency at a time when it is set.
+        """
+        keys = list(computations)
+        if not keys:
+            return {}
+        
+        hits: Dict[str, Any] = {}
+        misses: List[str] = []
+        entries = [None] * len(keys) if force_refresh else await self.mget(keys)
+        for key, entry in zip(keys, entries):
+            hit, value = _batch_hit(entry, is_usable)
+            if hit:
+                hits[key] = value
+            else:
+                misses.append(key)
+        
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        
+        async def run(key: str) -> Tuple[Optional[Exception], Any, float]:
+            try:
+                if semaphore is None:
+                    started = time.monotonic()
+                    value = await computations[key]()
+                else:
+                    async with semaphore:
+                        started = time.monotonic()
+                        value = await computations[key]()
+                return None, value, time.monotonic() - started
+            except Exception as e:
+                return e, None, 0.0
+        
+        outcomes = list(await asyncio.gather(*(run(key) for key in misses)))
+        
+        mapping, ttls = _batch_writes(misses, outcomes, expire, self._default_ttl, should_cache, envelope)
+        await self.set_many(mapping, ttls=ttls)
+        return _batch_results(keys, hits, misses, outcomes, return_exceptions)
+    
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists in the cache."""
+        prefixed_key = self._prefix_key(key)
+        try:
+            return bool(await self.client.exists(prefixed_key))
+        except Exception as e:
+            logging.warning(f"Redis async exists error for key {key}: {e}")
+            return False
+    
+    async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+        """Increment a key in the cache."""
+        prefixed_key = self._prefix_key(key)
+        try:
+            return await self.client.incr(prefixed_key, amount)
+        except Exception as e:
+            logging.warning(f"Redis async increment error for key {key}: {e}")
+            return None
+    
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set expiration on a key."""
+        prefixed_key = self._prefix_key(key)
+        try:
+            return bool(await self.client.expire(prefixed_key, seconds))
+        except Exception as e:
+            logging.warning(f"Redis async expire error for key {key}: {e}")
+            return False
+    
+    async def ttl(self, key: str) -> int:
+        """Get time to live for a key."""
+        prefixed_key = self._prefix_key(key)
+        try:
+            return await self.client.ttl(prefixed_key)
+        except Exception as e:
+            logging.warning(f"Redis async ttl error for key {key}: {e}")
+            return -1
+    
+    async def close(self) -> None:
+        """Close the client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 class RateLimiter:
@@ -335,7 +1820,19 @@ class RateLimiter:
 
 
 # Create global instances
-cache = RedisCache()
+local_cache = (
+    LocalCache(
+        max_entries=settings.CACHE_L1_MAX_ENTRIES,
+        max_bytes=settings.CACHE_L1_MAX_MEMORY_MB * 1024 * 1024,
+        ttl=settings.CACHE_L1_TTL,
+        categories=settings.CACHE_L1_CATEGORIES,
+        channel=settings.CACHE_INVALIDATION_CHANNEL
+    )
+    if settings.CACHE_L1_ENABLED
+    else None
+)
+cache = RedisCache(local=local_cache)
+async_cache = AsyncRedisCache(local=local_cache)
 rate_limiter = RateLimiter()
 
 
@@ -402,13 +1899,120 @@ def generate_cache_key(
         return f"cache:{name}:{key_hash}"
 
 
+def _raise_cached_error(cached_result: Dict[str, Any]) -> None:
+    """Re-raise an error that was stored in the cache by cache_errors=True."""
+    error_class = cached_result.get('_error_class')
+    error_msg = cached_result.get('_error_message', 'Unknown error')
+    if error_class:
+        try:
+            error_cls = __import__(error_class.rsplit('.', 1)[0], fromlist=[error_class.rsplit('.', 1)[1]])
+            raise getattr(error_cls, error_class.rsplit('.', 1)[1])(error_msg)
+        except (ImportError, AttributeError):
+            raise Exception(error_msg)
+    raise Exception(error_msg)
+
+
+def _is_usable_cached_result(cached_result: Any, cache_falsey: bool, cache_errors: bool) -> bool:
+    """
+    Decide whether a value read from the cache should be returned to the caller.
+    
+    Raises the original error if the value is a cached error and cache_errors is set.
+    """
+    if cached_result is None:
+        return False
+    # Check if this is a cached error
+    if isinstance(cached_result, dict) and '_cache_error' in cached_result:
+        if cache_errors:
+            _raise_cached_error(cached_result)
+        return False
+    if not cached_result and not cache_falsey:
+        return False  # Don't return cached falsey value if cache_falsey is False
+    return True
+
+
+def _should_cache_result(result: Any, cache_null: bool, cache_falsey: bool) -> bool:
+    """Check whether a freshly computed result should be written to the cache."""
+    if result is None and not cache_null:
+        # Skip caching None results unless explicitly enabled
+        return False
+    if not result and not cache_falsey:
+        # Skip caching falsey results unless explicitly enabled
+        return False
+    return True
+
+
+def _error_payload(e: Exception) -> Dict[str, Any]:
+    """Build the cache payload stored for an error when cache_errors is enabled."""
+    return {
+        '_cache_error': True,
+        '_error_class': f"{e.__class__.__module__}.{e.__class__.__name__}",
+        '_error_message': str(e),
+        '_error_raised_at': time.time()
+    }
+
+
+def _function_pattern(func: Callable, category: Optional[CacheCategory], key_prefix: Optional[str]) -> str:
+    """Pattern matching every cache entry of a function regardless of arguments."""
+    if category:
+        return f"{category}:{key_prefix or func.__qualname__}:*"
+    return f"cache:{key_prefix or func.__qualname__}:*"
+
+
+def _method_prefix(owner_key: str, func: Callable, key_prefix: Optional[str]) -> str:
+    """Custom key prefix used by the method cache decorators."""
+    return f"{key_prefix or owner_key}.{func.__name__}"
+
+
+def _instance_key(self: Any) -> str:
+    """Use class name and optional ID to identify an instance in cache keys."""
+    class_key = self.__class__.__name__
+    if hasattr(self, 'id') and self.id:
+        class_key = f"{class_key}:{self.id}"
+    return class_key
+
+
+def _prefix_pattern(category: Optional[CacheCategory], custom_prefix: str) -> str:
+    """Pattern matching every cache entry under a custom method prefix."""
+    if category:
+        return f"{category}:{custom_prefix}:*"
+    return f"cache:{custom_prefix}:*"
+
+
+def _compute_caching_errors(
+    cache_key: str, ttl: int, cache_errors: bool, call: Callable[[], Any]
+) -> Any:
+    """Call a cached function, storing its error first if cache_errors is set."""
+    try:
+        return call()
+    except Exception as e:
+        if cache_errors:
+            cache.set(cache_key, _error_payload(e), expire=ttl)
+        raise
+
+
+async def _async_compute_caching_errors(
+    cache_key: str, ttl: int, cache_errors: bool, call: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Await a cached coroutine function, storing its error first if cache_errors is set."""
+    try:
+        return await call()
+    except Exception as e:
+        if cache_errors:
+            await async_cache.set(cache_key, _error_payload(e), expire=ttl)
+        raise
+
+
 def cached(
     ttl: int = 3600,
     category: Optional[CacheCategory] = None,
     key_prefix: Optional[str] = None,
     cache_null: bool = False,
     cache_falsey: bool = True,
-    cache_errors: bool = False
+    cache_errors: bool = False,
+    stampede_protection: bool = False,
+    stale_ttl: int = 0,
+    early_expiration_beta: float = 1.0,
+    lock_timeout: float = 30.0
 ) -> Callable[[F], F]:
     """
     Enhanced cache decorator for functions with better control options.
@@ -420,6 +2024,12 @@ def cached(
         cache_null: Whether to cache None results (default: False)
         cache_falsey: Whether to cache falsey results like empty lists (default: True)
         cache_errors: Whether to cache error results (default: False)
+        stampede_protection: Recompute misses once across concurrent callers and
+            refresh hot entries probabilistically before they expire (default: False)
+        stale_ttl: Seconds to keep serving an expired value while one caller refreshes
+            it in the background; implies stampede_protection (default: 0)
+        early_expiration_beta: Aggressiveness of early refresh, 0 disables it (default: 1.0)
+        lock_timeout: Seconds to wait on another caller's recomputation (default: 30)
         
     Returns:
         Decorated function that caches results
@@ -435,60 +2045,45 @@ def cached(
             # Generate unique cache key
             cache_key = generate_cache_key(func, args, kwargs, category, key_prefix)
             
+            if not skip_cache and (stampede_protection or stale_ttl):
+                return cache.get_or_compute(
+                    cache_key,
+                    lambda: _compute_caching_errors(
+                        cache_key, local_ttl, cache_errors, lambda: func(*args, **kwargs)
+                    ),
+                    expire=local_ttl,
+                    stale_ttl=stale_ttl,
+                    early_expiration_beta=early_expiration_beta,
+                    lock_timeout=lock_timeout,
+                    should_cache=lambda result: _should_cache_result(result, cache_null, cache_falsey),
+                    is_usable=lambda entry: _is_usable_cached_result(entry, cache_falsey, cache_errors),
+                    force_refresh=force_refresh
+                )
+            
             # Try to get from cache first if not skipping cache
             if not skip_cache and not force_refresh:
                 cached_result = cache.get(cache_key)
-                if cached_result is not None:
-                    # Check if this is a cached error or None
-                    if isinstance(cached_result, dict) and '_cache_error' in cached_result:
-                        if cache_errors:
-                            error_class = cached_result.get('_error_class')
-                            error_msg = cached_result.get('_error_message', 'Unknown error')
-                            if error_class:
-                                try:
-                                    error_cls = __import__(error_class.rsplit('.', 1)[0], fromlist=[error_class.rsplit('.', 1)[1]])
-                                    raise getattr(error_cls, error_class.rsplit('.', 1)[1])(error_msg)
-                                except (ImportError, AttributeError):
-                                    raise Exception(error_msg)
-                            raise Exception(error_msg)
-                    elif cached_result is None and not cache_null:
-                        pass  # Don't return cached None if cache_null is False
-                    elif not cached_result and not cache_falsey:
-                        pass  # Don't return cached falsey value if cache_falsey is False
-                    else:
-                        return cached_result
+                if _is_usable_cached_result(cached_result, cache_falsey, cache_errors):
+                    return cached_result
             
             # Execute function if not in cache or skipping cache
             try:
                 result = func(*args, **kwargs)
                 
                 # Cache the result based on settings
-                if not skip_cache:
-                    if result is None and not cache_null:
-                        # Skip caching None results unless explicitly enabled
-                        pass
-                    elif not result and not cache_falsey:
-                        # Skip caching falsey results unless explicitly enabled
-                        pass
-                    else:
-                        try:
-                            cache.set(cache_key, result, expire=local_ttl)
-                        except Exception as e:
-                            logging.warning(f"Failed to cache result for {func.__name__}: {e}")
+                if not skip_cache and _should_cache_result(result, cache_null, cache_falsey):
+                    try:
+                        cache.set(cache_key, result, expire=local_ttl)
+                    except Exception as e:
+                        logging.warning(f"Failed to cache result for {func.__name__}: {e}")
                 
                 return result
                 
             except Exception as e:
                 if cache_errors:
                     # Cache the error if requested
-                    error_data = {
-                        '_cache_error': True,
-                        '_error_class': f"{e.__class__.__module__}.{e.__class__.__name__}",
-                        '_error_message': str(e),
-                        '_error_raised_at': time.time()
-                    }
                     try:
-                        cache.set(cache_key, error_data, expire=local_ttl)
+                        cache.set(cache_key, _error_payload(e), expire=local_ttl)
                     except Exception as ce:
                         logging.warning(f"Failed to cache error for {func.__name__}: {ce}")
                 raise
@@ -501,11 +2096,7 @@ def cached(
         
         def invalidate_all() -> int:
             """Invalidate all caches for this function regardless of arguments."""
-            if category:
-                pattern = f"{category}:{key_prefix or func.__qualname__}:*"
-            else:
-                pattern = f"cache:{key_prefix or func.__qualname__}:*"
-            return cache.delete_pattern(pattern)
+            return cache.delete_pattern(_function_pattern(func, category, key_prefix))
         
         def refresh_cache(*args: Any, **kwargs: Any) -> Any:
             """Force refresh the cache for specific arguments."""
@@ -528,7 +2119,11 @@ def method_cached(
     key_prefix: Optional[str] = None,
     cache_null: bool = False,
     cache_falsey: bool = True,
-    cache_errors: bool = False
+    cache_errors: bool = False,
+    stampede_protection: bool = False,
+    stale_ttl: int = 0,
+    early_expiration_beta: float = 1.0,
+    lock_timeout: float = 30.0
 ) -> Callable[[F], F]:
     """
     Enhanced cache decorator for class methods.
@@ -541,6 +2136,12 @@ def method_cached(
         cache_null: Whether to cache None results (default: False)
         cache_falsey: Whether to cache falsey results like empty lists (default: True)
         cache_errors: Whether to cache error results (default: False)
+        stampede_protection: Recompute misses once across concurrent callers and
+            refresh hot entries probabilistically before they expire (default: False)
+        stale_ttl: Seconds to keep serving an expired value while one caller refreshes
+            it in the background; implies stampede_protection (default: 0)
+        early_expiration_beta: Aggressiveness of early refresh, 0 disables it (default: 1.0)
+        lock_timeout: Seconds to wait on another caller's recomputation (default: 30)
         
     Returns:
         Decorated method that caches results with proper handling of self
@@ -553,69 +2154,49 @@ def method_cached(
             force_refresh = kwargs.pop('_force_refresh', False)
             local_ttl = kwargs.pop('_ttl', ttl)
             
-            # Use class name and optional ID in the cache key
-            class_key = self.__class__.__name__
-            if hasattr(self, 'id') and self.id:
-                class_key = f"{class_key}:{self.id}"
-            
             # Generate unique cache key (with self info)
-            custom_prefix = f"{key_prefix or class_key}.{func.__name__}"
+            custom_prefix = _method_prefix(_instance_key(self), func, key_prefix)
             cache_key = generate_cache_key(func, args, kwargs, category, custom_prefix)
             
+            if not skip_cache and (stampede_protection or stale_ttl):
+                return cache.get_or_compute(
+                    cache_key,
+                    lambda: _compute_caching_errors(
+                        cache_key, local_ttl, cache_errors, lambda: func(self, *args, **kwargs)
+                    ),
+                    expire=local_ttl,
+                    stale_ttl=stale_ttl,
+                    early_expiration_beta=early_expiration_beta,
+                    lock_timeout=lock_timeout,
+                    should_cache=lambda result: _should_cache_result(result, cache_null, cache_falsey),
+                    is_usable=lambda entry: _is_usable_cached_result(entry, cache_falsey, cache_errors),
+                    force_refresh=force_refresh
+                )
+            
             # Try to get from cache first if not skipping cache
             if not skip_cache and not force_refresh:
                 cached_result = cache.get(cache_key)
-                if cached_result is not None:
-                    # Check if this is a cached error or None
-                    if isinstance(cached_result, dict) and '_cache_error' in cached_result:
-                        if cache_errors:
-                            error_class = cached_result.get('_error_class')
-                            error_msg = cached_result.get('_error_message', 'Unknown error')
-                            if error_class:
-                                try:
-                                    error_cls = __import__(error_class.rsplit('.', 1)[0], fromlist=[error_class.rsplit('.', 1)[1]])
-                                    raise getattr(error_cls, error_class.rsplit('.', 1)[1])(error_msg)
-                                except (ImportError, AttributeError):
-                                    raise Exception(error_msg)
-                            raise Exception(error_msg)
-                    elif cached_result is None and not cache_null:
-                        pass  # Don't return cached None if cache_null is False
-                    elif not cached_result and not cache_falsey:
-                        pass  # Don't return cached falsey value if cache_falsey is False
-                    else:
-                        return cached_result
+                if _is_usable_cached_result(cached_result, cache_falsey, cache_errors):
+                    return cached_result
             
             # Execute function if not in cache or skipping cache
             try:
                 result = func(self, *args, **kwargs)
                 
                 # Cache the result based on settings
-                if not skip_cache:
-                    if result is None and not cache_null:
-                        # Skip caching None results unless explicitly enabled
-                        pass
-                    elif not result and not cache_falsey:
-                        # Skip caching falsey results unless explicitly enabled
-                        pass
-                    else:
-                        try:
-                            cache.set(cache_key, result, expire=local_ttl)
-                        except Exception as e:
-                            logging.warning(f"Failed to cache result for {func.__name__}: {e}")
+                if not skip_cache and _should_cache_result(result, cache_null, cache_falsey):
+                    try:
+                        cache.set(cache_key, result, expire=local_ttl)
+                    except Exception as e:
+                        logging.warning(f"Failed to cache result for {func.__name__}: {e}")
                 
                 return result
                 
             except Exception as e:
                 if cache_errors:
                     # Cache the error if requested
-                    error_data = {
-                        '_cache_error': True,
-                        '_error_class': f"{e.__class__.__module__}.{e.__class__.__name__}",
-                        '_error_message': str(e),
-                        '_error_raised_at': time.time()
-                    }
                     try:
-                        cache.set(cache_key, error_data, expire=local_ttl)
+                        cache.set(cache_key, _error_payload(e), expire=local_ttl)
                     except Exception as ce:
                         logging.warning(f"Failed to cache error for {func.__name__}: {ce}")
                 raise
@@ -623,37 +2204,19 @@ def method_cached(
         # Add methods to manipulate cache for this method
         def invalidate_cache(self: Any, *args: Any, **kwargs: Any) -> bool:
             """Invalidate the cache for specific arguments."""
-            # Use class name and optional ID in the cache key
-            class_key = self.__class__.__name__
-            if hasattr(self, 'id') and self.id:
-                class_key = f"{class_key}:{self.id}"
-            
-            custom_prefix = f"{key_prefix or class_key}.{func.__name__}"
+            custom_prefix = _method_prefix(_instance_key(self), func, key_prefix)
             cache_key = generate_cache_key(func, args, kwargs, category, custom_prefix)
             return cache.delete(cache_key)
         
         def invalidate_all_for_instance(self: Any) -> int:
             """Invalidate all caches for this method on this instance."""
-            class_key = self.__class__.__name__
-            if hasattr(self, 'id') and self.id:
-                class_key = f"{class_key}:{self.id}"
-            
-            custom_prefix = f"{key_prefix or class_key}.{func.__name__}"
-            if category:
-                pattern = f"{category}:{custom_prefix}:*"
-            else:
-                pattern = f"cache:{custom_prefix}:*"
-            return cache.delete_pattern(pattern)
+            custom_prefix = _method_prefix(_instance_key(self), func, key_prefix)
+            return cache.delete_pattern(_prefix_pattern(category, custom_prefix))
         
         def invalidate_all_for_class(cls: Any) -> int:
             """Invalidate all caches for this method across all instances of the class."""
-            class_key = cls.__name__
-            custom_prefix = f"{key_prefix or class_key}.{func.__name__}"
-            if category:
-                pattern = f"{category}:{custom_prefix}:*"
-            else:
-                pattern = f"cache:{custom_prefix}:*"
-            return cache.delete_pattern(pattern)
+            custom_prefix = _method_prefix(cls.__name__, func, key_prefix)
+            return cache.delete_pattern(_prefix_pattern(category, custom_prefix))
         
         def refresh_cache(self: Any, *args: Any, **kwargs: Any) -> Any:
             """Force refresh the cache for specific arguments."""
@@ -671,6 +2234,376 @@ def method_cached(
     return decorator
 
 
+def async_cached(
+    ttl: int = 3600,
+    category: Optional[CacheCategory] = None,
+    key_prefix: Optional[str] = None,
+    cache_null: bool = False,
+    cache_falsey: bool = True,
+    cache_errors: bool = False,
+    stampede_protection: bool = False,
+    stale_ttl: int = 0,
+    early_expiration_beta: float = 1.0,
+    lock_timeout: float = 30.0
+) -> Callable[[F], F]:
+    """
+    Cache decorator for coroutine functions backed by the asyncio Redis client.
+    
+    Accepts the same options and cache control kwargs as @cached and produces the
+    same keys, so sync and async callers share entries.
+    
+    Args:
+        ttl: Time to live in seconds (default: 1 hour)
+        category: Optional cache category for better organization
+        key_prefix: Optional custom prefix for the key
+        cache_null: Whether to cache None results (default: False)
+        cache_falsey: Whether to cache falsey results like empty lists (default: True)
+        cache_errors: Whether to cache error results (default: False)
+        stampede_protection: Recompute misses once across concurrent callers and
+            refresh hot entries probabilistically before they expire (default: False)
+        stale_ttl: Seconds to keep serving an expired value while one caller refreshes
+            it in the background; implies stampede_protection (default: 0)
+        early_expiration_beta: Aggressiveness of early refresh, 0 disables it (default: 1.0)
+        lock_timeout: Seconds to wait on another caller's recomputation (default: 30)
+        
+    Returns:
+        Decorated coroutine function that caches results
+    """
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"async_cached requires a coroutine function, got {func.__qualname__}")
+        
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Handle cache control kwargs
+            skip_cache = kwargs.pop('_skip_cache', False)
+            force_refresh = kwargs.pop('_force_refresh', False)
+            local_ttl = kwargs.pop('_ttl', ttl)
+            
+            cache_key = generate_cache_key(func, args, kwargs, category, key_prefix)
+            
+            if not skip_cache and (stampede_protection or stale_ttl):
+                return await async_cache.get_or_compute(
+                    cache_key,
+                    lambda: _async_compute_caching_errors(
+                        cache_key, local_ttl, cache_errors, lambda: func(*args, **kwargs)
+                    ),
+                    expire=local_ttl,
+                    stale_ttl=stale_ttl,
+                    early_expiration_beta=early_expiration_beta,
+                    lock_timeout=lock_timeout,
+                    should_cache=lambda result: _should_cache_result(result, cache_null, cache_falsey),
+                    is_usable=lambda entry: _is_usable_cached_result(entry, cache_falsey, cache_errors),
+                    force_refresh=force_refresh
+                )
+            
+            if not skip_cache and not force_refresh:
+                cached_result = await async_cache.get(cache_key)
+                if _is_usable_cached_result(cached_result, cache_falsey, cache_errors):
+                    return cached_result
+            
+            try:
+                result = await func(*args, **kwargs)
+                
+                if not skip_cache and _should_cache_result(result, cache_null, cache_falsey):
+                    await async_cache.set(cache_key, result, expire=local_ttl)
+                
+                return result
+                
+            except Exception as e:
+                if cache_errors:
+                    await async_cache.set(cache_key, _error_payload(e), expire=local_ttl)
+                raise
+        
+        async def invalidate_cache(*args: Any, **kwargs: Any) -> bool:
+            """Invalidate the cache for specific arguments."""
+            cache_key = generate_cache_key(func, args, kwargs, category, key_prefix)
+            return await async_cache.delete(cache_key)
+        
+        async def invalidate_all() -> int:
+            """Invalidate all caches for this function regardless of arguments."""
+            return await async_cache.delete_pattern(_function_pattern(func, category, key_prefix))
+        
+        async def refresh_cache(*args: Any, **kwargs: Any) -> Any:
+            """Force refresh the cache for specific arguments."""
+            kwargs['_force_refresh'] = True
+            return await wrapper(*args, **kwargs)
+        
+        wrapper.invalidate_cache = invalidate_cache  # type: ignore
+        wrapper.invalidate_all = invalidate_all  # type: ignore
+        wrapper.refresh_cache = refresh_cache  # type: ignore
+        
+        return cast(F, wrapper)
+    
+    return decorator
+
+
+def async_method_cached(
+    ttl: int = 3600,
+    category: Optional[CacheCategory] = None,
+    key_prefix: Optional[str] = None,
+    cache_null: bool = False,
+    cache_falsey: bool = True,
+    cache_errors: bool = False,
+    stampede_protection: bool = False,
+    stale_ttl: int = 0,
+    early_expiration_beta: float = 1.0,
+    lock_timeout: float = 30.0
+) -> Callable[[F], F]:
+    """
+    Cache decorator for coroutine methods backed by the asyncio Redis client.
+    Same as @async_cached but handles 'self' parameter like @method_cached.
+    
+    Args:
+        ttl: Time to live in seconds (default: 1 hour)
+        category: Optional cache category for better organization
+        key_prefix: Optional custom prefix for the key
+        cache_null: Whether to cache None results (default: False)
+        cache_falsey: Whether to cache falsey results like empty lists (default: True)
+        cache_errors: Whether to cache error results (default: False)
+        stampede_protection: Recompute misses once across concurrent callers and
+            refresh hot entries probabilistically before they expire (default: False)
+        stale_ttl: Seconds to keep serving an expired value while one caller refreshes
+            it in the background; implies stampede_protection (default: 0)
+        early_expiration_beta: Aggressiveness of early refresh, 0 disables it (default: 1.0)
+        lock_timeout: Seconds to wait on another caller's recomputation (default: 30)
+        
+    Returns:
+        Decorated coroutine method that caches results with proper handling of self
+    """
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"async_method_cached requires a coroutine function, got {func.__qualname__}")
+        
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            # Handle cache control kwargs
+            skip_cache = kwargs.pop('_skip_cache', False)
+            force_refresh = kwargs.pop('_force_refresh', False)
+            local_ttl = kwargs.pop('_ttl', ttl)
+            
+            custom_prefix = _method_prefix(_instance_key(self), func, key_prefix)
+            cache_key = generate_cache_key(func, args, kwargs, category, custom_prefix)
+            
+            if not skip_cache and (stampede_protection or stale_ttl):
+                return await async_cache.get_or_compute(
+                    cache_key,
+                    lambda: _async_compute_caching_errors(
+                        cache_key, local_ttl, cache_errors, lambda: func(self, *args, **kwargs)
+                    ),
+                    expire=local_ttl,
+                    stale_ttl=stale_ttl,
+                    early_expiration_beta=early_expiration_beta,
+                    lock_timeout=lock_timeout,
+                    should_cache=lambda result: _should_cache_result(result, cache_null, cache_falsey),
+                    is_usable=lambda entry: _is_usable_cached_result(entry, cache_falsey, cache_errors),
+                    force_refresh=force_refresh
+                )
+            
+            if not skip_cache and not force_refresh:
+                cached_result = await async_cache.get(cache_key)
+                if _is_usable_cached_result(cached_result, cache_falsey, cache_errors):
+                    return cached_result
+            
+            try:
+                result = await func(self, *args, **kwargs)
+                
+                if not skip_cache and _should_cache_result(result, cache_null, cache_falsey):
+                    await async_cache.set(cache_key, result, expire=local_ttl)
+                
+                return result
+                
+            except Exception as e:
+                if cache_errors:
+                    await async_cache.set(cache_key, _error_payload(e), expire=local_ttl)
+                raise
+        
+        async def invalidate_cache(self: Any, *args: Any, **kwargs: Any) -> bool:
+            """Invalidate the cache for specific arguments."""
+            custom_prefix = _method_prefix(_instance_key(self), func, key_prefix)
+            cache_key = generate_cache_key(func, args, kwargs, category, custom_prefix)
+            return await async_cache.delete(cache_key)
+        
+        async def invalidate_all_for_instance(self: Any) -> int:
+            """Invalidate all caches for this method on this instance."""
+            custom_prefix = _method_prefix(_instance_key(self), func, key_prefix)
+            return await async_cache.delete_pattern(_prefix_pattern(category, custom_prefix))
+        
+        async def invalidate_all_for_class(cls: Any) -> int:
+            """Invalidate all caches for this method across all instances of the class."""
+            custom_prefix = _method_prefix(cls.__name__, func, key_prefix)
+            return await async_cache.delete_pattern(_prefix_pattern(category, custom_prefix))
+        
+        async def refresh_cache(self: Any, *args: Any, **kwargs: Any) -> Any:
+            """Force refresh the cache for specific arguments."""
+            kwargs['_force_refresh'] = True
+            return await wrapper(self, *args, **kwargs)
+        
+        wrapper.invalidate_cache = invalidate_cache  # type: ignore
+        wrapper.invalidate_all_for_instance = invalidate_all_for_instance  # type: ignore
+        wrapper.invalidate_all_for_class = invalidate_all_for_class  # type: ignore
+        wrapper.refresh_cache = refresh_cache  # type: ignore
+        
+        return cast(F, wrapper)
+    
+    return decorator
+
+
+def _batch_call_args(item: Any) -> tuple:
+    """Normalize one entry of a batch to a tuple of positional arguments."""
+    return item if isinstance(item, tuple) else (item,)
+
+
+def cached_batch(
+    ttl: Union[int, Callable[[Any], int]] = 3600,
+    category: Optional[CacheCategory] = None,
+    key_prefix: Optional[str] = None,
+    cache_null: bool = False,
+    cache_falsey: bool = True,
+    concurrency: Optional[int] = None
+) -> Callable[[F], F]:
+    """
+    Cache decorator for functions that are often called for many arguments at once.
+    
+    The decorated function is cached per call like @cached, accepting the same
+    _skip_cache, _force_refresh and _ttl control kwargs, and gains a batch()
+    method taking a list of argument tuples. A batch is resolved with one MGET,
+    only the misses are computed, and they are written back in one pipeline.
+    Keys match @cached, so both decorators share entries.
+    
+    Args:
+        ttl: Time to live in seconds, or a callable deriving it from each result
+        category: Optional cache category for better organization
+        key_prefix: Optional custom prefix for the key
+        cache_null: Whether to cache None results (default: False)
+        cache_falsey: Whether to cache falsey results like empty lists (default: True)
+        concurrency: Number of threads computing misses of a batch (default: sequential)
+        
+    Returns:
+        Decorated function with a batch() method
+    """
+    def decorator(func: F) -> F:
+        def batch(arg_tuples: Sequence[Any], **kwargs: Any) -> List[Any]:
+            """Resolve several calls sharing the same keyword arguments."""
+            # Handle cache control kwargs
+            force_refresh = kwargs.pop('_force_refresh', False)
+            local_ttl = kwargs.pop('_ttl', ttl)
+            
+            keys = []
+            computations: Dict[str, Callable[[], Any]] = {}
+            for item in arg_tuples:
+                args = _batch_call_args(item)
+                key = generate_cache_key(func, args, kwargs, category, key_prefix)
+                keys.append(key)
+                computations.setdefault(key, lambda args=args: func(*args, **kwargs))
+            
+            results = cache.get_or_compute_many(
+                computations,
+                expire=local_ttl,
+                concurrency=concurrency,
+                should_cache=lambda result: _should_cache_result(result, cache_null, cache_falsey),
+                is_usable=lambda entry: _is_usable_cached_result(entry, cache_falsey, False),
+                force_refresh=force_refresh
+            )
+            return [results[key] for key in keys]
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if kwargs.pop('_skip_cache', False):
+                kwargs.pop('_force_refresh', None)
+                kwargs.pop('_ttl', None)
+                return func(*args, **kwargs)
+            return batch([args], **kwargs)[0]
+        
+        def invalidate_cache(*args: Any, **kwargs: Any) -> bool:
+            """Invalidate the cache for specific arguments."""
+            cache_key = generate_cache_key(func, args, kwargs, category, key_prefix)
+            return cache.delete(cache_key)
+        
+        def invalidate_all() -> int:
+            """Invalidate all caches for this function regardless of arguments."""
+            return cache.delete_pattern(_function_pattern(func, category, key_prefix))
+        
+        wrapper.batch = batch  # type: ignore
+        wrapper.invalidate_cache = invalidate_cache  # type: ignore
+        wrapper.invalidate_all = invalidate_all  # type: ignore
+        
+        return cast(F, wrapper)
+    
+    return decorator
+
+
+def async_cached_batch(
+    ttl: Union[int, Callable[[Any], int]] = 3600,
+    category: Optional[CacheCategory] = None,
+    key_prefix: Optional[str] = None,
+    cache_null: bool = False,
+    cache_falsey: bool = True,
+    concurrency: Optional[int] = None
+) -> Callable[[F], F]:
+    """
+    Batch cache decorator for coroutine functions backed by the asyncio Redis client.
+    
+    Accepts the same options as @cached_batch; misses of a batch are computed
+    concurrently, at most concurrency at a time when it is set.
+    
+    Returns:
+        Decorated coroutine function with an async batch() method
+    """
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"async_cached_batch requires a coroutine function, got {func.__qualname__}")
+        
+        async def batch(arg_tuples: Sequence[Any], **kwargs: Any) -> List[Any]:
+            """Resolve several calls sharing the same keyword arguments."""
+            # Handle cache control kwargs
+            force_refresh = kwargs.pop('_force_refresh', False)
+            local_ttl = kwargs.pop('_ttl', ttl)
+            
+            keys = []
+            computations: Dict[str, Callable[[], Awaitable[Any]]] = {}
+            for item in arg_tuples:
+                args = _batch_call_args(item)
+                key = generate_cache_key(func, args, kwargs, category, key_prefix)
+                keys.append(key)
+                computations.setdefault(key, lambda args=args: func(*args, **kwargs))
+            
+            results = await async_cache.get_or_compute_many(
+                computations,
+                expire=local_ttl,
+                concurrency=concurrency,
+                should_cache=lambda result: _should_cache_result(result, cache_null, cache_falsey),
+                is_usable=lambda entry: _is_usable_cached_result(entry, cache_falsey, False),
+                force_refresh=force_refresh
+            )
+            return [results[key] for key in keys]
+        
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if kwargs.pop('_skip_cache', False):
+                kwargs.pop('_force_refresh', None)
+                kwargs.pop('_ttl', None)
+                return await func(*args, **kwargs)
+            return (await batch([args], **kwargs))[0]
+        
+        async def invalidate_cache(*args: Any, **kwargs: Any) -> bool:
+            """Invalidate the cache for specific arguments."""
+            cache_key = generate_cache_key(func, args, kwargs, category, key_prefix)
+            return await async_cache.delete(cache_key)
+        
+        async def invalidate_all() -> int:
+            """Invalidate all caches for this function regardless of arguments."""
+            return await async_cache.delete_pattern(_function_pattern(func, category, key_prefix))
+        
+        wrapper.batch = batch  # type: ignore
+        wrapper.invalidate_cache = invalidate_cache  # type: ignore
+        wrapper.invalidate_all = invalidate_all  # type: ignore
+        
+        return cast(F, wrapper)
+    
+    return decorator
+
+
 def bulk_invalidate_cache(pattern: str) -> int:
     """
     Invalidate all cache keys matching a pattern.
@@ -684,6 +2617,19 @@ def bulk_invalidate_cache(pattern: str) -> int:
     return cache.delete_pattern(pattern)
 
 
+def invalidate_tag(tag: str) -> int:
+    """
+    Invalidate all cache keys indexed under a tag.
+    
+    Args:
+        tag: Tag passed to cache.set(..., tags=[...])
+        
+    Returns:
+        Number of invalidated keys
+    """
+    return cache.delete_tag(tag)
+
+
 def invalidate_category(category: CacheCategory) -> int:
     """
     Invalidate all cache keys in a specific category.
@@ -0,0 +1,233 @@
+"""
+Serialization codecs for cache values.
+
+This module encodes cache values with a configurable serializer (orjson, msgpack or
+stdlib json) and optional zstd/lz4 compression for large payloads. Every encoded value
+starts with a header byte identifying the serializer and compression used, so entries
+written with different settings, and legacy plain JSON entries, can be read side by side.
+"""
+
+import json
+import logging
+import threading
+from enum import Enum
+from typing import Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Bytes 0xF8-0xFF never start valid UTF-8, so legacy JSON or text entries cannot be
+# mistaken for encoded ones. The header is HEADER_BASE + format * 3 + compression.
+HEADER_BASE = 0xF8
+_HEADER_MAX = HEADER_BASE + 5
+
+
+class Serializer(str, Enum):
+    """Serializers available for cache values."""
+    JSON = "json"
+    ORJSON = "orjson"
+    MSGPACK = "msgpack"
+
+
+class Compression(str, Enum):
+    """Compression algorithms available for large cache values."""
+    NONE = "none"
+    ZSTD = "zstd"
+    LZ4 = "lz4"
+
+
+# Wire formats; orjson and stdlib json both produce JSON and share an identifier
+_FORMAT_JSON = 0
+_FORMAT_MSGPACK = 1
+
+_COMPRESSION_IDS = {Compression.NONE: 0, Compression.ZSTD: 1, Compression.LZ4: 2}
+
+# zstandard compressor objects must not be shared between threads
+_zstd_local = threading.local()
+
+
+class CodecError(ValueError):
+    """Raised when an encoded cache value cannot be decoded."""
+    pass
+
+
+def is_encoded(data: bytes) -> bool:
+    """Check whether stored bytes carry a codec header."""
+    return bool(data) and HEADER_BASE <= data[0] <= _HEADER_MAX
+
+
+def _dumps_json(value: Any) -> bytes:
+    """Serialize to JSON, preferring orjson and matching stdlib json's accepted types."""
+    if ORJSON_AVAILABLE:
+        try:
+            # Keep the same type surface as stdlib json so JSON entries read back the
+            # same whether orjson or stdlib json wrote them
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let stdlib json decide
+    return json.dumps(value).encode()
+
+
+def _loads_json(data: bytes) -> Any:
+    """Deserialize JSON, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    """Compress with a per-thread zstd compressor."""
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=level)
+    return compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    """Decompress with a per-thread zstd decompressor."""
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(data)
+
+
+class CacheCodec:
+    """Encodes and decodes cache values with a header identifying the format."""
+
+    def __init__(
+        self,
+        serializer: str = Serializer.ORJSON,
+        compression: str = Compression.NONE,
+        compression_threshold: int = 4096,
+        compression_level: int = 3
+    ):
+        """
+        Initialize the codec, falling back to what is installed.
+
+        Args:
+            serializer: One of Serializer; orjson falls back to stdlib json and
+                msgpack falls back to JSON if the package is missing
+            compression: One of Compression; falls back to none if the package is missing
+            compression_threshold: Minimum serialized size in bytes before compressing
+            compression_level: Compression level for zstd
+        """
+        self.serializer = Serializer(serializer)
+        self.compression = Compression(compression)
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+        if self.serializer == Serializer.MSGPACK and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack is not installed, cache values will be stored as JSON")
+            self.serializer = Serializer.ORJSON
+        if self.compression == Compression.ZSTD and not ZSTD_AVAILABLE:
+            logger.warning("zstandard is not installed, cache values will not be compressed")
+            self.compression = Compression.NONE
+        if self.compression == Compression.LZ4 and not LZ4_AVAILABLE:
+            logger.warning("lz4 is not installed, cache values will not be compressed")
+            self.compression = Compression.NONE
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize and optionally compress a value, prefixed with its header byte."""
+        wire_format = _FORMAT_JSON
+        payload = None
+        if self.serializer == Serializer.MSGPACK:
+            try:
+                payload = msgpack.packb(value, use_bin_type=True)
+                wire_format = _FORMAT_MSGPACK
+            except (TypeError, ValueError, OverflowError):
+                payload = None  # Types msgpack can't represent fall back to JSON
+        if payload is None:
+            payload = _dumps_json(value)
+
+        compression = Compression.NONE
+        if self.compression != Compression.NONE and len(payload) >= self.compression_threshold:
+            if self.compression == Compression.ZSTD:
+                compressed = _zstd_compress(payload, self.compression_level)
+            else:
+                compressed = lz4.frame.compress(payload)
+            # Only keep the compressed form if it actually saves space
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression = self.compression
+
+        header = HEADER_BASE + wire_format * 3 + _COMPRESSION_IDS[compression]
+        return bytes((header,)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a value produced by encode with any serializer and compression.
+
+        Raises:
+            CodecError: If the header is unknown or the required package is missing
+        """
+        if not is_encoded(data):
+            raise CodecError("Value has no codec header")
+        wire_format, compression_id = divmod(data[0] - HEADER_BASE, 3)
+        payload = memoryview(data)[1:]
+
+        try:
+            if compression_id == _COMPRESSION_IDS[Compression.ZSTD]:
+                if not ZSTD_AVAILABLE:
+                    raise CodecError("zstandard is required to read this cache value")
+                payload = _zstd_decompress(payload)
+            elif compression_id == _COMPRESSION_IDS[Compression.LZ4]:
+                if not LZ4_AVAILABLE:
+                    raise CodecError("lz4 is required to read this cache value")
+                payload = lz4.frame.decompress(payload)
+
+            if wire_format == _FORMAT_MSGPACK:
+                if not MSGPACK_AVAILABLE:
+                    raise CodecError("msgpack is required to read this cache value")
+                # Arrays come back as lists, as with JSON; unlike JSON, non-string map
+                # keys keep their type instead of becoming strings
+                return msgpack.unpackb(payload, raw=False, use_list=True, strict_map_key=False)
+            return _loads_json(bytes(payload))
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Could not decode cache value: {e}") from e
+
+
+def create_codec(
+    serializer: str,
+    compression: Optional[str],
+    compression_threshold: int
+) -> CacheCodec:
+    """Create a codec from settings values, falling back to JSON on bad configuration."""
+    try:
+        return CacheCodec(
+            serializer=serializer,
+            compression=compression or Compression.NONE,
+            compression_threshold=compression_threshold
+        )
+    except ValueError as e:
+        logger.warning(f"Invalid cache codec configuration, using JSON: {e}")
+        return CacheCodec(serializer=Serializer.JSON)
@@ -11,7 +11,7 @@ import logging
 from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar, Union, cast
 
 from sqlalchemy import event
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 from sqlalchemy.orm.attributes import get_history
 from sqlalchemy.orm.base import instance_state
 
@@ -159,6 +159,64 @@ def invalidate_on_commit(categories: List[CacheCategory]) -> Callable[[F], F]:
     return decorator
 
 
+# Session.info key for user IDs whose auth snapshots the session's commit must drop
+_AUTH_INVALIDATIONS_KEY = "auth_invalidations"
+
+
+def _queue_auth_invalidation(target: Any, user_id: Optional[int]) -> None:
+    """
+    Drop a user's auth snapshot, or every user's if user_id is None, once the change commits.
+    
+    Mapper events fire during the flush, while the change is still invisible to other
+    sessions; dropping the snapshot then would let a concurrent request cache the old
+    row again before the commit.
+    """
+    from src.core.security import invalidate_user_auth_cache
+    
+    session = object_session(target)
+    if session is None:
+        invalidate_user_auth_cache(user_id)
+        return
+    session.info.setdefault(_AUTH_INVALIDATIONS_KEY, set()).add(user_id)
+
+
+def _apply_auth_invalidations(session: Session) -> None:
+    """Drop the auth snapshots queued on a session that has just committed."""
+    from src.core.security import invalidate_user_auth_cache
+    
+    user_ids = session.info.pop(_AUTH_INVALIDATIONS_KEY, None)
+    if not user_ids:
+        return
+    if None in user_ids:
+        invalidate_user_auth_cache()
+        return
+    for user_id in user_ids:
+        invalidate_user_auth_cache(user_id)
+
+
+def register_auth_invalidation() -> None:
+    """Drop cached auth snapshots after a change to a user, role or permission commits."""
+    from src.models.system import User, Role, Permission
+    
+    def user_listener(mapper, connection, target):
+        # Also fires for role assignments, which mark the user dirty
+        _queue_auth_invalidation(target, target.id)
+    
+    def rbac_listener(mapper, connection, target):
+        _queue_auth_invalidation(target, None)
+    
+    event.listen(User, 'after_update', user_listener)
+    event.listen(User, 'after_delete', user_listener)
+    for model_class in (Role, Permission):
+        event.listen(model_class, 'after_update', rbac_listener)
+        event.listen(model_class, 'after_delete', rbac_listener)
+    # Queued IDs survive a rollback; dropping a snapshot that is still valid only costs a reload
+    if not event.contains(Session, 'after_commit', _apply_auth_invalidations):
+        event.listen(Session, 'after_commit', _apply_auth_invalidations)
+    
+    logging.info("Registered cache invalidation for auth snapshots")
+
+
 def register_common_models():
     """Register common models for automatic cache invalidation."""
     from src.models.brand import Brand
@@ -176,4 +234,6 @@ def register_common_models():
     register_model_invalidation(Campaign, CacheCategory.CAMPAIGN)
     register_model_invalidation(CampaignVersion, CacheCategory.CAMPAIGN)
     register_model_invalidation(User, CacheCategory.USER)
-    register_model_invalidation(SystemSetting, CacheCategory.SYSTEM)
\ No newline at end of file
+    register_model_invalidation(SystemSetting, CacheCategory.SYSTEM)
+    
+    register_auth_invalidation()
@@ -0,0 +1,292 @@
+"""
+Shared outbound HTTP clients.
+
+Integrations and AI providers send their requests through one pooled client
+per process, so repeated calls to the same host reuse keep-alive connections
+instead of paying a new TCP and TLS handshake every time.
+
+- ``http_client``: synchronous facade over a pooled requests Session
+- ``async_http_client``: asyncio facade over a shared aiohttp session, plus a
+  shared httpx client (HTTP/2 when ``h2`` is installed) for the AI SDKs
+
+Pool sizes and timeouts come from the HTTP_* settings, read when a client is
+first used; HTTP_HOST_TIMEOUTS overrides the read timeout for individual hosts.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - httpx negotiates HTTP/2 only when h2 is installed
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from src.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection pool limits and timeouts shared by the HTTP facades."""
+    max_connections: int = 100
+    max_per_host: int = 10
+    keepalive_seconds: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    http2: bool = True
+    host_timeouts: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_settings(cls) -> "HTTPPoolConfig":
+        """Build the configuration from application settings."""
+        return cls(
+            max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+            max_per_host=settings.HTTP_POOL_MAX_PER_HOST,
+            keepalive_seconds=settings.HTTP_KEEPALIVE_SECONDS,
+            connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+            read_timeout=settings.HTTP_READ_TIMEOUT,
+            http2=settings.HTTP2_ENABLED,
+            host_timeouts=dict(settings.HTTP_HOST_TIMEOUTS)
+        )
+
+    def timeout_for(self, url: str, read_timeout: Optional[float] = None) -> Tuple[float, float]:
+        """Get the (connect, read) timeout in seconds for a request URL.
+
+        Args:
+            url: Request URL
+            read_timeout: Read timeout for hosts without an override (defaults to read_timeout)
+        """
+        host = urlsplit(url).hostname or ""
+        default = self.read_timeout if read_timeout is None else read_timeout
+        return self.connect_timeout, self.host_timeouts.get(host, default)
+
+
+class SyncHTTPClient:
+    """
+    Synchronous HTTP facade over a pooled requests Session.
+
+    Each host gets a keep-alive pool of up to ``max_per_host`` connections.
+    Requests without an explicit ``timeout`` get the configured per-host
+    timeout. The session never stores response cookies, because it is
+    shared by every integration and tenant in the process.
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        self._config = config
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> HTTPPoolConfig:
+        """Get the pool configuration, reading settings on first use."""
+        if self._config is None:
+            self._config = HTTPPoolConfig.from_settings()
+        return self._config
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the shared session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=max(1, self.config.max_connections // self.config.max_per_host),
+            pool_maxsize=self.config.max_per_host
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the shared pool.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments accepted by ``requests.request``
+
+        Returns:
+            The response
+        """
+        kwargs.setdefault("timeout", self.config.timeout_for(url))
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a HEAD request."""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a PATCH request."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class AsyncHTTPClient:
+    """
+    Asyncio HTTP facade with shared connection pools.
+
+    ``session()`` returns an aiohttp ClientSession whose connector enforces
+    ``max_connections`` overall and ``max_per_host`` per host. aiohttp
+    sessions are bound to an event loop, so a new one is created if the
+    running loop changes. ``httpx_client()`` returns a shared httpx client
+    for SDKs that accept one (OpenAI, Anthropic), speaking HTTP/2 when the
+    h2 package is installed. httpx has no per-host connection limit, so only
+    ``max_connections`` applies to it; HTTP_HOST_TIMEOUTS overrides the read
+    timeout of its requests to the listed hosts. SDKs derive their default
+    timeout from the client's, so give them one with ``httpx_timeout_for()``.
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        self._config = config
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._httpx_client: Optional["httpx.AsyncClient"] = None
+
+    @property
+    def config(self) -> HTTPPoolConfig:
+        """Get the pool configuration, reading settings on first use."""
+        if self._config is None:
+            self._config = HTTPPoolConfig.from_settings()
+        return self._config
+
+    async def session(self) -> "aiohttp.ClientSession":
+        """Get the shared aiohttp session for the running event loop.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncHTTPClient.session()")
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                logger.debug("Event loop changed; creating a new pooled aiohttp session")
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.max_connections,
+                    limit_per_host=self.config.max_per_host,
+                    keepalive_timeout=self.config.keepalive_seconds,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.config.connect_timeout,
+                    sock_read=self.config.read_timeout
+                ),
+                cookie_jar=aiohttp.DummyCookieJar()
+            )
+            self._session_loop = loop
+        return self._session
+
+    def timeout_for(self, url: str) -> "aiohttp.ClientTimeout":
+        """Get the aiohttp timeout for a request URL, honouring per-host overrides."""
+        connect, read = self.config.timeout_for(url)
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+    def httpx_client(self) -> Optional["httpx.AsyncClient"]:
+        """Get the shared httpx client, or None if httpx is not installed."""
+        if not HTTPX_AVAILABLE:
+            return None
+
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(
+                http2=self.config.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    # A pool-wide cap; keep every open connection alive rather than churn them
+                    max_keepalive_connections=self.config.max_connections,
+                    keepalive_expiry=self.config.keepalive_seconds
+                ),
+                timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout),
+                event_hooks={"request": [self._apply_host_timeout]}
+            )
+        return self._httpx_client
+
+    def httpx_timeout_for(self, url: str, read_timeout: Optional[float] = None) -> "httpx.Timeout":
+        """Get the httpx timeout for a request URL, honouring per-host overrides.
+
+        Args:
+            url: Request URL, or the base URL of an API
+            read_timeout: Read timeout for hosts without an override (defaults to HTTP_READ_TIMEOUT)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for AsyncHTTPClient.httpx_timeout_for()")
+
+        connect, read = self.config.timeout_for(url, read_timeout)
+        return httpx.Timeout(read, connect=connect)
+
+    async def _apply_host_timeout(self, request: "httpx.Request") -> None:
+        """Replace the read timeout of a request to a host listed in HTTP_HOST_TIMEOUTS."""
+        read = self.config.host_timeouts.get(request.url.host)
+        if read is not None:
+            request.extensions["timeout"] = {**request.extensions.get("timeout", {}), "read": read}
+
+    async def close(self) -> None:
+        """Close the shared sessions."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            await self._httpx_client.aclose()
+        self._httpx_client = None
+
+
+# Process-wide clients; pools and settings are only touched on first request
+http_client = SyncHTTPClient()
+async_http_client = AsyncHTTPClient()
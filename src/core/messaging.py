@@ -1,13 +1,593 @@
 import json
+import time
 import uuid
+import atexit
 import pika
 import asyncio
-from typing import Dict, Any, Callable, Awaitable, Optional, List
+import functools
+import threading
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Awaitable, Deque, Optional, List, Set, Tuple
 from loguru import logger
 from datetime import datetime
 
+try:
+    import aio_pika
+    AIO_PIKA_AVAILABLE = True
+except ImportError:
+    AIO_PIKA_AVAILABLE = False
+
 from src.core.settings import settings
 
+
+def _stamp_message(message: Dict[str, Any]) -> None:
+    """Add a message ID and timestamp if not present."""
+    if 'message_id' not in message:
+        message['message_id'] = str(uuid.uuid4())
+    if 'timestamp' not in message:
+        message['timestamp'] = datetime.now().isoformat()
+
+
+@dataclass
+class _OutgoingMessage:
+    """A message waiting in the publisher's batch buffer."""
+    exchange: str  # Prefixed exchange name, empty for the default exchange
+    routing_key: str
+    body: bytes
+    message_id: str
+    future: Future
+    waited: bool = False  # The caller blocks on the future, so don't hold it for the interval
+
+
+class RabbitMQPublisher:
+    """
+    Publisher with a channel pool, publisher confirms and micro-batching.
+    
+    The publisher owns one robust aio-pika connection driven by an event loop on a
+    background thread, so sync and async callers anywhere in the process share it.
+    Messages are buffered and flushed every batch_size messages or batch_interval_ms
+    milliseconds, whichever comes first; a message whose caller blocks on its confirm
+    is flushed on the loop's next pass, together with whatever arrived meanwhile, so
+    sequential callers never wait out the interval. Each flush publishes on the pool's channels and
+    waits for the broker's confirms together, instead of paying a synchronous round
+    trip per message. Every exchange/routing key pair always uses the same channel, and
+    a channel publishes one batch at a time, so messages for a routing key reach the
+    broker in the order they were published.
+    
+    publish() returns a concurrent.futures.Future that resolves once the broker has
+    confirmed the message, or fails if it was rejected or not confirmed in time.
+    """
+    
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_interval_ms: Optional[int] = None,
+        confirm_timeout: Optional[float] = None
+    ):
+        self.queue_prefix = settings.RABBITMQ_QUEUE_PREFIX
+        self.pool_size = pool_size or settings.RABBITMQ_PUBLISHER_CHANNELS
+        self.batch_size = batch_size or settings.RABBITMQ_PUBLISH_BATCH_SIZE
+        interval_ms = (
+            batch_interval_ms if batch_interval_ms is not None
+            else settings.RABBITMQ_PUBLISH_BATCH_INTERVAL_MS
+        )
+        self.batch_interval = interval_ms / 1000.0
+        self.confirm_timeout = confirm_timeout or settings.RABBITMQ_PUBLISH_CONFIRM_TIMEOUT
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._exit_registered = False
+        
+        # State below is only touched on the publisher loop
+        self._connection = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._channels: Optional[List[Any]] = None  # One channel per slot, opened on first use
+        self._slot_locks: List[asyncio.Lock] = []
+        self._buffer: List[_OutgoingMessage] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._batches: Set[asyncio.Task] = set()
+    
+    def publish(
+        self, exchange: str, routing_key: str, message: Dict[str, Any], waited: bool = False
+    ) -> Future:
+        """
+        Queue a message for an exchange; returns a future resolved on broker confirm.
+        
+        Pass waited=True when the caller is about to block on the future, so the
+        message is sent without waiting for the batch interval.
+        """
+        return self._submit(f"{self.queue_prefix}{exchange}", routing_key, message, waited)
+    
+    def publish_direct(self, queue: str, message: Dict[str, Any], waited: bool = False) -> Future:
+        """Queue a message for a queue via the default exchange; see publish."""
+        return self._submit('', f"{self.queue_prefix}{queue}", message, waited)
+    
+    async def publish_async(self, exchange: str, routing_key: str, message: Dict[str, Any]) -> None:
+        """Publish to an exchange and wait for the broker's confirm."""
+        await asyncio.wrap_future(self.publish(exchange, routing_key, message, waited=True))
+    
+    async def publish_direct_async(self, queue: str, message: Dict[str, Any]) -> None:
+        """Publish to a queue and wait for the broker's confirm."""
+        await asyncio.wrap_future(self.publish_direct(queue, message, waited=True))
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Publish buffered messages now and wait for their confirms."""
+        if self._loop is None or not self._loop.is_running():
+            return True
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(), self._loop).result(timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Error flushing RabbitMQ publisher: {e}")
+            return False
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending messages, close the connection and stop the publisher thread."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or not loop.is_running():
+                return
+            self.flush(timeout)
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_connection(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Error closing RabbitMQ publisher connection: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            self._loop = None
+            self._thread = None
+            logger.info("Closed RabbitMQ publisher")
+    
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the publisher loop thread on first use."""
+        with self._start_lock:
+            if self._loop is None or not self._loop.is_running():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+                
+                self._thread = threading.Thread(target=run, name="rabbitmq-publisher", daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+                self._connection = None
+                self._connect_lock = None
+                self._channels = None
+                if not self._exit_registered:
+                    # Don't drop buffered messages on interpreter shutdown
+                    atexit.register(self.close, self.confirm_timeout)
+                    self._exit_registered = True
+            return self._loop
+    
+    def _submit(
+        self, exchange: str, routing_key: str, message: Dict[str, Any], waited: bool = False
+    ) -> Future:
+        """Serialize a message and hand it to the publisher loop."""
+        _stamp_message(message)
+        future: Future = Future()
+        outgoing = _OutgoingMessage(
+            exchange=exchange,
+            routing_key=routing_key,
+            body=json.dumps(message).encode(),
+            message_id=message['message_id'],
+            future=future,
+            waited=waited
+        )
+        self._ensure_started().call_soon_threadsafe(self._enqueue, outgoing)
+        return future
+    
+    def _enqueue(self, outgoing: _OutgoingMessage) -> None:
+        """Buffer a message and flush when the batch is full or its interval elapses."""
+        self._buffer.append(outgoing)
+        if len(self._buffer) >= self.batch_size or self.batch_interval <= 0:
+            self._flush_buffer()
+        elif outgoing.waited:
+            # Flush on the next pass so messages submitted alongside still share the batch
+            if isinstance(self._flush_handle, asyncio.TimerHandle):
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            if self._flush_handle is None:
+                self._flush_handle = self._loop.call_soon(self._flush_buffer)
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.batch_interval, self._flush_buffer)
+    
+    def _flush_buffer(self) -> None:
+        """Start publishing the buffered messages as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        by_slot: Dict[int, List[_OutgoingMessage]] = {}
+        for outgoing in batch:
+            by_slot.setdefault(self._slot_for(outgoing), []).append(outgoing)
+        for slot, messages in by_slot.items():
+            task = self._loop.create_task(self._publish_batch(slot, messages))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+    
+    def _slot_for(self, outgoing: _OutgoingMessage) -> int:
+        """Pool slot whose channel publishes a message's exchange and routing key."""
+        return hash((outgoing.exchange, outgoing.routing_key)) % self.pool_size
+    
+    async def _drain(self) -> None:
+        """Flush the buffer and wait for all batches in flight."""
+        self._flush_buffer()
+        if self._batches:
+            await asyncio.gather(*list(self._batches), return_exceptions=True)
+    
+    async def _acquire_channel(self, slot: int):
+        """
+        Take a slot's confirm-mode channel, opening it if needed.
+        
+        Slots are locked in the order batches ask for them, so batches sharing a
+        slot are published one after another in flush order.
+        """
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._connection is None or self._connection.is_closed:
+                self._connection = await aio_pika.connect_robust(str(settings.RABBITMQ_URL))
+                logger.info("Connected to RabbitMQ (publisher)")
+            if self._channels is None:
+                self._channels = [None] * self.pool_size
+                self._slot_locks = [asyncio.Lock() for _ in range(self.pool_size)]
+        
+        await self._slot_locks[slot].acquire()
+        channel = self._channels[slot]
+        if channel is None or channel.is_closed:
+            try:
+                channel = await self._connection.channel(publisher_confirms=True)
+            except Exception:
+                self._slot_locks[slot].release()
+                raise
+            self._channels[slot] = channel
+        return channel
+    
+    def _release_channel(self, slot: int) -> None:
+        """Let the next batch for a slot use its channel."""
+        self._slot_locks[slot].release()
+    
+    async def _publish_batch(self, slot: int, batch: List[_OutgoingMessage]) -> None:
+        """Publish a batch on a slot's channel and settle each message's future."""
+        try:
+            channel = await self._acquire_channel(slot)
+        except Exception as e:
+            logger.error(f"Error opening RabbitMQ publisher channel: {e}")
+            for outgoing in batch:
+                outgoing.future.set_exception(e)
+            return
+        
+        try:
+            results = await asyncio.gather(
+                *(self._publish_one(channel, outgoing) for outgoing in batch),
+                return_exceptions=True
+            )
+        finally:
+            self._release_channel(slot)
+        
+        for outgoing, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error publishing message {outgoing.message_id}: {result}")
+                outgoing.future.set_exception(result)
+            else:
+                outgoing.future.set_result(None)
+                logger.debug(
+                    f"Published message to {outgoing.exchange or 'default'}/{outgoing.routing_key}: "
+                    f"{outgoing.message_id}"
+                )
+    
+    async def _publish_one(self, channel, outgoing: _OutgoingMessage) -> None:
+        """Publish one message and wait for its confirm."""
+        if outgoing.exchange:
+            exchange = await channel.get_exchange(outgoing.exchange, ensure=False)
+        else:
+            exchange = channel.default_exchange
+        await exchange.publish(
+            aio_pika.Message(
+                body=outgoing.body,
+                content_type='application/json',
+                message_id=outgoing.message_id,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+            ),
+            routing_key=outgoing.routing_key,
+            timeout=self.confirm_timeout
+        )
+    
+    async def _close_connection(self) -> None:
+        """Close the publisher connection."""
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+        self._channels = None
+
+
+# Process-wide publisher, created on first publish
+_publisher: Optional[RabbitMQPublisher] = None
+_publisher_lock = threading.Lock()
+
+
+def get_publisher() -> RabbitMQPublisher:
+    """Get the process-wide pooled publisher, creating it on first use."""
+    global _publisher
+    if _publisher is None:
+        with _publisher_lock:
+            if _publisher is None:
+                _publisher = RabbitMQPublisher()
+    return _publisher
+
+
+def _use_publisher() -> bool:
+    """Whether publishes should go through the pooled publisher."""
+    return settings.RABBITMQ_PUBLISHER_ENABLED and AIO_PIKA_AVAILABLE
+
+def _task_type(message: Dict[str, Any]) -> Optional[str]:
+    """Default concurrency key: the message's task type."""
+    return message.get("task_type")
+
+
+# Headers recording a message's failed deliveries
+ATTEMPTS_HEADER = "x-attempts"
+ERROR_HEADER = "x-last-error"
+FAILED_AT_HEADER = "x-failed-at"
+ORIGINAL_QUEUE_HEADER = "x-original-queue"
+_FAILURE_HEADERS = (ATTEMPTS_HEADER, ERROR_HEADER, FAILED_AT_HEADER, ORIGINAL_QUEUE_HEADER)
+
+
+class PoisonMessageError(Exception):
+    """
+    Raised for messages that can never succeed, such as undecodable bodies.
+
+    Consumers dead-letter these immediately instead of retrying them. Callbacks may
+    raise it to reject a message they know is invalid.
+    """
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff for failed messages.
+
+    A message that fails is republished to a delay queue for its attempt, whose TTL
+    dead-letters it back onto the work queue once the delay has passed. After
+    max_attempts failures it goes to the queue's dead-letter exchange instead.
+    Each delay gets its own queue so a long delay never holds back a short one.
+    """
+    max_attempts: int = 5
+    base_delay_ms: int = 1000
+    max_delay_ms: int = 300_000
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        return cls(
+            max_attempts=settings.RABBITMQ_MAX_ATTEMPTS,
+            base_delay_ms=settings.RABBITMQ_RETRY_BASE_DELAY_MS,
+            max_delay_ms=settings.RABBITMQ_RETRY_MAX_DELAY_MS
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether failures are retried and dead-lettered rather than requeued."""
+        return self.max_attempts > 0
+
+    def delay_for(self, attempts: int) -> Optional[int]:
+        """Delay in milliseconds before retrying after `attempts` failures, None to dead-letter."""
+        if attempts >= self.max_attempts:
+            return None
+        return min(self.base_delay_ms * 2 ** (attempts - 1), self.max_delay_ms)
+
+    @property
+    def delays(self) -> List[int]:
+        """Distinct retry delays, one delay queue each."""
+        return sorted({self.delay_for(attempts) for attempts in range(1, self.max_attempts)})
+
+
+def dead_letter_exchange_name(prefixed_queue: str) -> str:
+    return f"{prefixed_queue}.dlx"
+
+
+def dead_letter_queue_name(prefixed_queue: str) -> str:
+    return f"{prefixed_queue}.dead"
+
+
+def retry_queue_name(prefixed_queue: str, delay_ms: int) -> str:
+    return f"{prefixed_queue}.retry.{delay_ms}"
+
+
+def retry_queue_arguments(prefixed_queue: str, delay_ms: int) -> Dict[str, Any]:
+    """Arguments making a delay queue expire messages back onto the work queue."""
+    return {
+        "x-message-ttl": delay_ms,
+        "x-dead-letter-exchange": "",
+        "x-dead-letter-routing-key": prefixed_queue
+    }
+
+
+def _attempts(headers: Optional[Dict[str, Any]]) -> int:
+    """Failed deliveries recorded on a message so far."""
+    try:
+        return int((headers or {}).get(ATTEMPTS_HEADER, 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _plan_failure(
+    prefixed_queue: str,
+    policy: RetryPolicy,
+    headers: Optional[Dict[str, Any]],
+    error: Exception
+) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Decide where a failed message goes next.
+
+    Returns:
+        Exchange, routing key and headers to republish the message with
+    """
+    attempts = _attempts(headers) + 1
+    failure_headers = dict(headers or {})
+    failure_headers.update({
+        ATTEMPTS_HEADER: attempts,
+        ERROR_HEADER: f"{type(error).__name__}: {error}"[:1000],
+        FAILED_AT_HEADER: datetime.now().isoformat(),
+        ORIGINAL_QUEUE_HEADER: prefixed_queue
+    })
+
+    delay = None if isinstance(error, PoisonMessageError) else policy.delay_for(attempts)
+    if delay is None:
+        logger.warning(f"Dead-lettering message from {prefixed_queue} after {attempts} attempt(s): {error}")
+        return dead_letter_exchange_name(prefixed_queue), prefixed_queue, failure_headers
+    logger.info(f"Retrying message from {prefixed_queue} in {delay}ms (attempt {attempts})")
+    return "", retry_queue_name(prefixed_queue, delay), failure_headers
+
+
+def _dead_letter_summary(body: bytes, headers: Optional[Dict[str, Any]], message_id: Optional[str]) -> Dict[str, Any]:
+    """Describe a dead-lettered message for inspection."""
+    headers = headers or {}
+    try:
+        message = json.loads(body)
+    except Exception:
+        message = body.decode(errors="replace")
+    return {
+        "message_id": message_id,
+        "attempts": _attempts(headers),
+        "error": headers.get(ERROR_HEADER),
+        "failed_at": headers.get(FAILED_AT_HEADER),
+        "message": message
+    }
+
+
+class _ConcurrentDispatcher:
+    """
+    Runs message callbacks on a bounded thread pool while keeping acks in order.
+    
+    Deliveries arrive on the connection thread and workers hand their outcome back to
+    it with add_callback_threadsafe, so all bookkeeping and every channel call happen
+    on the thread that owns the connection. Acks are released for the completed prefix
+    of deliveries, batched with multiple=True; a slow message therefore holds back the
+    acks (not the processing) of later ones. Messages whose task type is at its
+    concurrency limit wait in a per-type queue and count against the prefetch window.
+    
+    Failed deliveries are passed to on_failure, which republishes them for a retry or
+    to the dead-letter exchange and returns True so they are acked with the rest;
+    without a handler, or if it fails, they are nacked and requeued.
+    """
+    
+    def __init__(
+        self,
+        connection: Any,
+        channel: Any,
+        callback: Callable[[Dict[str, Any]], None],
+        max_workers: int,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        concurrency_key: Callable[[Dict[str, Any]], Optional[str]] = _task_type,
+        on_failure: Optional[Callable[[bytes, Any, Exception], bool]] = None
+    ):
+        self.connection = connection
+        self.channel = channel
+        self.callback = callback
+        self.concurrency_limits = concurrency_limits or {}
+        self.concurrency_key = concurrency_key
+        self.on_failure = on_failure
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rabbitmq-worker")
+        self.in_flight = 0
+        self.stopping = False
+        # Delivery tag -> outcome (None while pending, True or the error), in delivery order
+        self._outcomes: "OrderedDict[int, Any]" = OrderedDict()
+        # Delivery tag -> (body, properties), kept for republishing failures
+        self._deliveries: Dict[int, Tuple[bytes, Any]] = {}
+        self._running: Dict[Optional[str], int] = defaultdict(int)
+        self._waiting: Dict[Optional[str], Deque[Tuple[int, Dict[str, Any]]]] = defaultdict(deque)
+    
+    def on_message(self, ch: Any, method: Any, properties: Any, body: bytes) -> None:
+        """Dispatch a delivery to the pool, or queue it behind its type's limit."""
+        tag = method.delivery_tag
+        self._outcomes[tag] = None
+        if self.on_failure is not None:
+            self._deliveries[tag] = (body, properties)
+        try:
+            message = json.loads(body)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            self._outcomes[tag] = PoisonMessageError(f"Undecodable message: {e}")
+            self._release_acks()
+            return
+        
+        key = self.concurrency_key(message)
+        limit = self.concurrency_limits.get(key)
+        if limit is not None and self._running[key] >= limit:
+            self._waiting[key].append((tag, message))
+            return
+        self._start(tag, key, message)
+    
+    def _start(self, tag: int, key: Optional[str], message: Dict[str, Any]) -> None:
+        self._running[key] += 1
+        self.in_flight += 1
+        self.executor.submit(self._run, tag, key, message)
+    
+    def _run(self, tag: int, key: Optional[str], message: Dict[str, Any]) -> None:
+        """Run the callback on a worker thread and report back to the connection thread."""
+        try:
+            self.callback(message)
+            outcome = True
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            outcome = e
+        self.connection.add_callback_threadsafe(functools.partial(self._complete, tag, key, outcome))
+    
+    def _complete(self, tag: int, key: Optional[str], outcome: Any) -> None:
+        """Record an outcome, start the next waiting message of its type and release acks."""
+        self._running[key] -= 1
+        self.in_flight -= 1
+        self._outcomes[tag] = outcome
+        waiting = self._waiting.get(key)
+        if waiting and not self.stopping:
+            next_tag, next_message = waiting.popleft()
+            self._start(next_tag, key, next_message)
+        self._release_acks()
+    
+    def _release_acks(self) -> None:
+        """Ack or nack every settled delivery at the head of the window."""
+        last_ack = None
+        while self._outcomes:
+            tag, outcome = next(iter(self._outcomes.items()))
+            if outcome is None:
+                break
+            self._outcomes.popitem(last=False)
+            delivery = self._deliveries.pop(tag, None)
+            if outcome is True:
+                last_ack = tag
+                continue
+            if delivery is not None and self.on_failure(delivery[0], delivery[1], outcome):
+                # Republished for retry or dead-lettered; the ack completes the hand-off
+                last_ack = tag
+                continue
+            if last_ack is not None:
+                self.channel.basic_ack(delivery_tag=last_ack, multiple=True)
+                last_ack = None
+            # Negative acknowledgment, requeue the message
+            self.channel.basic_nack(delivery_tag=tag, requeue=True)
+        if last_ack is not None:
+            self.channel.basic_ack(delivery_tag=last_ack, multiple=True)
+    
+    def drain(self, timeout: float) -> None:
+        """Let in-flight callbacks finish and deliver their acks before closing."""
+        self.stopping = True
+        self.executor.shutdown(wait=False)
+        deadline = time.monotonic() + timeout
+        while self.in_flight and time.monotonic() < deadline and self.connection.is_open:
+            self.connection.process_data_events(time_limit=0.1)
+
+
 class RabbitMQClient:
     """Client for interacting with RabbitMQ."""
     
@@ -16,6 +596,12 @@ class RabbitMQClient:
         self.channel = None
         self.queue_prefix = settings.RABBITMQ_QUEUE_PREFIX
         self.callbacks = {}
+        # Queues and exchanges declared on the current connection
+        self._declared: Set[str] = set()
+        # Thread running the consume loop, which owns the connection while consuming
+        self._consumer_thread: Optional[int] = None
+        # Channel in confirm mode for republishing failed messages
+        self._failure_channel = None
         
     def connect(self):
         """Connect to RabbitMQ server."""
@@ -23,26 +609,74 @@ class RabbitMQClient:
             params = pika.URLParameters(str(settings.RABBITMQ_URL))
             self.connection = pika.BlockingConnection(params)
             self.channel = self.connection.channel()
+            self._failure_channel = None
+            self._declared.clear()
             logger.info("Connected to RabbitMQ")
     
     def close(self):
         """Close the connection to RabbitMQ."""
+        if _publisher is not None:
+            # Deliver anything this process still has buffered
+            _publisher.flush(_publisher.confirm_timeout)
+        if self._consumer_thread is not None and threading.get_ident() != self._consumer_thread:
+            # Only the consuming thread may touch the connection; it closes it on exit
+            self.connection.add_callback_threadsafe(self.channel.stop_consuming)
+            return
         if self.connection and self.connection.is_open:
             self.connection.close()
             logger.info("Closed RabbitMQ connection")
     
+    def _on_connection_thread(self, operation: Callable[[], Any], wait: bool = False) -> Any:
+        """
+        Run a channel operation on the thread that owns the connection.
+        
+        From another thread the operation is handed to the consume loop. With wait the
+        caller blocks until it has run and gets its result or exception; otherwise
+        errors are only logged.
+        """
+        if self._consumer_thread is None or threading.get_ident() == self._consumer_thread:
+            return operation()
+        
+        future: Future = Future()
+        
+        def run() -> None:
+            try:
+                future.set_result(operation())
+            except Exception as e:
+                if not wait:
+                    logger.error(f"Error running RabbitMQ channel operation: {e}")
+                future.set_exception(e)
+        
+        self.connection.add_callback_threadsafe(run)
+        if wait:
+            return future.result(timeout=settings.RABBITMQ_PUBLISH_CONFIRM_TIMEOUT)
+        return None
+    
     def declare_queue(self, queue_name: str) -> str:
-        """Declare a queue with the given name."""
+        """Declare a queue with the given name, once per connection."""
         prefixed_name = f"{self.queue_prefix}{queue_name}"
         self.connect()
-        self.channel.queue_declare(queue=prefixed_name, durable=True)
+        if f"queue:{prefixed_name}" not in self._declared:
+            # Handlers on the worker pool call this while the consume loop owns the channel
+            self._on_connection_thread(
+                functools.partial(self.channel.queue_declare, queue=prefixed_name, durable=True),
+                wait=True
+            )
+            self._declared.add(f"queue:{prefixed_name}")
         return prefixed_name
     
     def declare_exchange(self, exchange_name: str) -> str:
-        """Declare a topic exchange with the given name."""
+        """Declare a topic exchange with the given name, once per connection."""
         prefixed_name = f"{self.queue_prefix}{exchange_name}"
         self.connect()
-        self.channel.exchange_declare(exchange=prefixed_name, exchange_type='topic', durable=True)
+        if f"exchange:{prefixed_name}" not in self._declared:
+            self._on_connection_thread(
+                functools.partial(
+                    self.channel.exchange_declare, exchange=prefixed_name, exchange_type='topic', durable=True
+                ),
+                wait=True
+            )
+            self._declared.add(f"exchange:{prefixed_name}")
         return prefixed_name
     
     def bind_queue_to_exchange(self, queue_name: str, exchange_name: str, routing_key: str):
@@ -50,24 +684,103 @@ class RabbitMQClient:
         prefixed_queue = f"{self.queue_prefix}{queue_name}"
         prefixed_exchange = f"{self.queue_prefix}{exchange_name}"
         self.connect()
-        self.channel.queue_bind(
-            queue=prefixed_queue,
-            exchange=prefixed_exchange,
-            routing_key=routing_key
+        self._on_connection_thread(
+            functools.partial(
+                self.channel.queue_bind,
+                queue=prefixed_queue,
+                exchange=prefixed_exchange,
+                routing_key=routing_key
+            ),
+            wait=True
         )
     
-    def publish(self, exchange: str, routing_key: str, message: Dict[str, Any]) -> None:
-        """Publish a message to an exchange with a routing key."""
+    def _declare_dead_letter_queue(self, prefixed_queue: str) -> str:
+        """Declare a queue's dead-letter exchange and the queue collecting its messages."""
+        dead_letter_queue = dead_letter_queue_name(prefixed_queue)
+        if f"queue:{dead_letter_queue}" not in self._declared:
+            exchange = dead_letter_exchange_name(prefixed_queue)
+            self.channel.exchange_declare(exchange=exchange, exchange_type='fanout', durable=True)
+            self.channel.queue_declare(queue=dead_letter_queue, durable=True)
+            self.channel.queue_bind(queue=dead_letter_queue, exchange=exchange)
+            self._declared.add(f"queue:{dead_letter_queue}")
+        return dead_letter_queue
+    
+    def _declare_retry_queues(self, prefixed_queue: str, policy: RetryPolicy) -> None:
+        """Declare the dead-letter queue and one delay queue per retry delay."""
+        self._declare_dead_letter_queue(prefixed_queue)
+        for delay in policy.delays:
+            retry_queue = retry_queue_name(prefixed_queue, delay)
+            if f"queue:{retry_queue}" not in self._declared:
+                self.channel.queue_declare(
+                    queue=retry_queue,
+                    durable=True,
+                    arguments=retry_queue_arguments(prefixed_queue, delay)
+                )
+                self._declared.add(f"queue:{retry_queue}")
+    
+    def _route_failure(
+        self, prefixed_queue: str, policy: RetryPolicy, body: bytes, properties: Any, error: Exception
+    ) -> bool:
+        """
+        Republish a failed message to its delay queue or the dead-letter exchange.
+        
+        Runs on the connection thread before the original delivery is acked. The copy
+        goes out on a channel in confirm mode and only counts as republished once the
+        broker has confirmed and routed it, so a lost copy never gets the original acked.
+        
+        Returns:
+            True if the message was republished, False if it should be requeued
+        """
+        exchange, routing_key, headers = _plan_failure(
+            prefixed_queue, policy, getattr(properties, "headers", None), error
+        )
+        try:
+            if self._failure_channel is None or self._failure_channel.is_closed:
+                self._failure_channel = self.connection.channel()
+                self._failure_channel.confirm_delivery()
+            # Blocks until the broker acks; raises on a nack or an unroutable message
+            self._failure_channel.basic_publish(
+                exchange=exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=pika.BasicProperties(
+                    delivery_mode=2,  # make message persistent
+                    content_type='application/json',
+                    message_id=getattr(properties, "message_id", None),
+                    headers=headers
+                ),
+                mandatory=True
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error republishing failed message from {prefixed_queue}: {e}")
+            return False
+    
+    def publish(
+        self, exchange: str, routing_key: str, message: Dict[str, Any],
+        wait_for_confirm: bool = True
+    ) -> Optional[Future]:
+        """
+        Publish a message to an exchange with a routing key.
+        
+        By default the call blocks until the message is published, and with the
+        pooled publisher enabled until the broker confirms it, raising if that fails.
+        Pass wait_for_confirm=False to return at once; publishing errors are then
+        reported through the returned future (pooled publisher) or only logged.
+        """
+        if _use_publisher():
+            publisher = get_publisher()
+            future = publisher.publish(exchange, routing_key, message, waited=wait_for_confirm)
+            if wait_for_confirm:
+                future.result(publisher.confirm_timeout)
+            return future
+        
         prefixed_exchange = f"{self.queue_prefix}{exchange}"
         self.connect()
+        _stamp_message(message)
         
-        # Add message ID and timestamp if not present
-        if 'message_id' not in message:
-            message['message_id'] = str(uuid.uuid4())
-        if 'timestamp' not in message:
-            message['timestamp'] = datetime.now().isoformat()
-        
-        self.channel.basic_publish(
+        self._on_connection_thread(functools.partial(
+            self.channel.basic_publish,
             exchange=prefixed_exchange,
             routing_key=routing_key,
             body=json.dumps(message),
@@ -76,21 +789,27 @@ class RabbitMQClient:
                 content_type='application/json',
                 message_id=message['message_id']
             )
-        )
+        ), wait=wait_for_confirm)
         logger.debug(f"Published message to {prefixed_exchange}/{routing_key}: {message['message_id']}")
+        return None
     
-    def publish_direct(self, queue: str, message: Dict[str, Any]) -> None:
-        """Publish a message directly to a queue."""
+    def publish_direct(
+        self, queue: str, message: Dict[str, Any], wait_for_confirm: bool = True
+    ) -> Optional[Future]:
+        """Publish a message directly to a queue; see publish for confirm handling."""
+        if _use_publisher():
+            publisher = get_publisher()
+            future = publisher.publish_direct(queue, message, waited=wait_for_confirm)
+            if wait_for_confirm:
+                future.result(publisher.confirm_timeout)
+            return future
+        
         prefixed_queue = f"{self.queue_prefix}{queue}"
         self.connect()
+        _stamp_message(message)
         
-        # Add message ID and timestamp if not present
-        if 'message_id' not in message:
-            message['message_id'] = str(uuid.uuid4())
-        if 'timestamp' not in message:
-            message['timestamp'] = datetime.now().isoformat()
-        
-        self.channel.basic_publish(
+        self._on_connection_thread(functools.partial(
+            self.channel.basic_publish,
             exchange='',
             routing_key=prefixed_queue,
             body=json.dumps(message),
@@ -99,37 +818,366 @@ class RabbitMQClient:
                 content_type='application/json',
                 message_id=message['message_id']
             )
-        )
+        ), wait=wait_for_confirm)
         logger.debug(f"Published message directly to {prefixed_queue}: {message['message_id']}")
+        return None
     
-    def consume(self, queue: str, callback: Callable[[Dict[str, Any]], None]):
-        """Start consuming messages from a queue."""
+    def consume(
+        self,
+        queue: str,
+        callback: Callable[[Dict[str, Any]], None],
+        prefetch_count: int = 1,
+        max_workers: int = 1,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        concurrency_key: Callable[[Dict[str, Any]], Optional[str]] = _task_type,
+        drain_timeout: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Start consuming messages from a queue.
+        
+        By default messages are handled one at a time on the consuming thread. With
+        max_workers above 1, callbacks run concurrently on a bounded thread pool, at
+        most concurrency_limits[key] at a time per concurrency_key(message), and acks
+        are released in delivery order.
+        
+        Messages whose callback raises are retried with exponential backoff through
+        delay queues and, after the policy's maximum attempts, moved to the queue's
+        dead-letter queue (see inspect_dead_letters and replay_dead_letters).
+        Undecodable messages and PoisonMessageError are dead-lettered immediately.
+        
+        Args:
+            queue: Queue name without prefix
+            callback: Called with each decoded message
+            prefetch_count: Unacked messages the broker may deliver ahead
+            max_workers: Size of the worker pool; 1 handles messages inline
+            concurrency_limits: Optional per-key limits on concurrent callbacks
+            concurrency_key: Derives the limit key from a message (default: task_type)
+            drain_timeout: Seconds to let in-flight callbacks finish when stopping
+            retry_policy: Backoff and attempt limit; defaults to the RABBITMQ_* settings.
+                A policy with max_attempts of 0 requeues failures immediately
+        """
         prefixed_queue = f"{self.queue_prefix}{queue}"
         self.connect()
         
-        def _callback(ch, method, properties, body):
-            try:
-                message = json.loads(body)
-                callback(message)
-                ch.basic_ack(delivery_tag=method.delivery_tag)
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
-                # Negative acknowledgment, requeue the message
-                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+        policy = retry_policy or RetryPolicy.from_settings()
+        on_failure = None
+        if policy.enabled:
+            self._declare_retry_queues(prefixed_queue, policy)
+            on_failure = functools.partial(self._route_failure, prefixed_queue, policy)
         
-        self.channel.basic_qos(prefetch_count=1)
-        self.channel.basic_consume(queue=prefixed_queue, on_message_callback=_callback)
+        dispatcher = None
+        if max_workers > 1:
+            dispatcher = _ConcurrentDispatcher(
+                self.connection, self.channel, callback, max_workers,
+                concurrency_limits, concurrency_key, on_failure
+            )
+            on_message = dispatcher.on_message
+            # Keep every worker busy
+            prefetch_count = max(prefetch_count, max_workers)
+        else:
+            def on_message(ch, method, properties, body):
+                try:
+                    try:
+                        message = json.loads(body)
+                    except Exception as e:
+                        raise PoisonMessageError(f"Undecodable message: {e}") from e
+                    callback(message)
+                except Exception as e:
+                    logger.error(f"Error processing message: {e}")
+                    if on_failure is not None and on_failure(body, properties, e):
+                        ch.basic_ack(delivery_tag=method.delivery_tag)
+                    else:
+                        # Negative acknowledgment, requeue the message
+                        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+                else:
+                    ch.basic_ack(delivery_tag=method.delivery_tag)
+        
+        self.channel.basic_qos(prefetch_count=prefetch_count)
+        self.channel.basic_consume(queue=prefixed_queue, on_message_callback=on_message)
         
+        self._consumer_thread = threading.get_ident()
         try:
             logger.info(f"Start consuming from {prefixed_queue}")
             self.channel.start_consuming()
         except KeyboardInterrupt:
             self.channel.stop_consuming()
-            self.close()
         except Exception as e:
             logger.error(f"Error in consume: {e}")
             self.channel.stop_consuming()
+        finally:
+            if dispatcher is not None:
+                dispatcher.drain(drain_timeout)
+            self._consumer_thread = None
             self.close()
+    
+    def inspect_dead_letters(self, queue: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Peek at messages in a queue's dead-letter queue without removing them.
+        
+        Uses the client's own channel, so call it from a client that isn't consuming.
+        
+        Args:
+            queue: Work queue name without prefix
+            limit: Maximum number of messages to return
+            
+        Returns:
+            Message ID, attempts, last error, failure time and decoded body per message
+        """
+        self.connect()
+        dead_letter_queue = self._declare_dead_letter_queue(f"{self.queue_prefix}{queue}")
+        
+        messages = []
+        last_tag = None
+        while len(messages) < limit:
+            method, properties, body = self.channel.basic_get(queue=dead_letter_queue, auto_ack=False)
+            if method is None:
+                break
+            last_tag = method.delivery_tag
+            messages.append(_dead_letter_summary(body, properties.headers, properties.message_id))
+        if last_tag is not None:
+            # Put everything back where it was
+            self.channel.basic_nack(delivery_tag=last_tag, multiple=True, requeue=True)
+        return messages
+    
+    def replay_dead_letters(
+        self, queue: str, message_ids: Optional[List[str]] = None, limit: Optional[int] = None
+    ) -> int:
+        """
+        Move dead-lettered messages back onto their work queue with a fresh attempt count.
+        
+        Args:
+            queue: Work queue name without prefix
+            message_ids: Only replay these messages; all by default
+            limit: Maximum number of messages to replay
+            
+        Returns:
+            Number of messages replayed
+        """
+        prefixed_queue = f"{self.queue_prefix}{queue}"
+        self.connect()
+        dead_letter_queue = self._declare_dead_letter_queue(prefixed_queue)
+        wanted = set(message_ids) if message_ids is not None else None
+        
+        replayed = 0
+        skipped_tag = None
+        while limit is None or replayed < limit:
+            if wanted is not None and not wanted:
+                break
+            method, properties, body = self.channel.basic_get(queue=dead_letter_queue, auto_ack=False)
+            if method is None:
+                break
+            if wanted is not None and properties.message_id not in wanted:
+                skipped_tag = method.delivery_tag
+                continue
+            
+            headers = {
+                key: value for key, value in (properties.headers or {}).items()
+                if key not in _FAILURE_HEADERS
+            }
+            self.channel.basic_publish(
+                exchange='',
+                routing_key=prefixed_queue,
+                body=body,
+                properties=pika.BasicProperties(
+                    delivery_mode=2,  # make message persistent
+                    content_type='application/json',
+                    message_id=properties.message_id,
+                    headers=headers
+                )
+            )
+            self.channel.basic_ack(delivery_tag=method.delivery_tag)
+            if wanted is not None:
+                wanted.discard(properties.message_id)
+            replayed += 1
+        
+        if skipped_tag is not None:
+            self.channel.basic_nack(delivery_tag=skipped_tag, multiple=True, requeue=True)
+        logger.info(f"Replayed {replayed} dead-lettered message(s) onto {prefixed_queue}")
+        return replayed
+    
+    def purge_dead_letters(self, queue: str) -> int:
+        """Delete every message in a queue's dead-letter queue; returns how many were removed."""
+        self.connect()
+        dead_letter_queue = self._declare_dead_letter_queue(f"{self.queue_prefix}{queue}")
+        result = self.channel.queue_purge(queue=dead_letter_queue)
+        return result.method.message_count
+
+
+class RabbitMQRpcClient:
+    """
+    Request/response over one long-lived reply queue per owner.
+    
+    A background thread owns a dedicated connection and consumes an exclusive,
+    auto-deleted reply queue. Each request carries a correlation ID and the reply
+    queue's name; replies resolve the matching future from a shared map, so any
+    number of calls can be in flight without declaring queues or starting threads
+    per request. Late replies for calls that already timed out are discarded.
+    """
+    
+    def __init__(self, owner: str, ready_timeout: float = 10.0):
+        """
+        Args:
+            owner: Name used in the reply queue, e.g. the agent ID
+            ready_timeout: Seconds to wait for the reply queue when a call starts it
+        """
+        self.owner = owner
+        self.ready_timeout = ready_timeout
+        self.queue_prefix = settings.RABBITMQ_QUEUE_PREFIX
+        self.reply_queue: Optional[str] = None  # Unprefixed, as carried in response_queue
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._connection = None
+        self._channel = None
+    
+    def call(self, queue: str, message: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
+        """
+        Send a request to a queue and wait for its reply.
+        
+        Raises:
+            TimeoutError: If no reply arrives within timeout
+            ConnectionError: If the reply queue is unavailable
+        """
+        correlation_id, future = self._send(queue, message)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._discard(correlation_id)
+            raise TimeoutError(f"No reply from {queue} within {timeout}s")
+    
+    async def call_async(self, queue: str, message: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
+        """Awaitable variant of call."""
+        # Starting the reply consumer may block briefly, so keep it off the event loop
+        correlation_id, future = await asyncio.get_running_loop().run_in_executor(
+            None, self._send, queue, message
+        )
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self._discard(correlation_id)
+            raise TimeoutError(f"No reply from {queue} within {timeout}s")
+    
+    def close(self) -> None:
+        """Stop the reply consumer; pending calls fail with ConnectionError."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    def _send(self, queue: str, message: Dict[str, Any]) -> Tuple[str, Future]:
+        """Register a pending call and publish its request."""
+        self._start()
+        correlation_id = message.setdefault("correlation_id", str(uuid.uuid4()))
+        message["response_queue"] = self.reply_queue
+        future: Future = Future()
+        with self._lock:
+            self._pending[correlation_id] = future
+        try:
+            self._publish(queue, message)
+        except Exception:
+            self._discard(correlation_id)
+            raise
+        return correlation_id, future
+    
+    def _publish(self, queue: str, message: Dict[str, Any]) -> None:
+        """Publish a request via the pooled publisher or the reply connection."""
+        if _use_publisher():
+            # Wait for the confirm so a failed publish raises instead of timing out the call
+            publisher = get_publisher()
+            publisher.publish_direct(queue, message, waited=True).result(publisher.confirm_timeout)
+            return
+        _stamp_message(message)
+        self._connection.add_callback_threadsafe(functools.partial(
+            self._channel.basic_publish,
+            exchange='',
+            routing_key=f"{self.queue_prefix}{queue}",
+            body=json.dumps(message),
+            properties=pika.BasicProperties(
+                delivery_mode=2,  # make message persistent
+                content_type='application/json',
+                message_id=message['message_id'],
+                correlation_id=message['correlation_id']
+            )
+        ))
+    
+    def _discard(self, correlation_id: str) -> None:
+        with self._lock:
+            self._pending.pop(correlation_id, None)
+    
+    def _start(self) -> None:
+        """Start the reply consumer thread and wait until its queue exists."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._ready.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name=f"rpc-replies-{self.owner}", daemon=True
+                )
+                self._thread.start()
+        if not self._ready.wait(self.ready_timeout):
+            raise ConnectionError(f"RPC reply queue for {self.owner} is not available")
+    
+    def _run(self) -> None:
+        """Consume replies, reconnecting with a fresh reply queue after failures."""
+        while not self._stopping.is_set():
+            try:
+                self._connection = pika.BlockingConnection(pika.URLParameters(str(settings.RABBITMQ_URL)))
+                self._channel = self._connection.channel()
+                reply_queue = f"reply_{self.owner}_{uuid.uuid4().hex[:12]}"
+                self._channel.queue_declare(
+                    queue=f"{self.queue_prefix}{reply_queue}", exclusive=True, auto_delete=True
+                )
+                self._channel.basic_consume(
+                    queue=f"{self.queue_prefix}{reply_queue}",
+                    on_message_callback=self._on_reply,
+                    auto_ack=True
+                )
+                self.reply_queue = reply_queue
+                self._ready.set()
+                logger.info(f"Consuming RPC replies on {self.queue_prefix}{reply_queue}")
+                while not self._stopping.is_set():
+                    self._connection.process_data_events(time_limit=1)
+            except Exception as e:
+                logger.error(f"Error in RPC reply consumer for {self.owner}: {e}")
+                self._ready.clear()
+                # Replies to the old exclusive queue are lost with it
+                self._fail_pending(ConnectionError(f"RPC reply queue lost: {e}"))
+                self._stopping.wait(1)
+            finally:
+                if self._connection is not None and self._connection.is_open:
+                    try:
+                        self._connection.close()
+                    except Exception:
+                        pass
+        self._ready.clear()
+        self._fail_pending(ConnectionError("RPC client closed"))
+    
+    def _on_reply(self, ch: Any, method: Any, properties: Any, body: bytes) -> None:
+        """Resolve the pending call a reply belongs to."""
+        try:
+            message = json.loads(body)
+        except Exception as e:
+            logger.error(f"Error decoding RPC reply: {e}")
+            return
+        correlation_id = message.get("correlation_id") or getattr(properties, "correlation_id", None)
+        with self._lock:
+            future = self._pending.pop(correlation_id, None)
+        if future is None:
+            logger.debug(f"Discarding RPC reply without a pending call: {correlation_id}")
+            return
+        # Skip calls whose waiter already gave up and cancelled the future
+        if future.set_running_or_notify_cancel():
+            future.set_result(message)
+    
+    def _fail_pending(self, error: Exception) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
 
 
 class AsyncRabbitMQClient:
@@ -140,26 +1188,105 @@ class AsyncRabbitMQClient:
         self.channel = None
         self.queue_prefix = settings.RABBITMQ_QUEUE_PREFIX
         self.callbacks = {}
+        # Queues declared and exchanges looked up on the current channel
+        self._declared_queues: Set[str] = set()
+        self._exchanges: Dict[str, Any] = {}
     
     async def connect(self):
         """Connect to RabbitMQ server asynchronously."""
         if not self.connection or self.connection.is_closed:
             from aio_pika import connect_robust
             self.connection = await connect_robust(str(settings.RABBITMQ_URL))
-            self.channel = await self.connection.channel()
+            # Confirms let _route_failure wait for a republished copy before acking
+            self.channel = await self.connection.channel(publisher_confirms=True)
+            self._declared_queues.clear()
+            self._exchanges.clear()
             logger.info("Connected to RabbitMQ (async)")
     
+    async def _declare_queue_once(self, prefixed_name: str) -> None:
+        """Declare a durable queue unless already declared on this channel."""
+        if prefixed_name not in self._declared_queues:
+            await self.channel.declare_queue(prefixed_name, durable=True)
+            self._declared_queues.add(prefixed_name)
+    
+    async def _get_exchange(self, prefixed_name: str):
+        """Look up an exchange once per channel."""
+        exchange = self._exchanges.get(prefixed_name)
+        if exchange is None:
+            exchange = await self.channel.get_exchange(prefixed_name)
+            self._exchanges[prefixed_name] = exchange
+        return exchange
+    
     async def close(self):
         """Close the connection to RabbitMQ."""
         if self.connection and not self.connection.is_closed:
             await self.connection.close()
             logger.info("Closed RabbitMQ connection (async)")
     
+    async def _declare_retry_queues(self, prefixed_queue: str, policy: RetryPolicy) -> None:
+        """Declare a queue's dead-letter exchange and queue and one delay queue per retry delay."""
+        from aio_pika import ExchangeType
+        exchange_name = dead_letter_exchange_name(prefixed_queue)
+        if exchange_name not in self._exchanges:
+            exchange = await self.channel.declare_exchange(
+                name=exchange_name,
+                type=ExchangeType.FANOUT,
+                durable=True
+            )
+            dead_letter_queue = await self.channel.declare_queue(
+                dead_letter_queue_name(prefixed_queue), durable=True
+            )
+            await dead_letter_queue.bind(exchange)
+            self._exchanges[exchange_name] = exchange
+        
+        for delay in policy.delays:
+            retry_queue = retry_queue_name(prefixed_queue, delay)
+            if retry_queue not in self._declared_queues:
+                await self.channel.declare_queue(
+                    retry_queue,
+                    durable=True,
+                    arguments=retry_queue_arguments(prefixed_queue, delay)
+                )
+                self._declared_queues.add(retry_queue)
+    
+    async def _route_failure(
+        self, prefixed_queue: str, policy: RetryPolicy, message: Any, error: Exception
+    ) -> bool:
+        """
+        Republish a failed message to its delay queue or the dead-letter exchange.
+        
+        The channel is in confirm mode, so the publish returns only once the broker
+        has confirmed the copy, before the original is acked.
+        
+        Returns:
+            True if the message was republished, False if it should be requeued
+        """
+        from aio_pika import Message
+        exchange_name, routing_key, headers = _plan_failure(
+            prefixed_queue, policy, message.headers, error
+        )
+        try:
+            exchange = self._exchanges[exchange_name] if exchange_name else self.channel.default_exchange
+            await exchange.publish(
+                Message(
+                    body=message.body,
+                    content_type='application/json',
+                    message_id=message.message_id,
+                    headers=headers,
+                    delivery_mode=2  # make message persistent
+                ),
+                routing_key=routing_key
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error republishing failed message from {prefixed_queue}: {e}")
+            return False
+    
     async def declare_queue(self, queue_name: str) -> str:
         """Declare a queue with the given name."""
         prefixed_name = f"{self.queue_prefix}{queue_name}"
         await self.connect()
-        queue = await self.channel.declare_queue(prefixed_name, durable=True)
+        await self._declare_queue_once(prefixed_name)
         return prefixed_name
     
     async def declare_exchange(self, exchange_name: str) -> str:
@@ -167,11 +1294,12 @@ class AsyncRabbitMQClient:
         from aio_pika import ExchangeType
         prefixed_name = f"{self.queue_prefix}{exchange_name}"
         await self.connect()
-        exchange = await self.channel.declare_exchange(
-            name=prefixed_name,
-            type=ExchangeType.TOPIC,
-            durable=True
-        )
+        if prefixed_name not in self._exchanges:
+            self._exchanges[prefixed_name] = await self.channel.declare_exchange(
+                name=prefixed_name,
+                type=ExchangeType.TOPIC,
+                durable=True
+            )
         return prefixed_name
     
     async def bind_queue_to_exchange(self, queue_name: str, exchange_name: str, routing_key: str):
@@ -181,23 +1309,23 @@ class AsyncRabbitMQClient:
         await self.connect()
         
         queue = await self.channel.declare_queue(prefixed_queue, durable=True)
-        exchange = await self.channel.get_exchange(prefixed_exchange)
+        self._declared_queues.add(prefixed_queue)
+        exchange = await self._get_exchange(prefixed_exchange)
         await queue.bind(exchange, routing_key=routing_key)
     
     async def publish(self, exchange: str, routing_key: str, message: Dict[str, Any]) -> None:
         """Publish a message to an exchange with a routing key."""
+        if _use_publisher():
+            # Batched on the shared publisher and awaited until the broker confirms
+            await get_publisher().publish_async(exchange, routing_key, message)
+            return
+        
         from aio_pika import Message
         prefixed_exchange = f"{self.queue_prefix}{exchange}"
         await self.connect()
+        _stamp_message(message)
         
-        # Add message ID and timestamp if not present
-        if 'message_id' not in message:
-            message['message_id'] = str(uuid.uuid4())
-        if 'timestamp' not in message:
-            from datetime import datetime
-            message['timestamp'] = datetime.now().isoformat()
-        
-        exchange_obj = await self.channel.get_exchange(prefixed_exchange)
+        exchange_obj = await self._get_exchange(prefixed_exchange)
         
         await exchange_obj.publish(
             Message(
@@ -212,18 +1340,16 @@ class AsyncRabbitMQClient:
     
     async def publish_direct(self, queue: str, message: Dict[str, Any]) -> None:
         """Publish a message directly to a queue."""
-        from aio_pika import Message
         prefixed_queue = f"{self.queue_prefix}{queue}"
         await self.connect()
+        await self._declare_queue_once(prefixed_queue)
         
-        # Add message ID and timestamp if not present
-        if 'message_id' not in message:
-            message['message_id'] = str(uuid.uuid4())
-        if 'timestamp' not in message:
-            from datetime import datetime
-            message['timestamp'] = datetime.now().isoformat()
+        if _use_publisher():
+            await get_publisher().publish_direct_async(queue, message)
+            return
         
-        queue = await self.channel.declare_queue(prefixed_queue, durable=True)
+        from aio_pika import Message
+        _stamp_message(message)
         
         await self.channel.default_exchange.publish(
             Message(
@@ -236,25 +1362,61 @@ class AsyncRabbitMQClient:
         )
         logger.debug(f"Published message directly to {prefixed_queue}: {message['message_id']}")
     
-    async def consume(self, queue: str, callback: Callable[[Dict[str, Any]], Awaitable[None]]):
-        """Start consuming messages from a queue."""
+    async def consume(
+        self,
+        queue: str,
+        callback: Callable[[Dict[str, Any]], Awaitable[None]],
+        prefetch_count: int = 1,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        concurrency_key: Callable[[Dict[str, Any]], Optional[str]] = _task_type,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Start consuming messages from a queue.
+        
+        Up to prefetch_count callbacks run concurrently on the event loop, at most
+        concurrency_limits[key] at a time per concurrency_key(message). Failures are
+        retried and dead-lettered as in RabbitMQClient.consume.
+        """
         prefixed_queue = f"{self.queue_prefix}{queue}"
         await self.connect()
         
         queue_obj = await self.channel.declare_queue(prefixed_queue, durable=True)
+        self._declared_queues.add(prefixed_queue)
+        
+        policy = retry_policy or RetryPolicy.from_settings()
+        if policy.enabled:
+            await self._declare_retry_queues(prefixed_queue, policy)
+        
+        limits = {
+            key: asyncio.Semaphore(limit) for key, limit in (concurrency_limits or {}).items()
+        }
         
         async def _callback(message):
-            async with message.process():
+            # Settle explicitly: exactly one ack or nack per delivery
+            try:
                 try:
                     message_body = json.loads(message.body.decode())
-                    await callback(message_body)
                 except Exception as e:
-                    logger.error(f"Error processing message: {e}")
+                    raise PoisonMessageError(f"Undecodable message: {e}") from e
+                semaphore = limits.get(concurrency_key(message_body))
+                if semaphore is None:
+                    await callback(message_body)
+                else:
+                    async with semaphore:
+                        await callback(message_body)
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                if policy.enabled and await self._route_failure(prefixed_queue, policy, message, e):
+                    await message.ack()
+                else:
                     # Requeue the message
                     await message.nack(requeue=True)
+            else:
+                await message.ack()
         
         # Set prefetch count
-        await self.channel.set_qos(prefetch_count=1)
+        await self.channel.set_qos(prefetch_count=prefetch_count)
         
         # Start consuming
         await queue_obj.consume(_callback)
@@ -4,12 +4,16 @@ Rate limiting implementation using token bucket algorithm.
 
 import time
 import json
+import asyncio
+import logging
 from typing import Dict, Any, Optional, Set, Tuple, List
 from enum import Enum
 
-from src.core.cache import RedisCache
+from src.core.cache import RedisCache, async_cache, KEY_PREFIX
 from src.core.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class RateLimitCategory(Enum):
     """Rate limit categories for different levels of protection."""
@@ -47,6 +51,133 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if system has recovered
 
 
+# Special endpoint costs for expensive operations
+ENDPOINT_COSTS = {
+    "/api/v1/content/generate": 5,
+    "/api/v1/analytics/report/generate": 10,
+    "/api/v1/users/bulk-import": 20,
+    "/api/v1/content/upload-image": 3
+}
+
+
+def default_category_limits() -> Dict[str, Dict[str, int]]:
+    """
+    Build the rate limit parameters for every category.
+
+    Returns:
+        Mapping of category value to tokens_per_interval, interval_seconds,
+        burst_limit and cost_per_request
+    """
+    return {
+        RateLimitCategory.DEFAULT.value: {
+            "tokens_per_interval": settings.RATE_LIMIT_MAX_REQUESTS,
+            "interval_seconds": settings.RATE_LIMIT_WINDOW_MS // 1000,
+            "burst_limit": settings.RATE_LIMIT_MAX_REQUESTS * 2,
+            "cost_per_request": 1
+        },
+        RateLimitCategory.SECURITY.value: {
+            "tokens_per_interval": 20,
+            "interval_seconds": 60,
+            "burst_limit": 30,
+            "cost_per_request": 2
+        },
+        RateLimitCategory.SENSITIVE.value: {
+            "tokens_per_interval": 50,
+            "interval_seconds": 60,
+            "burst_limit": 60,
+            "cost_per_request": 1
+        },
+        RateLimitCategory.PUBLIC.value: {
+            "tokens_per_interval": 200,
+            "interval_seconds": 60,
+            "burst_limit": 300,
+            "cost_per_request": 1
+        },
+        RateLimitCategory.FRONTEND.value: {
+            "tokens_per_interval": 300,
+            "interval_seconds": 60,
+            "burst_limit": 500,
+            "cost_per_request": 1
+        }
+    }
+
+
+# Token bucket step for TokenBucketRateLimiter.allow_request, run atomically in one round trip.
+# KEYS: bucket hash, IP block key, circuit breaker hash, violations list, violation counter.
+# ARGV: tokens_per_interval, interval_seconds, burst_limit, cost, client IP ('' if unknown),
+#       circuit breaker error threshold.
+# Returns {status, a, b, ip_blocked} where status is 1 (allowed: a=remaining, b=reset),
+# 0 (limited: a=retry_after, b=reset), -1 (IP blocked), -2 (circuit open) or
+# -3 (cooling down); for negative statuses a is retry_after.
+_TOKEN_BUCKET_SCRIPT = """
+local ip = ARGV[5]
+if ip ~= '' and redis.call('exists', KEYS[2]) == 1 then
+    return {-1, math.max(redis.call('ttl', KEYS[2]), 1), 0, 0}
+end
+if redis.call('hget', KEYS[3], 'state') == 'open' then
+    return {-2, 30, 0, 0}
+end
+
+local interval = tonumber(ARGV[2])
+local rate = tonumber(ARGV[1]) / interval
+local burst = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local clock = redis.call('time')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('hmget', KEYS[1], 'tokens', 'last_update', 'request_count', 'blocked_until')
+local tokens = tonumber(bucket[1]) or burst
+local last_update = tonumber(bucket[2]) or now
+local request_count = (tonumber(bucket[3]) or 0) + 1
+local blocked_until = tonumber(bucket[4]) or 0
+if blocked_until > now then
+    return {-3, math.floor(blocked_until - now), 0, 0}
+end
+
+tokens = math.min(tokens + (now - last_update) * rate, burst)
+local status, a, b, ip_blocked = 1, 0, 0, 0
+if tokens < cost then
+    local wait = (cost - tokens) / rate
+    status, a, b = 0, math.floor(wait) + 1, math.floor(now + wait)
+    -- Clients that keep hitting the limit get progressively longer cooldowns
+    if request_count > burst * 2 then
+        local block_duration = math.min(60 * 2 ^ (math.floor(request_count / burst) - 1), 3600)
+        blocked_until = now + block_duration
+        a = block_duration
+        redis.call('lpush', KEYS[4], cjson.encode({
+            timestamp = now,
+            type = 'burst_traffic',
+            ip = (ip ~= '' and ip) or cjson.null,
+            context = {request_count = request_count}
+        }))
+        redis.call('ltrim', KEYS[4], 0, 99)
+        redis.call('expire', KEYS[4], 86400)
+        local violations = redis.call('incr', KEYS[5])
+        redis.call('expire', KEYS[5], 3600)
+        if ip ~= '' and violations > 10 then
+            redis.call('set', KEYS[2], now, 'ex', 3600)
+            ip_blocked = 1
+            local errors = redis.call('hincrby', KEYS[3], 'error_count', 1)
+            redis.call('hset', KEYS[3], 'updated_at', now)
+            local state = redis.call('hget', KEYS[3], 'state') or 'closed'
+            if state == 'closed' and errors >= tonumber(ARGV[6]) then
+                redis.call('hset', KEYS[3], 'state', 'open', 'tripped_at', now)
+            end
+            redis.call('expire', KEYS[3], 86400)
+        end
+    end
+else
+    tokens = tokens - cost
+    a, b = math.floor(tokens / cost), math.floor(now + (burst - tokens) / rate)
+end
+
+redis.call('hset', KEYS[1], 'tokens', tokens, 'last_update', now,
+    'request_count', request_count, 'blocked_until', blocked_until)
+redis.call('expire', KEYS[1], math.ceil(interval * 2))
+return {status, a, b, ip_blocked}
+"""
+
+
 class TokenBucketRateLimiter:
     """
     Token bucket rate limiter implementation using Redis.
@@ -62,6 +193,9 @@ class TokenBucketRateLimiter:
     - Last update time
     - Current token count
     - Additional metadata for rate limiting decisions
+    
+    Bucket and circuit breaker state are Redis hashes so the whole
+    allow_request decision can run server-side in one Lua script.
     """
     
     def __init__(
@@ -74,54 +208,93 @@ class TokenBucketRateLimiter:
         # Block list for IPs that have violated rate limits repeatedly
         self.block_list_key = f"{prefix}blocklist"
         
-        # Circuit breaker state
-        self.circuit_key = f"{prefix}circuit"
+        # Circuit breaker state, a hash read directly by the limiter script
+        self.circuit_key = self._redis_key("circuit_state")
+        
+        self._script = None
+        self._async_script = None
         
         # Initialize circuit breaker if not exists
-        if not self.cache.exists(self.circuit_key):
+        if not self._read_circuit():
             self._set_circuit_state(CircuitState.CLOSED)
         
         # Configure default rate limits
-        self.default_limits = {
-            RateLimitCategory.DEFAULT.value: {
-                "tokens_per_interval": settings.RATE_LIMIT_MAX_REQUESTS,
-                "interval_seconds": settings.RATE_LIMIT_WINDOW_MS // 1000,
-                "burst_limit": settings.RATE_LIMIT_MAX_REQUESTS * 2,
-                "cost_per_request": 1
-            },
-            RateLimitCategory.SECURITY.value: {
-                "tokens_per_interval": 20,
-                "interval_seconds": 60,
-                "burst_limit": 30,
-                "cost_per_request": 2
-            },
-            RateLimitCategory.SENSITIVE.value: {
-                "tokens_per_interval": 50,
-                "interval_seconds": 60,
-                "burst_limit": 60,
-                "cost_per_request": 1
-            },
-            RateLimitCategory.PUBLIC.value: {
-                "tokens_per_interval": 200,
-                "interval_seconds": 60,
-                "burst_limit": 300,
-                "cost_per_request": 1
-            },
-            RateLimitCategory.FRONTEND.value: {
-                "tokens_per_interval": 300,
-                "interval_seconds": 60,
-                "burst_limit": 500,
-                "cost_per_request": 1
-            }
-        }
+        self.default_limits = default_category_limits()
         
         # Special endpoint costs for expensive operations
-        self.endpoint_costs = {
-            "/api/v1/content/generate": 5,
-            "/api/v1/analytics/report/generate": 10,
-            "/api/v1/users/bulk-import": 20,
-            "/api/v1/content/upload-image": 3
+        self.endpoint_costs = dict(ENDPOINT_COSTS)
+    
+    def _redis_key(self, name: str) -> str:
+        """Get the full Redis key for limiter state accessed through scripts."""
+        return f"{KEY_PREFIX}{self.prefix}{name}"
+    
+    @property
+    def script(self):
+        """Get the token bucket script registered on the sync Redis client."""
+        if self._script is None:
+            self._script = self.cache.client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._script
+    
+    @property
+    def async_script(self):
+        """Get the token bucket script registered on the asyncio Redis client."""
+        if self._async_script is None:
+            self._async_script = async_cache.client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._async_script
+    
+    def _script_arguments(
+        self,
+        key: str,
+        category: RateLimitCategory,
+        endpoint: Optional[str],
+        ip_address: Optional[str]
+    ) -> Tuple[List[str], List[Any], Dict[str, int]]:
+        """Build the keys and arguments for one token bucket script call."""
+        limits = self.default_limits.get(
+            category.value, 
+            self.default_limits[RateLimitCategory.DEFAULT.value]
+        )
+        keys = [
+            self._redis_key(f"bucket:{category.value}:{key}"),
+            self._redis_key(f"block:{ip_address or ''}"),
+            self.circuit_key,
+            self._redis_key(f"violations:{key}"),
+            self._redis_key(f"violation_count:{key}")
+        ]
+        args = [
+            limits["tokens_per_interval"],
+            limits["interval_seconds"],
+            limits["burst_limit"],
+            self._get_request_cost(category, endpoint),
+            ip_address or "",
+            settings.CIRCUIT_BREAKER_ERROR_THRESHOLD
+        ]
+        return keys, args, limits
+    
+    @staticmethod
+    def _decision(result: List[int], limits: Dict[str, int]) -> Tuple[bool, Dict[str, Any]]:
+        """Turn the script result into the (allowed, context) pair."""
+        status, first, second = (int(value) for value in result[:3])
+        if status == 1:
+            return True, {
+                "limit": limits["tokens_per_interval"],
+                "remaining": first,
+                "reset": second
+            }
+        if status == 0:
+            return False, {
+                "reason": "Rate limit exceeded",
+                "retry_after": first,
+                "limit": limits["tokens_per_interval"],
+                "remaining": 0,
+                "reset": second
+            }
+        reasons = {
+            -1: "IP address blocked due to suspicious activity",
+            -2: "Service protection circuit breaker engaged",
+            -3: "Too many requests"
         }
+        return False, {"reason": reasons[status], "retry_after": first}
     
     def allow_request(
         self,
@@ -134,6 +307,10 @@ class TokenBucketRateLimiter:
         """
         Check if a request should be allowed based on rate limits.
         
+        The block list, circuit breaker, bucket refill and consumption and
+        violation counting all run in a single Redis script, so each request
+        costs one round trip and concurrent requests cannot race.
+        
         Args:
             key: The client identifier (typically IP address or API key)
             category: The rate limit category for this request
@@ -145,128 +322,48 @@ class TokenBucketRateLimiter:
             A tuple of (allowed, context) where allowed is a boolean and context
             contains information about the rate limiting decision
         """
-        # Check if the IP is blocked
-        if ip_address and self._is_ip_blocked(ip_address):
-            return False, {
-                "reason": "IP address blocked due to suspicious activity",
-                "retry_after": 3600  # 1 hour
-            }
-        
-        # Check circuit breaker state
-        circuit_state = self._get_circuit_state()
-        if circuit_state == CircuitState.OPEN:
-            return False, {
-                "reason": "Service protection circuit breaker engaged",
-                "retry_after": 30  # 30 seconds
-            }
-        
-        # Determine cost for this request
-        cost = self._get_request_cost(category, endpoint)
-        
-        # Get rate limit parameters for this category
-        limits = self.default_limits.get(
-            category.value, 
-            self.default_limits[RateLimitCategory.DEFAULT.value]
-        )
-        
-        # Format the key with prefix and category
-        cache_key = f"{self.prefix}{category.value}:{key}"
-        
-        # Get current time
-        now = time.time()
-        
-        # Get current bucket state or create a new one
-        bucket = self.cache.get(cache_key)
-        if not bucket:
-            # Initialize a new bucket
-            bucket = {
-                "tokens": limits["burst_limit"],  # Start with full bucket
-                "last_update": now,
-                "request_count": 0,
-                "blocked_until": 0
-            }
-        else:
-            # Convert from JSON if needed
-            if isinstance(bucket, str):
-                bucket = json.loads(bucket)
-        
-        # Check if request is temporarily blocked
-        if bucket.get("blocked_until", 0) > now:
-            retry_after = int(bucket["blocked_until"] - now)
-            return False, {
-                "reason": "Too many requests",
-                "retry_after": retry_after
-            }
-        
-        # Calculate token refill
-        time_passed = now - bucket["last_update"]
-        token_refill = time_passed * (limits["tokens_per_interval"] / limits["interval_seconds"])
-        
-        # Update token count
-        new_token_count = min(
-            bucket["tokens"] + token_refill,
-            limits["burst_limit"]
-        )
+        keys, args, limits = self._script_arguments(key, category, endpoint, ip_address)
+        try:
+            result = self.script(keys=keys, args=args)
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+            return True, {"limit": limits["tokens_per_interval"]}
+        
+        if int(result[3]):
+            self._add_to_block_list(ip_address)
+        return self._decision(result, limits)
+    
+    async def allow_request_async(
+        self,
+        key: str,
+        category: RateLimitCategory = RateLimitCategory.DEFAULT,
+        endpoint: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ip_address: Optional[str] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Asyncio variant of allow_request for use inside the event loop.
         
-        # Check if bucket has enough tokens
-        if new_token_count < cost:
-            # Calculate when enough tokens will be available
-            time_until_refill = (cost - new_token_count) * (
-                limits["interval_seconds"] / limits["tokens_per_interval"]
-            )
-            retry_after = int(time_until_refill) + 1  # Round up
-            
-            # Update bucket with refilled tokens but don't consume
-            bucket["tokens"] = new_token_count
-            bucket["last_update"] = now
-            
-            # Check for suspicious patterns
-            request_count = bucket.get("request_count", 0) + 1
-            bucket["request_count"] = request_count
-            
-            # If client is repeatedly hitting limits, enforce a cooldown
-            if request_count > limits["burst_limit"] * 2:
-                # Block for progressively longer periods
-                block_duration = min(60 * (2 ** ((request_count // limits["burst_limit"]) - 1)), 3600)
-                bucket["blocked_until"] = now + block_duration
-                
-                # Log the violation for analysis
-                self._record_violation(
-                    key, 
-                    ip_address,
-                    RateLimitViolation.BURST_TRAFFIC,
-                    {"request_count": request_count}
-                )
-                
-                retry_after = block_duration
-            
-            # Save updated bucket
-            self.cache.set(cache_key, bucket, expire=limits["interval_seconds"] * 2)
+        Args:
+            key: The client identifier (typically IP address or API key)
+            category: The rate limit category for this request
+            endpoint: The API endpoint being accessed
+            headers: Request headers for additional context
+            ip_address: Client IP address for additional checks
             
-            return False, {
-                "reason": "Rate limit exceeded",
-                "retry_after": retry_after,
-                "limit": limits["tokens_per_interval"],
-                "remaining": 0,
-                "reset": int(now + time_until_refill)
-            }
-        
-        # Consume tokens and update bucket
-        bucket["tokens"] = new_token_count - cost
-        bucket["last_update"] = now
-        bucket["request_count"] = bucket.get("request_count", 0) + 1
-        
-        # Save updated bucket
-        self.cache.set(cache_key, bucket, expire=limits["interval_seconds"] * 2)
-        
-        # Return success with rate limit headers
-        tokens_remaining = int(bucket["tokens"] // cost)
-        return True, {
-            "limit": limits["tokens_per_interval"],
-            "remaining": tokens_remaining,
-            "reset": int(now + (limits["burst_limit"] - bucket["tokens"]) * 
-                       (limits["interval_seconds"] / limits["tokens_per_interval"]))
-        }
+        Returns:
+            A tuple of (allowed, context) as for allow_request
+        """
+        keys, args, limits = self._script_arguments(key, category, endpoint, ip_address)
+        try:
+            result = await self.async_script(keys=keys, args=args)
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+            return True, {"limit": limits["tokens_per_interval"]}
+        
+        if int(result[3]):
+            await asyncio.to_thread(self._add_to_block_list, ip_address)
+        return self._decision(result, limits)
     
     def _get_request_cost(
         self, 
@@ -288,11 +385,17 @@ class TokenBucketRateLimiter:
     
     def _is_ip_blocked(self, ip_address: str) -> bool:
         """Check if an IP address is blocked."""
+        return self.cache.exists(f"{self.prefix}block:{ip_address}")
+    
+    def _add_to_block_list(self, ip_address: str) -> None:
+        """Add an IP address to the 24-hour list of recently blocked addresses."""
         blocked_ips = self.cache.get(self.block_list_key) or []
         if isinstance(blocked_ips, str):
             blocked_ips = json.loads(blocked_ips)
         
-        return ip_address in blocked_ips
+        if ip_address not in blocked_ips:
+            blocked_ips.append(ip_address)
+            self.cache.set(self.block_list_key, blocked_ips, expire=86400)  # 24-hour list
     
     def block_ip(self, ip_address: str, duration: int = 3600) -> None:
         """
@@ -302,13 +405,7 @@ class TokenBucketRateLimiter:
             ip_address: The IP address to block
             duration: Duration to block in seconds (default: 1 hour)
         """
-        blocked_ips = self.cache.get(self.block_list_key) or []
-        if isinstance(blocked_ips, str):
-            blocked_ips = json.loads(blocked_ips)
-        
-        if ip_address not in blocked_ips:
-            blocked_ips.append(ip_address)
-            self.cache.set(self.block_list_key, blocked_ips, expire=86400)  # 24-hour list
+        self._add_to_block_list(ip_address)
         
         # Set individual IP block with expiry
         self.cache.set(
@@ -373,88 +470,88 @@ class TokenBucketRateLimiter:
             # Also update circuit breaker metrics
             self._increment_error_count()
     
+    def _read_circuit(self) -> Dict[str, str]:
+        """Read the circuit breaker hash, or an empty dict if missing or unreachable."""
+        try:
+            data = self.cache.client.hgetall(self.circuit_key)
+        except Exception as e:
+            logger.warning(f"Redis circuit breaker read error: {e}")
+            return {}
+        return {field.decode(): value.decode() for field, value in data.items()}
+    
+    def _write_circuit(self, fields: Dict[str, Any]) -> None:
+        """Update fields of the circuit breaker hash."""
+        try:
+            pipe = self.cache.client.pipeline()
+            pipe.hset(self.circuit_key, mapping=fields)
+            pipe.expire(self.circuit_key, 86400)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis circuit breaker write error: {e}")
+    
     def _get_circuit_state(self) -> CircuitState:
         """Get the current circuit breaker state."""
-        circuit_data = self.cache.get(self.circuit_key)
-        if not circuit_data:
-            return CircuitState.CLOSED
-            
-        if isinstance(circuit_data, str):
-            circuit_data = json.loads(circuit_data)
-            
+        circuit_data = self._read_circuit()
         return CircuitState(circuit_data.get("state", CircuitState.CLOSED.value))
     
     def _set_circuit_state(self, state: CircuitState) -> None:
         """Set the circuit breaker state."""
-        circuit_data = {
+        self._write_circuit({
             "state": state.value,
             "updated_at": time.time(),
             "error_count": 0,
             "success_count": 0
-        }
-        self.cache.set(self.circuit_key, circuit_data, expire=86400)
+        })
     
     def _increment_error_count(self) -> None:
         """Increment the error count for circuit breaker evaluation."""
-        circuit_data = self.cache.get(self.circuit_key)
-        if not circuit_data:
-            circuit_data = {
-                "state": CircuitState.CLOSED.value,
-                "updated_at": time.time(),
-                "error_count": 0,
-                "success_count": 0
-            }
-        
-        if isinstance(circuit_data, str):
-            circuit_data = json.loads(circuit_data)
+        try:
+            error_count = self.cache.client.hincrby(self.circuit_key, "error_count", 1)
+        except Exception as e:
+            logger.warning(f"Redis circuit breaker write error: {e}")
+            return
         
-        circuit_data["error_count"] = circuit_data.get("error_count", 0) + 1
-        circuit_data["updated_at"] = time.time()
+        fields = {"updated_at": time.time()}
+        state = self._read_circuit().get("state", CircuitState.CLOSED.value)
         
         # Update circuit breaker state based on error threshold
-        if (circuit_data["state"] == CircuitState.CLOSED.value and 
-                circuit_data["error_count"] >= settings.CIRCUIT_BREAKER_ERROR_THRESHOLD):
-            circuit_data["state"] = CircuitState.OPEN.value
-            circuit_data["tripped_at"] = time.time()
+        if (state == CircuitState.CLOSED.value and 
+                error_count >= settings.CIRCUIT_BREAKER_ERROR_THRESHOLD):
+            fields["state"] = CircuitState.OPEN.value
+            fields["tripped_at"] = time.time()
         
-        self.cache.set(self.circuit_key, circuit_data, expire=86400)
+        self._write_circuit(fields)
     
     def _increment_success_count(self) -> None:
         """Increment the success count for circuit breaker evaluation."""
-        circuit_data = self.cache.get(self.circuit_key)
+        circuit_data = self._read_circuit()
         if not circuit_data:
             return
-            
-        if isinstance(circuit_data, str):
-            circuit_data = json.loads(circuit_data)
         
-        circuit_data["success_count"] = circuit_data.get("success_count", 0) + 1
+        success_count = int(circuit_data.get("success_count", 0)) + 1
+        fields = {"success_count": success_count}
         
         # If in half-open state and enough successes, close the circuit
-        if (circuit_data["state"] == CircuitState.HALF_OPEN.value and 
-                circuit_data["success_count"] >= settings.CIRCUIT_BREAKER_SUCCESS_THRESHOLD):
-            circuit_data["state"] = CircuitState.CLOSED.value
-            circuit_data["error_count"] = 0
-            circuit_data["success_count"] = 0
+        if (circuit_data.get("state") == CircuitState.HALF_OPEN.value and 
+                success_count >= settings.CIRCUIT_BREAKER_SUCCESS_THRESHOLD):
+            fields.update(state=CircuitState.CLOSED.value, error_count=0, success_count=0)
         
-        self.cache.set(self.circuit_key, circuit_data, expire=86400)
+        self._write_circuit(fields)
     
     def check_and_update_circuit_breaker(self) -> None:
         """Check and update circuit breaker state based on time elapsed."""
-        circuit_data = self.cache.get(self.circuit_key)
+        circuit_data = self._read_circuit()
         if not circuit_data:
             return
             
-        if isinstance(circuit_data, str):
-            circuit_data = json.loads(circuit_data)
-            
         # If circuit is open and recovery timeout has elapsed, set to half-open
-        if (circuit_data["state"] == CircuitState.OPEN.value and 
-                time.time() - circuit_data.get("tripped_at", 0) > settings.CIRCUIT_BREAKER_TIMEOUT):
-            circuit_data["state"] = CircuitState.HALF_OPEN.value
-            circuit_data["success_count"] = 0
-            circuit_data["updated_at"] = time.time()
-            self.cache.set(self.circuit_key, circuit_data, expire=86400)
+        if (circuit_data.get("state") == CircuitState.OPEN.value and 
+                time.time() - float(circuit_data.get("tripped_at", 0)) > settings.CIRCUIT_BREAKER_TIMEOUT):
+            self._write_circuit({
+                "state": CircuitState.HALF_OPEN.value,
+                "success_count": 0,
+                "updated_at": time.time()
+            })
     
     def record_request_result(self, success: bool) -> None:
         """Record the result of a request for circuit breaker purposes."""
@@ -464,5 +561,129 @@ class TokenBucketRateLimiter:
             self._increment_error_count()
 
 
+# GCRA step: KEYS[1] holds the theoretical arrival time (ms), KEYS[2] the IP block key.
+# ARGV: emission interval (ms per token), burst tolerance (ms), request cost in tokens.
+# Returns {allowed, remaining, retry_after_ms, reset_ms}; allowed is -1 for blocked IPs.
+_GCRA_SCRIPT = """
+if KEYS[2] ~= KEYS[1] and redis.call('exists', KEYS[2]) == 1 then
+    return {-1, 0, redis.call('pttl', KEYS[2]), 0}
+end
+local emission = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local increment = emission * tonumber(ARGV[3])
+local clock = redis.call('time')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tat = tonumber(redis.call('get', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + increment
+local allow_at = new_tat - tolerance
+if allow_at > now then
+    return {0, 0, math.ceil(allow_at - now), math.ceil(tat - now)}
+end
+local ttl = math.ceil(new_tat - now)
+redis.call('set', KEYS[1], new_tat, 'px', ttl)
+return {1, math.floor((now - allow_at) / emission), 0, ttl}
+"""
+
+
+class GCRARateLimiter:
+    """
+    Distributed rate limiter using the generic cell rate algorithm on Redis.
+    
+    GCRA is a sliding-window equivalent of the token bucket: each client key
+    stores a single timestamp (the theoretical arrival time of the next
+    request), so memory stays constant per client however busy it is. The
+    whole decision, including the IP block list check, runs in one Lua
+    script using the Redis clock, which keeps limits exact across workers
+    and hosts without clock skew or read-modify-write races.
+    
+    Limits come from the same per-category table as TokenBucketRateLimiter:
+    tokens_per_interval sets the sustained rate and burst_limit the number
+    of requests a fresh client may send at once.
+    """
+    
+    def __init__(
+        self,
+        prefix: str = "ratelimit:",
+        limits: Optional[Dict[str, Dict[str, int]]] = None,
+        endpoint_costs: Optional[Dict[str, int]] = None
+    ):
+        self.prefix = prefix
+        self.limits = limits or default_category_limits()
+        self.endpoint_costs = ENDPOINT_COSTS if endpoint_costs is None else endpoint_costs
+        self._script = None
+    
+    @property
+    def script(self):
+        """Get the registered GCRA script, loaded with EVALSHA on first use."""
+        if self._script is None:
+            self._script = async_cache.client.register_script(_GCRA_SCRIPT)
+        return self._script
+    
+    def _limits_for(self, category: RateLimitCategory) -> Dict[str, int]:
+        return self.limits.get(category.value, self.limits[RateLimitCategory.DEFAULT.value])
+    
+    def _cost_for(self, category: RateLimitCategory, endpoint: Optional[str]) -> int:
+        cost = self._limits_for(category)["cost_per_request"]
+        if endpoint and endpoint in self.endpoint_costs:
+            cost += self.endpoint_costs[endpoint]
+        return cost
+    
+    async def allow_request(
+        self,
+        key: str,
+        category: RateLimitCategory = RateLimitCategory.DEFAULT,
+        endpoint: Optional[str] = None,
+        ip_address: Optional[str] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Check and consume the rate limit for a request in one Redis round trip.
+        
+        Args:
+            key: The client identifier (typically IP address or API key)
+            category: The rate limit category for this request
+            endpoint: The API endpoint being accessed
+            ip_address: Client IP address to check against the block list
+            
+        Returns:
+            A tuple of (allowed, context) where context carries limit,
+            remaining, reset (seconds) and, for rejections, reason and
+            retry_after (seconds). Requests are allowed if Redis is unavailable.
+        """
+        limits = self._limits_for(category)
+        emission_ms = limits["interval_seconds"] * 1000 / limits["tokens_per_interval"]
+        state_key = f"{KEY_PREFIX}{self.prefix}gcra:{category.value}:{key}"
+        block_key = f"{KEY_PREFIX}{self.prefix}block:{ip_address}" if ip_address else state_key
+        
+        try:
+            allowed, remaining, retry_after_ms, reset_ms = await self.script(
+                keys=[state_key, block_key],
+                args=[emission_ms, emission_ms * limits["burst_limit"], self._cost_for(category, endpoint)]
+            )
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+            return True, {"limit": limits["tokens_per_interval"]}
+        
+        if allowed == -1:
+            return False, {
+                "reason": "IP address blocked due to suspicious activity",
+                "retry_after": max(int(retry_after_ms) // 1000, 1)
+            }
+        
+        context = {
+            "limit": limits["tokens_per_interval"],
+            "remaining": int(remaining),
+            "reset": -(-int(reset_ms) // 1000)
+        }
+        if allowed:
+            return True, context
+        
+        context["reason"] = "Rate limit exceeded"
+        context["retry_after"] = -(-int(retry_after_ms) // 1000)
+        return False, context
+
+
 # Create global instance
-rate_limiter = TokenBucketRateLimiter()
\ No newline at end of file
+rate_limiter = TokenBucketRateLimiter()
@@ -1,5 +1,6 @@
 # Standard library imports
 import base64
+import json
 import os
 import secrets
 import hashlib
@@ -8,26 +9,28 @@ import uuid
 import logging
 import time
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import wraps, lru_cache
 from enum import Enum
-from typing import Optional, Union, Any, Dict, List, Tuple, Set
+from typing import Optional, Union, Any, Dict, FrozenSet, Iterable, List, Tuple, Set
 
 # Third-party imports
 from fastapi import Depends, HTTPException, status, Request, Header, Cookie
 from fastapi.security import OAuth2PasswordBearer, OAuth2AuthorizationCodeBearer
-from jose import jwt, JWTError
+from jose import jwt, JWTError, ExpiredSignatureError
 from passlib.context import CryptContext
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.exc import UnmappedInstanceError
 import pyotp
 from sqlalchemy import and_, or_
 
 # Local imports
 from src.core.settings import settings
 from src.core.database import get_db
-from src.core.cache import cache
+from src.core.cache import cache, async_cache, CacheCategory, LocalCache
 from src.core.secrets_manager import secrets_manager
 
 # Set up logging
@@ -98,6 +101,8 @@ class JWTManager:
         self._keys = {}
         self._key_rotation_interval = int(os.getenv("JWT_KEY_ROTATION_DAYS", "30"))  # Default 30 days
         self._initialized = False
+        # Key IDs from other processes, mapped to the key that verified them
+        self._kid_aliases: Dict[str, str] = {}
         
     def initialize(self, db: Optional[Session] = None):
         """Initialize JWT keys from database or environment."""
@@ -254,10 +259,16 @@ class JWTManager:
             del self._keys[key_id]
         
         # Remove from database
-        db.query(JWTSecretKey).filter(
-            JWTSecretKey.expires_at < now
-        ).delete()
-        db.commit()
+        try:
+            db.query(JWTSecretKey).filter(
+                JWTSecretKey.expires_at < now
+            ).delete()
+            db.commit()
+        finally:
+            if expired_keys:
+                # Tokens verified with a removed key must be checked again
+                self._kid_aliases.clear()
+                _token_cache.clear()
         
         logger.info(f"Cleaned up {len(expired_keys)} expired JWT keys")
     
@@ -273,10 +284,22 @@ class JWTManager:
         return self._keys[self._active_key_id]["key"]
     
     def get_key_by_id(self, key_id: str) -> Optional[str]:
-        """Get JWT key by ID."""
+        """Get JWT key by ID, including IDs learned through remember_key_id."""
         if key_id in self._keys:
             return self._keys[key_id]["key"]
-        return None
+        return self._kid_aliases.get(key_id)
+    
+    def remember_key_id(self, key_id: str, key: str) -> None:
+        """
+        Map a key ID to the key that verified a token carrying it.
+        
+        Processes that create their own initial key give it a random ID, so tokens
+        from other workers carry IDs this process doesn't know; remembering them
+        lets later tokens skip trying every key.
+        """
+        if len(self._kid_aliases) >= 1000:
+            self._kid_aliases.clear()
+        self._kid_aliases[key_id] = key
     
     def get_all_valid_keys(self) -> List[str]:
         """Get all non-expired JWT keys."""
@@ -331,57 +354,81 @@ def create_access_token(
     )
     return encoded_jwt
 
+# Verified payloads keyed by token hash. Tokens are immutable, so entries only need
+# to expire with the token itself; see _cache_payload
+_token_cache = LocalCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_SIZE,
+    max_bytes=16 * 1024 * 1024,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL
+)
+
+
+def _cache_payload(token_hash: str, payload: Dict[str, Any]) -> None:
+    """Cache a verified payload for at most the time left before it expires."""
+    ttl = settings.AUTH_TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, int(exp - time.time()))
+    if ttl > 0:
+        _token_cache.set(token_hash, json.dumps(payload).encode(), ttl)
+
+
+def _fallback_keys():
+    """Keys to try for tokens without a known key ID: all valid keys, then the settings key."""
+    valid_keys = jwt_manager.get_all_valid_keys()
+    yield from valid_keys
+    if settings.JWT_SECRET not in valid_keys:
+        yield settings.JWT_SECRET
+
+
+def _verify_token(token: str) -> Optional[Dict[str, Any]]:
+    """Verify a token's signature and expiry, trying its key ID's key first."""
+    claims = jwt.get_unverified_claims(token)
+    key_id = claims.get("kid")
+    
+    # If key ID is in token and exists in our keys, only that key can have signed it
+    if key_id and key_id != "default":
+        key = jwt_manager.get_key_by_id(key_id)
+        if key:
+            try:
+                return jwt.decode(token, key, algorithms=[settings.JWT_ALGORITHM])
+            except JWTError:
+                logger.warning(f"Failed to decode token with key ID {key_id}")
+                return None
+    
+    # Try with all valid keys, then the settings key
+    for key in _fallback_keys():
+        try:
+            payload = jwt.decode(token, key, algorithms=[settings.JWT_ALGORITHM])
+        except ExpiredSignatureError:
+            # Signed with this key but expired; no other key will do better
+            return None
+        except JWTError:
+            continue
+        if key_id and key_id != "default":
+            jwt_manager.remember_key_id(key_id, key)
+        return payload
+    return None
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """Decode a JWT token and return the full payload."""
     # Initialize JWT manager if needed
     if not jwt_manager._initialized:
         jwt_manager.initialize()
     
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    cached = _token_cache.get(token_hash)
+    if cached is not None:
+        return json.loads(cached)
+    
     try:
-        # First try to decode without verification to get the key ID
-        unverified_payload = jwt.decode(
-            token, 
-            options={"verify_signature": False}
-        )
-        
-        # Get key ID from token
-        key_id = unverified_payload.get("kid")
-        
-        # If key ID is in token and exists in our keys, use that key
-        if key_id and key_id != "default":
-            key = jwt_manager.get_key_by_id(key_id)
-            if key:
-                try:
-                    payload = jwt.decode(
-                        token, key, algorithms=[settings.JWT_ALGORITHM]
-                    )
-                    return payload
-                except JWTError:
-                    logger.warning(f"Failed to decode token with key ID {key_id}")
-                    pass
-        
-        # Try with all valid keys
-        valid_keys = jwt_manager.get_all_valid_keys()
-        for key in valid_keys:
-            try:
-                payload = jwt.decode(
-                    token, key, algorithms=[settings.JWT_ALGORITHM]
-                )
-                return payload
-            except JWTError:
-                continue
-        
-        # Fallback to settings key
-        try:
-            payload = jwt.decode(
-                token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-            )
-            return payload
-        except JWTError:
-            return None
-                
+        payload = _verify_token(token)
     except JWTError:
         return None
+    if payload:
+        _cache_payload(token_hash, payload)
+    return payload
 
 def verify_token(token: str) -> Optional[str]:
     """Verify a JWT token and return the subject."""
@@ -402,6 +449,8 @@ class CSRFProtection:
         self._cookie_max_age = 60 * 60 * 24  # 24 hours
         self._csrf_token_length = 32
         self._safe_methods = {"GET", "HEAD", "OPTIONS", "TRACE"}
+        # Paths that receive cross-site posts by design (OAuth callbacks, webhooks)
+        self._exempt_paths = ("/api/v1/auth/oauth-callback", "/api/v1/webhook")
         
     @property
     def secret(self) -> str:
@@ -493,7 +542,7 @@ class CSRFProtection:
         
         # Skip for specific paths (like OAuth callbacks)
         path = request.url.path
-        if path.startswith(("/api/v1/auth/oauth-callback", "/api/v1/webhook")):
+        if path.startswith(self._exempt_paths):
             return await call_next(request)
             
         # For state-changing operations, validate CSRF token
@@ -552,13 +601,125 @@ import hmac
 import json
 
 
+# Columns kept in a user's auth snapshot; anything else loads on first access
+_USER_SNAPSHOT_FIELDS = ("id", "email", "username", "full_name", "is_active", "is_superuser")
+_USER_SNAPSHOT_TAG = "auth_user"
+
+
+def _user_snapshot_key(user_id: int) -> str:
+    return f"{CacheCategory.USER.value}:auth:{user_id}"
+
+
+async def _load_user(db: Session, user_id: int):
+    """
+    Load a user for request authentication, from a cached snapshot when possible.
+    
+    A cached snapshot is attached to the session with merge(load=False), so callers
+    get a normal persistent User without a query; relationships and columns outside
+    the snapshot load lazily if used.
+    """
+    from src.models.system import User
+    
+    key = _user_snapshot_key(user_id)
+    snapshot = await async_cache.get(key)
+    if snapshot:
+        try:
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            return db.merge(user, load=False)
+        except Exception as e:
+            logger.warning(f"Discarding cached user snapshot {user_id}: {str(e)}")
+    
+    user = db.query(User).filter(User.id == user_id).first()
+    if user:
+        await async_cache.set(
+            key,
+            {field: getattr(user, field) for field in _USER_SNAPSHOT_FIELDS},
+            expire=settings.AUTH_USER_CACHE_TTL,
+            tags=[_USER_SNAPSHOT_TAG]
+        )
+    return user
+
+
+def _user_permissions_key(user_id: int) -> str:
+    return f"{CacheCategory.USER.value}:permissions:{user_id}"
+
+
+async def get_user_permissions(db: Session, user_id: int) -> FrozenSet[str]:
+    """
+    Get the "resource:action" permissions granted to a user through their roles.
+    
+    The set is built with a single join over user_roles and role_permissions rather
+    than walking each role's permissions, and cached alongside the user's snapshot.
+    
+    Args:
+        db: Database session
+        user_id: The user's ID
+        
+    Returns:
+        Granted permissions, possibly containing "*" wildcards
+    """
+    from src.models.system import Permission, user_roles, role_permissions
+    
+    key = _user_permissions_key(user_id)
+    cached = await async_cache.get(key)
+    if cached is not None:
+        return frozenset(cached)
+    
+    rows = (
+        db.query(Permission.resource, Permission.action)
+        .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+        .join(user_roles, user_roles.c.role_id == role_permissions.c.role_id)
+        .filter(user_roles.c.user_id == user_id)
+        .distinct()
+        .all()
+    )
+    permissions = frozenset(f"{resource}:{action}" for resource, action in rows)
+    await async_cache.set(
+        key,
+        sorted(permissions),
+        expire=settings.AUTH_USER_CACHE_TTL,
+        tags=[_USER_SNAPSHOT_TAG]
+    )
+    return permissions
+
+
+def _parse_permissions(permission_strings: List[str]) -> List[Tuple[str, str]]:
+    """Parse "resource:action" strings, skipping malformed ones."""
+    parsed = []
+    for permission_string in permission_strings:
+        try:
+            resource, action = permission_string.split(":")
+        except ValueError:
+            continue
+        parsed.append((resource, action))
+    return parsed
+
+
+def permission_granted(granted: FrozenSet[str], resource: str, action: str) -> bool:
+    """Check a permission against a compiled set, honouring "*" resources and actions."""
+    return (
+        f"{resource}:{action}" in granted
+        or f"{resource}:*" in granted
+        or f"*:{action}" in granted
+        or "*:*" in granted
+    )
+
+
+def invalidate_user_auth_cache(user_id: Optional[int] = None) -> None:
+    """Drop one user's cached auth snapshot and permissions, or every user's if no ID is given."""
+    if user_id is None:
+        cache.delete_tag(_USER_SNAPSHOT_TAG)
+    else:
+        cache.delete(_user_snapshot_key(user_id))
+        cache.delete(_user_permissions_key(user_id))
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ):
     """Get the current authenticated user."""
-    from src.models.system import User
-    
     payload = decode_token(token)
     if not payload:
         raise HTTPException(
@@ -575,7 +736,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = await _load_user(db, int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -601,6 +762,10 @@ def has_permission(resource: str, action: str):
     def get_brands(current_user = Depends(get_current_user)):
         # This function will only be called if the user has permission to read brands
         pass
+    
+    Permissions come from get_user_permissions, using the endpoint's db session or
+    the one the user was loaded in, so "*" wildcards apply as they do for
+    get_current_user_with_permissions.
     """
     def decorator(func):
         @wraps(func)
@@ -623,11 +788,23 @@ def has_permission(resource: str, action: str):
             if current_user.is_superuser:
                 return await func(*args, **kwargs)
             
-            # Check user permissions through roles
-            for role in current_user.roles:
-                for permission in role.permissions:
-                    if permission.resource == resource and permission.action == action:
-                        return await func(*args, **kwargs)
+            db = kwargs.get("db")
+            if db is None:
+                try:
+                    db = object_session(current_user)
+                except UnmappedInstanceError:
+                    db = None
+            if db is not None:
+                granted = await get_user_permissions(db, current_user.id)
+            else:
+                # Detached user: compile the permissions its roles already loaded
+                granted = frozenset(
+                    f"{permission.resource}:{permission.action}"
+                    for role in current_user.roles
+                    for permission in role.permissions
+                )
+            if permission_granted(granted, resource, action):
+                return await func(*args, **kwargs)
             
             # Permission denied
             raise HTTPException(
@@ -648,12 +825,12 @@ def get_current_user_with_permissions(required_permissions: List[str]):
     Returns:
         Dependency function that will raise an exception if the user doesn't have the required permissions
     """
+    required = _parse_permissions(required_permissions)
+    
     async def check_permissions(
         token: str = Depends(oauth2_scheme),
         db: Session = Depends(get_db)
     ):
-        from src.models.system import User, Role, Permission
-        
         # Verify the token and get the user
         payload = decode_token(token)
         if not payload:
@@ -671,8 +848,7 @@ def get_current_user_with_permissions(required_permissions: List[str]):
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Get the user with their roles and permissions
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        user = await _load_user(db, int(user_id))
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -691,28 +867,10 @@ def get_current_user_with_permissions(required_permissions: List[str]):
             return user
         
         # Check if the user has any of the required permissions
-        for permission_string in required_permissions:
-            # Parse the permission string
-            try:
-                resource, action = permission_string.split(":")
-            except ValueError:
-                continue
-            
-            # Check if the user has this permission through any of their roles
-            for role in user.roles:
-                for permission in role.permissions:
-                    # Wildcard permission check
-                    if permission.resource == "*" and permission.action == "*":
-                        return user
-                    # Specific resource wildcard action
-                    if permission.resource == resource and permission.action == "*":
-                        return user
-                    # Wildcard resource specific action
-                    if permission.resource == "*" and permission.action == action:
-                        return user
-                    # Exact permission match
-                    if permission.resource == resource and permission.action == action:
-                        return user
+        granted = await get_user_permissions(db, user.id)
+        for resource, action in required:
+            if permission_granted(granted, resource, action):
+                return user
         
         # User doesn't have any of the required permissions
         raise HTTPException(
@@ -752,23 +910,57 @@ def create_audit_log(
     
     return audit_log
 
+# Ciphertext formats for encrypt_sensitive_data. Version 1 derives each value's key
+# with PBKDF2 from the application secret and the value's salt. Version 2 derives one
+# data key per deployment with PBKDF2 and each value's key from it with HKDF, so only
+# the first encryption in a process pays for PBKDF2; its ciphertexts carry a prefix.
+_PBKDF2_ITERATIONS = 100000
+_CIPHERTEXT_V2_PREFIX = "v2."
+_DATA_KEY_SALT = b"umt-data-encryption-key"
+_DATA_KEY_INFO = b"umt-field-encryption"
+
+
+@lru_cache(maxsize=1024)
+def _derive_salted_key(secret: bytes, salt: bytes) -> bytes:
+    """Run PBKDF2 over the secret; cached per salt, as it takes tens of milliseconds."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=_PBKDF2_ITERATIONS,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(secret))
+
+
 def _get_encryption_key(salt: Optional[bytes] = None) -> tuple[bytes, bytes]:
     """
-    Derive an encryption key from the application secret.
+    Derive a version 1 encryption key from the application secret.
     Returns tuple of (key, salt)
     """
     if salt is None:
         salt = os.urandom(16)
     
-    kdf = PBKDF2HMAC(
+    key = _derive_salted_key(settings.JWT_SECRET.encode(), salt)
+    return key, salt
+
+
+def _get_data_key() -> bytes:
+    """Get the deployment data key that version 2 value keys are derived from."""
+    return base64.urlsafe_b64decode(_derive_salted_key(settings.JWT_SECRET.encode(), _DATA_KEY_SALT))
+
+
+def _get_data_key_fernet(salt: bytes, data_key: Optional[bytes] = None) -> Fernet:
+    """Get the version 2 cipher for a value's salt, derived from the deployment data key."""
+    if data_key is None:
+        data_key = _get_data_key()
+    hkdf = HKDF(
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
-        iterations=100000,
+        info=_DATA_KEY_INFO,
     )
-    
-    key = base64.urlsafe_b64encode(kdf.derive(settings.JWT_SECRET.encode()))
-    return key, salt
+    return Fernet(base64.urlsafe_b64encode(hkdf.derive(data_key)))
+
 
 def encrypt_sensitive_data(data: str) -> tuple[str, str]:
     """
@@ -778,31 +970,80 @@ def encrypt_sensitive_data(data: str) -> tuple[str, str]:
     if not data:
         return ("", "")
     
-    key, salt = _get_encryption_key()
-    fernet = Fernet(key)
+    salt = os.urandom(16)
+    if settings.DATA_ENCRYPTION_FORMAT == 1:
+        # Readable by releases that predate version 2
+        key, _ = _get_encryption_key(salt)
+        fernet, prefix = Fernet(key), ""
+    else:
+        fernet, prefix = _get_data_key_fernet(salt), _CIPHERTEXT_V2_PREFIX
     encrypted_data = fernet.encrypt(data.encode())
     
     # Convert binary data to strings for database storage
-    encrypted_b64 = base64.urlsafe_b64encode(encrypted_data).decode()
+    encrypted_b64 = prefix + base64.urlsafe_b64encode(encrypted_data).decode()
     salt_b64 = base64.urlsafe_b64encode(salt).decode()
     
     return encrypted_b64, salt_b64
 
+
 def decrypt_sensitive_data(encrypted_b64: str, salt_b64: str) -> str:
-    """Decrypt sensitive data using Fernet symmetric encryption."""
+    """Decrypt sensitive data encrypted with either ciphertext format."""
     if not encrypted_b64 or not salt_b64:
         return ""
     
-    # Convert from base64 strings back to binary
-    encrypted_data = base64.urlsafe_b64decode(encrypted_b64.encode())
     salt = base64.urlsafe_b64decode(salt_b64.encode())
+    if encrypted_b64.startswith(_CIPHERTEXT_V2_PREFIX):
+        fernet = _get_data_key_fernet(salt)
+        encrypted_b64 = encrypted_b64[len(_CIPHERTEXT_V2_PREFIX):]
+    else:
+        key, _ = _get_encryption_key(salt)
+        fernet = Fernet(key)
     
-    key, _ = _get_encryption_key(salt)
-    fernet = Fernet(key)
+    # Convert from base64 strings back to binary
+    encrypted_data = base64.urlsafe_b64decode(encrypted_b64.encode())
     decrypted_data = fernet.decrypt(encrypted_data).decode()
     
     return decrypted_data
 
+
+def decrypt_many(
+    values: Iterable[Tuple[str, str]],
+    return_exceptions: bool = False
+) -> List[Union[str, Exception]]:
+    """
+    Decrypt many values encrypted with encrypt_sensitive_data, e.g. a page of records.
+    
+    Version 2 values share the data key, which is looked up once for the batch, so
+    each costs one HKDF on top of Fernet. Version 1 values each have their own salt
+    and need a PBKDF2 derivation unless their salt is in the cache, so they cost as
+    much here as decrypted one at a time.
+    
+    Args:
+        values: (encrypted_data, salt_b64) pairs
+        return_exceptions: Return the exception in place of a value that fails to
+            decrypt instead of raising it
+        
+    Returns:
+        Decrypted strings in input order
+    """
+    results: List[Union[str, Exception]] = []
+    data_key: Optional[bytes] = None
+    for encrypted_b64, salt_b64 in values:
+        try:
+            if encrypted_b64 and salt_b64 and encrypted_b64.startswith(_CIPHERTEXT_V2_PREFIX):
+                if data_key is None:
+                    data_key = _get_data_key()
+                fernet = _get_data_key_fernet(base64.urlsafe_b64decode(salt_b64.encode()), data_key)
+                encrypted_data = base64.urlsafe_b64decode(encrypted_b64[len(_CIPHERTEXT_V2_PREFIX):].encode())
+                results.append(fernet.decrypt(encrypted_data).decode())
+            else:
+                results.append(decrypt_sensitive_data(encrypted_b64, salt_b64))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
 def encrypt_data(data: Any) -> Dict[str, str]:
     """
     Encrypt data of various types and return encrypted data with salt.
@@ -78,8 +78,8 @@ class WebSocketBridge:
                 
             await manager.broadcast_to_room(room_id, event)
             
-        elif event_type == "content_generation_progress":
-            # Forward generation progress to user
+        elif event_type in ("content_generation_progress", "content_generation_chunk"):
+            # Forward generation progress and streamed text to user
             user_id = event.get("user_id")
             if not user_id:
                 return
@@ -193,6 +193,19 @@ class WebSocketBridge:
         }
         await self.queue_event(event)
     
+    async def notify_generation_chunk(self, user_id: str, task_id: str, text: str, sequence: int, done: bool = False):
+        """Send the next piece of streamed generation output to the user."""
+        event = {
+            "type": "content_generation_chunk",
+            "user_id": user_id,
+            "task_id": task_id,
+            "text": text,
+            "sequence": sequence,
+            "done": done,
+            "timestamp": datetime.now().isoformat()
+        }
+        await self.queue_event(event)
+    
     async def notify_ai_suggestion(self, content_id: str, suggestion_id: str, suggestion_text: str, suggestion_data: Dict[str, Any]):
         """Notify about an AI writing suggestion."""
         if content_id in self.content_rooms:
@@ -258,6 +271,10 @@ async def notify_generation_progress(user_id: str, task_id: str, progress: float
     """Notify about content generation progress."""
     await bridge.notify_generation_progress(user_id, task_id, progress, status, task_data)
 
+async def notify_generation_chunk(user_id: str, task_id: str, text: str, sequence: int, done: bool = False):
+    """Send the next piece of streamed generation output to the user."""
+    await bridge.notify_generation_chunk(user_id, task_id, text, sequence, done)
+
 async def notify_ai_suggestion(content_id: str, suggestion_id: str, suggestion_text: str, suggestion_data: Dict[str, Any]):
     """Notify about an AI writing suggestion."""
     await bridge.notify_ai_suggestion(content_id, suggestion_id, suggestion_text, suggestion_data)
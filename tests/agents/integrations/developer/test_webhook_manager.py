@@ -136,7 +136,7 @@ class TestWebhookManager:
         
         assert signature == expected_signature
 
-    @patch('src.agents.integrations.developer.webhook_manager.requests.post')
+    @patch('src.agents.integrations.developer.webhook_manager.http_client.post')
     def test_trigger_webhook_success(self, mock_post, webhook_manager, sample_webhook, sample_payload):
         """Test triggering a webhook successfully."""
         # Set up the mock response
@@ -173,7 +173,7 @@ class TestWebhookManager:
         # Check timeout
         assert call_args[1]["timeout"] == webhook_manager.default_timeout
 
-    @patch('src.agents.integrations.developer.webhook_manager.requests.post')
+    @patch('src.agents.integrations.developer.webhook_manager.http_client.post')
     def test_trigger_webhook_failure(self, mock_post, webhook_manager, sample_webhook, sample_payload):
         """Test triggering a webhook with a failure."""
         # Set up the mock response to simulate a failure
@@ -190,7 +190,7 @@ class TestWebhookManager:
         assert len(result["failures"]) == 1
         assert "Connection error" in result["failures"][0]["error"]
 
-    @patch('src.agents.integrations.developer.webhook_manager.requests.post')
+    @patch('src.agents.integrations.developer.webhook_manager.http_client.post')
     def test_trigger_webhook_with_retries(self, mock_post, webhook_manager, sample_webhook, sample_payload):
         """Test webhook retries on failure."""
         # First call fails, subsequent calls succeed
@@ -0,0 +1,87 @@
+"""Unit tests for the rolling AI latency tracker."""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from src.agents.integrations.ai_latency import LatencyTracker
+
+
+def make_tracker(latencies, failures=0, min_samples=10):
+    """Create a tracker with recorded successes for openai/gpt-4o, plus some failures."""
+    tracker = LatencyTracker(window_seconds=60, window_size=100, min_samples=min_samples)
+    for latency in latencies:
+        tracker.record("openai", "gpt-4o", latency, True)
+    for _ in range(failures):
+        tracker.record("openai", "gpt-4o", 0.01, False)
+    return tracker
+
+
+class TestLatencyTracker:
+    """Test suite for LatencyTracker."""
+
+    def test_percentiles_and_error_rate(self):
+        """Test nearest-rank percentiles over successes and the share of failures."""
+        tracker = make_tracker([i / 100 for i in range(1, 100)], failures=1)
+
+        stats = tracker.stats("openai", "gpt-4o")
+
+        assert stats.samples == 100
+        assert stats.p50 == pytest.approx(0.50)
+        assert stats.p95 == pytest.approx(0.95)
+        assert stats.error_rate == pytest.approx(0.01)
+
+    def test_lower_bounds_count_in_percentiles_only(self):
+        """Test that abandoned slow calls raise the tail without changing the error rate."""
+        tracker = make_tracker([0.1] * 9, failures=1)
+        for _ in range(10):
+            tracker.record_lower_bound("openai", "gpt-4o", 2.0)
+
+        stats = tracker.stats("openai", "gpt-4o")
+
+        assert stats.samples == 20
+        assert stats.p95 == pytest.approx(2.0)
+        assert stats.error_rate == pytest.approx(0.1)
+
+    def test_window_size_bounds_samples(self):
+        """Test that only the most recent window_size calls are kept."""
+        tracker = make_tracker([1.0] * 50 + [0.1] * 100)
+
+        assert tracker.stats("openai", "gpt-4o").p99 == pytest.approx(0.1)
+
+    def test_no_stats_below_min_samples(self):
+        """Test that cold models report nothing and are not hedged."""
+        tracker = make_tracker([0.5] * 9)
+
+        assert tracker.stats("openai", "gpt-4o") is None
+        assert tracker.hedge_delay("openai", "gpt-4o") is None
+
+    def test_old_calls_leave_the_window(self):
+        """Test that calls older than the window are dropped."""
+        with patch("src.agents.integrations.ai_latency.time.monotonic", return_value=1000.0):
+            tracker = make_tracker([0.5] * 10)
+        with patch("src.agents.integrations.ai_latency.time.monotonic", return_value=1061.0):
+            assert tracker.stats("openai", "gpt-4o") is None
+
+    def test_hedge_delay_uses_p95_with_floor(self):
+        """Test that the hedge delay follows p95 but never drops below the configured minimum."""
+        with patch("src.agents.integrations.ai_latency.settings") as settings:
+            settings.AI_HEDGE_MIN_DELAY_SECONDS = 1.0
+            assert make_tracker([2.0] * 20).hedge_delay("openai", "gpt-4o") == 2.0
+            assert make_tracker([0.2] * 20).hedge_delay("openai", "gpt-4o") == 1.0
+
+    def test_all_failures(self):
+        """Test that a model whose recent calls all failed reports full error rate."""
+        stats = make_tracker([], failures=10).stats("openai", "gpt-4o")
+
+        assert stats.error_rate == 1.0
+        assert stats.p95 == float("inf")
+
+    def test_status_is_json_serializable_when_all_calls_fail(self):
+        """Test that monitoring reports missing percentiles as None rather than infinity."""
+        status = make_tracker([], failures=10).get_status()["openai/gpt-4o"]
+
+        assert status["p95_ms"] is None
+        assert status["error_rate"] == 1.0
+        json.dumps(status, allow_nan=False)
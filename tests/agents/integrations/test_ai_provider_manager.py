@@ -0,0 +1,269 @@
+"""Unit tests for AIProviderManager."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.agents.integrations.ai_integration import AIRequestError
+from src.agents.integrations.ai_provider_manager import AIProviderManager, normalize_prompt_text
+from src.core.api_metrics import GENERATION_DEDUP_COUNTERS, metrics_service
+
+
+@pytest.fixture(autouse=True)
+def reset_dedup_counters():
+    """Start every test with empty dedup counters."""
+    GENERATION_DEDUP_COUNTERS.clear()
+    yield
+    GENERATION_DEDUP_COUNTERS.clear()
+
+
+@pytest.fixture
+def manager():
+    """Create a manager whose provider call takes a moment and a cache that always misses."""
+    with patch.object(AIProviderManager, "_load_config", return_value={}):
+        manager = AIProviderManager()
+
+    async def generate_uncached(*args):
+        await asyncio.sleep(0.05)
+        return {"content": f"generated for {args[0]}"}
+
+    manager._generate_uncached = AsyncMock(side_effect=generate_uncached)
+    return manager
+
+
+@pytest.fixture
+def cache_miss():
+    """Patch the shared cache so every lookup computes."""
+    async def get_or_compute(key, compute, **kwargs):
+        return await compute()
+
+    with patch("src.agents.integrations.ai_provider_manager.async_cache") as cache:
+        cache.get_or_compute = AsyncMock(side_effect=get_or_compute)
+        yield cache
+
+
+class TestNormalizePromptText:
+    """Tests for normalize_prompt_text."""
+
+    def test_collapses_whitespace(self):
+        """Test that spacing differences are ignored."""
+        assert normalize_prompt_text("  Write a\n\npost   about  shoes ") == "Write a post about shoes"
+
+    def test_sorts_embedded_json_keys(self):
+        """Test that the order of rendered variables does not matter."""
+        first = normalize_prompt_text('Context: {"tone": "warm", "audience": {"b": 1, "a": 2}}')
+        second = normalize_prompt_text('Context: {"audience": {"a": 2, "b": 1}, "tone": "warm"}')
+
+        assert first == second
+
+    def test_leaves_non_json_braces(self):
+        """Test that braces that are not JSON are kept as they are."""
+        assert normalize_prompt_text("Use {brand} and {\"x\": 1}") == 'Use {brand} and {"x": 1}'
+
+
+class TestRequestCoalescing:
+    """Tests for in-flight coalescing in generate_content."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self, manager, cache_miss):
+        """Test that identical concurrent requests make a single provider call."""
+        results = await asyncio.gather(*[manager.generate_content("Write a slogan") for _ in range(5)])
+
+        assert manager._generate_uncached.await_count == 1
+        assert all(result == {"content": "generated for Write a slogan"} for result in results)
+        metrics = await metrics_service.get_generation_dedup_metrics()
+        assert metrics["generated"] == 1
+        assert metrics["coalesced"] == 4
+        assert metrics["dedup_ratio"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_normalized_prompts_are_coalesced(self, manager, cache_miss):
+        """Test that prompts differing only in whitespace share a call when normalized."""
+        await asyncio.gather(
+            manager.generate_content("Write  a slogan", normalize_prompt=True),
+            manager.generate_content("Write a\nslogan ", normalize_prompt=True)
+        )
+
+        assert manager._generate_uncached.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_fail_followers(self, manager, cache_miss):
+        """Test that cancelling the first caller leaves the shared call running."""
+        leader = asyncio.ensure_future(manager.generate_content("Write a slogan"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(manager.generate_content("Write a slogan"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert (await follower)["content"] == "generated for Write a slogan"
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_counted(self, manager):
+        """Test that requests served from the cache are counted as hits."""
+        with patch("src.agents.integrations.ai_provider_manager.async_cache") as cache:
+            cache.get_or_compute = AsyncMock(return_value={"content": "cached"})
+            result = await manager.generate_content("Write a slogan")
+
+        assert result == {"content": "cached"}
+        manager._generate_uncached.assert_not_awaited()
+        assert (await metrics_service.get_generation_dedup_metrics())["cache_hits"] == 1
+
+
+class TestGenerateContentStream:
+    """Tests for generate_content_stream."""
+
+    @staticmethod
+    def stream_from(*texts, error=None):
+        """Create a stream_text_completion replacement yielding texts, then done or an error."""
+        async def stream_text_completion(provider, model, **kwargs):
+            for text in texts:
+                yield {"type": "token", "text": text}
+            if error:
+                raise error
+            yield {"type": "done", "response": {"text": "".join(texts), "usage": {}}}
+        return stream_text_completion
+
+    @pytest.fixture
+    def routed_manager(self, manager):
+        """A manager routed to openai with anthropic as its fallback."""
+        manager._select_provider_and_model = AsyncMock(return_value=("openai", "gpt-4"))
+        manager.service_routing = {"openai": {"fallback_providers": ["anthropic"]}}
+        manager._get_best_model_for_provider = lambda provider: "claude-3-haiku"
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_yields_tokens_then_response(self, routed_manager, cache_miss):
+        """Test that text arrives as tokens before the final response, which is cached."""
+        cache_miss.get_computed = AsyncMock(return_value=None)
+        with patch("src.agents.integrations.ai_provider_manager.ai_client") as client:
+            client.stream_text_completion = self.stream_from("Hello", " world")
+            events = [event async for event in routed_manager.generate_content_stream("Greet")]
+
+        assert [event["text"] for event in events[:-1]] == ["Hello", " world"]
+        assert events[-1]["type"] == "done"
+        assert events[-1]["response"]["text"] == "Hello world"
+        assert events[-1]["response"]["provider"] == "openai"
+        cache_miss.get_or_compute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_only_before_first_token(self, routed_manager, cache_miss):
+        """Test that a provider failing before any output is replaced by a fallback."""
+        cache_miss.get_computed = AsyncMock(return_value=None)
+        streams = {
+            "openai": self.stream_from(error=RuntimeError("connection reset")),
+            "anthropic": self.stream_from("Hi")
+        }
+        with patch("src.agents.integrations.ai_provider_manager.ai_client") as client:
+            client.stream_text_completion = lambda provider, model, **kwargs: streams[provider](provider, model)
+            events = [event async for event in routed_manager.generate_content_stream("Greet")]
+
+        assert events[-1]["response"]["provider"] == "anthropic"
+        assert routed_manager.fallback_counter == 1
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_failure_is_not_retried(self, routed_manager, cache_miss):
+        """Test that a failure after text was sent raises instead of switching provider."""
+        cache_miss.get_computed = AsyncMock(return_value=None)
+        with patch("src.agents.integrations.ai_provider_manager.ai_client") as client:
+            client.stream_text_completion = self.stream_from("Hel", error=RuntimeError("connection reset"))
+            events = []
+            with pytest.raises(AIRequestError):
+                async for event in routed_manager.generate_content_stream("Greet"):
+                    events.append(event)
+
+        assert events == [{"type": "token", "text": "Hel"}]
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_one_token(self, routed_manager, cache_miss):
+        """Test that a cached result is sent at once without calling a provider."""
+        cache_miss.get_computed = AsyncMock(return_value={"text": "cached"})
+        events = [event async for event in routed_manager.generate_content_stream("Greet")]
+
+        assert events == [{"type": "token", "text": "cached"}, {"type": "done", "response": {"text": "cached"}}]
+        routed_manager._select_provider_and_model.assert_not_awaited()
+
+
+class TestLatencyAwareRouting:
+    """Tests for latency-aware routing and hedged requests."""
+
+    @pytest.fixture
+    def hedging_manager(self, manager):
+        """A manager whose openai model has a p95 of 0.05s, with anthropic as its fallback."""
+        manager.service_routing = {"openai": {"fallback_providers": ["anthropic"]}}
+        manager._get_best_model_for_provider = lambda provider: "claude-3-haiku"
+        for _ in range(20):
+            manager.latency_tracker.record("openai", "gpt-4", 0.05, True)
+        return manager
+
+    @staticmethod
+    def client_with_delays(delays):
+        """Create an ai_client whose completions take a per-provider delay."""
+        async def get_text_completion(provider, model, **kwargs):
+            await asyncio.sleep(delays[provider])
+            return {"text": provider, "provider": provider, "model": model}
+        return get_text_completion
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self, hedging_manager):
+        """Test that a call outlasting its p95 is raced by the fallback, which wins."""
+        with patch("src.agents.integrations.ai_provider_manager.ai_client") as client, \
+                patch("src.agents.integrations.ai_latency.settings") as settings:
+            settings.AI_HEDGE_MIN_DELAY_SECONDS = 0.01
+            client.get_text_completion = self.client_with_delays({"openai": 5, "anthropic": 0.01})
+            response = await hedging_manager._generate_with_fallback(
+                "openai", "gpt-4", "Greet", None, {"hedge": True}
+            )
+
+        assert response["provider"] == "anthropic"
+        assert hedging_manager.hedge_stats == {"fired": 1, "won": 1}
+        # The cancelled primary counts as a slow call once its cancellation runs, not as a success
+        await asyncio.sleep(0)
+        stats = hedging_manager.latency_tracker.stats("openai", "gpt-4")
+        assert stats.p99 > 0.05
+        assert stats.samples == 21
+        assert stats.error_rate == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_before_hedge_delay_is_not_recorded(self, hedging_manager):
+        """Test that a call cancelled by its caller leaves no latency sample."""
+        with patch("src.agents.integrations.ai_provider_manager.ai_client") as client:
+            client.get_text_completion = self.client_with_delays({"openai": 5})
+            call = asyncio.ensure_future(hedging_manager._call_model("openai", "gpt-4", "Greet", {}))
+            await asyncio.sleep(0.01)
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+
+        assert hedging_manager.latency_tracker.stats("openai", "gpt-4").samples == 20
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, hedging_manager):
+        """Test that calls finishing within p95 never reach a second provider."""
+        with patch("src.agents.integrations.ai_provider_manager.ai_client") as client, \
+                patch("src.agents.integrations.ai_latency.settings") as settings:
+            settings.AI_HEDGE_MIN_DELAY_SECONDS = 0.01
+            client.get_text_completion = self.client_with_delays({"openai": 0.01, "anthropic": 0.01})
+            response = await hedging_manager._generate_with_fallback(
+                "openai", "gpt-4", "Greet", None, {"hedge": True}
+            )
+
+        assert response["provider"] == "openai"
+        assert hedging_manager.hedge_stats["fired"] == 0
+
+    def test_slow_and_failing_models_are_scored_down(self, manager):
+        """Test that recent latency and errors lower an otherwise equal candidate."""
+        for _ in range(20):
+            manager.latency_tracker.record("openai", "gpt-4", 4.0, True)
+            manager.latency_tracker.record("anthropic", "claude-3-haiku", 1.0, True)
+        manager.latency_tracker.record("openai", "gpt-4", 0.1, False)
+        candidates = [
+            {"provider": "openai", "model": "gpt-4", "score": 5},
+            {"provider": "anthropic", "model": "claude-3-haiku", "score": 5}
+        ]
+
+        manager._apply_latency_scores(candidates)
+
+        assert candidates[1]["score"] == 5
+        assert candidates[0]["score"] == pytest.approx(5 - 5 / 21 - 2)
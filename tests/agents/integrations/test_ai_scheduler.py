@@ -0,0 +1,163 @@
+"""Unit tests for the AI request scheduler."""
+
+import asyncio
+
+import pytest
+
+from src.agents.integrations.ai_scheduler import AIRequestScheduler, RequestPriority, TokenBucket
+
+
+def make_scheduler(requests_per_minute=60, tokens_per_minute=60000, burst_seconds=1, interactive_weight=2):
+    """Create a scheduler for one provider with two models and small buckets."""
+    config = {
+        "openai": {
+            "rate_limits": {
+                "requests_per_minute": requests_per_minute,
+                "tokens_per_minute": tokens_per_minute
+            },
+            "models": [{"name": "gpt-4o"}, {"name": "gpt-4o-mini"}]
+        }
+    }
+    return AIRequestScheduler(config, burst_seconds=burst_seconds, interactive_weight=interactive_weight)
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_wait_time_after_consume(self):
+        """Test that an empty bucket reports the time until it refills."""
+        bucket = TokenBucket(per_minute=60, burst_seconds=2)
+        assert bucket.capacity == 2
+        assert bucket.wait_time(2) == 0
+
+        bucket.consume(2)
+        assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.05)
+
+    def test_oversized_request_only_waits_for_full_bucket(self):
+        """Test that a request larger than the bucket is not blocked forever."""
+        bucket = TokenBucket(per_minute=60, burst_seconds=1)
+        assert bucket.wait_time(1000) == 0
+
+
+class TestAIRequestScheduler:
+    """Test suite for AIRequestScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_admits_immediately_with_capacity(self):
+        """Test that a request is admitted without queueing when buckets have room."""
+        scheduler = make_scheduler()
+        admission = await scheduler.acquire("openai", "gpt-4o", 100)
+
+        assert admission.waited == 0
+        assert scheduler.get_status()["openai"]["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queued_request_waits_for_refill(self):
+        """Test that a request over the limit waits instead of failing."""
+        scheduler = make_scheduler(requests_per_minute=600, burst_seconds=0.1)
+        await scheduler.acquire("openai", "gpt-4o", 10)
+
+        admission = await scheduler.acquire("openai", "gpt-4o", 10, timeout=1)
+
+        assert admission.waited > 0.05
+
+    @pytest.mark.asyncio
+    async def test_timeout_leaves_queue(self):
+        """Test that a request that cannot be admitted in time raises and is dropped."""
+        scheduler = make_scheduler(requests_per_minute=1)
+        await scheduler.acquire("openai", "gpt-4o", 10)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await scheduler.acquire("openai", "gpt-4o", 10, timeout=0.05)
+
+        await asyncio.sleep(0)
+        assert "queued" not in scheduler.get_status()["openai"]
+
+    @pytest.mark.asyncio
+    async def test_bypass_queue_borrows_capacity(self):
+        """Test that urgent requests are admitted at once and push the bucket into debt."""
+        scheduler = make_scheduler(requests_per_minute=1)
+        await scheduler.acquire("openai", "gpt-4o", 10)
+
+        admission = await scheduler.acquire("openai", "gpt-4o", 10, bypass_queue=True)
+
+        assert admission.waited == 0
+        assert scheduler.get_status()["openai"]["requests"] < 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_served_before_batch(self):
+        """Test priority lanes, weighted so batch work still gets a share, and brand round-robin."""
+        scheduler = make_scheduler(requests_per_minute=6000, burst_seconds=0.01)
+        await scheduler.acquire("openai", "gpt-4o", 1)
+        order = []
+
+        async def request(name, priority, brand):
+            await scheduler.acquire("openai", "gpt-4o", 1, priority=priority, brand_id=brand, timeout=2)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(request("batch-a1", RequestPriority.BATCH, "a")),
+            asyncio.create_task(request("batch-a2", RequestPriority.BATCH, "a")),
+            asyncio.create_task(request("batch-b1", "batch", "b")),
+        ]
+        await asyncio.sleep(0)
+        tasks += [
+            asyncio.create_task(request(f"interactive-{i}", RequestPriority.INTERACTIVE, "c"))
+            for i in range(3)
+        ]
+        await asyncio.gather(*tasks)
+
+        assert order == [
+            "interactive-0", "interactive-1", "batch-a1",
+            "interactive-2", "batch-b1", "batch-a2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_models_sharing_provider_buckets_queue_together(self):
+        """Test that a request on another model cannot jump ahead of one already waiting."""
+        scheduler = make_scheduler(requests_per_minute=6000, burst_seconds=0.01)
+        await scheduler.acquire("openai", "gpt-4o", 1)
+        order = []
+
+        async def request(name, model, priority):
+            await scheduler.acquire("openai", model, 1, priority=priority, timeout=2)
+            order.append(name)
+
+        waiting = asyncio.create_task(request("gpt-4o", "gpt-4o", RequestPriority.INTERACTIVE))
+        await asyncio.sleep(0)
+        assert scheduler.get_status()["openai"]["queued"] == 1
+
+        await asyncio.gather(waiting, request("gpt-4o-mini", "gpt-4o-mini", RequestPriority.BATCH))
+
+        assert order == ["gpt-4o", "gpt-4o-mini"]
+
+    @pytest.mark.asyncio
+    async def test_settle_refunds_unused_tokens(self):
+        """Test that settling with the real usage corrects the token bucket."""
+        scheduler = make_scheduler(tokens_per_minute=60000)
+        admission = await scheduler.acquire("openai", "gpt-4o", 800)
+        assert scheduler.get_status()["openai"]["tokens"] == pytest.approx(200, abs=5)
+
+        scheduler.settle(admission, 300)
+
+        assert scheduler.get_status()["openai"]["tokens"] == pytest.approx(700, abs=5)
+
+    def test_set_token_rate(self):
+        """Test that adaptive rate limiting can change a provider's token rate."""
+        scheduler = make_scheduler(tokens_per_minute=60000)
+        scheduler.set_token_rate("openai", 30000)
+
+        assert scheduler.token_rate("openai") == 30000
+        assert scheduler.token_rate("anthropic") == float("inf")
+
+    def test_queues_work_across_event_loops(self):
+        """Test that a scheduler can queue requests in successive event loops."""
+        scheduler = make_scheduler(requests_per_minute=600, burst_seconds=0.1)
+
+        async def queued_request():
+            await scheduler.acquire("openai", "gpt-4o", 10)
+            return await scheduler.acquire("openai", "gpt-4o", 10, timeout=1)
+
+        for _ in range(2):
+            assert asyncio.run(queued_request()).waited > 0
+        assert len(scheduler._queues) == 1
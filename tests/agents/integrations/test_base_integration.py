@@ -122,4 +122,24 @@ class TestIntegration:
     def test_platform_name_lowercased(self):
         """Test that platform name is converted to lowercase."""
         integration = Integration("TeST_PlAtFoRm", {})
-        assert integration.platform == "test_platform"
\ No newline at end of file
+        assert integration.platform == "test_platform"
+    @pytest.mark.asyncio
+    async def test_run_blocking_uses_io_pool(self, integration):
+        """Test that blocking calls run in the integration I/O threads, not the event loop."""
+        import threading
+
+        def blocking_call(value, suffix=""):
+            return threading.current_thread().name, f"{value}{suffix}"
+
+        thread_name, result = await integration.run_blocking(blocking_call, "post", suffix="-ok")
+
+        assert thread_name.startswith("integration-io")
+        assert result == "post-ok"
+
+    @pytest.mark.asyncio
+    async def test_check_health_async(self, mock_integration):
+        """Test that the async health check delegates to check_health."""
+        result = await mock_integration.check_health_async()
+
+        assert result == {"status": "healthy"}
+        mock_integration.check_health.assert_called_once_with()
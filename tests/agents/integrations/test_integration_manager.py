@@ -0,0 +1,142 @@
+"""Unit tests for the IntegrationManager fan-out."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.agents.integrations.integration_manager import IntegrationManager
+
+
+def make_integration(delay=0.0, result=None, error=None):
+    """Create a social integration mock whose async post takes delay seconds."""
+    async def post_content_async(content_data):
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result or {"status": "success"}
+
+    async def check_health_async():
+        await asyncio.sleep(delay)
+        return result or {"status": "healthy", "response_time_ms": 5}
+
+    integration = MagicMock()
+    integration.post_content_async = post_content_async
+    integration.check_health_async = check_health_async
+    return integration
+
+
+class TestIntegrationManager:
+    """Test suite for IntegrationManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a manager with short timeouts."""
+        return IntegrationManager(max_concurrency=4, platform_timeout=0.5, health_check_timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_publish_runs_platforms_concurrently(self, manager):
+        """Test that publishing takes as long as the slowest platform, not the sum."""
+        integrations = {platform: make_integration(delay=0.1) for platform in ("facebook", "twitter", "linkedin")}
+        manager.get_social_integration = AsyncMock(side_effect=lambda brand_id, platform: integrations[platform])
+
+        start = time.perf_counter()
+        results = await manager.publish_to_social(1, ["facebook", "twitter", "linkedin"], {"text": "hi"})
+
+        assert time.perf_counter() - start < 0.25
+        assert list(results) == ["facebook", "twitter", "linkedin"]
+        assert all(result["status"] == "success" for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_publish_isolates_failures_and_timeouts(self, manager):
+        """Test that a slow, failing or unconfigured platform does not affect the others."""
+        integrations = {
+            "facebook": make_integration(),
+            "twitter": make_integration(delay=5),
+            "linkedin": make_integration(error=RuntimeError("API down")),
+            "pinterest": None
+        }
+        manager.get_social_integration = AsyncMock(side_effect=lambda brand_id, platform: integrations[platform])
+
+        results = await manager.publish_to_social(1, list(integrations), {"text": "hi"})
+
+        assert results["facebook"]["status"] == "success"
+        assert results["twitter"]["status"] == "error"
+        assert "Timed out" in results["twitter"]["error"]
+        assert results["linkedin"]["error"] == "API down"
+        assert results["pinterest"]["error"] == "No integration available for pinterest"
+
+    @pytest.mark.asyncio
+    async def test_iter_publish_streams_in_completion_order(self, manager):
+        """Test that results are yielded as soon as each platform finishes."""
+        integrations = {"slow": make_integration(delay=0.1), "fast": make_integration()}
+        manager.get_social_integration = AsyncMock(side_effect=lambda brand_id, platform: integrations[platform])
+
+        order = [platform async for platform, _ in manager.iter_publish_to_social(1, ["slow", "fast"], {})]
+
+        assert order == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency platform calls run at once."""
+        manager = IntegrationManager(max_concurrency=2, platform_timeout=1)
+        in_flight = peak = 0
+
+        async def post_content_async(content_data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return {"status": "success"}
+
+        integration = MagicMock(post_content_async=post_content_async)
+        manager.get_social_integration = AsyncMock(return_value=integration)
+
+        await manager.publish_to_social(1, [f"platform-{i}" for i in range(6)], {})
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check_writes_one_batch(self, manager):
+        """Test that every account is checked and the results are stored in one write."""
+        manager._load_brand_accounts = MagicMock(return_value=[
+            ("social", 1, "facebook"), ("social", 2, "twitter"), ("cms", 3, "wordpress")
+        ])
+        manager._write_health_results = MagicMock()
+        manager.get_social_integration = AsyncMock(side_effect=lambda brand_id, platform: (
+            make_integration(delay=5) if platform == "twitter" else make_integration()
+        ))
+        manager.get_cms_integration = AsyncMock(return_value=make_integration())
+
+        results = await manager.check_all_integrations_health(1)
+
+        assert results["social"]["facebook"]["status"] == "healthy"
+        assert results["social"]["twitter"]["status"] == "unhealthy"
+        assert results["cms"]["wordpress"]["status"] == "healthy"
+        manager._write_health_results.assert_called_once()
+        checked = manager._write_health_results.call_args.args[0]
+        assert sorted((kind, account_id) for kind, account_id, _ in checked) == [
+            ("cms", 3), ("social", 1), ("social", 2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_health_check_database_calls_use_io_pool(self, manager):
+        """Test that the account load and results write run on the integration I/O pool."""
+        threads = []
+        manager._load_brand_accounts = MagicMock(
+            side_effect=lambda brand_id: threads.append(threading.current_thread().name) or [
+                ("social", 1, "facebook")
+            ]
+        )
+        manager._write_health_results = MagicMock(
+            side_effect=lambda checked: threads.append(threading.current_thread().name)
+        )
+        manager.get_social_integration = AsyncMock(return_value=make_integration())
+
+        await manager.check_all_integrations_health(1)
+
+        assert len(threads) == 2
+        assert all(name.startswith("integration-io") for name in threads)
@@ -0,0 +1,255 @@
+"""Unit tests for prompt template rendering and analytics."""
+
+import json
+import os
+import time
+
+import pytest
+import yaml
+from unittest.mock import patch
+
+from src.agents.integrations.prompt_manager import (
+    FCNTL_AVAILABLE, CompiledText, PromptAnalytics, PromptManager, PromptTemplate
+)
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    """Write a template file and return its path."""
+    path = tmp_path / "campaign_email.yaml"
+    path.write_text(yaml.dump({
+        "system_prompt": "You write for {{brand.name}}.",
+        "template": "Write to {{ name }} about {{product}} in a {{brand.tone}} tone. {{missing}}",
+        "response_format": "Plain text"
+    }))
+    return str(path)
+
+
+class TestCompiledText:
+    """Tests for CompiledText."""
+
+    def test_substitutes_simple_and_nested_variables(self):
+        """Test that simple and dotted placeholders are resolved."""
+        compiled = CompiledText("Hi {{ name }}, from {{brand.name}}!")
+
+        assert compiled.render({"name": "Ana", "brand": {"name": "Acme"}}) == "Hi Ana, from Acme!"
+
+    def test_keeps_unresolved_placeholders(self):
+        """Test that missing variables and broken paths leave the placeholder as written."""
+        compiled = CompiledText("{{ a }} {{b.c}} {{d.e}}")
+
+        assert compiled.render({"b": {"x": 1}, "d": "text"}) == "{{ a }} {{b.c}} {{d.e}}"
+
+    def test_text_without_placeholders(self):
+        """Test that literal text renders unchanged."""
+        assert CompiledText("No {variables} here").render({}) == "No {variables} here"
+
+
+class TestPromptTemplate:
+    """Tests for PromptTemplate rendering."""
+
+    def test_render(self, template_path):
+        """Test that all parts of the template are rendered."""
+        template = PromptTemplate(template_path)
+
+        rendered = template.render({
+            "name": "Ana", "product": "shoes", "brand": {"name": "Acme", "tone": "warm"}
+        })
+
+        assert rendered == {
+            "system_prompt": "You write for Acme.",
+            "user_prompt": "Write to Ana about shoes in a warm tone. {{missing}}",
+            "response_format": "Plain text"
+        }
+
+    def test_render_many_matches_render(self, template_path):
+        """Test that bulk rendering gives the same prompts as rendering one by one."""
+        template = PromptTemplate(template_path)
+        variable_sets = [
+            {"name": f"user{i}", "product": "shoes", "brand": {"name": "Acme", "tone": "warm"}}
+            for i in range(50)
+        ]
+
+        assert template.render_many(variable_sets) == [template.render(v) for v in variable_sets]
+
+    def test_render_many_with_shared_system_variables(self, template_path):
+        """Test that shared system prompt variables apply to every prompt."""
+        template = PromptTemplate(template_path)
+
+        rendered = template.render_many([{"name": "A"}, {"name": "B"}], {"brand": {"name": "Acme"}})
+
+        assert [r["system_prompt"] for r in rendered] == ["You write for Acme."] * 2
+        assert rendered[1]["user_prompt"].startswith("Write to B about")
+
+    def test_compiled_texts_follow_version_changes(self, template_path):
+        """Test that loading another version or reloading does not render stale text."""
+        template = PromptTemplate(template_path)
+        template.render({"name": "Ana"})
+        original_version = template.save_version("Initial")
+
+        template.template = "Hello {{name}}"
+        assert template.render({"name": "Ana"})["user_prompt"] == "Hello Ana"
+
+        assert template.load_version(original_version)
+        assert template.render({"name": "Ana"})["user_prompt"].startswith("Write to Ana")
+
+        template.template = "Edited in memory {{name}}"
+        template.reload()
+        assert template.render({"name": "Ana"})["user_prompt"].startswith("Write to Ana")
+
+
+class TestPromptManager:
+    """Tests for PromptManager.render_many."""
+
+    def test_render_many(self, template_path, tmp_path):
+        """Test rendering many variable sets by template ID."""
+        manager = PromptManager(str(tmp_path))
+
+        rendered = manager.render_many("campaign_email", [{"name": "A"}, {"name": "B"}])
+
+        assert [r["user_prompt"][:10] for r in rendered] == ["Write to A", "Write to B"]
+        with pytest.raises(ValueError):
+            manager.render_many("unknown", [{}])
+
+
+class TestPromptAnalytics:
+    """Tests for buffered, aggregated PromptAnalytics storage."""
+
+    @pytest.fixture
+    def analytics(self, tmp_path):
+        """Create analytics that flush every three records."""
+        return PromptAnalytics(str(tmp_path), flush_records=3, flush_seconds=3600,
+                               segment_bytes=1 << 20, compact_segments=100)
+
+    def test_records_are_buffered_then_aggregated(self, analytics, tmp_path):
+        """Test that usage is written in batches and averaged per template and version."""
+        analytics.record_usage("email", "v1", "gpt-4", {}, {"conversion_rate": 0.1, "model": "gpt-4"})
+        analytics.record_usage("email", "v2", "gpt-4", {}, {"conversion_rate": 0.3})
+
+        assert not os.listdir(tmp_path / "aggregates")
+        # Unflushed records are still reported
+        assert analytics.get_template_performance("email")["usage_count"] == 2
+
+        analytics.record_usage("email", "v2", "gpt-4", {}, {"conversion_rate": 0.5})
+
+        performance = analytics.get_template_performance("email")
+        assert performance["usage_count"] == 3
+        assert performance["performance"] == {"conversion_rate": pytest.approx(0.3)}
+        assert analytics.get_version_performance("email", "v2") == {
+            "usage_count": 2, "performance": {"conversion_rate": pytest.approx(0.4)}
+        }
+        segments = os.listdir(tmp_path / "usage" / "segments")
+        assert len(segments) == 1
+        with open(tmp_path / "usage" / "segments" / segments[0]) as f:
+            assert [json.loads(line)["version_id"] for line in f] == ["v1", "v2", "v2"]
+
+    def test_seeds_from_legacy_metrics_file(self, analytics, tmp_path):
+        """Test that averages from the old per-template metrics file are carried over."""
+        (tmp_path / "email_metrics.json").write_text(json.dumps({
+            "usage_count": 4,
+            "versions": {"v1": {"usage_count": 4, "performance": {"user_rating": 3.0}}},
+            "performance": {"user_rating": 3.0}
+        }))
+
+        analytics.record_usage("email", "v1", "gpt-4", {}, {"user_rating": 4.0})
+        analytics.flush()
+
+        performance = analytics.get_template_performance("email")
+        assert performance["usage_count"] == 5
+        assert performance["performance"]["user_rating"] == pytest.approx(3.2)
+
+    def test_concurrent_writers_do_not_lose_updates(self, tmp_path):
+        """Test that two writers sharing a directory both land in the aggregate."""
+        writers = [PromptAnalytics(str(tmp_path), flush_records=1000, flush_seconds=3600) for _ in range(2)]
+        for i in range(10):
+            writers[i % 2].record_usage("email", "v1", "gpt-4", {}, {"engagement_rate": 0.5})
+        for writer in writers:
+            writer.flush()
+
+        assert writers[0].get_template_performance("email")["usage_count"] == 10
+        assert len(os.listdir(tmp_path / "usage" / "segments")) == 2
+
+    def test_failed_flush_retries_without_double_counting(self, analytics, tmp_path):
+        """Test that a flush failing on one template only retries what was not written."""
+        analytics.record_usage("email", "v1", "gpt-4", {}, {"engagement_rate": 0.5})
+        analytics.record_usage("social", "v1", "gpt-4", {}, {"engagement_rate": 0.5})
+        merge = analytics._merge_into_aggregate
+
+        def fail_for_social(template_id, delta):
+            if template_id == "social":
+                raise OSError("disk full")
+            merge(template_id, delta)
+
+        with patch.object(analytics, "_merge_into_aggregate", side_effect=fail_for_social):
+            analytics.flush()
+        analytics.flush()
+
+        assert analytics.get_template_performance("email")["usage_count"] == 1
+        assert analytics.get_template_performance("social")["usage_count"] == 1
+        segments = os.listdir(tmp_path / "usage" / "segments")
+        with open(tmp_path / "usage" / "segments" / segments[0]) as f:
+            assert len(f.readlines()) == 2
+
+    def test_suggestions_are_cached_until_aggregate_changes(self, analytics):
+        """Test that suggestions are recomputed only when new usage is flushed."""
+        for _ in range(3):
+            analytics.record_usage("email", "v1", "gpt-4", {}, {"conversion_rate": 0.0, "engagement_rate": 0.5})
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            calls = []
+            build = PromptAnalytics._build_suggestions
+            monkeypatch.setattr(PromptAnalytics, "_build_suggestions",
+                                staticmethod(lambda metrics: calls.append(1) or build(metrics)))
+            first = analytics.get_improvement_suggestions("email")
+            second = analytics.get_improvement_suggestions("email")
+
+        assert [s["type"] for s in first] == ["low_conversion"]
+        assert second == first
+        assert len(calls) == 1
+
+    def test_compaction_merges_sealed_segments_by_month(self, tmp_path):
+        """Test that full segments are sealed and compacted into monthly logs."""
+        analytics = PromptAnalytics(str(tmp_path), flush_records=1, flush_seconds=3600,
+                                    segment_bytes=1, compact_segments=2)
+        for _ in range(3):
+            analytics.record_usage("email", "v1", "gpt-4", {}, {"conversion_rate": 0.1})
+
+        usage_dir = tmp_path / "usage"
+        monthly_logs = [name for name in os.listdir(usage_dir) if name.endswith(".jsonl")]
+        assert len(monthly_logs) == 1
+        with open(usage_dir / monthly_logs[0]) as f:
+            assert len(f.readlines()) == 2
+        assert len(os.listdir(usage_dir / "segments")) == 1
+        assert analytics.compact() == 1
+        assert analytics.get_template_performance("email")["usage_count"] == 3
+
+    def test_idle_buffer_is_flushed_on_time(self, tmp_path):
+        """Test that buffered records are flushed after flush_seconds without further usage."""
+        analytics = PromptAnalytics(str(tmp_path), flush_records=100, flush_seconds=0.05)
+        analytics.record_usage("email", "v1", "gpt-4", {}, {"conversion_rate": 0.1})
+
+        aggregate_path = tmp_path / "aggregates" / "email.json"
+        deadline = time.monotonic() + 5
+        while not aggregate_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert aggregate_path.exists()
+        assert analytics._flush_timer is None
+
+    @pytest.mark.skipif(not FCNTL_AVAILABLE, reason="segment locks need fcntl")
+    def test_compaction_skips_live_active_segments(self, tmp_path):
+        """Test that another writer's idle active segment is kept and an abandoned one compacted."""
+        writer = PromptAnalytics(str(tmp_path), flush_records=1, flush_seconds=3600)
+        writer.record_usage("email", "v1", "gpt-4", {}, {"conversion_rate": 0.1})
+        segments_dir = tmp_path / "usage" / "segments"
+        (live,) = os.listdir(segments_dir)
+        os.utime(segments_dir / live, (0, 0))
+
+        # Left behind by a process that stopped without sealing it
+        with open(segments_dir / "abandoned.active.jsonl", "w") as f:
+            f.write(json.dumps({"timestamp": "2024-01-02T00:00:00"}) + "\n")
+
+        compactor = PromptAnalytics(str(tmp_path), flush_records=1, flush_seconds=3600)
+        assert compactor.compact() == 1
+        assert os.listdir(segments_dir) == [live]
+        assert os.path.exists(tmp_path / "usage" / "2024-01.jsonl")
@@ -15,13 +15,13 @@ class TestAgent(BaseAgent):
 
 @pytest.fixture
 def mock_rabbitmq():
-    with patch('src.core.messaging.RabbitMQClient') as mock:
+    with patch('src.agents.base_agent.RabbitMQClient') as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_redis():
-    with patch('src.core.cache.RedisCache') as mock:
+    with patch('src.agents.base_agent.RedisCache') as mock:
         yield mock
 
 
@@ -112,13 +112,18 @@ class TestBaseAgent:
         task_message = {
             "task_id": "123",
             "task_type": "test_task",
-            "data": {"key": "value"}
+            "data": {"key": "value"},
+            "response_queue": "response_queue"
         }
         
-        result = test_agent.handle_task(task_message)
+        # The error is replied and re-raised so the consumer retries or dead-letters it
+        with pytest.raises(ValueError, match="Test error"):
+            test_agent.handle_task(task_message)
         
-        assert result["status"] == "error"
-        assert "Test error" in result["error"]
+        reply = test_agent.mq_client.publish_direct.call_args[0]
+        assert reply[0] == "response_queue"
+        assert reply[1]["status"] == "error"
+        assert "Test error" in reply[1]["error"]
         
     def test_handle_event_with_handler(self, test_agent):
         """Test handling an event with a registered handler."""
@@ -184,14 +189,30 @@ class TestBaseAgent:
         """Test starting the agent."""
         # Mock methods to avoid actual RabbitMQ interaction
         test_agent.mq_client.declare_queue = MagicMock()
+        test_agent.mq_client.declare_exchange = MagicMock()
         test_agent.mq_client.consume = MagicMock()
         
         test_agent.start()
         
         test_agent.mq_client.declare_queue.assert_called_once_with("test_agent_queue")
+        test_agent.mq_client.declare_exchange.assert_called_once_with("events")
         test_agent.mq_client.consume.assert_called_once()
         assert test_agent.is_running is True
         
+    def test_start_with_concurrency(self, test_agent):
+        """Test starting the agent with a worker pool and per-type limits."""
+        test_agent.mq_client.declare_queue = MagicMock()
+        test_agent.mq_client.declare_exchange = MagicMock()
+        test_agent.mq_client.consume = MagicMock()
+        test_agent.register_task_handler("slow_task", MagicMock(), max_concurrency=2)
+        
+        test_agent.start(prefetch_count=20, max_concurrency=8)
+        
+        kwargs = test_agent.mq_client.consume.call_args[1]
+        assert kwargs["prefetch_count"] == 20
+        assert kwargs["max_workers"] == 8
+        assert kwargs["concurrency_limits"] == {"slow_task": 2}
+        
     def test_start_already_running(self, test_agent):
         """Test starting an already running agent."""
         test_agent.is_running = True
@@ -248,4 +269,27 @@ class TestBaseAgent:
         assert call_args[1] == "broadcast"
         assert call_args[2]["event_id"] == "test-uuid"
         assert call_args[2]["sender_agent_id"] == "test_agent"
-        assert call_args[2]["event_type"] == "test_event"
\ No newline at end of file
+        assert call_args[2]["event_type"] == "test_event"
+        
+    def test_send_task_waits_on_shared_reply_queue(self, test_agent):
+        """Test that waiting sends go through the agent's RPC client."""
+        test_agent.mq_client = MagicMock()
+        test_agent.rpc_client = MagicMock()
+        test_agent.rpc_client.call.return_value = {"status": "success"}
+        
+        result = test_agent.send_task("target_agent", {"task_type": "test_task"}, wait_for_response=True)
+        
+        assert result == {"status": "success"}
+        queue_name, task = test_agent.rpc_client.call.call_args[0]
+        assert queue_name == "target_agent_queue"
+        assert task["sender_agent_id"] == "test_agent"
+        test_agent.mq_client.declare_queue.assert_not_called()
+        
+    def test_send_task_timeout(self, test_agent):
+        """Test that a missing response returns a timeout status."""
+        test_agent.rpc_client = MagicMock()
+        test_agent.rpc_client.call.side_effect = TimeoutError()
+        
+        result = test_agent.send_task("target_agent", {"task_type": "test_task"}, wait_for_response=True)
+        
+        assert result["status"] == "timeout"
@@ -0,0 +1,77 @@
+"""
+Tests for the streaming content generation endpoint.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import content_generation
+from src.core.security import get_current_user
+
+
+@pytest.fixture
+def client():
+    """Client for an app serving only the content generation router, as an authenticated user."""
+    app = FastAPI()
+    app.include_router(content_generation.router)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+    with patch.object(content_generation, "log_api_usage_sync"):
+        yield TestClient(app)
+
+
+def generation_payload():
+    return {"content_type": "blog_post", "variables": {"topic": "spring launch"}}
+
+
+def read_events(response):
+    """Parse a text/event-stream body into (event, data) pairs."""
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_emits_tokens_then_done(client):
+    """Test that generated text arrives as token events followed by the full response."""
+    async def generate(request, user_id, on_token=None):
+        await on_token("Hello ")
+        await on_token("world")
+        return content_generation.GenerationResponse(
+            request_id="req-1",
+            content_type=request.content_type,
+            variations=[content_generation.ContentVariation(variation_id="v1", content="Hello world")],
+            provider="openai",
+            model="gpt-4o",
+            generation_time_ms=10,
+            total_time_ms=12
+        )
+
+    with patch.object(content_generation.rate_limiter, "allow_request_async",
+                      AsyncMock(return_value=(True, {}))) as allow, \
+            patch.object(content_generation, "_generate_content", side_effect=generate):
+        response = client.post("/content-generation/generate/stream", json=generation_payload())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = read_events(response)
+    assert events[:2] == [("token", {"text": "Hello "}), ("token", {"text": "world"})]
+    assert events[2][0] == "done"
+    assert events[2][1]["variations"][0]["content"] == "Hello world"
+    assert allow.await_args.args == ("content_gen:1",)
+
+
+def test_stream_is_rate_limited(client):
+    """Test that a user over the content generation limit is refused before generating."""
+    with patch.object(content_generation.rate_limiter, "allow_request_async",
+                      AsyncMock(return_value=(False, {"reason": "Rate limit exceeded"}))), \
+            patch.object(content_generation, "_generate_content") as generate:
+        response = client.post("/content-generation/generate/stream", json=generation_payload())
+
+    assert response.status_code == 429
+    generate.assert_not_called()
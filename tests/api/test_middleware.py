@@ -0,0 +1,156 @@
+"""
+Unit tests for the pure ASGI gateway middleware.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.api.middleware import CSRFMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
+from src.core.rate_limiting import RateLimitCategory
+from src.core.security import CSRFProtection
+
+
+async def _endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _call(app, path="/api/v1/things", client=("10.0.0.1", 5000), scope_type="http",
+                method="GET", headers=(), body=b""):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": scope_type, "path": path, "client": client, "method": method,
+             "headers": list(headers), "query_string": b""}
+    await app(scope, receive, send)
+    return messages
+
+
+@pytest.fixture
+def limiter():
+    limiter = AsyncMock()
+    limiter.allow_request.return_value = (True, {"limit": 100, "remaining": 99, "reset": 1})
+    return limiter
+
+
+class TestRateLimitMiddleware:
+    """Tests for RateLimitMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_responses_carry_limit_headers(self, limiter):
+        app = RateLimitMiddleware(_endpoint, limiter=limiter, trusted_ips=[])
+
+        start, body = await _call(app)
+
+        assert start["status"] == 200
+        assert (b"x-ratelimit-remaining", b"99") in start["headers"]
+        assert body["body"] == b"ok"
+        limiter.allow_request.assert_awaited_once_with(
+            "10.0.0.1", RateLimitCategory.DEFAULT, endpoint="/api/v1/things", ip_address="10.0.0.1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rejection_short_circuits(self, limiter):
+        limiter.allow_request.return_value = (
+            False, {"limit": 20, "remaining": 0, "reset": 3, "retry_after": 3, "reason": "Rate limit exceeded"}
+        )
+        endpoint = AsyncMock()
+        app = RateLimitMiddleware(endpoint, limiter=limiter, trusted_ips=[])
+
+        start, body = await _call(app, path="/api/v1/auth/login")
+
+        assert start["status"] == 429
+        assert (b"retry-after", b"3") in start["headers"]
+        assert body["body"] == b"Too many requests. Please try again later."
+        assert limiter.allow_request.call_args[0][1] == RateLimitCategory.SECURITY
+        endpoint.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_trusted_ips_and_websockets_bypass_limiter(self, limiter):
+        app = RateLimitMiddleware(_endpoint, limiter=limiter, trusted_ips=["127.0.0.1"])
+
+        await _call(app, client=("127.0.0.1", 5000))
+        await _call(app, scope_type="websocket")
+
+        limiter.allow_request.assert_not_called()
+
+    def test_path_categories(self, limiter):
+        app = RateLimitMiddleware(_endpoint, limiter=limiter, trusted_ips=[])
+
+        assert app.category_for("/health") == RateLimitCategory.PUBLIC
+        assert app.category_for("/api/v1/compliance/requests") == RateLimitCategory.SENSITIVE
+        assert app.category_for("/api/v1/templates") == RateLimitCategory.DEFAULT
+
+
+class TestSecurityHeadersMiddleware:
+    """Tests for SecurityHeadersMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_headers_replace_endpoint_values(self):
+        async def endpoint(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"X-Frame-Options", b"SAMEORIGIN"), (b"content-type", b"text/plain")]})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        start, _ = await _call(SecurityHeadersMiddleware(endpoint))
+
+        headers = start["headers"]
+        assert (b"content-type", b"text/plain") in headers
+        assert [value for name, value in headers if name.lower() == b"x-frame-options"] == [b"DENY"]
+        assert any(name == b"content-security-policy" for name, _ in headers)
+
+
+@pytest.fixture
+def protection():
+    protection = CSRFProtection()
+    protection.validate_token = MagicMock(side_effect=lambda token: token == "good")
+    return protection
+
+
+class TestCSRFMiddleware:
+    """Tests for CSRFMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_safe_methods_and_exempt_paths_skip_validation(self, protection):
+        app = CSRFMiddleware(_endpoint, protection=protection)
+
+        get = await _call(app)
+        webhook = await _call(app, path="/api/v1/webhook/stripe", method="POST")
+
+        assert get[0]["status"] == 200
+        assert webhook[0]["status"] == 200
+        protection.validate_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("headers, status", [
+        ([(b"x-csrf-token", b"good"), (b"cookie", b"csrf_token=c")], 200),
+        ([(b"x-csrf-token", b"bad"), (b"cookie", b"csrf_token=c")], 403),
+        ([(b"x-csrf-token", b"good")], 403),
+    ])
+    async def test_header_token(self, protection, headers, status):
+        start, body = await _call(CSRFMiddleware(_endpoint, protection=protection), method="POST", headers=headers)
+
+        assert start["status"] == status
+        if status == 403:
+            assert body["body"] == b'{"detail":"CSRF token missing or invalid"}'
+
+    @pytest.mark.asyncio
+    async def test_form_token_and_body_replay(self, protection):
+        received = []
+
+        async def endpoint(scope, receive, send):
+            received.append(await receive())
+            await _endpoint(scope, receive, send)
+
+        app = CSRFMiddleware(endpoint, protection=protection)
+        headers = [(b"content-type", b"application/x-www-form-urlencoded"), (b"cookie", b"csrf_token=c")]
+
+        start, _ = await _call(app, method="POST", headers=headers, body=b"csrf_token=good&name=x")
+
+        assert start["status"] == 200
+        assert received[0]["body"] == b"csrf_token=good&name=x"
@@ -11,8 +11,12 @@ from unittest.mock import MagicMock, patch
 import base64
 import os
 
+from cryptography.fernet import Fernet
+
+from src.core import security
 from src.core.security import (
-    encrypt_data, decrypt_data, encrypt_field_if_needed, decrypt_field_if_needed
+    encrypt_data, decrypt_data, encrypt_field_if_needed, decrypt_field_if_needed,
+    encrypt_sensitive_data, decrypt_sensitive_data, decrypt_many
 )
 from src.core.compliance import DataClassificationService
 
@@ -270,4 +274,68 @@ class TestFieldEncryption:
             
             # Assert
             assert result is None
-            mock_classification_service.should_encrypt_field.assert_called_once_with("user", "ssn")
\ No newline at end of file
+            mock_classification_service.should_encrypt_field.assert_called_once_with("user", "ssn")
+
+
+class TestEncryptionKeyDerivation:
+    """Tests for derived-key caching and the versioned ciphertext formats."""
+    
+    def test_legacy_ciphertexts_still_decrypt(self):
+        """Test that values written before version 2 decrypt unchanged."""
+        # Arrange: encrypt the way version 1 did
+        salt = os.urandom(16)
+        key, _ = security._get_encryption_key(salt)
+        legacy = base64.urlsafe_b64encode(Fernet(key).encrypt(b"legacy secret")).decode()
+        
+        # Act
+        result = decrypt_sensitive_data(legacy, base64.urlsafe_b64encode(salt).decode())
+        
+        # Assert
+        assert result == "legacy secret"
+    
+    def test_new_ciphertexts_are_versioned(self):
+        """Test that new values use the data key format and round trip."""
+        encrypted, salt = encrypt_sensitive_data("token")
+        
+        assert encrypted.startswith("v2.")
+        assert decrypt_sensitive_data(encrypted, salt) == "token"
+    
+    def test_version_1_can_still_be_written(self):
+        """Test that DATA_ENCRYPTION_FORMAT=1 writes the legacy format."""
+        with patch.object(security.settings, "DATA_ENCRYPTION_FORMAT", 1):
+            encrypted, salt = encrypt_sensitive_data("token")
+        
+        assert not encrypted.startswith("v2.")
+        assert decrypt_sensitive_data(encrypted, salt) == "token"
+    
+    def test_pbkdf2_runs_once_per_salt(self):
+        """Test that repeated decryption reuses derived keys."""
+        encrypted = [encrypt_sensitive_data(f"value {i}") for i in range(5)]
+        security._derive_salted_key.cache_clear()
+        
+        with patch("src.core.security.PBKDF2HMAC", wraps=security.PBKDF2HMAC) as kdf:
+            decrypt_many(encrypted)
+            decrypt_many(encrypted)
+        
+        # Only the deployment data key is derived with PBKDF2
+        assert kdf.call_count == 1
+    
+    def test_decrypt_many_handles_mixed_versions(self):
+        """Test a page holding both ciphertext formats and empty values."""
+        with patch.object(security.settings, "DATA_ENCRYPTION_FORMAT", 1):
+            legacy = encrypt_sensitive_data("old")
+        values = [legacy, encrypt_sensitive_data("new"), ("", "")]
+        
+        assert decrypt_many(values) == ["old", "new", ""]
+    
+    def test_decrypt_many_preserves_order_and_reports_failures(self):
+        """Test bulk decryption with a corrupt value in the page."""
+        values = [encrypt_sensitive_data("a"), ("v2.corrupt", "c2FsdA=="), encrypt_sensitive_data("c")]
+        
+        results = decrypt_many(values, return_exceptions=True)
+        
+        assert results[0] == "a"
+        assert isinstance(results[1], Exception)
+        assert results[2] == "c"
+        with pytest.raises(Exception):
+            decrypt_many(values)
@@ -0,0 +1,697 @@
+"""
+Unit tests for the Redis cache layer and caching decorators.
+"""
+
+import json
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.cache import (
+    AsyncRedisCache,
+    CacheCategory,
+    LocalCache,
+    RedisCache,
+    _deserialize,
+    _envelope,
+    _needs_refresh,
+    _serialize,
+    async_cached,
+    async_cached_batch,
+    async_method_cached,
+    cached,
+    cached_batch,
+    generate_cache_key,
+)
+
+
+@pytest.fixture
+def mock_async_cache():
+    """Patch the global asyncio cache client used by the async decorators."""
+    with patch('src.core.cache.async_cache') as mock:
+        mock.get = AsyncMock(return_value=None)
+        mock.set = AsyncMock(return_value=True)
+        mock.delete = AsyncMock(return_value=True)
+        mock.delete_pattern = AsyncMock(return_value=0)
+        yield mock
+
+
+class TestAsyncRedisCache:
+    """Tests for AsyncRedisCache."""
+
+    @pytest.mark.asyncio
+    async def test_get_deserializes_json(self):
+        async_cache = AsyncRedisCache()
+        client = MagicMock()
+        client.get = AsyncMock(return_value=json.dumps({"a": 1}).encode())
+        async_cache._client = client
+
+        assert await async_cache.get("key") == {"a": 1}
+        client.get.assert_awaited_once_with("umt:key")
+
+    @pytest.mark.asyncio
+    async def test_get_returns_default_on_error(self):
+        async_cache = AsyncRedisCache()
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=ConnectionError("down"))
+        async_cache._client = client
+
+        assert await async_cache.get("key", default="fallback") == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_get_starts_l1_listener_off_the_event_loop(self):
+        local = LocalCache(categories=["brand"])
+        started_on = []
+        local.ensure_listening = lambda: started_on.append(threading.get_ident()) or True
+        async_cache = AsyncRedisCache(local=local)
+        client = MagicMock()
+        client.get = AsyncMock(return_value=b"1")
+        async_cache._client = client
+
+        assert await async_cache.get("brand:1") == 1
+        assert started_on and started_on[0] != threading.get_ident()
+        assert local.get("umt:brand:1") == b"1"
+
+    @pytest.mark.asyncio
+    async def test_set_uses_shared_serialization(self):
+        async_cache = AsyncRedisCache()
+        client = MagicMock()
+        client.set = AsyncMock(return_value=True)
+        async_cache._client = client
+
+        assert await async_cache.set("key", {"a": 1}, expire=60) is True
+        args, kwargs = client.set.call_args
+        assert args == ("umt:key", _serialize({"a": 1}))
+        assert kwargs["ex"] == 60
+
+
+class TestAsyncCachedDecorators:
+    """Tests for async_cached and async_method_cached."""
+
+    @pytest.mark.asyncio
+    async def test_async_cached_returns_hit_without_calling(self, mock_async_cache):
+        mock_async_cache.get.return_value = {"cached": True}
+        calls = []
+
+        @async_cached(ttl=30, category=CacheCategory.CONTENT)
+        async def compute(x):
+            calls.append(x)
+            return {"cached": False}
+
+        assert await compute(1) == {"cached": True}
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_async_cached_stores_miss(self, mock_async_cache):
+        @async_cached(ttl=30)
+        async def compute(x):
+            return x * 2
+
+        assert await compute(21) == 42
+        key = generate_cache_key(compute.__wrapped__, (21,), {}, None, None)
+        mock_async_cache.set.assert_awaited_once_with(key, 42, expire=30)
+
+    @pytest.mark.asyncio
+    async def test_async_cached_skip_cache(self, mock_async_cache):
+        @async_cached()
+        async def compute():
+            return "value"
+
+        assert await compute(_skip_cache=True) == "value"
+        mock_async_cache.get.assert_not_awaited()
+        mock_async_cache.set.assert_not_awaited()
+
+    def test_async_cached_rejects_sync_function(self):
+        with pytest.raises(TypeError):
+            @async_cached()
+            def compute():
+                return None
+
+    @pytest.mark.asyncio
+    async def test_async_method_cached_uses_instance_prefix(self, mock_async_cache):
+        class Service:
+            id = 7
+
+            @async_method_cached(category=CacheCategory.ANALYTICS)
+            async def summary(self, brand_id):
+                return {"brand_id": brand_id}
+
+        assert await Service().summary(3) == {"brand_id": 3}
+        key = mock_async_cache.set.call_args[0][0]
+        assert key.startswith(f"{CacheCategory.ANALYTICS}:Service:7.summary:")
+
+
+class TestLocalCache:
+    """Tests for the in-process L1 tier."""
+
+    def test_get_and_set(self):
+        local = LocalCache(categories=["brand"])
+        local.set("umt:brand:a", b"1")
+
+        assert local.get("umt:brand:a") == b"1"
+        assert local.get("umt:brand:b") is None
+        stats = local.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l1_misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        local = LocalCache(max_entries=2)
+        local.set("umt:a", b"1")
+        local.set("umt:b", b"2")
+        local.get("umt:a")
+        local.set("umt:c", b"3")
+
+        assert local.get("umt:b") is None
+        assert local.get("umt:a") == b"1"
+        assert local.get_stats()["l1_evictions"] == 1
+
+    def test_respects_memory_bound(self):
+        local = LocalCache(max_bytes=8)
+        local.set("umt:a", b"12345")
+        local.set("umt:b", b"12345")
+        local.set("umt:huge", b"x" * 100)
+
+        assert local.get("umt:a") is None
+        assert local.get("umt:b") == b"12345"
+        assert local.get("umt:huge") is None
+        assert local.get_stats()["l1_bytes"] == 5
+
+    def test_expires_entries(self):
+        local = LocalCache(ttl=60)
+        with patch("src.core.cache.time.monotonic", return_value=1000.0):
+            local.set("umt:a", b"1", ttl=5)
+        with patch("src.core.cache.time.monotonic", return_value=1006.0):
+            assert local.get("umt:a") is None
+
+    def test_accepts_only_configured_categories(self):
+        local = LocalCache(categories=["brand", "template"])
+
+        assert local.accepts(f"umt:{CacheCategory.BRAND}:x")
+        assert local.accepts("umt:template:x")
+        assert not local.accepts("umt:content:x")
+
+    def test_applies_remote_invalidations(self):
+        local = LocalCache()
+        local.set("umt:brand:1", b"1")
+        local.set("umt:brand:2", b"2")
+        local.set("umt:user:1", b"3")
+
+        local._handle_message({"data": json.dumps({"origin": "other", "op": "pattern", "target": "umt:brand:*"})})
+
+        assert local.get("umt:brand:1") is None
+        assert local.get("umt:brand:2") is None
+        assert local.get("umt:user:1") == b"3"
+
+    def test_ignores_own_invalidations(self):
+        local = LocalCache()
+        local.set("umt:brand:1", b"1")
+
+        local._handle_message({"data": local.invalidation_message("clear")})
+
+        assert local.get("umt:brand:1") == b"1"
+
+
+class TestTwoTierRedisCache:
+    """Tests for RedisCache with an L1 tier."""
+
+    @pytest.fixture
+    def two_tier(self):
+        local = LocalCache(categories=["brand"])
+        local.ensure_listening = MagicMock(return_value=True)
+        redis_cache = RedisCache(local=local)
+        redis_cache._client = MagicMock()
+        return redis_cache, local
+
+    def test_get_serves_repeat_reads_from_l1(self, two_tier):
+        redis_cache, local = two_tier
+        redis_cache._client.get.return_value = json.dumps({"voice": "friendly"}).encode()
+
+        assert redis_cache.get("brand:guidelines:1") == {"voice": "friendly"}
+        assert redis_cache.get("brand:guidelines:1") == {"voice": "friendly"}
+        redis_cache._client.get.assert_called_once()
+        assert redis_cache.get_stats()["l1_hits"] == 1
+
+    def test_other_categories_bypass_l1(self, two_tier):
+        redis_cache, local = two_tier
+        redis_cache._client.get.return_value = b"1"
+
+        redis_cache.get("content:1")
+        redis_cache.get("content:1")
+
+        assert redis_cache._client.get.call_count == 2
+
+    def test_delete_invalidates_and_broadcasts(self, two_tier):
+        redis_cache, local = two_tier
+        local.set("umt:brand:1", b"1")
+        redis_cache._client.pipeline.return_value.execute.return_value = [1, 1]
+
+        assert redis_cache.delete("brand:1") is True
+        assert local.get("umt:brand:1") is None
+        channel, message = redis_cache._client.publish.call_args[0]
+        assert channel == local.channel
+        assert json.loads(message)["target"] == "umt:brand:1"
+
+    def test_delete_pattern_broadcasts_even_without_redis_keys(self, two_tier):
+        redis_cache, local = two_tier
+        local.set("umt:brand:1", b"1")
+        redis_cache._client.scan_iter.return_value = iter([])
+
+        assert redis_cache.delete_pattern("brand:*") == 0
+        assert local.get("umt:brand:1") is None
+        assert json.loads(redis_cache._client.publish.call_args[0][1])["op"] == "pattern"
+
+
+class TestTagInvalidation:
+    """Tests for tag-indexed invalidation and SCAN-based pattern deletion."""
+
+    @pytest.fixture
+    def redis_cache(self):
+        redis_cache = RedisCache()
+        redis_cache._client = MagicMock()
+        return redis_cache
+
+    def test_set_indexes_category_tag(self, redis_cache):
+        pipeline = redis_cache._client.pipeline.return_value
+        pipeline.execute.return_value = [True, 1, True]
+
+        before = time.time()
+        assert redis_cache.set("brand:guidelines:1", {"voice": "friendly"}, expire=60) is True
+        tag_key, members = pipeline.zadd.call_args[0]
+        assert tag_key == "umt:tags:brand"
+        assert before + 60 <= members["umt:brand:guidelines:1"] <= time.time() + 60
+        pipeline.zremrangebyscore.assert_called_once()
+        redis_cache._client.set.assert_not_called()
+
+    def test_conditional_set_indexes_only_when_written(self, redis_cache):
+        redis_cache._client.set.return_value = None
+
+        assert redis_cache.set("brand:guidelines:1", {}, nx=True) is False
+        redis_cache._client.pipeline.return_value.zadd.assert_not_called()
+
+        redis_cache._client.set.return_value = True
+        assert redis_cache.set("brand:guidelines:1", {}, nx=True) is True
+        redis_cache._client.pipeline.return_value.zadd.assert_called_once()
+
+    def test_delete_removes_key_from_category_index(self, redis_cache):
+        pipeline = redis_cache._client.pipeline.return_value
+        pipeline.execute.return_value = [1, 1]
+
+        assert redis_cache.delete("brand:guidelines:1") is True
+        pipeline.zrem.assert_called_once_with("umt:tags:brand", "umt:brand:guidelines:1")
+
+    def test_set_indexes_formatted_enum_keys(self, redis_cache):
+        pipeline = redis_cache._client.pipeline.return_value
+        pipeline.execute.return_value = [True, 1, True]
+
+        redis_cache.set(f"{CacheCategory.USER}:profile:1", {})
+
+        assert pipeline.zadd.call_args[0][0] == "umt:tags:user"
+
+    def test_set_without_tags_is_single_command(self, redis_cache):
+        redis_cache._client.set.return_value = True
+
+        assert redis_cache.set("session:abc", "value") is True
+        redis_cache._client.pipeline.assert_not_called()
+
+    def test_delete_category_unlinks_tag_members(self, redis_cache):
+        redis_cache._scanned_categories.add("brand")
+        redis_cache._client.zscan_iter.return_value = iter([(b"umt:brand:a", 1.0), (b"umt:brand:b", 2.0)])
+        redis_cache._client.unlink.side_effect = [2, 1]
+
+        assert redis_cache.delete_category(CacheCategory.BRAND) == 2
+        renamed_from, purge_key = redis_cache._client.rename.call_args[0]
+        assert renamed_from == "umt:tags:brand"
+        redis_cache._client.unlink.assert_any_call(b"umt:brand:a", b"umt:brand:b")
+        redis_cache._client.unlink.assert_any_call(purge_key)
+        redis_cache._client.keys.assert_not_called()
+        redis_cache._client.scan_iter.assert_not_called()
+
+    def test_delete_category_sweeps_unindexed_keys_once(self, redis_cache):
+        from redis.exceptions import ResponseError
+
+        redis_cache._client.rename.side_effect = ResponseError("no such key")
+        redis_cache._client.scan_iter.return_value = iter([])
+
+        redis_cache.delete_category(CacheCategory.BRAND)
+        sweeps = redis_cache._client.scan_iter.call_count
+        redis_cache.delete_category(CacheCategory.BRAND)
+
+        assert sweeps >= 1
+        assert redis_cache._client.scan_iter.call_count == sweeps
+
+    def test_delete_pattern_unlinks_in_batches(self, redis_cache):
+        keys = [f"umt:cache:fn:{i}".encode() for i in range(1200)]
+        redis_cache._client.scan_iter.return_value = iter(keys)
+        redis_cache._client.unlink.side_effect = lambda *batch: len(batch)
+
+        assert redis_cache.delete_pattern("cache:fn:*") == 1200
+        assert redis_cache._client.unlink.call_count == 3
+        redis_cache._client.keys.assert_not_called()
+
+
+class _DictBackedCache:
+    """Replace a cache client's storage and locking with in-memory fakes."""
+
+    def __init__(self, client):
+        self.store = {}
+        self.locks = set()
+        self.unstored = set()
+        client.get = self.get
+        client.set = self.set
+        client.acquire_lock = self.acquire_lock
+        client.release_lock = self.release_lock
+        client.result_not_stored = self.result_not_stored
+
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
+    def set(self, key, value, expire=None, **kwargs):
+        self.store[key] = value
+        return True
+
+    def acquire_lock(self, name, timeout):
+        if name in self.locks or name in self.unstored:
+            return None
+        self.locks.add(name)
+        return "token"
+
+    def release_lock(self, name, token, stored=True):
+        self.locks.discard(name)
+        if not stored:
+            self.unstored.add(name)
+
+    def result_not_stored(self, name):
+        return name in self.unstored
+
+
+class _AsyncDictBackedCache(_DictBackedCache):
+    """Async flavour of _DictBackedCache for AsyncRedisCache."""
+
+    async def get(self, key, default=None):
+        return super().get(key, default)
+
+    async def set(self, key, value, expire=None, **kwargs):
+        return super().set(key, value, expire)
+
+    async def acquire_lock(self, name, timeout):
+        return super().acquire_lock(name, timeout)
+
+    async def release_lock(self, name, token, stored=True):
+        super().release_lock(name, token, stored)
+
+    async def result_not_stored(self, name):
+        return super().result_not_stored(name)
+
+
+class TestStampedeProtection:
+    """Tests for single-flight recomputation and stale-while-revalidate."""
+
+    def test_needs_refresh_after_expiry(self):
+        entry = _envelope("value", ttl=10, delta=0.1)
+        assert not _needs_refresh(entry, beta=0)
+        entry["expires_at"] = time.time() - 1
+        assert _needs_refresh(entry, beta=0)
+
+    def test_needs_refresh_early_for_expensive_values(self):
+        entry = _envelope("value", ttl=1, delta=1000.0)
+        assert _needs_refresh(entry, beta=1.0)
+
+    def test_concurrent_misses_compute_once(self):
+        redis_cache = RedisCache()
+        storage = _DictBackedCache(redis_cache)
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"summary": 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(redis_cache.get_or_compute("k", compute, expire=60)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert results == [{"summary": 1}] * 5
+        assert storage.store["k"]["value"] == {"summary": 1}
+
+    def test_waiters_stop_when_holder_stores_nothing(self):
+        redis_cache = RedisCache()
+        storage = _DictBackedCache(redis_cache)
+        storage.locks.add("k")  # Another worker is computing
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(
+            redis_cache.get_or_compute("k", lambda: None, lock_timeout=30, should_cache=lambda r: r is not None)
+        ))
+        waiter.start()
+        time.sleep(0.1)
+
+        storage.release_lock("k", "token", stored=False)
+        waiter.join(2)
+
+        assert not waiter.is_alive()
+        assert results == [None]
+
+    def test_uncached_result_releases_lock_as_unstored(self):
+        redis_cache = RedisCache()
+        storage = _DictBackedCache(redis_cache)
+
+        redis_cache.get_or_compute("k", lambda: None, should_cache=lambda r: r is not None)
+
+        assert storage.unstored == {"k"}
+        assert "k" not in storage.store
+
+    def test_stale_value_served_while_refreshing(self):
+        redis_cache = RedisCache()
+        storage = _DictBackedCache(redis_cache)
+        stale = _envelope("old", ttl=10, delta=0.0)
+        stale["expires_at"] = time.time() - 1
+        storage.store["k"] = stale
+        refreshed = threading.Event()
+
+        def compute():
+            refreshed.set()
+            return "new"
+
+        assert redis_cache.get_or_compute("k", compute, expire=10, stale_ttl=30) == "old"
+        assert refreshed.wait(5)
+        deadline = time.time() + 5
+        while storage.store["k"]["value"] != "new" and time.time() < deadline:
+            time.sleep(0.01)
+        assert storage.store["k"]["value"] == "new"
+
+    def test_plain_legacy_entries_are_served(self):
+        redis_cache = RedisCache()
+        storage = _DictBackedCache(redis_cache)
+        storage.store["k"] = {"legacy": True}
+
+        assert redis_cache.get_or_compute("k", lambda: {"legacy": False}) == {"legacy": True}
+
+    def test_cached_decorator_uses_single_flight(self):
+        with patch("src.core.cache.cache") as mock_cache:
+            mock_cache.get_or_compute.return_value = 3
+
+            @cached(ttl=60, stale_ttl=120)
+            def summary(x):
+                return x
+
+            assert summary(3) == 3
+            kwargs = mock_cache.get_or_compute.call_args[1]
+            assert kwargs["stale_ttl"] == 120
+            assert kwargs["expire"] == 60
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_misses_compute_once(self):
+        async_cache = AsyncRedisCache()
+        _AsyncDictBackedCache(async_cache)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        results = await asyncio.gather(
+            *[async_cache.get_or_compute("k", compute, expire=60) for _ in range(10)]
+        )
+
+        assert calls == [1]
+        assert results == ["value"] * 10
+
+    @pytest.mark.asyncio
+    async def test_async_follower_survives_leader_cancellation(self):
+        async_cache = AsyncRedisCache()
+        _AsyncDictBackedCache(async_cache)
+        leader_started = asyncio.Event()
+
+        async def slow_compute():
+            leader_started.set()
+            await asyncio.sleep(10)
+
+        async def compute():
+            return "value"
+
+        leader = asyncio.ensure_future(async_cache.get_or_compute("k", slow_compute, expire=60))
+        await leader_started.wait()
+        follower = asyncio.ensure_future(async_cache.get_or_compute("k", compute, expire=60))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class TestBatchLookups:
+    """Tests for pipelined multi-key lookups and the batch decorators."""
+
+    @pytest.fixture
+    def redis_cache(self):
+        redis_cache = RedisCache()
+        redis_cache._client = MagicMock()
+        return redis_cache
+
+    def test_set_many_uses_one_pipeline_with_per_key_ttls(self, redis_cache):
+        pipeline = redis_cache._client.pipeline.return_value
+
+        assert redis_cache.set_many({"a": 1, "b": 2}, expire=60, ttls={"b": 10}) is True
+
+        redis_cache._client.pipeline.assert_called_once_with(transaction=False)
+        ttls = {call.args[0]: call.kwargs["ex"] for call in pipeline.set.call_args_list}
+        assert ttls == {"umt:a": 60, "umt:b": 10}
+        pipeline.execute.assert_called_once()
+
+    def test_get_or_compute_many_computes_only_misses(self, redis_cache):
+        redis_cache._client.mget.return_value = [_serialize({"cached": True}), None]
+        pipeline = redis_cache._client.pipeline.return_value
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"fresh": True}
+
+        results = redis_cache.get_or_compute_many(
+            {"hit": lambda: {"unexpected": True}, "miss": compute},
+            expire=lambda value: 42
+        )
+
+        assert results == {"hit": {"cached": True}, "miss": {"fresh": True}}
+        assert calls == [1]
+        redis_cache._client.mget.assert_called_once_with(["umt:hit", "umt:miss"])
+        pipeline.set.assert_called_once()
+        assert pipeline.set.call_args.kwargs["ex"] == 42
+
+    def test_get_or_compute_many_treats_expired_envelopes_as_misses(self, redis_cache):
+        expired = _envelope("old", ttl=10, delta=0.1)
+        expired["expires_at"] = time.time() - 1
+        redis_cache._client.mget.return_value = [
+            _serialize(expired), _serialize(_envelope("current", ttl=10, delta=0.1))
+        ]
+
+        results = redis_cache.get_or_compute_many(
+            {"expired": lambda: "new", "fresh": lambda: "unexpected"}, envelope=True
+        )
+
+        assert results == {"expired": "new", "fresh": "current"}
+        stored = redis_cache._client.pipeline.return_value.set.call_args.args[1]
+        assert _deserialize(stored)["value"] == "new"
+
+    def test_get_or_compute_many_writes_back_before_raising(self, redis_cache):
+        redis_cache._client.mget.return_value = [None, None]
+        pipeline = redis_cache._client.pipeline.return_value
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            redis_cache.get_or_compute_many({"ok": lambda: 1, "bad": fail}, concurrency=2)
+
+        assert [call.args[0] for call in pipeline.set.call_args_list] == ["umt:ok"]
+
+    def test_cached_batch_decorator(self):
+        storage = {}
+        calls = []
+
+        def get_or_compute_many(computations, **kwargs):
+            for key, compute in computations.items():
+                if key not in storage:
+                    storage[key] = compute()
+            return {key: storage[key] for key in computations}
+
+        with patch("src.core.cache.cache") as mock_cache:
+            mock_cache.get_or_compute_many.side_effect = get_or_compute_many
+
+            @cached_batch(ttl=60, category=CacheCategory.CONTENT)
+            def score(content_id):
+                calls.append(content_id)
+                return content_id * 10
+
+            assert score.batch([1, (2,), 1]) == [10, 20, 10]
+            assert score(2) == 20
+            assert calls == [1, 2]
+            assert mock_cache.get_or_compute_many.call_args.kwargs["expire"] == 60
+
+    def test_cached_batch_control_kwargs(self):
+        with patch("src.core.cache.cache") as mock_cache:
+            mock_cache.get_or_compute_many.side_effect = lambda computations, **kwargs: {
+                key: compute() for key, compute in computations.items()
+            }
+
+            @cached_batch(ttl=60)
+            def score(content_id, scale=1):
+                return content_id * scale
+
+            assert score(2, scale=3, _force_refresh=True, _ttl=5) == 6
+            kwargs = mock_cache.get_or_compute_many.call_args.kwargs
+            assert kwargs["force_refresh"] is True
+            assert kwargs["expire"] == 5
+            (key,) = mock_cache.get_or_compute_many.call_args.args[0]
+            assert key == generate_cache_key(score.__wrapped__, (2,), {"scale": 3}, None, None)
+            assert score(2, _skip_cache=True, _force_refresh=True) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_get_or_compute_many_returns_exceptions(self):
+        async_cache = AsyncRedisCache()
+        client = MagicMock()
+        client.mget = AsyncMock(return_value=[None, None])
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[])
+        client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipeline)
+        client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        async_cache._client = client
+
+        async def ok():
+            return "value"
+
+        async def fail():
+            raise ValueError("boom")
+
+        results = await async_cache.get_or_compute_many(
+            {"ok": ok, "bad": fail}, expire=30, concurrency=1, return_exceptions=True
+        )
+
+        assert results["ok"] == "value"
+        assert isinstance(results["bad"], ValueError)
+        pipeline.set.assert_called_once()
+        pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_cached_batch_requires_coroutine(self):
+        with pytest.raises(TypeError):
+            @async_cached_batch()
+            def not_async(x):
+                return x
@@ -0,0 +1,143 @@
+"""
+Unit tests for cache value codecs.
+"""
+
+import json
+import pytest
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from src.core import cache_codecs
+from src.core.cache import _deserialize, _serialize
+from src.core.cache_codecs import (
+    HEADER_BASE,
+    CacheCodec,
+    CodecError,
+    Compression,
+    Serializer,
+    create_codec,
+    is_encoded,
+)
+
+
+@dataclass
+class _Score:
+    value: float
+
+
+class TestCacheCodec:
+    """Tests for CacheCodec."""
+
+    def test_round_trip_json(self):
+        """Structured values survive encode and decode."""
+        codec = CacheCodec(serializer=Serializer.JSON)
+        value = {"name": "brand", "scores": [1, 2.5, None], "nested": {"ok": True}}
+
+        encoded = codec.encode(value)
+
+        assert encoded[0] == HEADER_BASE
+        assert codec.decode(encoded) == value
+
+    def test_non_string_keys_match_stdlib_json(self):
+        """Integer dict keys come back as strings, as with json.dumps."""
+        codec = CacheCodec(serializer=Serializer.ORJSON)
+
+        assert codec.decode(codec.encode({1: "a"})) == json.loads(json.dumps({1: "a"}))
+
+    def test_rejects_types_json_rejects(self):
+        """Values stdlib json can't store are still rejected under orjson."""
+        codec = CacheCodec(serializer=Serializer.ORJSON)
+
+        with pytest.raises(TypeError):
+            codec.encode(_Score(0.5))
+
+    def test_missing_packages_fall_back(self):
+        """Unavailable serializers and compressors degrade to JSON without compression."""
+        with patch.object(cache_codecs, "MSGPACK_AVAILABLE", False), \
+                patch.object(cache_codecs, "ZSTD_AVAILABLE", False):
+            codec = CacheCodec(serializer=Serializer.MSGPACK, compression=Compression.ZSTD)
+
+        assert codec.serializer == Serializer.ORJSON
+        assert codec.compression == Compression.NONE
+
+    def test_invalid_configuration_uses_json(self):
+        """Unknown settings values produce a working JSON codec."""
+        codec = create_codec("pickle", "brotli", 1024)
+
+        assert codec.serializer == Serializer.JSON
+        assert codec.decode(codec.encode([1, 2])) == [1, 2]
+
+    def test_small_values_are_not_compressed(self):
+        """Values under the threshold are stored uncompressed."""
+        codec = CacheCodec(compression=Compression.NONE, compression_threshold=10)
+        codec.compression = Compression.ZSTD
+
+        encoded = codec.encode([1])
+
+        assert encoded[0] == HEADER_BASE
+
+    @pytest.mark.skipif(not cache_codecs.ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_zstd_compression_above_threshold(self):
+        """Large values are compressed and flagged in the header."""
+        codec = CacheCodec(compression=Compression.ZSTD, compression_threshold=64)
+        value = {"text": "repeated content " * 200}
+
+        encoded = codec.encode(value)
+
+        assert encoded[0] == HEADER_BASE + 1
+        assert len(encoded) < len(json.dumps(value))
+        assert CacheCodec(serializer=Serializer.JSON).decode(encoded) == value
+
+    @pytest.mark.skipif(not cache_codecs.MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_entries_readable_by_json_codec(self):
+        """A codec decodes entries written with a different serializer."""
+        value = {"ids": [1, 2, 3], "label": "x"}
+        encoded = CacheCodec(serializer=Serializer.MSGPACK).encode(value)
+
+        assert encoded[0] == HEADER_BASE + 3
+        assert CacheCodec(serializer=Serializer.JSON).decode(encoded) == value
+
+    @pytest.mark.skipif(not cache_codecs.MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_round_trip_of_tuples_and_int_keys(self):
+        """Tuples come back as lists and integer map keys are readable."""
+        codec = CacheCodec(serializer=Serializer.MSGPACK)
+
+        decoded = codec.decode(codec.encode({"pair": (1, 2), "by_id": {1: "a", 2: "b"}}))
+
+        assert decoded == {"pair": [1, 2], "by_id": {1: "a", 2: "b"}}
+
+    def test_decode_unknown_compression_raises(self):
+        """Headers naming an unavailable compressor raise CodecError."""
+        with patch.object(cache_codecs, "LZ4_AVAILABLE", False):
+            with pytest.raises(CodecError):
+                CacheCodec().decode(bytes((HEADER_BASE + 2,)) + b"data")
+
+    def test_headers_never_collide_with_text(self):
+        """Legacy JSON and UTF-8 text entries are not treated as encoded."""
+        assert not is_encoded(json.dumps({"a": 1}).encode())
+        assert not is_encoded("héllo".encode())
+        assert not is_encoded(b"")
+
+
+class TestCacheSerialization:
+    """Tests for the cache module's serialize and deserialize helpers."""
+
+    def test_structured_values_use_codec(self):
+        """Dicts and lists are written with a codec header."""
+        serialized = _serialize({"a": 1})
+
+        assert is_encoded(serialized)
+        assert _deserialize(serialized) == {"a": 1}
+
+    def test_strings_pass_through(self):
+        """Strings are stored as-is and read back as strings."""
+        assert _serialize("plain") == "plain"
+        assert _deserialize(b"plain") == "plain"
+
+    def test_legacy_json_entries_still_readable(self):
+        """Entries written before codecs existed decode as JSON."""
+        assert _deserialize(json.dumps({"legacy": [1, 2]}).encode()) == {"legacy": [1, 2]}
+
+    def test_corrupt_encoded_entry_is_a_miss(self):
+        """Undecodable encoded entries deserialize to None."""
+        assert _deserialize(bytes((HEADER_BASE,)) + b"{not json") is None
@@ -0,0 +1,125 @@
+"""Tests for the shared outbound HTTP clients."""
+
+import pytest
+import responses
+from unittest.mock import patch
+
+from src.core.http_client import HTTPPoolConfig, SyncHTTPClient, AsyncHTTPClient, HTTPX_AVAILABLE
+
+
+@pytest.fixture
+def config():
+    """Pool configuration with a per-host timeout override."""
+    return HTTPPoolConfig(
+        max_connections=20,
+        max_per_host=4,
+        connect_timeout=2.0,
+        read_timeout=10.0,
+        host_timeouts={"slow.example.com": 60.0}
+    )
+
+
+class TestHTTPPoolConfig:
+    """Tests for HTTPPoolConfig."""
+
+    def test_timeout_for_uses_host_override(self, config):
+        """Test that a per-host read timeout replaces the default."""
+        assert config.timeout_for("https://slow.example.com/v1/items") == (2.0, 60.0)
+        assert config.timeout_for("https://api.example.com/v1/items") == (2.0, 10.0)
+
+
+class TestSyncHTTPClient:
+    """Tests for SyncHTTPClient."""
+
+    def test_settings_are_read_on_first_use(self, config):
+        """Test that creating a client does not read settings until it is used."""
+        with patch.object(HTTPPoolConfig, "from_settings", return_value=config) as from_settings:
+            client = SyncHTTPClient()
+            from_settings.assert_not_called()
+
+            assert client.config is config
+            assert client.config is config
+        from_settings.assert_called_once()
+
+    def test_session_is_shared_and_pooled(self, config):
+        """Test that one session is reused with a per-host pool size."""
+        client = SyncHTTPClient(config)
+        session = client.session
+
+        assert client.session is session
+        adapter = session.get_adapter("https://api.example.com")
+        assert adapter._pool_maxsize == 4
+        assert adapter._pool_connections == 5
+
+    @responses.activate
+    def test_request_applies_default_timeout(self, config):
+        """Test that requests without a timeout get the configured one."""
+        responses.add(responses.GET, "https://slow.example.com/ping", json={"ok": True})
+        client = SyncHTTPClient(config)
+
+        with patch.object(client.session, "request", wraps=client.session.request) as mock_request:
+            response = client.get("https://slow.example.com/ping")
+
+        assert response.json() == {"ok": True}
+        assert mock_request.call_args.kwargs["timeout"] == (2.0, 60.0)
+
+    @responses.activate
+    def test_response_cookies_are_not_stored(self, config):
+        """Test that the shared session does not carry cookies between integrations."""
+        responses.add(
+            responses.GET, "https://api.example.com/login",
+            headers={"Set-Cookie": "session=secret; Path=/"}
+        )
+        client = SyncHTTPClient(config)
+
+        client.get("https://api.example.com/login")
+
+        assert len(client.session.cookies) == 0
+
+
+class TestAsyncHTTPClient:
+    """Tests for AsyncHTTPClient."""
+
+    @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not installed")
+    @pytest.mark.asyncio
+    async def test_httpx_client_is_shared(self, config):
+        """Test that SDKs get the same pooled httpx client until it is closed."""
+        client = AsyncHTTPClient(config)
+        first = client.httpx_client()
+
+        assert client.httpx_client() is first
+        await client.close()
+        assert client.httpx_client() is not first
+        await client.close()
+
+    @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not installed")
+    def test_httpx_timeout_for_uses_host_override(self, config):
+        """Test that SDK timeouts keep their own read default unless the host is overridden."""
+        client = AsyncHTTPClient(config)
+
+        timeout = client.httpx_timeout_for("https://api.example.com", 600.0)
+        assert (timeout.connect, timeout.read) == (2.0, 600.0)
+        assert client.httpx_timeout_for("https://slow.example.com", 600.0).read == 60.0
+
+    @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not installed")
+    @pytest.mark.asyncio
+    async def test_httpx_requests_get_host_override(self, config):
+        """Test that the shared httpx client applies per-host read timeouts."""
+        client = AsyncHTTPClient(config)
+        httpx_client = client.httpx_client()
+        slow = httpx_client.build_request("GET", "https://slow.example.com/v1", timeout=600.0)
+        fast = httpx_client.build_request("GET", "https://api.example.com/v1", timeout=600.0)
+
+        for hook in httpx_client.event_hooks["request"]:
+            await hook(slow)
+            await hook(fast)
+
+        assert slow.extensions["timeout"]["read"] == 60.0
+        assert slow.extensions["timeout"]["connect"] == 600.0
+        assert fast.extensions["timeout"]["read"] == 600.0
+        await client.close()
+
+    def test_httpx_client_without_httpx(self, config):
+        """Test that SDKs fall back to their own client when httpx is missing."""
+        with patch("src.core.http_client.HTTPX_AVAILABLE", False):
+            assert AsyncHTTPClient(config).httpx_client() is None
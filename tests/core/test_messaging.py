@@ -0,0 +1,446 @@
+"""
+Unit tests for the RabbitMQ clients and the pooled publisher.
+"""
+
+import json
+import queue
+import threading
+import pytest
+from concurrent.futures import wait
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from src.core.messaging import (
+    ATTEMPTS_HEADER,
+    PoisonMessageError,
+    RabbitMQClient,
+    RabbitMQPublisher,
+    RabbitMQRpcClient,
+    RetryPolicy,
+    _ConcurrentDispatcher,
+)
+
+
+@pytest.fixture
+def blocking_connection():
+    """Patch pika's blocking connection with a mock."""
+    with patch('src.core.messaging.pika.BlockingConnection') as mock:
+        connection = mock.return_value
+        connection.is_closed = False
+        yield connection
+
+
+@pytest.fixture
+def fake_publisher():
+    """A publisher whose channels and broker confirms are mocked out."""
+    publisher = RabbitMQPublisher(pool_size=2, batch_size=3, batch_interval_ms=10_000, confirm_timeout=5)
+    publisher._acquire_channel = AsyncMock(return_value=MagicMock())
+    publisher._release_channel = MagicMock()
+    publisher._publish_one = AsyncMock(return_value=None)
+    publisher._close_connection = AsyncMock(return_value=None)
+    yield publisher
+    publisher.close(timeout=5)
+
+
+class TestRabbitMQClient:
+    """Tests for the blocking RabbitMQ client."""
+
+    def test_declarations_are_cached_per_connection(self, blocking_connection):
+        client = RabbitMQClient()
+        channel = blocking_connection.channel.return_value
+
+        client.declare_exchange("events")
+        client.declare_exchange("events")
+        client.declare_queue("agent_queue")
+        client.declare_queue("agent_queue")
+
+        channel.exchange_declare.assert_called_once()
+        channel.queue_declare.assert_called_once()
+
+        # A new connection forgets earlier declarations
+        blocking_connection.is_closed = True
+        client.declare_exchange("events")
+        assert channel.exchange_declare.call_count == 2
+
+    def test_declarations_from_worker_threads_run_on_the_consumer_thread(self, blocking_connection):
+        client = RabbitMQClient()
+        client.connect()
+        connection = _FakeConnection()
+        client.connection = connection
+        client._consumer_thread = threading.get_ident()  # This thread plays the consume loop
+
+        worker = threading.Thread(target=client.declare_exchange, args=("events",))
+        worker.start()
+        client.channel.exchange_declare.assert_not_called()
+
+        connection.run_callbacks(1)
+        worker.join(5)
+        client.channel.exchange_declare.assert_called_once()
+        assert not worker.is_alive()
+
+    def test_publish_uses_pooled_publisher_when_enabled(self):
+        client = RabbitMQClient()
+        with patch('src.core.messaging._use_publisher', return_value=True), \
+                patch('src.core.messaging.get_publisher') as get_publisher:
+            future = client.publish_direct("agent_queue", {"task_type": "x"})
+
+        publisher = get_publisher.return_value
+        publisher.publish_direct.assert_called_once_with("agent_queue", {"task_type": "x"}, waited=True)
+        future.result.assert_called_once()
+
+    def test_publish_raises_when_not_confirmed(self):
+        client = RabbitMQClient()
+        with patch('src.core.messaging._use_publisher', return_value=True), \
+                patch('src.core.messaging.get_publisher') as get_publisher:
+            get_publisher.return_value.publish.return_value.result.side_effect = RuntimeError("nacked")
+
+            with pytest.raises(RuntimeError):
+                client.publish("events", "broadcast", {"event_type": "x"})
+
+            future = client.publish("events", "broadcast", {"event_type": "x"}, wait_for_confirm=False)
+            assert future is get_publisher.return_value.publish.return_value
+
+    def test_publish_falls_back_to_blocking_channel(self, blocking_connection):
+        client = RabbitMQClient()
+        with patch('src.core.messaging._use_publisher', return_value=False):
+            assert client.publish("events", "broadcast", {"event_type": "x"}) is None
+
+        kwargs = blocking_connection.channel.return_value.basic_publish.call_args.kwargs
+        assert kwargs["exchange"] == f"{client.queue_prefix}events"
+        assert kwargs["routing_key"] == "broadcast"
+
+
+class TestRabbitMQPublisher:
+    """Tests for batching and confirm handling in RabbitMQPublisher."""
+
+    def test_full_batch_is_published_together(self, fake_publisher):
+        futures = [fake_publisher.publish_direct("q", {"n": i}) for i in range(3)]
+
+        done, _ = wait(futures, timeout=5)
+
+        assert len(done) == 3
+        assert all(future.exception() is None for future in futures)
+        fake_publisher._acquire_channel.assert_awaited_once()
+        assert fake_publisher._publish_one.await_count == 3
+
+    def test_partial_batch_waits_for_interval_or_flush(self, fake_publisher):
+        future = fake_publisher.publish("events", "broadcast", {"event_type": "x"})
+
+        done, _ = wait([future], timeout=0.2)
+        assert not done
+
+        assert fake_publisher.flush(timeout=5) is True
+        assert future.result(timeout=1) is None
+        outgoing = fake_publisher._publish_one.await_args.args[1]
+        assert outgoing.exchange == f"{fake_publisher.queue_prefix}events"
+        assert outgoing.routing_key == "broadcast"
+
+    def test_waited_message_is_sent_without_the_interval(self, fake_publisher):
+        buffered = fake_publisher.publish_direct("q", {"n": 0})
+        waited = fake_publisher.publish_direct("q", {"n": 1}, waited=True)
+
+        # The interval is 10s; both go out on the loop's next pass in one batch
+        assert waited.result(timeout=1) is None
+        assert buffered.result(timeout=1) is None
+        fake_publisher._acquire_channel.assert_awaited_once()
+
+    def test_failed_confirm_fails_only_that_message(self, fake_publisher):
+        async def publish_one(channel, outgoing):
+            if b'"bad"' in outgoing.body:
+                raise RuntimeError("nacked")
+
+        fake_publisher._publish_one = AsyncMock(side_effect=publish_one)
+        good = fake_publisher.publish_direct("q", {"kind": "good"})
+        bad = fake_publisher.publish_direct("q", {"kind": "bad"})
+        fake_publisher.flush(timeout=5)
+
+        assert good.result(timeout=1) is None
+        with pytest.raises(RuntimeError):
+            bad.result(timeout=1)
+        fake_publisher._release_channel.assert_called_once()
+
+    def test_routing_keys_keep_their_channel_and_order(self, fake_publisher):
+        published = []
+
+        async def publish_one(channel, outgoing):
+            published.append(json.loads(outgoing.body)["n"])
+
+        fake_publisher._publish_one = AsyncMock(side_effect=publish_one)
+        for n in range(7):
+            fake_publisher.publish_direct("q", {"n": n})
+        fake_publisher.flush(timeout=5)
+
+        assert published == list(range(7))
+        slots = {call.args[0] for call in fake_publisher._acquire_channel.await_args_list}
+        assert len(slots) == 1
+        assert fake_publisher._release_channel.call_count == fake_publisher._acquire_channel.await_count
+
+    def test_messages_are_stamped(self, fake_publisher):
+        message = {"event_type": "x"}
+
+        fake_publisher.publish_direct("q", message)
+        fake_publisher.flush(timeout=5)
+
+        assert "message_id" in message
+        assert "timestamp" in message
+
+
+class _FakeConnection:
+    """Collects thread-safe callbacks so a test can run them as the connection thread."""
+
+    def __init__(self):
+        self.callbacks = queue.Queue()
+        self.is_open = True
+        self.is_closed = False
+
+    def add_callback_threadsafe(self, callback):
+        self.callbacks.put(callback)
+
+    def run_callbacks(self, count):
+        for _ in range(count):
+            self.callbacks.get(timeout=5)()
+
+
+def _deliver(dispatcher, tag, message):
+    dispatcher.on_message(None, MagicMock(delivery_tag=tag), None, json.dumps(message).encode())
+
+
+class TestConcurrentDispatcher:
+    """Tests for concurrent consumption with ordered acks."""
+
+    def test_acks_are_released_in_delivery_order(self):
+        connection = _FakeConnection()
+        channel = MagicMock()
+        release = threading.Event()
+
+        def callback(message):
+            if message["n"] == 1:
+                release.wait(5)
+
+        dispatcher = _ConcurrentDispatcher(connection, channel, callback, max_workers=3)
+        for tag in (1, 2, 3):
+            _deliver(dispatcher, tag, {"n": tag})
+
+        connection.run_callbacks(2)
+        channel.basic_ack.assert_not_called()
+
+        release.set()
+        connection.run_callbacks(1)
+        channel.basic_ack.assert_called_once_with(delivery_tag=3, multiple=True)
+        dispatcher.executor.shutdown()
+
+    def test_failures_are_nacked_without_covering_them_with_acks(self):
+        connection = _FakeConnection()
+        channel = MagicMock()
+
+        def callback(message):
+            if message["n"] == 2:
+                raise ValueError("bad task")
+
+        dispatcher = _ConcurrentDispatcher(connection, channel, callback, max_workers=1)
+        for tag in (1, 2, 3):
+            _deliver(dispatcher, tag, {"n": tag})
+        connection.run_callbacks(3)
+
+        assert channel.mock_calls == [
+            call.basic_ack(delivery_tag=1, multiple=True),
+            call.basic_nack(delivery_tag=2, requeue=True),
+            call.basic_ack(delivery_tag=3, multiple=True),
+        ]
+        dispatcher.executor.shutdown()
+
+    def test_per_type_limits_queue_excess_tasks(self):
+        connection = _FakeConnection()
+        started = []
+        release = threading.Event()
+
+        def callback(message):
+            started.append(message["task_id"])
+            release.wait(5)
+
+        dispatcher = _ConcurrentDispatcher(
+            connection, MagicMock(), callback, max_workers=4,
+            concurrency_limits={"generate_content": 1}
+        )
+        _deliver(dispatcher, 1, {"task_type": "generate_content", "task_id": "a"})
+        _deliver(dispatcher, 2, {"task_type": "generate_content", "task_id": "b"})
+        _deliver(dispatcher, 3, {"task_type": "create_brand", "task_id": "c"})
+
+        assert dispatcher.in_flight == 2
+        release.set()
+        connection.run_callbacks(2)
+
+        assert dispatcher.in_flight == 1
+        connection.run_callbacks(1)
+        assert sorted(started) == ["a", "b", "c"]
+        dispatcher.executor.shutdown()
+
+    def test_handled_failures_are_acked_with_the_rest(self):
+        connection = _FakeConnection()
+        channel = MagicMock()
+        on_failure = MagicMock(return_value=True)
+
+        def callback(message):
+            if message["n"] == 2:
+                raise ValueError("bad task")
+
+        dispatcher = _ConcurrentDispatcher(
+            connection, channel, callback, max_workers=1, on_failure=on_failure
+        )
+        for tag in (1, 2, 3):
+            _deliver(dispatcher, tag, {"n": tag})
+        connection.run_callbacks(3)
+
+        body, _, error = on_failure.call_args[0]
+        assert json.loads(body) == {"n": 2}
+        assert isinstance(error, ValueError)
+        channel.basic_nack.assert_not_called()
+        assert channel.basic_ack.call_args == call(delivery_tag=3, multiple=True)
+        dispatcher.executor.shutdown()
+
+    def test_undecodable_messages_are_poison(self):
+        channel = MagicMock()
+        on_failure = MagicMock(return_value=True)
+        dispatcher = _ConcurrentDispatcher(
+            _FakeConnection(), channel, MagicMock(), max_workers=2, on_failure=on_failure
+        )
+
+        dispatcher.on_message(None, MagicMock(delivery_tag=1), None, b"{not json")
+
+        assert isinstance(on_failure.call_args[0][2], PoisonMessageError)
+        channel.basic_ack.assert_called_once_with(delivery_tag=1, multiple=True)
+        dispatcher.executor.shutdown()
+
+
+class TestRetryPolicy:
+    """Tests for backoff and dead-letter routing."""
+
+    def test_delays_back_off_exponentially_up_to_the_cap(self):
+        policy = RetryPolicy(max_attempts=5, base_delay_ms=1000, max_delay_ms=3000)
+
+        assert [policy.delay_for(n) for n in range(1, 6)] == [1000, 2000, 3000, 3000, None]
+        assert policy.delays == [1000, 2000, 3000]
+
+    def test_failure_goes_to_delay_queue_for_its_attempt(self, blocking_connection):
+        client = RabbitMQClient()
+        client.connect()
+        policy = RetryPolicy(max_attempts=3, base_delay_ms=100)
+        properties = MagicMock(headers={ATTEMPTS_HEADER: 1}, message_id="m1")
+
+        assert client._route_failure("umt_q", policy, b"{}", properties, ValueError("boom"))
+
+        kwargs = client.channel.basic_publish.call_args.kwargs
+        assert kwargs["exchange"] == ""
+        assert kwargs["routing_key"] == "umt_q.retry.200"
+        assert kwargs["properties"].headers[ATTEMPTS_HEADER] == 2
+
+    def test_exhausted_and_poison_messages_are_dead_lettered(self, blocking_connection):
+        client = RabbitMQClient()
+        client.connect()
+        policy = RetryPolicy(max_attempts=3)
+
+        client._route_failure("umt_q", policy, b"{}", MagicMock(headers={ATTEMPTS_HEADER: 2}), ValueError())
+        assert client.channel.basic_publish.call_args.kwargs["exchange"] == "umt_q.dlx"
+
+        client._route_failure("umt_q", policy, b"x", MagicMock(headers=None), PoisonMessageError())
+        assert client.channel.basic_publish.call_args.kwargs["exchange"] == "umt_q.dlx"
+
+    def test_failure_is_acked_only_after_the_broker_confirms_the_copy(self, blocking_connection):
+        consume_channel, failure_channel = MagicMock(), MagicMock()
+        blocking_connection.channel.side_effect = [consume_channel, failure_channel]
+        client = RabbitMQClient()
+        client.connect()
+        policy = RetryPolicy(max_attempts=3)
+
+        assert client._route_failure("umt_q", policy, b"{}", MagicMock(headers=None), ValueError())
+        failure_channel.confirm_delivery.assert_called_once()
+        assert failure_channel.basic_publish.call_args.kwargs["mandatory"] is True
+        consume_channel.basic_publish.assert_not_called()
+
+        # A nacked or unroutable copy leaves the original to be requeued
+        failure_channel.basic_publish.side_effect = RuntimeError("nacked")
+        assert not client._route_failure("umt_q", policy, b"{}", MagicMock(headers=None), ValueError())
+
+    def test_replay_moves_selected_messages_back(self, blocking_connection):
+        client = RabbitMQClient()
+        client.connect()
+        channel = client.channel
+        channel.basic_get.side_effect = [
+            (MagicMock(delivery_tag=1), MagicMock(message_id="keep", headers={}), b"{}"),
+            (MagicMock(delivery_tag=2), MagicMock(message_id="replay", headers={ATTEMPTS_HEADER: 5, "trace": "t"}), b"{}"),
+        ]
+
+        assert client.replay_dead_letters("q", message_ids=["replay"]) == 1
+
+        kwargs = channel.basic_publish.call_args.kwargs
+        assert kwargs["routing_key"] == f"{client.queue_prefix}q"
+        assert kwargs["properties"].headers == {"trace": "t"}
+        channel.basic_ack.assert_called_once_with(delivery_tag=2)
+        channel.basic_nack.assert_called_once_with(delivery_tag=1, multiple=True, requeue=True)
+
+
+@pytest.fixture
+def rpc_client():
+    """An RPC client whose reply consumer and publishing are faked."""
+    client = RabbitMQRpcClient("agent")
+    client._start = MagicMock()
+    client.reply_queue = "reply_agent_test"
+    client._publish = MagicMock()
+    return client
+
+
+def _reply(client, message):
+    client._on_reply(None, None, None, json.dumps(message).encode())
+
+
+class TestRabbitMQRpcClient:
+    """Tests for correlation-based request/response."""
+
+    def test_call_returns_matching_reply(self, rpc_client):
+        def respond(queue_name, message):
+            assert queue_name == "target_queue"
+            assert message["response_queue"] == "reply_agent_test"
+            threading.Thread(
+                target=_reply,
+                args=(rpc_client, {"correlation_id": message["correlation_id"], "status": "ok"})
+            ).start()
+
+        rpc_client._publish.side_effect = respond
+
+        assert rpc_client.call("target_queue", {"task_type": "x"}, timeout=5)["status"] == "ok"
+        assert rpc_client._pending == {}
+
+    def test_replies_are_routed_by_correlation_id(self, rpc_client):
+        first_id, first = rpc_client._send("q", {"correlation_id": "first"})
+        second_id, second = rpc_client._send("q", {"correlation_id": "second"})
+
+        _reply(rpc_client, {"correlation_id": "second", "n": 2})
+        _reply(rpc_client, {"correlation_id": "first", "n": 1})
+
+        assert first.result(timeout=1)["n"] == 1
+        assert second.result(timeout=1)["n"] == 2
+
+    def test_timeout_discards_pending_call(self, rpc_client):
+        with pytest.raises(TimeoutError):
+            rpc_client.call("q", {"correlation_id": "slow"}, timeout=0.01)
+
+        assert "slow" not in rpc_client._pending
+        # A late reply is dropped without error
+        _reply(rpc_client, {"correlation_id": "slow"})
+
+    @pytest.mark.asyncio
+    async def test_call_async(self, rpc_client):
+        rpc_client._publish.side_effect = lambda queue_name, message: _reply(
+            rpc_client, {"correlation_id": message["correlation_id"], "status": "ok"}
+        )
+
+        result = await rpc_client.call_async("q", {"task_type": "x"}, timeout=5)
+
+        assert result["status"] == "ok"
+
+    def test_lost_connection_fails_pending_calls(self, rpc_client):
+        _, future = rpc_client._send("q", {"correlation_id": "c"})
+
+        rpc_client._fail_pending(ConnectionError("gone"))
+
+        with pytest.raises(ConnectionError):
+            future.result(timeout=1)
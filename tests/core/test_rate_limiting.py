@@ -0,0 +1,149 @@
+"""
+Unit tests for the Redis-backed rate limiters.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.rate_limiting import GCRARateLimiter, RateLimitCategory, TokenBucketRateLimiter
+
+LIMITS = {
+    "default": {"tokens_per_interval": 10, "interval_seconds": 1, "burst_limit": 3, "cost_per_request": 1},
+    "security": {"tokens_per_interval": 20, "interval_seconds": 60, "burst_limit": 30, "cost_per_request": 2},
+}
+
+
+@pytest.fixture
+def limiter():
+    limiter = GCRARateLimiter(limits=LIMITS, endpoint_costs={"/expensive": 5})
+    limiter._script = AsyncMock(return_value=[1, 2, 0, 100])
+    return limiter
+
+
+class TestGCRARateLimiter:
+    """Tests for GCRARateLimiter.allow_request."""
+
+    @pytest.mark.asyncio
+    async def test_single_script_call_with_category_parameters(self, limiter):
+        allowed, context = await limiter.allow_request(
+            "1.2.3.4", RateLimitCategory.SECURITY, endpoint="/expensive", ip_address="1.2.3.4"
+        )
+
+        assert allowed
+        assert context == {"limit": 20, "remaining": 2, "reset": 1}
+        limiter._script.assert_awaited_once_with(
+            keys=["umt:ratelimit:gcra:security:1.2.3.4", "umt:ratelimit:block:1.2.3.4"],
+            args=[3000.0, 90000.0, 7]
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_category_uses_default_limits(self, limiter):
+        await limiter.allow_request("client", RateLimitCategory.PUBLIC)
+
+        kwargs = limiter._script.call_args.kwargs
+        assert kwargs["keys"] == ["umt:ratelimit:gcra:public:client"] * 2
+        assert kwargs["args"] == [100.0, 300.0, 1]
+
+    @pytest.mark.asyncio
+    async def test_rejection_reports_retry_after(self, limiter):
+        limiter._script.return_value = [0, 0, 1500, 300]
+
+        allowed, context = await limiter.allow_request("client")
+
+        assert not allowed
+        assert context["retry_after"] == 2
+        assert context["remaining"] == 0
+        assert context["reason"] == "Rate limit exceeded"
+
+    @pytest.mark.asyncio
+    async def test_blocked_ip(self, limiter):
+        limiter._script.return_value = [-1, 0, 3600000, 0]
+
+        allowed, context = await limiter.allow_request("client", ip_address="1.2.3.4")
+
+        assert not allowed
+        assert context["retry_after"] == 3600
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_is_unavailable(self, limiter):
+        limiter._script.side_effect = ConnectionError("down")
+
+        allowed, context = await limiter.allow_request("client")
+
+        assert allowed
+        assert context == {"limit": 10}
+
+
+@pytest.fixture
+def token_bucket():
+    with patch("src.core.rate_limiting.RedisCache"):
+        limiter = TokenBucketRateLimiter()
+    limiter.default_limits = LIMITS
+    limiter.endpoint_costs = {"/expensive": 5}
+    limiter._script = MagicMock(return_value=[1, 2, 1700000000, 0])
+    limiter._async_script = AsyncMock(return_value=[1, 2, 1700000000, 0])
+    return limiter
+
+
+class TestTokenBucketRateLimiter:
+    """Tests for the scripted TokenBucketRateLimiter.allow_request."""
+
+    def test_one_script_call_per_request(self, token_bucket):
+        allowed, context = token_bucket.allow_request(
+            "client", RateLimitCategory.SECURITY, endpoint="/expensive", ip_address="1.2.3.4"
+        )
+
+        assert allowed
+        assert context == {"limit": 20, "remaining": 2, "reset": 1700000000}
+        token_bucket._script.assert_called_once()
+        kwargs = token_bucket._script.call_args.kwargs
+        assert kwargs["keys"] == [
+            "umt:ratelimit:bucket:security:client",
+            "umt:ratelimit:block:1.2.3.4",
+            "umt:ratelimit:circuit_state",
+            "umt:ratelimit:violations:client",
+            "umt:ratelimit:violation_count:client",
+        ]
+        assert kwargs["args"][:5] == [20, 60, 30, 7, "1.2.3.4"]
+        token_bucket.cache.get.assert_not_called()
+        token_bucket.cache.set.assert_not_called()
+
+    @pytest.mark.parametrize("result, reason, retry_after", [
+        ([0, 2, 1700000000, 0], "Rate limit exceeded", 2),
+        ([-1, 3600, 0, 0], "IP address blocked due to suspicious activity", 3600),
+        ([-2, 30, 0, 0], "Service protection circuit breaker engaged", 30),
+        ([-3, 45, 0, 0], "Too many requests", 45),
+    ])
+    def test_rejections(self, token_bucket, result, reason, retry_after):
+        token_bucket._script.return_value = result
+
+        allowed, context = token_bucket.allow_request("client")
+
+        assert not allowed
+        assert context["reason"] == reason
+        assert context["retry_after"] == retry_after
+
+    def test_newly_blocked_ip_is_added_to_block_list(self, token_bucket):
+        token_bucket._script.return_value = [0, 120, 1700000000, 1]
+        token_bucket.cache.get.return_value = ["5.6.7.8"]
+
+        token_bucket.allow_request("client", ip_address="1.2.3.4")
+
+        token_bucket.cache.set.assert_called_once_with(
+            "ratelimit:blocklist", ["5.6.7.8", "1.2.3.4"], expire=86400
+        )
+
+    def test_fails_open_when_redis_is_unavailable(self, token_bucket):
+        token_bucket._script.side_effect = ConnectionError("down")
+
+        assert token_bucket.allow_request("client") == (True, {"limit": 10})
+
+    @pytest.mark.asyncio
+    async def test_async_variant(self, token_bucket):
+        token_bucket._async_script.return_value = [-2, 30, 0, 0]
+
+        allowed, context = await token_bucket.allow_request_async("client")
+
+        assert not allowed
+        assert context["reason"] == "Service protection circuit breaker engaged"
+        token_bucket._script.assert_not_called()
@@ -0,0 +1,226 @@
+"""
+Unit tests for token verification and user lookup caching in the security module.
+"""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from jose import ExpiredSignatureError, JWTError
+
+from src.core import security
+from src.core.security import decode_token, jwt_manager
+
+
+@pytest.fixture(autouse=True)
+def clean_token_cache():
+    """Start every test with an empty verified-token cache and known JWT keys."""
+    security._token_cache.clear()
+    jwt_manager._initialized = True
+    jwt_manager._keys = {
+        "kid-1": {"key": "secret-1", "expires_at": security.datetime.utcnow().replace(year=2100)}
+    }
+    jwt_manager._kid_aliases.clear()
+    yield
+    security._token_cache.clear()
+
+
+class TestDecodeToken:
+    """Tests for the decode_token fast paths."""
+
+    def test_verified_payloads_are_cached(self):
+        payload = {"sub": "1", "exp": time.time() + 600}
+
+        with patch("src.core.security._verify_token", return_value=payload) as verify:
+            assert decode_token("token") == payload
+            assert decode_token("token") == payload
+
+        verify.assert_called_once_with("token")
+
+    def test_expired_payloads_are_not_cached(self):
+        payload = {"sub": "1", "exp": time.time() - 1}
+
+        with patch("src.core.security._verify_token", return_value=payload) as verify:
+            decode_token("token")
+            decode_token("token")
+
+        assert verify.call_count == 2
+
+    def test_known_key_id_uses_only_its_key(self):
+        with patch("src.core.security.jwt") as jwt:
+            jwt.get_unverified_claims.return_value = {"kid": "kid-1"}
+            jwt.decode.side_effect = ExpiredSignatureError("expired")
+
+            assert decode_token("token") is None
+
+        jwt.decode.assert_called_once()
+        assert jwt.decode.call_args[0][1] == "secret-1"
+
+    def test_unknown_key_id_is_remembered(self):
+        with patch("src.core.security.jwt") as jwt:
+            jwt.get_unverified_claims.return_value = {"kid": "other-worker", "sub": "1"}
+            jwt.decode.side_effect = lambda token, key, algorithms: {"sub": "1", "key": key}
+
+            assert decode_token("token")["key"] == "secret-1"
+
+        assert jwt_manager.get_key_by_id("other-worker") == "secret-1"
+
+    def test_invalid_tokens_return_none(self):
+        with patch("src.core.security.jwt") as jwt:
+            jwt.get_unverified_claims.side_effect = JWTError("malformed")
+
+            assert decode_token("garbage") is None
+
+
+class TestUserSnapshot:
+    """Tests for cached user lookups during authentication."""
+
+    @pytest.mark.asyncio
+    async def test_cached_snapshot_skips_query(self):
+        db = MagicMock()
+        snapshot = {"id": 1, "email": "a@example.com", "is_active": True}
+
+        with patch("src.core.security.async_cache") as async_cache, \
+                patch("src.core.security.make_transient_to_detached") as detach, \
+                patch("src.models.system.User") as user_model:
+            async_cache.get = AsyncMock(return_value=snapshot)
+
+            user = await security._load_user(db, 1)
+
+        user_model.assert_called_once_with(**snapshot)
+        detach.assert_called_once_with(user_model.return_value)
+        db.merge.assert_called_once_with(user_model.return_value, load=False)
+        db.query.assert_not_called()
+        assert user is db.merge.return_value
+
+    @pytest.mark.asyncio
+    async def test_miss_queries_and_caches_snapshot(self):
+        db = MagicMock()
+        user = MagicMock(id=1, email="a@example.com", username="a", full_name="A",
+                         is_active=True, is_superuser=False)
+        db.query.return_value.filter.return_value.first.return_value = user
+
+        with patch("src.core.security.async_cache") as async_cache:
+            async_cache.get = AsyncMock(return_value=None)
+            async_cache.set = AsyncMock(return_value=True)
+
+            assert await security._load_user(db, 1) is user
+
+        key, value = async_cache.set.call_args[0]
+        assert key == "user:auth:1"
+        assert value["email"] == "a@example.com"
+        assert "hashed_password" not in value
+
+    def test_invalidation(self):
+        with patch("src.core.security.cache") as cache:
+            security.invalidate_user_auth_cache(1)
+            security.invalidate_user_auth_cache()
+
+        assert cache.delete.call_args_list == [call("user:auth:1"), call("user:permissions:1")]
+        cache.delete_tag.assert_called_once_with("auth_user")
+
+    def test_invalidation_waits_for_commit(self):
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+        from src.core import cache_invalidation
+
+        session = Session()
+        event.listen(Session, "after_commit", cache_invalidation._apply_auth_invalidations)
+        try:
+            with patch("src.core.security.cache") as cache, \
+                    patch("src.core.cache_invalidation.object_session", return_value=session):
+                # Flush-time listeners only queue the user
+                cache_invalidation._queue_auth_invalidation(MagicMock(), 1)
+                cache.delete.assert_not_called()
+
+                session.commit()
+                assert cache.delete.call_args_list == [call("user:auth:1"), call("user:permissions:1")]
+
+                # A role change drops every user's snapshot once
+                cache_invalidation._queue_auth_invalidation(MagicMock(), 2)
+                cache_invalidation._queue_auth_invalidation(MagicMock(), None)
+                session.commit()
+                cache.delete_tag.assert_called_once_with("auth_user")
+                assert cache.delete.call_count == 2
+        finally:
+            event.remove(Session, "after_commit", cache_invalidation._apply_auth_invalidations)
+
+
+class TestPermissions:
+    """Tests for compiled permission sets."""
+
+    def test_wildcards(self):
+        granted = frozenset({"brand:read", "content:*", "*:export"})
+
+        assert security.permission_granted(granted, "brand", "read")
+        assert security.permission_granted(granted, "content", "delete")
+        assert security.permission_granted(granted, "analytics", "export")
+        assert not security.permission_granted(granted, "brand", "delete")
+        assert security.permission_granted(frozenset({"*:*"}), "anything", "at_all")
+
+    @pytest.mark.asyncio
+    async def test_permissions_are_compiled_once_and_cached(self):
+        db = MagicMock()
+        query = db.query.return_value.join.return_value.join.return_value.filter.return_value
+        query.distinct.return_value.all.return_value = [("brand", "read"), ("content", "*")]
+
+        with patch("src.core.security.async_cache") as async_cache:
+            async_cache.get = AsyncMock(return_value=None)
+            async_cache.set = AsyncMock(return_value=True)
+
+            granted = await security.get_user_permissions(db, 7)
+
+        assert granted == frozenset({"brand:read", "content:*"})
+        db.query.assert_called_once()
+        key, value = async_cache.set.call_args[0]
+        assert key == "user:permissions:7"
+        assert value == ["brand:read", "content:*"]
+
+    @pytest.mark.asyncio
+    async def test_cached_permissions_skip_query(self):
+        db = MagicMock()
+
+        with patch("src.core.security.async_cache") as async_cache:
+            async_cache.get = AsyncMock(return_value=["brand:read"])
+
+            assert await security.get_user_permissions(db, 7) == frozenset({"brand:read"})
+
+        db.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dependency_checks_compiled_set(self):
+        user = MagicMock(id=7, is_active=True, is_superuser=False)
+        check = security.get_current_user_with_permissions(["content:view", "malformed"])
+
+        with patch("src.core.security.decode_token", return_value={"sub": "7"}), \
+                patch("src.core.security._load_user", AsyncMock(return_value=user)), \
+                patch("src.core.security.get_user_permissions",
+                      AsyncMock(return_value=frozenset({"content:*"}))):
+            assert await check(token="token", db=MagicMock()) is user
+
+        with patch("src.core.security.decode_token", return_value={"sub": "7"}), \
+                patch("src.core.security._load_user", AsyncMock(return_value=user)), \
+                patch("src.core.security.get_user_permissions",
+                      AsyncMock(return_value=frozenset({"brand:read"}))):
+            with pytest.raises(security.HTTPException) as error:
+                await check(token="token", db=MagicMock())
+        assert error.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_decorator_checks_compiled_set(self):
+        user = MagicMock(id=7, is_superuser=False)
+        endpoint = AsyncMock(return_value="ok")
+        guarded = security.has_permission("content", "delete")(endpoint)
+        db = MagicMock()
+
+        with patch("src.core.security.get_user_permissions",
+                   AsyncMock(return_value=frozenset({"content:*"}))) as permissions:
+            assert await guarded(current_user=user, db=db) == "ok"
+            permissions.assert_awaited_once_with(db, 7)
+
+            permissions.return_value = frozenset({"brand:read"})
+            with pytest.raises(security.HTTPException) as denied:
+                await guarded(current_user=user, db=db)
+        assert denied.value.status_code == 403
+        # Roles are never walked when a session is available
+        assert not user.roles.__iter__.called